@@ -4,5 +4,6 @@ API routes module for FastAPI endpoints
 
 from .transactions import router as transaction_router
 from .accounts import router as account_router
+from .dashboard import router as dashboard_router
 
-__all__ = ["transaction_router", "account_router"]
\ No newline at end of file
+__all__ = ["transaction_router", "account_router", "dashboard_router"]
\ No newline at end of file
@@ -3,15 +3,37 @@ Account API Endpoints
 FastAPI routes for account operations
 """
 
+from datetime import date, timedelta
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from ..database.connection import get_db
+from ..database.connection import SessionLocal, get_db
+from ..models.database_models import Account
+from ..services.balance_cache import get_balance_cache
+from ..services.balance_checkpoint_service import BalanceCheckpointService
+from ..services.spending_service import SpendingService, shift_month
 from ..services.transaction_service import AccountService, TransactionService
-from ..utils.validators import ValidationUtils
+from ..utils.fieldsets import FieldSet, serialize_fields
+from ..utils.formatting import BatchFormatter, CurrencyFormatter
+from ..utils.validators import SecurityUtils
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
+# Fields selectable with ``fields=`` on the account list, with the columns they read
+ACCOUNT_FIELDS = FieldSet(Account, {
+    "id": ("id",),
+    "account_number": ("account_number",),
+    "account_name": ("account_name",),
+    "account_type": ("account_type",),
+    "balance": ("balance",),
+    "formatted_balance": ("balance",),
+    "masked_account_number": ("account_number",),
+    "created_at": ("created_at",),
+})
+
 
 @router.get("/{account_id}")
 async def get_account_detail(
@@ -32,7 +54,7 @@ async def get_account_detail(
             raise HTTPException(status_code=404, detail="Account not found")
         
         # Get account summary with transaction statistics
-        account_summary = transaction_service.get_account_summary(account_id)
+        account_summary = await run_in_threadpool(transaction_service.get_account_summary, account_id)
         
         return {
             "account": {
@@ -41,11 +63,11 @@ async def get_account_detail(
                 "account_name": account.account_name,
                 "account_type": account.account_type,
                 "balance": float(account.balance),
-                "formatted_balance": f"{account.balance:,.0f}원",
+                "formatted_balance": CurrencyFormatter.format_amount(account.balance, "won"),
                 "created_at": account.created_at.isoformat(),
                 "updated_at": account.updated_at.isoformat() if account.updated_at else None,
                 # Security: mask account number for display
-                "masked_account_number": ValidationUtils.mask_account_number(account.account_number)
+                "masked_account_number": SecurityUtils.mask_account_number(account.account_number)
             },
             "summary": account_summary.get("summary") if account_summary else None
         }
@@ -60,27 +82,37 @@ async def get_account_detail(
 async def get_accounts(
     limit: int = Query(default=10, ge=1, le=50, description="Maximum number of accounts"),
     offset: int = Query(default=0, ge=0, description="Number of accounts to skip"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated account fields to return (default: all)"),
     db: Session = Depends(get_db)
 ):
     """
     Get list of accounts (for prototype - normally would be user-specific)
+    
+    With ``fields=`` only the columns those fields need are read and only
+    those fields are returned.
     """
+    try:
+        selected = ACCOUNT_FIELDS.parse(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         service = AccountService(db)
-        accounts, total_count = service.get_accounts(limit=limit, offset=offset)
+        accounts, total_count = service.get_accounts(
+            limit=limit, offset=offset, columns=ACCOUNT_FIELDS.columns(selected) if fields else None
+        )
         
-        account_data = []
-        for account in accounts:
-            account_data.append({
-                "id": account.id,
-                "account_number": account.account_number,
-                "account_name": account.account_name,
-                "account_type": account.account_type,
-                "balance": float(account.balance),
-                "formatted_balance": f"{account.balance:,.0f}원",
-                "masked_account_number": ValidationUtils.mask_account_number(account.account_number),
-                "created_at": account.created_at.isoformat()
-            })
+        formatted_balances = {}
+        if "formatted_balance" in selected:
+            formatted_balances = dict(zip(
+                (account.id for account in accounts),
+                BatchFormatter.format_amounts([account.balance for account in accounts], "won")
+            ))
+        derived = {
+            "formatted_balance": lambda account: formatted_balances[account.id],
+            "masked_account_number": lambda account: SecurityUtils.mask_account_number(account.account_number),
+        }
+        account_data = [serialize_fields(account, selected, derived) for account in accounts]
         
         return {
             "data": account_data,
@@ -101,27 +133,102 @@ async def get_accounts(
 @router.get("/{account_id}/balance")
 async def get_account_balance(
     account_id: int,
+    as_of: Optional[date] = Query(default=None, description="Return the closing balance of this day (YYYY-MM-DD)")
+):
+    """
+    Get current account balance, or the balance at the end of a past day
+    
+    The current balance is served from the process-wide balance cache, which
+    revalidates against committed transfers on every call (see BalanceCache).
+    Historical balances come from the nearest balance checkpoint plus the
+    few ledger rows after it (see BalanceCheckpointService).
+    """
+    try:
+        if as_of is not None:
+            db = SessionLocal()
+            try:
+                balance = BalanceCheckpointService(db).balance_as_of(account_id, as_of)
+            finally:
+                db.close()
+        else:
+            balance = get_balance_cache().get(account_id)
+        
+        if not balance:
+            raise HTTPException(status_code=404, detail="Account not found")
+        
+        return balance
+        
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/{account_id}/balance-series")
+async def get_balance_series(
+    account_id: int,
+    start_date: Optional[date] = Query(default=None, alias="from", description="First day (default: 90 days before to)"),
+    end_date: Optional[date] = Query(default=None, alias="to", description="Last day, inclusive (default: today)"),
+    points: int = Query(default=200, ge=3, le=2000, description="Maximum number of points"),
     db: Session = Depends(get_db)
 ):
     """
-    Get current account balance
+    Get balance over time for charts, downsampled server-side with LTTB
+    
+    Built from balance checkpoints plus the ledger rows after the last
+    checkpoint, so the cost follows the number of days, not transactions.
     """
     try:
-        service = AccountService(db)
-        account = service.get_account_by_id(account_id)
+        end_date = end_date or date.today()
+        start_date = start_date or end_date - timedelta(days=90)
+        if start_date > end_date:
+            raise HTTPException(status_code=400, detail="from must not be after to")
         
-        if not account:
+        series = BalanceCheckpointService(db).balance_series(account_id, start_date, end_date, points)
+        
+        if not series:
             raise HTTPException(status_code=404, detail="Account not found")
         
-        return {
-            "account_id": account.id,
-            "balance": float(account.balance),
-            "formatted_balance": f"{account.balance:,.0f}원",
-            "account_name": account.account_name,
-            "last_updated": account.updated_at.isoformat() if account.updated_at else account.created_at.isoformat()
-        }
+        return series
         
     except HTTPException:
         raise
     except Exception:
-        raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/{account_id}/spending")
+async def get_account_spending(
+    account_id: int,
+    period: str = Query(
+        default="6m",
+        pattern=r"^(\d{1,2}m|\d{4}-(0[1-9]|1[0-2]))$",
+        description="Last N months including this one (e.g. 3m, 12m) or a single month (YYYY-MM)"
+    ),
+    db: Session = Depends(get_db)
+):
+    """
+    Get spending by category and month with month-over-month changes
+    
+    Served from the monthly category spend aggregate, so the cost is
+    categories × months regardless of transaction volume.
+    """
+    try:
+        if not AccountService(db).get_account_by_id(account_id):
+            raise HTTPException(status_code=404, detail="Account not found")
+        
+        if period.endswith("m"):
+            months = int(period[:-1])
+            if not 1 <= months <= 24:
+                raise HTTPException(status_code=400, detail="period must be between 1m and 24m")
+            last_month = date.today().strftime("%Y-%m")
+            first_month = shift_month(last_month, -(months - 1))
+        else:
+            first_month = last_month = period
+        
+        return SpendingService(db).get_spending(account_id, first_month, last_month)
+        
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -0,0 +1,97 @@
+"""
+Admin API Router
+FastAPI router for operational status endpoints
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, status
+from sqlalchemy.orm import Session
+from typing import Any, Dict
+from ..database import get_db
+from ..services.reconciliation import reconciliation_status, start_reconciliation
+from ..services.scheduler import get_scheduler
+from ..middleware.admission import get_admission_stats
+from ..services.single_flight import single_flight_stats
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/jobs")
+async def get_jobs(db: Session = Depends(get_db)) -> Dict[str, Any]:
+    """
+    Background job status
+    
+    Lists every job known to the cluster (from the lease table) merged with
+    the metrics of the worker that served the request.
+    
+    Args:
+        db: Database session dependency
+        
+    Returns:
+        Dict: Worker id, whether its scheduler is running, and per-job status
+    """
+    try:
+        return get_scheduler().status(db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to load job status: {str(e)}")
+
+
+@router.get("/reconciliation")
+async def get_reconciliation() -> Dict[str, Any]:
+    """
+    Latest balance reconciliation run in this worker
+    
+    Returns:
+        Dict: Whether a run is in progress, its last error, and the last report
+    """
+    return reconciliation_status()
+
+
+@router.post("/reconciliation", status_code=status.HTTP_202_ACCEPTED)
+async def run_reconciliation() -> Dict[str, Any]:
+    """
+    Start reconciling every account balance against its transaction ledger
+    
+    The run uses a process pool and read-only connections; poll
+    ``GET /admin/reconciliation`` for the report.
+    
+    Returns:
+        Dict: Current reconciliation status
+        
+    Raises:
+        HTTPException: 409 if a run is already in progress, 400 if the database is not file-backed SQLite
+    """
+    try:
+        started = start_reconciliation()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not started:
+        raise HTTPException(status_code=409, detail="Reconciliation is already running")
+    return reconciliation_status()
+
+
+@router.get("/single-flight")
+async def get_single_flight() -> Dict[str, Any]:
+    """
+    Request coalescing counters of the worker that served the request
+    
+    Returns:
+        Dict: Per service method, executions, coalesced calls, coalesce rate,
+        largest number of callers sharing one execution, and calls in flight
+    """
+    return single_flight_stats()
+
+
+@router.get("/admission")
+async def get_admission() -> Dict[str, Any]:
+    """
+    Admission control state of the worker that served the request
+    
+    Returns:
+        Dict: Worker slots in use and, per route class, limits, running and
+        queued requests, admitted, rejected and timed-out counts, requests
+        that ran past their deadline, and average service time
+    """
+    stats = get_admission_stats()
+    if stats is None:
+        return {"enabled": False}
+    return {"enabled": True, **stats}
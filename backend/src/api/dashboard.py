@@ -0,0 +1,41 @@
+"""
+Dashboard API Endpoints
+FastAPI route for the combined account dashboard
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from ..database.connection import get_db
+from ..services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("/{account_id}")
+async def get_dashboard(
+    account_id: int,
+    accounts_limit: int = Query(default=10, ge=1, le=50, description="Accounts in the account list"),
+    transactions_limit: int = Query(default=20, ge=1, le=100, description="Most recent transactions"),
+    period_days: int = Query(default=30, ge=1, le=365, description="Statistics period in days"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the account list, account detail and summary, recent transactions
+    and statistics in one response, all read from the same snapshot
+    """
+    try:
+        dashboard = DashboardService(db).get_dashboard(
+            account_id,
+            accounts_limit=accounts_limit,
+            transactions_limit=transactions_limit,
+            period_days=period_days
+        )
+        if dashboard is None:
+            raise HTTPException(status_code=404, detail="Account not found")
+        return dashboard
+
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -8,15 +8,30 @@ import traceback
 from typing import Optional
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from ..database.connection import get_db
-from ..services.transaction_service import TransactionService
+from ..database.connection import SessionLocal, get_db
+from ..models.database_models import Transaction
+from ..services.export_service import EXPORT_BATCH_SIZE, TransactionExporter
+from ..services.transaction_service import TransactionService, decode_feed_cursor, encode_feed_cursor
+from ..utils.fieldsets import FieldSet, serialize_fields
+from ..utils.formatting import CurrencyFormatter, DateFormatter, TransactionFormatter
 from ..utils.validators import ValidationUtils, DataUtils
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+# Accounts one feed request may merge
+MAX_FEED_ACCOUNTS = 20
+
+# Fields selectable with ``fields=`` on the transaction list
+TRANSACTION_FIELDS = FieldSet.of_columns(Transaction, (
+    "id", "account_id", "transaction_date", "transaction_type", "amount", "description",
+    "recipient_account", "balance_after", "reference_number", "status", "created_at"
+))
+
 
 @router.get("/", response_model=dict)
 async def get_transactions(
@@ -29,12 +44,14 @@ async def get_transactions(
     search: Optional[str] = Query(default=None, description="Search in description or recipient account"),
     sort_by: str = Query(default="transaction_date", description="Sort by field (transaction_date, amount)"),
     sort_order: str = Query(default="desc", description="Sort order (asc, desc)"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated transaction fields to return (default: all)"),
     db: Session = Depends(get_db)
 ):
     """
     Get transactions with filtering, pagination, and search
     
-    Returns transaction list with pagination information and account summary
+    Returns transaction list with pagination information and account summary.
+    With ``fields=`` only those columns are read from the database and returned.
     """
     logger.info(f"GET /transactions called with: account_id={account_id}, type={type}, from_date={from_date}, to_date={to_date}, limit={limit}, offset={offset}")
     
@@ -42,6 +59,9 @@ async def get_transactions(
         logger.info("Creating TransactionService instance")
         service = TransactionService(db)
         
+        selected = TRANSACTION_FIELDS.parse(fields)
+        columns = TRANSACTION_FIELDS.columns(selected) if fields else None
+        
         # Validate date range if provided
         if from_date and to_date:
             logger.info(f"Validating date range: {from_date} to {to_date}")
@@ -65,12 +85,18 @@ async def get_transactions(
                 search_term=search,
                 account_id=account_id,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                columns=columns
             )
+            # Convert to response format
+            transaction_data = [serialize_fields(transaction, selected) for transaction in transactions]
         else:
             # Regular filtering
             logger.info(f"Performing regular transaction filtering")
-            transactions, total_count = service.get_transactions(
+            # Off the event loop, so identical concurrent reads can coalesce
+            transaction_data, total_count = await run_in_threadpool(
+                service.get_transaction_page,
+                selected,
                 account_id=account_id,
                 transaction_type=type,
                 from_date=from_date,
@@ -78,27 +104,11 @@ async def get_transactions(
                 limit=limit,
                 offset=offset,
                 sort_by=sort_by,
-                sort_order=sort_order
+                sort_order=sort_order,
+                columns=columns
             )
         
-        logger.info(f"Found {len(transactions)} transactions, total count: {total_count}")
-        
-        # Convert to response format
-        transaction_data = []
-        for transaction in transactions:
-            transaction_data.append({
-                "id": transaction.id,
-                "account_id": transaction.account_id,
-                "transaction_date": transaction.transaction_date.isoformat(),
-                "transaction_type": transaction.transaction_type,
-                "amount": float(transaction.amount),
-                "description": transaction.description,
-                "recipient_account": transaction.recipient_account,
-                "balance_after": float(transaction.balance_after),
-                "reference_number": transaction.reference_number,
-                "status": transaction.status,
-                "created_at": transaction.created_at.isoformat()
-            })
+        logger.info(f"Found {len(transaction_data)} transactions, total count: {total_count}")
         
         # Create pagination info
         pagination_info = {
@@ -111,7 +121,7 @@ async def get_transactions(
         }
         
         # Get account summary
-        account_summary = service.get_account_summary(account_id or 1)
+        account_summary = await run_in_threadpool(service.get_account_summary, account_id or 1)
         
         logger.info(f"Successfully returning {len(transaction_data)} transactions")
         
@@ -136,6 +146,111 @@ async def get_transactions(
         )
 
 
+@router.get("/export")
+async def export_transactions(
+    account_id: Optional[int] = Query(default=1, description="Account ID"),
+    type: Optional[str] = Query(default=None, description="Transaction type (deposit, withdrawal, transfer)"),
+    from_date: Optional[date] = Query(default=None, description="Start date filter (YYYY-MM-DD)"),
+    to_date: Optional[date] = Query(default=None, description="End date filter (YYYY-MM-DD)"),
+    format: str = Query(default="csv", pattern="^(csv|jsonl)$", description="Export format (csv, jsonl)"),
+    gzip: bool = Query(default=False, description="Gzip-compress the export"),
+):
+    """
+    Stream the full transaction history for a range as CSV or JSON Lines
+    
+    Rows are streamed oldest first from a server-side cursor, including
+    archived months in the date range, with the same formatted display
+    fields as the transaction summary. No pagination, counts or summaries.
+    """
+    logger.info(f"GET /transactions/export called with: account_id={account_id}, type={type}, from_date={from_date}, to_date={to_date}, format={format}, gzip={gzip}")
+    
+    # Validate up front: once streaming starts the status code is already sent
+    if from_date and to_date:
+        is_valid, error_msg = ValidationUtils.validate_date_range(from_date, to_date)
+        if not is_valid:
+            raise HTTPException(status_code=400, detail=error_msg)
+    
+    if type:
+        is_valid, error_msg = ValidationUtils.validate_transaction_type(type)
+        if not is_valid:
+            raise HTTPException(status_code=400, detail=error_msg)
+    
+    exporter = TransactionExporter(format, compress=gzip)
+    
+    def stream_export():
+        # The stream outlives the request handler, so it owns its session
+        db = SessionLocal()
+        try:
+            batches = TransactionService(db).iter_transaction_batches(
+                account_id=account_id,
+                transaction_type=type,
+                from_date=from_date,
+                to_date=to_date,
+                batch_size=EXPORT_BATCH_SIZE
+            )
+            yield from exporter.encode(batches)
+        finally:
+            db.close()
+    
+    filename = exporter.filename(
+        f"transactions_{account_id or 'all'}_{from_date or 'start'}_{to_date or 'latest'}"
+    )
+    return StreamingResponse(
+        stream_export(),
+        media_type=exporter.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/feed", response_model=dict)
+async def get_transaction_feed(
+    account_ids: str = Query(..., description="Comma-separated account IDs to merge"),
+    limit: int = Query(default=20, ge=1, le=100, description="Maximum number of transactions"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated transaction fields to return (default: all)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get one timeline of several accounts' transactions, newest first
+    
+    Pages with a keyset cursor instead of an offset: pass ``next_cursor``
+    from the response to get the next page. Each page merges the accounts'
+    own date-ordered streams, so its cost does not grow with history length.
+    """
+    try:
+        ids = list(dict.fromkeys(int(value) for value in account_ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="account_ids must be comma-separated integers")
+    if not ids:
+        raise HTTPException(status_code=400, detail="account_ids is required")
+    if len(ids) > MAX_FEED_ACCOUNTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_FEED_ACCOUNTS} accounts per feed")
+    
+    try:
+        selected = TRANSACTION_FIELDS.parse(fields)
+        after = decode_feed_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        transactions, next_cursor = TransactionService(db).get_feed(
+            ids,
+            limit=limit,
+            cursor=after,
+            columns=TRANSACTION_FIELDS.columns(selected) if fields else None
+        )
+        return {
+            "data": [serialize_fields(transaction, selected) for transaction in transactions],
+            "account_ids": ids,
+            "next_cursor": encode_feed_cursor(*next_cursor) if next_cursor else None,
+            "has_next": next_cursor is not None
+        }
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in get_transaction_feed: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/{transaction_id}", response_model=dict)
 async def get_transaction_detail(
     transaction_id: int,
@@ -164,10 +279,10 @@ async def get_transaction_detail(
             "status": transaction.status,
             "created_at": transaction.created_at.isoformat(),
             # Additional formatted fields for display
-            "formatted_amount": f"{transaction.amount:,.0f}원",
-            "formatted_balance": f"{transaction.balance_after:,.0f}원",
-            "formatted_date": transaction.transaction_date.strftime("%Y년 %m월 %d일 %H시 %M분"),
-            "type_icon": "↑" if transaction.transaction_type == "deposit" else "↓" if transaction.transaction_type == "withdrawal" else "→"
+            "formatted_amount": CurrencyFormatter.format_amount(transaction.amount, "won"),
+            "formatted_balance": CurrencyFormatter.format_amount(transaction.balance_after, "won"),
+            "formatted_date": DateFormatter.format_datetime(transaction.transaction_date, "detail"),
+            "type_icon": TransactionFormatter.type_icon(transaction.transaction_type)
         }
         
     except HTTPException:
@@ -3,15 +3,23 @@ Transfer API Router
 FastAPI router for transfer operations
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..database import get_db
 from ..models.schemas import TransferCreate, TransferResponse, BankResponse, TransferValidation
+from ..models.transfer import Transfer
+from ..services.transfer_executor import get_transfer_executor
 from ..services.transfer_service import TransferService
+from ..utils.fieldsets import FieldSet, serialize_fields
 
 router = APIRouter(prefix="/api/v1/transfers", tags=["transfers"])
 
+# Fields selectable with ``fields=`` on the transfer history
+TRANSFER_FIELDS = FieldSet.of_columns(Transfer, list(TransferResponse.model_fields))
+
 # Dependency injection for transfer service
 def get_transfer_service(db: Session = Depends(get_db)) -> TransferService:
     return TransferService(db)
@@ -40,13 +48,22 @@ async def create_transfer(
         print(f"Transfer data dict: {transfer_data.dict()}")
         # Determine transfer type based on to_bank_id
         if transfer_data.to_bank_id is None:
-            # Internal transfer (same bank)
-            transfer = service.create_internal_transfer(
-                from_account_id=transfer_data.from_account_id,
-                to_account_number=transfer_data.to_account_number,
-                amount=transfer_data.amount,
-                description=transfer_data.description
-            )
+            # Internal transfer (same bank), group-committed with concurrent transfers
+            executor = get_transfer_executor()
+            if executor is not None:
+                transfer = await asyncio.wrap_future(executor.submit(
+                    from_account_id=transfer_data.from_account_id,
+                    to_account_number=transfer_data.to_account_number,
+                    amount=transfer_data.amount,
+                    description=transfer_data.description
+                ))
+            else:
+                transfer = service.create_internal_transfer(
+                    from_account_id=transfer_data.from_account_id,
+                    to_account_number=transfer_data.to_account_number,
+                    amount=transfer_data.amount,
+                    description=transfer_data.description
+                )
         else:
             # External transfer - not implemented in Phase 3
             raise HTTPException(
@@ -79,6 +96,7 @@ async def get_transfers(
     status: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    fields: Optional[str] = Query(default=None, description="Comma-separated transfer fields to return (default: all)"),
     service: TransferService = Depends(get_transfer_service)
 ):
     """
@@ -89,14 +107,21 @@ async def get_transfers(
         status: Optional status filter
         limit: Maximum number of records (default: 50)
         offset: Number of records to skip (default: 0)
+        fields: Comma-separated fields; only their columns are read and returned
         service: Transfer service dependency
         
     Returns:
-        List[TransferResponse]: List of transfer records
+        List[TransferResponse]: List of transfer records (partial records with ``fields``)
         
     Raises:
         HTTPException: 400 for invalid parameters
     """
+    try:
+        selected = TRANSFER_FIELDS.parse(fields)
+    except ValueError as e:
+        # ``status`` is the status filter here, not fastapi.status
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         # Validate parameters
         if limit < 1 or limit > 100:
@@ -122,9 +147,13 @@ async def get_transfers(
             account_id=account_id,
             status=status,
             limit=limit,
-            offset=offset
+            offset=offset,
+            columns=TRANSFER_FIELDS.columns(selected) if fields else None
         )
         
+        if fields:
+            # Partial records bypass TransferResponse validation
+            return JSONResponse([serialize_fields(transfer, selected) for transfer in transfers])
         return transfers
         
     except HTTPException:
@@ -236,10 +265,32 @@ async def get_transfer_limits(
 ):
     """
     Get transfer limits for an account
-    Implementation will be added in Phase 5 (User Story 3)
+    
+    Args:
+        account_id: Account ID
+        service: Transfer service dependency
+        
+    Returns:
+        dict: Daily limit, today's usage and remaining amount, per-transfer limit
+        
+    Raises:
+        HTTPException: 404 if account not found
     """
-    # TODO: Implement in Phase 5
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Transfer limits check not implemented yet"
-    )
\ No newline at end of file
+    try:
+        limits = service.limits.get_limits(account_id)
+        
+        if limits is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Account with ID {account_id} not found"
+            )
+        
+        return limits
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve transfer limits: {str(e)}"
+        )
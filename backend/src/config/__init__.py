@@ -3,11 +3,11 @@ Configuration Module
 Centralized configuration management for Banking App Backend
 """
 
-from .settings import settings, get_settings, Settings
+from .settings import get_settings, Settings
 from .settings import DatabaseConfig, ServerConfig, SecurityConfig, APIConfig, LoggingConfig
 
+# ``src.config.settings`` is the submodule; use get_settings() for the instance
 __all__ = [
-    "settings",
     "get_settings", 
     "Settings",
     "DatabaseConfig",
@@ -15,4 +15,5 @@ __all__ = [
     "SecurityConfig",
     "APIConfig",
     "LoggingConfig"
-]
\ No newline at end of file
+]
+
@@ -7,10 +7,6 @@ import os
 from pathlib import Path
 from typing import Optional
 from functools import lru_cache
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 
 class DatabaseConfig:
@@ -64,6 +60,7 @@ class APIConfig:
         self.page_size: int = int(os.getenv("API_PAGE_SIZE", "50"))
         self.max_page_size: int = int(os.getenv("API_MAX_PAGE_SIZE", "100"))
         self.timeout: int = int(os.getenv("API_TIMEOUT", "30"))
+        self.balance_cache_size: int = int(os.getenv("BALANCE_CACHE_SIZE", "1024"))
 
 
 class LoggingConfig:
@@ -77,6 +74,74 @@ class LoggingConfig:
         self.backup_count: int = int(os.getenv("LOG_BACKUP_COUNT", "5"))
 
 
+class ArchiveConfig:
+    """Transaction archive tier settings"""
+    
+    def __init__(self, data_dir: Path):
+        self.enabled: bool = os.getenv("ARCHIVE_ENABLED", "false").lower() == "true"
+        self.hot_months: int = int(os.getenv("ARCHIVE_HOT_MONTHS", "12"))
+        self.directory: Path = Path(os.getenv("ARCHIVE_DIR", str(data_dir / "archive")))
+        self.cache_dir: Path = Path(os.getenv("ARCHIVE_CACHE_DIR", str(self.directory / "cache")))
+        self.compression_level: int = int(os.getenv("ARCHIVE_COMPRESSION_LEVEL", "6"))
+        self.batch_size: int = int(os.getenv("ARCHIVE_BATCH_SIZE", "5000"))
+
+
+class TransferConfig:
+    """Transfer execution settings"""
+    
+    def __init__(self):
+        self.group_commit: bool = os.getenv("TRANSFER_GROUP_COMMIT", "false").lower() == "true"
+        self.batch_size: int = int(os.getenv("TRANSFER_BATCH_SIZE", "64"))
+        self.batch_latency_ms: float = float(os.getenv("TRANSFER_BATCH_LATENCY_MS", "2"))
+        self.directory_refresh_seconds: float = float(os.getenv("ACCOUNT_DIRECTORY_REFRESH_SECONDS", "1.0"))
+
+
+class OutboxConfig:
+    """Transfer event outbox settings"""
+    
+    def __init__(self):
+        self.sink: str = os.getenv("OUTBOX_SINK", "")  # file:<path>, unix:<path> or queue; empty disables
+        self.consumer: str = os.getenv("OUTBOX_CONSUMER", "default")
+        self.batch_size: int = int(os.getenv("OUTBOX_BATCH_SIZE", "500"))
+        self.poll_interval: float = float(os.getenv("OUTBOX_POLL_INTERVAL", "0.5"))
+        self.ack_timeout: float = float(os.getenv("OUTBOX_ACK_TIMEOUT", "30"))  # queue sink only
+
+
+class SchedulerConfig:
+    """Background job scheduler settings"""
+    
+    def __init__(self):
+        self.enabled: bool = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+        self.tick_seconds: float = float(os.getenv("SCHEDULER_TICK_SECONDS", "1.0"))
+        self.disabled_jobs: set = {
+            name.strip() for name in os.getenv("SCHEDULER_DISABLED_JOBS", "").split(",") if name.strip()
+        }
+        self.wal_checkpoint_seconds: float = float(os.getenv("SCHEDULER_WAL_CHECKPOINT_SECONDS", "300"))
+        self.archive_seconds: float = float(os.getenv("SCHEDULER_ARCHIVE_SECONDS", "86400"))
+        self.balance_checkpoint_seconds: float = float(os.getenv("SCHEDULER_BALANCE_CHECKPOINT_SECONDS", "3600"))
+        self.directory_refresh_seconds: float = float(os.getenv("SCHEDULER_DIRECTORY_REFRESH_SECONDS", "30"))
+        self.outbox_purge_seconds: float = float(os.getenv("SCHEDULER_OUTBOX_PURGE_SECONDS", "3600"))
+
+
+class ReconciliationConfig:
+    """Balance reconciliation settings"""
+    
+    def __init__(self):
+        self.workers: int = int(os.getenv("RECONCILE_WORKERS", str(os.cpu_count() or 1)))
+        self.tolerance: float = float(os.getenv("RECONCILE_TOLERANCE", "0.01"))
+
+
+class AdmissionConfig:
+    """Admission control and load shedding settings"""
+    
+    def __init__(self, api: APIConfig):
+        self.enabled: bool = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+        self.max_concurrent: int = int(os.getenv("ADMISSION_MAX_CONCURRENT", "32"))
+        self.max_queue: int = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+        # Per-request deadline, enforced while queued and inside SQLite
+        self.deadline_seconds: float = float(os.getenv("ADMISSION_DEADLINE_SECONDS", str(api.timeout)))
+
+
 class Settings:
     """Main application settings"""
     
@@ -93,13 +158,21 @@ class Settings:
         self.security = SecurityConfig()
         self.api = APIConfig()
         self.logging = LoggingConfig()
+        self.transfer = TransferConfig()
+        self.outbox = OutboxConfig()
+        self.scheduler = SchedulerConfig()
+        self.reconciliation = ReconciliationConfig()
+        self.admission = AdmissionConfig(self.api)
         
         # File paths
         self.base_dir = Path(__file__).resolve().parent.parent.parent
         self.data_dir = self.base_dir / "data"
         self.logs_dir = self.base_dir / "logs"
         
-        # Ensure directories exist
+        self.archive = ArchiveConfig(self.data_dir)
+    
+    def ensure_directories(self) -> None:
+        """Create data and log directories (called on application startup)"""
         self.data_dir.mkdir(exist_ok=True)
         self.logs_dir.mkdir(exist_ok=True)
     
@@ -121,9 +194,21 @@ class Settings:
 
 @lru_cache()
 def get_settings() -> Settings:
-    """Get cached settings instance"""
+    """
+    Get cached settings instance
+    
+    The .env file is loaded on first call rather than at import time so that
+    worker processes only pay for it once they actually read configuration.
+    """
+    from dotenv import load_dotenv
+    
+    # Load environment variables from .env file
+    load_dotenv()
     return Settings()
 
 
-# Global settings instance
-settings = get_settings()
\ No newline at end of file
+def __getattr__(name: str):
+    """Materialize the global ``settings`` instance on first access"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,6 +2,22 @@
 Data management module for sample data generation and database seeding
 """
 
+from importlib import import_module
+
 from .seed_data import SampleDataGenerator
 
-__all__ = ["SampleDataGenerator"]
\ No newline at end of file
+# Names resolved on first access: the bulk generator pulls in multiprocessing
+# and SQLAlchemy's engine machinery, which only the load-testing CLI needs
+_LAZY_ATTRIBUTES = {
+    "BulkDataGenerator": ".bulk_generator",
+}
+
+__all__ = ["SampleDataGenerator", "BulkDataGenerator"]
+
+
+def __getattr__(name: str):
+    """Import lazily exported attributes on first use"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
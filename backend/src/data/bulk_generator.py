@@ -0,0 +1,430 @@
+"""
+Bulk Synthetic Data Generator
+Produces production-sized account and transaction datasets for load testing
+
+Usage:
+    python -m src.data.bulk_generator --accounts 100000 --transactions 50000000 \
+        --workers 8 --seed 42 --database-url sqlite:///./loadtest.db
+"""
+
+import argparse
+import logging
+import random
+import time
+from collections import deque
+from datetime import date, datetime, time as dt_time, timedelta
+from multiprocessing import Pool
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+
+from .seed_data import SampleDataGenerator
+
+logger = logging.getLogger(__name__)
+
+# Korean descriptions are shared with the small sample data generator
+TRANSACTION_DESCRIPTIONS = SampleDataGenerator().transaction_descriptions
+ACCOUNT_TYPES = ["checking", "savings", "investment"]
+
+# Relative frequency of each transaction type in generated histories
+TRANSACTION_TYPE_WEIGHTS = [("deposit", 30), ("withdrawal", 50), ("transfer", 20)]
+
+# Column order of generated rows (rows are tuples to keep pickling and executemany cheap)
+ACCOUNT_COLUMNS = (
+    "id", "account_number", "account_name", "account_type", "balance", "created_at", "updated_at"
+)
+TRANSACTION_COLUMNS = (
+    "account_id", "transaction_type", "amount", "description", "recipient_account",
+    "transaction_date", "balance_after", "reference_number", "status", "created_at"
+)
+
+ShardResult = Tuple[List[tuple], List[tuple]]
+
+
+def _sqlite_datetime(value: datetime) -> str:
+    """Format a datetime the way SQLAlchemy stores DateTime columns in SQLite"""
+    return value.isoformat(" ", "microseconds")
+
+
+def _account_number(account_id: int) -> str:
+    """Build a unique XXXX-XXXX-XXXX account number from the account ID"""
+    digits = f"{300000000000 + account_id:012d}"
+    return f"{digits[:4]}-{digits[4:8]}-{digits[8:]}"
+
+
+def _generate_amount(rng: random.Random, transaction_type: str) -> float:
+    """Generate a realistic whole-won amount for the transaction type"""
+    if transaction_type == "deposit":
+        if rng.random() < 0.1:  # 10% chance of salary deposit
+            return float(rng.randint(2500000, 4000000))
+        return float(rng.randint(10000, 500000))
+    if transaction_type == "withdrawal":
+        return float(rng.randint(5000, 200000))
+    return float(rng.randint(50000, 1000000))
+
+
+def generate_account_history(
+    seed: int,
+    account_id: int,
+    transaction_count: int,
+    end_date: date,
+    days: int,
+    sqlite_dates: bool = False,
+    chunk_size: int = 50000
+) -> Iterator[ShardResult]:
+    """
+    Generate one account and its full transaction history in chunks
+
+    The random stream is derived from (seed, account_id) only, so output is
+    identical regardless of how accounts are sharded across worker processes.
+    Amounts are whole won and withdrawals never overdraw, so every row's
+    ``balance_after`` equals the previous row's plus or minus its amount.
+    Only the sorted transaction offsets are held for the whole history; rows
+    are built ``chunk_size`` at a time.
+
+    Args:
+        seed: Global dataset seed
+        account_id: ID the account row will be inserted with
+        transaction_count: Number of transactions to generate for the account
+        end_date: Last day of the generated history
+        days: Length of the generated history in days
+        sqlite_dates: Emit dates pre-formatted as SQLite DateTime text
+        chunk_size: Most transaction rows per yielded chunk
+
+    Yields:
+        Tuples of (account rows, transaction rows ordered by date) as tuples in
+        ``ACCOUNT_COLUMNS`` / ``TRANSACTION_COLUMNS`` order. The account row,
+        which carries the closing balance, comes with the last chunk.
+    """
+    rng = random.Random(f"{seed}:{account_id}")
+    period_end = datetime.combine(end_date, dt_time.max).replace(microsecond=0)
+    period_seconds = days * 86400
+    chunk_size = max(chunk_size, 1)
+
+    offsets = sorted(rng.randrange(period_seconds) for _ in range(transaction_count))
+    types = [t for t, _ in TRANSACTION_TYPE_WEIGHTS]
+    weights = [w for _, w in TRANSACTION_TYPE_WEIGHTS]
+
+    opening_balance = float(rng.randint(100, 5000) * 1000)
+    balance = opening_balance
+    transactions = []
+    last_date = None
+
+    for sequence, offset in enumerate(offsets):
+        transaction_type = rng.choices(types, weights)[0]
+        amount = _generate_amount(rng, transaction_type)
+        if transaction_type != "deposit" and amount > balance:
+            # Never overdraw: turn the debit into a deposit to keep the chain valid
+            transaction_type = "deposit"
+
+        if transaction_type == "deposit":
+            balance += amount
+        else:
+            balance -= amount
+
+        transaction_date = period_end - timedelta(seconds=period_seconds - 1 - offset)
+        if sqlite_dates:
+            transaction_date = _sqlite_datetime(transaction_date)
+        last_date = transaction_date
+        transactions.append((
+            account_id,
+            transaction_type,
+            amount,
+            rng.choice(TRANSACTION_DESCRIPTIONS[transaction_type]),
+            (
+                f"2002-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}"
+                if transaction_type == "transfer" else None
+            ),
+            transaction_date,
+            balance,
+            f"BLK{account_id:09d}{sequence:08d}",
+            "completed",
+            transaction_date,
+        ))
+        if len(transactions) >= chunk_size and sequence < transaction_count - 1:
+            yield [], transactions
+            transactions = []
+
+    created_at = period_end - timedelta(days=days + rng.randint(1, 365))
+    if sqlite_dates:
+        created_at = _sqlite_datetime(created_at)
+    account = (
+        account_id,
+        _account_number(account_id),
+        f"부하테스트 계좌 {account_id}",
+        ACCOUNT_TYPES[account_id % len(ACCOUNT_TYPES)],
+        balance,
+        created_at,
+        last_date if last_date is not None else created_at,
+    )
+    yield [account], transactions
+
+
+def iter_shard(
+    seed: int,
+    accounts: List[Tuple[int, int]],
+    end_date: date,
+    days: int,
+    sqlite_dates: bool = False,
+    chunk_size: int = 50000
+) -> Iterator[ShardResult]:
+    """
+    Generate rows for a shard of accounts in batches of about ``chunk_size`` transactions
+
+    Args:
+        seed: Global dataset seed
+        accounts: List of (account_id, transaction_count) pairs
+        end_date: Last day of the generated history
+        days: Length of the generated history in days
+        sqlite_dates: Emit dates pre-formatted as SQLite DateTime text
+        chunk_size: Transaction rows after which a batch is yielded
+
+    Yields:
+        Tuples of (account rows, transaction rows)
+    """
+    account_rows: List[tuple] = []
+    transaction_rows: List[tuple] = []
+    for account_id, transaction_count in accounts:
+        for account, transactions in generate_account_history(
+            seed, account_id, transaction_count, end_date, days, sqlite_dates, chunk_size
+        ):
+            account_rows.extend(account)
+            transaction_rows.extend(transactions)
+            if len(transaction_rows) >= chunk_size:
+                yield account_rows, transaction_rows
+                account_rows, transaction_rows = [], []
+    if account_rows or transaction_rows:
+        yield account_rows, transaction_rows
+
+
+def generate_shard(
+    seed: int,
+    accounts: List[Tuple[int, int]],
+    end_date: date,
+    days: int,
+    sqlite_dates: bool = False
+) -> ShardResult:
+    """
+    Generate every row of a shard of accounts (process pool task)
+
+    Args:
+        seed: Global dataset seed
+        accounts: List of (account_id, transaction_count) pairs
+        end_date: Last day of the generated history
+        days: Length of the generated history in days
+        sqlite_dates: Emit dates pre-formatted as SQLite DateTime text
+
+    Returns:
+        Tuple of (account rows, transaction rows)
+    """
+    account_rows: List[tuple] = []
+    transaction_rows: List[tuple] = []
+    for accounts_batch, transactions_batch in iter_shard(seed, accounts, end_date, days, sqlite_dates):
+        account_rows.extend(accounts_batch)
+        transaction_rows.extend(transactions_batch)
+    return account_rows, transaction_rows
+
+
+class BulkDataGenerator:
+    """Generate and load large synthetic datasets in chunks"""
+
+    def __init__(
+        self,
+        accounts: int,
+        transactions: int,
+        seed: int = 42,
+        days: int = 365,
+        end_date: Optional[date] = None,
+        chunk_size: int = 50000,
+        workers: int = 1
+    ):
+        if accounts < 1:
+            raise ValueError("accounts must be at least 1")
+        if transactions < 0:
+            raise ValueError("transactions must not be negative")
+
+        self.accounts = accounts
+        self.transactions = transactions
+        self.seed = seed
+        self.days = max(days, 1)
+        self.end_date = end_date or date.today()
+        self.chunk_size = max(chunk_size, 1)
+        self.workers = max(workers, 1)
+
+    def transaction_count_for(self, account_index: int) -> int:
+        """Number of transactions assigned to the n-th generated account"""
+        base, remainder = divmod(self.transactions, self.accounts)
+        return base + (1 if account_index < remainder else 0)
+
+    def iter_shards(self, first_account_id: int) -> Iterator[List[Tuple[int, int]]]:
+        """
+        Split accounts into shards of roughly ``chunk_size`` transactions
+
+        Args:
+            first_account_id: ID assigned to the first generated account
+
+        Yields:
+            Lists of (account_id, transaction_count) pairs
+        """
+        per_account = max(self.transactions // self.accounts, 1)
+        accounts_per_shard = max(self.chunk_size // per_account, 1)
+
+        shard: List[Tuple[int, int]] = []
+        for index in range(self.accounts):
+            shard.append((first_account_id + index, self.transaction_count_for(index)))
+            if len(shard) >= accounts_per_shard:
+                yield shard
+                shard = []
+        if shard:
+            yield shard
+
+    def iter_generated(self, first_account_id: int, sqlite_dates: bool = False) -> Iterator[ShardResult]:
+        """
+        Generate shards in order, optionally across a process pool
+
+        In this process rows are streamed in ``chunk_size`` batches, even
+        within one account's history. Pool workers return whole shards, of
+        about ``chunk_size`` transactions or a single account; at most
+        ``2 * workers`` shards are in flight, so memory stays bounded when
+        inserting is slower than generating.
+        """
+        shards = self.iter_shards(first_account_id)
+        if self.workers == 1:
+            for shard in shards:
+                yield from iter_shard(self.seed, shard, self.end_date, self.days, sqlite_dates, self.chunk_size)
+            return
+
+        with Pool(self.workers) as pool:
+            pending: deque = deque()
+            for shard in shards:
+                pending.append(pool.apply_async(
+                    generate_shard, (self.seed, shard, self.end_date, self.days, sqlite_dates)
+                ))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+    def load(self, engine: Engine) -> Dict[str, Any]:
+        """
+        Generate the dataset and stream it into the database
+
+        Args:
+            engine: Target database engine (tables must already exist)
+
+        Returns:
+            Dictionary with load statistics
+        """
+        from ..models.database_models import Account, Transaction
+
+        account_table = Account.__table__
+        transaction_table = Transaction.__table__
+        is_sqlite = engine.dialect.name == "sqlite"
+        started = time.perf_counter()
+        inserted_accounts = 0
+        inserted_transactions = 0
+
+        insert_accounts = insert_transactions = None
+        if is_sqlite:
+            # Plain executemany over tuples; dates are pre-formatted by the generators
+            insert_accounts = str(account_table.insert().compile(
+                dialect=engine.dialect, column_keys=list(ACCOUNT_COLUMNS)
+            ))
+            insert_transactions = str(transaction_table.insert().compile(
+                dialect=engine.dialect, column_keys=list(TRANSACTION_COLUMNS)
+            ))
+
+        def insert_rows(conn, table, sql, columns, rows) -> None:
+            if not rows:
+                # Batches in the middle of a long history carry no account row
+                return
+            if is_sqlite:
+                conn.exec_driver_sql(sql, rows)
+            else:
+                conn.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+
+        with engine.connect() as conn:
+            previous_synchronous = None
+            if is_sqlite:
+                # Generated data is reproducible, so trade durability for load speed
+                previous_synchronous = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+                conn.exec_driver_sql("PRAGMA synchronous=OFF")
+
+            first_account_id = (conn.execute(select(func.max(account_table.c.id))).scalar() or 0) + 1
+            logger.info(
+                f"Generating {self.accounts} accounts / {self.transactions} transactions "
+                f"starting at account id {first_account_id}"
+            )
+
+            for account_rows, transaction_rows in self.iter_generated(first_account_id, is_sqlite):
+                insert_rows(conn, account_table, insert_accounts, ACCOUNT_COLUMNS, account_rows)
+                for start in range(0, len(transaction_rows), self.chunk_size):
+                    chunk = transaction_rows[start:start + self.chunk_size]
+                    insert_rows(conn, transaction_table, insert_transactions, TRANSACTION_COLUMNS, chunk)
+                    conn.commit()
+                conn.commit()
+
+                inserted_accounts += len(account_rows)
+                inserted_transactions += len(transaction_rows)
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    f"Loaded {inserted_accounts}/{self.accounts} accounts, "
+                    f"{inserted_transactions}/{self.transactions} transactions "
+                    f"({inserted_transactions / elapsed if elapsed else 0:,.0f} rows/s)"
+                )
+
+            if previous_synchronous is not None:
+                conn.exec_driver_sql(f"PRAGMA synchronous={int(previous_synchronous)}")
+
+        elapsed = time.perf_counter() - started
+        return {
+            "accounts": inserted_accounts,
+            "transactions": inserted_transactions,
+            "first_account_id": first_account_id,
+            "seed": self.seed,
+            "elapsed_seconds": round(elapsed, 3),
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point for bulk data generation"""
+    parser = argparse.ArgumentParser(description="Generate bulk synthetic banking data")
+    parser.add_argument("--accounts", type=int, default=1000, help="Number of accounts")
+    parser.add_argument("--transactions", type=int, default=100000, help="Total number of transactions")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible datasets")
+    parser.add_argument("--days", type=int, default=365, help="Length of generated history in days")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None,
+                        help="Last day of generated history (YYYY-MM-DD, default: today)")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Rows per insert batch")
+    parser.add_argument("--workers", type=int, default=1, help="Generator processes (account shards)")
+    parser.add_argument("--database-url", default=None,
+                        help="Target database URL (default: DATABASE_URL setting)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    from ..database.connection import Base, get_engine
+    from ..models import database_models  # noqa: F401 - register tables
+
+    engine = create_engine(args.database_url) if args.database_url else get_engine()
+    Base.metadata.create_all(bind=engine)
+
+    generator = BulkDataGenerator(
+        accounts=args.accounts,
+        transactions=args.transactions,
+        seed=args.seed,
+        days=args.days,
+        end_date=args.end_date,
+        chunk_size=args.chunk_size,
+        workers=args.workers
+    )
+    stats = generator.load(engine)
+    print(
+        f"✅ Loaded {stats['accounts']:,} accounts and {stats['transactions']:,} transactions "
+        f"in {stats['elapsed_seconds']:.1f}s (seed={stats['seed']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
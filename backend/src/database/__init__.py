@@ -3,16 +3,36 @@ Database connection and configuration
 SQLite setup for Banking App transaction history
 """
 
-from .connection import Base, SessionLocal, engine, get_db, create_tables, drop_tables
-from .crud import (
-    get_account_by_number, get_account_by_id,
-    get_transactions_by_account, get_transaction_by_id,
-    get_all_categories, get_category_by_name
-)
+from importlib import import_module
+
+from .connection import Base, SessionLocal, get_engine, get_db, create_tables, drop_tables
+
+# Names resolved on first access: the engine is created lazily and the CRUD
+# helpers pull in the Pydantic schemas, which most request paths never need
+_LAZY_ATTRIBUTES = {
+    "engine": ".connection",
+    "get_account_by_number": ".crud",
+    "get_account_by_id": ".crud",
+    "get_transactions_by_account": ".crud",
+    "get_transaction_by_id": ".crud",
+    "get_all_categories": ".crud",
+    "get_category_by_name": ".crud",
+    "TransactionArchive": ".archive",
+    "archive_cold_months": ".archive",
+}
 
 __all__ = [
-    "Base", "SessionLocal", "engine", "get_db", "create_tables", "drop_tables",
+    "Base", "SessionLocal", "engine", "get_engine", "get_db", "create_tables", "drop_tables",
     "get_account_by_number", "get_account_by_id",
     "get_transactions_by_account", "get_transaction_by_id", 
-    "get_all_categories", "get_category_by_name"
-]
\ No newline at end of file
+    "get_all_categories", "get_category_by_name",
+    "TransactionArchive", "archive_cold_months"
+]
+
+
+def __getattr__(name: str):
+    """Import lazily exported attributes on first use"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
\ No newline at end of file
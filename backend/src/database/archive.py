@@ -0,0 +1,590 @@
+"""
+Transaction Archive Tier
+Moves cold months of transaction history into compressed, read-only monthly
+SQLite files and serves date-ranged reads from them on demand
+
+Usage:
+    python -m src.database.archive                      # archive months older than ARCHIVE_HOT_MONTHS
+    python -m src.database.archive --hot-months 6 --dry-run
+"""
+
+import argparse
+import gzip
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+from sqlalchemy import MetaData, Table, and_, create_engine, delete, func, insert, select, true
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..config.settings import get_settings
+from ..models.database_models import Transaction, TransactionPartition, TransactionPartitionCount
+
+logger = logging.getLogger(__name__)
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Read-only engines over decompressed archive files, shared per process
+_archive_engines = {}
+_archive_lock = threading.Lock()
+
+# Filtered row counts of archive files, keyed by file checksum: a file never
+# changes under its checksum, so a count stays valid until the month is rewritten
+_FILE_COUNT_CACHE_SIZE = 4096
+_file_counts: "OrderedDict[tuple, int]" = OrderedDict()
+
+
+def month_start(value: Union[date, datetime]) -> datetime:
+    """First instant of the month containing ``value``"""
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """First instant of the month ``months`` after the month of ``value``"""
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _file_checksum(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _add_missing_columns(path: Path, table: Table) -> None:
+    """Bring an archive file's transactions table up to ``table``'s columns"""
+    conn = sqlite3.connect(path)
+    try:
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(transactions)")}
+        for column in table.columns:
+            if column.name not in existing:
+                column_type = column.type.compile(dialect=sqlite_dialect.dialect())
+                conn.execute(f"ALTER TABLE transactions ADD COLUMN {column.name} {column_type}")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class TransactionArchive:
+    """
+    Registry and query router for archived monthly transaction partitions
+
+    Each archived month is a standalone SQLite file holding that month's rows
+    of the ``transactions`` table, gzip-compressed and made read-only. Reads
+    decompress a month once into the cache directory and open it with
+    ``mode=ro``. Row counts per account and type are kept in the hot database
+    (``transaction_partition_counts``), so totals do not open archive files.
+    With ``ARCHIVE_ENABLED=false`` the tier is off and readers never query
+    the registry.
+
+    Args:
+        db: Session on the hot database (partition registry and live rows)
+        directory: Archive directory (default: ARCHIVE_DIR setting)
+        cache_dir: Decompressed archive cache (default: ARCHIVE_CACHE_DIR setting)
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        directory: Optional[Path] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        config = get_settings().archive
+        self.db = db
+        self.enabled = config.enabled
+        self.directory = Path(directory or config.directory)
+        self.cache_dir = Path(cache_dir or config.cache_dir)
+
+    def partitions_for_range(
+        self,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None
+    ) -> List[TransactionPartition]:
+        """
+        Get archived partitions overlapping a date range
+
+        Args:
+            from_date: Inclusive start date (None for unbounded)
+            to_date: Inclusive end date (None for unbounded)
+
+        Returns:
+            Matching partitions, newest month first (none while the tier is disabled)
+        """
+        if not self.enabled:
+            return []
+
+        query = self.db.query(TransactionPartition)
+
+        if from_date:
+            query = query.filter(
+                TransactionPartition.period_end > datetime.combine(from_date, datetime.min.time())
+            )
+
+        if to_date:
+            query = query.filter(
+                TransactionPartition.period_start <= datetime.combine(to_date, datetime.max.time())
+            )
+
+        return query.order_by(TransactionPartition.period_start.desc()).all()
+
+    @contextmanager
+    def session(self, partition: TransactionPartition) -> Iterator[Session]:
+        """
+        Open a read-only session on an archived partition
+
+        Args:
+            partition: Registry entry of the month to read
+
+        Yields:
+            Session bound to the decompressed archive file
+        """
+        db = Session(bind=self._engine_for(partition))
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def count(self, account_id: Optional[int] = None, transaction_type: Optional[str] = None,
+              from_date: Optional[date] = None, to_date: Optional[date] = None) -> int:
+        """
+        Count archived transactions of an account and type in a date range
+
+        Args:
+            account_id: Account filter (None for every account)
+            transaction_type: Type filter (None for every type)
+            from_date: Inclusive start date (None for unbounded)
+            to_date: Inclusive end date (None for unbounded)
+
+        Returns:
+            int: Matching rows over every archived partition in range
+        """
+        partitions = self.partitions_for_range(from_date, to_date)
+        filters = []
+        if account_id:
+            filters.append(Transaction.account_id == account_id)
+        if transaction_type:
+            filters.append(Transaction.transaction_type == transaction_type)
+        if from_date:
+            filters.append(Transaction.transaction_date >= from_date)
+        if to_date:
+            filters.append(Transaction.transaction_date <= datetime.combine(to_date, datetime.max.time()))
+        return sum(self.partition_counts(partitions, filters, account_id, transaction_type, from_date, to_date))
+
+    def partition_counts(self, partitions: Sequence[TransactionPartition], filters: Sequence,
+                         account_id: Optional[int] = None, transaction_type: Optional[str] = None,
+                         from_date: Optional[date] = None, to_date: Optional[date] = None,
+                         stored: bool = True) -> List[int]:
+        """
+        Rows matching ``filters`` in each partition
+
+        With ``stored``, ``filters`` must be exactly the account, type and
+        date filters given as arguments: months wholly inside the date range
+        are then answered from ``transaction_partition_counts`` in one query.
+        Months cut by the range, and any partition for other filters (search
+        terms), are counted from their files once per file version.
+
+        Args:
+            partitions: Partitions to count
+            filters: Filter expressions on Transaction
+            account_id: Account filter included in ``filters``
+            transaction_type: Type filter included in ``filters``
+            from_date: Start date included in ``filters``
+            to_date: End date included in ``filters``
+            stored: Whether ``filters`` may be answered from stored counts
+
+        Returns:
+            Counts in ``partitions`` order
+        """
+        whole = []
+        if stored:
+            range_start = datetime.combine(from_date, datetime.min.time()) if from_date else None
+            range_end = datetime.combine(to_date + timedelta(days=1), datetime.min.time()) if to_date else None
+            whole = [
+                partition.month for partition in partitions
+                if (range_start is None or partition.period_start >= range_start)
+                and (range_end is None or partition.period_end <= range_end)
+            ]
+        stored_counts = self._stored_counts(whole, account_id, transaction_type) if whole else {}
+        return [
+            stored_counts.get(partition.month, 0) if partition.month in whole
+            else self._file_count(partition, filters)
+            for partition in partitions
+        ]
+
+    def _stored_counts(self, months: Sequence[str], account_id: Optional[int],
+                       transaction_type: Optional[str]) -> Dict[str, int]:
+        query = (
+            self.db.query(TransactionPartitionCount.month, func.sum(TransactionPartitionCount.row_count))
+            .filter(TransactionPartitionCount.month.in_(months))
+            .group_by(TransactionPartitionCount.month)
+        )
+        if account_id:
+            query = query.filter(TransactionPartitionCount.account_id == account_id)
+        if transaction_type:
+            query = query.filter(TransactionPartitionCount.transaction_type == transaction_type)
+        return dict(query.all())
+
+    def _file_count(self, partition: TransactionPartition, filters: Sequence) -> int:
+        statement = select(func.count(Transaction.id)).where(and_(true(), *filters)).compile(
+            dialect=sqlite_dialect.dialect()
+        )
+        key = (partition.checksum, statement.string, tuple(sorted(statement.params.items(), key=repr)))
+        with _archive_lock:
+            if key in _file_counts:
+                _file_counts.move_to_end(key)
+                return _file_counts[key]
+
+        with self.session(partition) as archive_db:
+            total = archive_db.query(func.count(Transaction.id)).filter(*filters).scalar()
+
+        with _archive_lock:
+            _file_counts[key] = total
+            while len(_file_counts) > _FILE_COUNT_CACHE_SIZE:
+                _file_counts.popitem(last=False)
+        return total
+
+    def local_path(self, partition: TransactionPartition) -> Path:
+        """
+        Decompressed, read-only copy of an archived partition
+
+        For readers that open archive files directly (``sqlite3`` workers).
+        """
+        base_name = partition.archive_path.removesuffix(".gz")
+        # The checksum is part of the cache name so a re-archived month is never
+        # served from a stale decompressed copy
+        cache_path = self.cache_dir / f"{base_name}.{partition.checksum[:12]}"
+
+        with _archive_lock:
+            if not cache_path.exists():
+                self._materialize(partition, cache_path)
+                self._evict_stale(base_name, cache_path)
+        return cache_path
+
+    def _engine_for(self, partition: TransactionPartition) -> Engine:
+        cache_path = self.local_path(partition)
+
+        with _archive_lock:
+            engine = _archive_engines.get(cache_path)
+            if engine is None:
+                engine = create_engine(
+                    f"sqlite:///file:{cache_path.resolve()}?mode=ro&uri=true",
+                    connect_args={"check_same_thread": False}
+                )
+                _archive_engines[cache_path] = engine
+        return engine
+
+    def _evict_stale(self, base_name: str, current: Path) -> None:
+        """Drop decompressed copies of earlier versions of the same month"""
+        for stale in self.cache_dir.glob(f"{base_name}.*"):
+            if stale == current or stale.suffix == ".tmp":
+                continue
+            engine = _archive_engines.pop(stale, None)
+            if engine is not None:
+                engine.dispose()
+            stale.unlink(missing_ok=True)
+
+    def _materialize(self, partition: TransactionPartition, target: Path) -> None:
+        """Verify and decompress an archive file to ``target``"""
+        source = self.directory / partition.archive_path
+        if _file_checksum(source) != partition.checksum:
+            raise ValueError(f"Archive checksum mismatch for {partition.month}: {source}")
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(target.name + ".tmp")
+        with gzip.open(source, "rb") as src, open(tmp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+        # Archives written before a schema change still map onto the current model
+        _add_missing_columns(tmp_path, Transaction.__table__)
+        os.replace(tmp_path, target)
+        logger.info(f"Decompressed archive {partition.month} to {target}")
+
+    def archive_month(
+        self,
+        month: Union[date, datetime],
+        batch_size: Optional[int] = None,
+        compression_level: Optional[int] = None
+    ) -> Optional[TransactionPartition]:
+        """
+        Move one month of transactions from the hot table into its archive file
+
+        Rows are copied into a fresh SQLite file, verified, compressed and
+        registered; only then are they deleted from the hot table, in the same
+        commit as the registry update. Rows that land in an already archived
+        month are merged into a rebuilt archive.
+
+        Args:
+            month: Any date within the month to archive
+            batch_size: Rows per copy batch (default: ARCHIVE_BATCH_SIZE setting)
+            compression_level: gzip level (default: ARCHIVE_COMPRESSION_LEVEL setting)
+
+        Returns:
+            Updated partition entry, or None if the month has no hot rows
+
+        Raises:
+            ValueError: If the archive tier is disabled, as its rows would disappear from reads
+        """
+        if not self.enabled:
+            raise ValueError("Transaction archive is disabled; set ARCHIVE_ENABLED=true to archive months")
+
+        config = get_settings().archive
+        batch_size = batch_size or config.batch_size
+        compression_level = compression_level or config.compression_level
+
+        start = month_start(month)
+        end = add_months(start, 1)
+        label = start.strftime("%Y-%m")
+
+        # Reflect the physical table so columns added by migrations are archived too
+        hot_table = Table("transactions", MetaData(), autoload_with=self.db.connection())
+        window = and_(hot_table.c.transaction_date >= start, hot_table.c.transaction_date < end)
+
+        hot_rows = self.db.execute(select(func.count()).select_from(hot_table).where(window)).scalar()
+        if not hot_rows:
+            return None
+
+        existing = self.db.query(TransactionPartition).filter(TransactionPartition.month == label).first()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        archive_name = f"transactions_{start:%Y_%m}.db.gz"
+        build_path = self.directory / f"transactions_{start:%Y_%m}.db.building"
+        build_path.unlink(missing_ok=True)
+
+        if existing:
+            self._materialize(existing, build_path)
+            _add_missing_columns(build_path, hot_table)
+
+        build_engine = create_engine(f"sqlite:///{build_path}")
+        copied, max_id = 0, 0
+        try:
+            archive_table = hot_table.to_metadata(MetaData())
+            archive_table.create(build_engine, checkfirst=True)
+
+            rows = self.db.execute(
+                select(hot_table).where(window).order_by(hot_table.c.id),
+                execution_options={"yield_per": batch_size}
+            )
+            with build_engine.begin() as conn:
+                for batch in rows.partitions():
+                    conn.execute(insert(archive_table), [dict(row._mapping) for row in batch])
+                    copied += len(batch)
+                    max_id = batch[-1].id
+
+            with build_engine.connect() as conn:
+                archived_rows = conn.execute(select(func.count()).select_from(archive_table)).scalar()
+                conn.exec_driver_sql("VACUUM")
+        finally:
+            build_engine.dispose()
+
+        expected_rows = copied + (existing.row_count if existing else 0)
+        if archived_rows != expected_rows:
+            build_path.unlink(missing_ok=True)
+            raise ValueError(
+                f"Archive verification failed for {label}: expected {expected_rows} rows, found {archived_rows}"
+            )
+
+        partition = existing or TransactionPartition(month=label, period_start=start, period_end=end)
+        self._publish(partition, build_path, archive_name, archived_rows, compression_level)
+
+        # Only delete what was copied; rows inserted meanwhile get the next run
+        self.db.execute(hot_table.delete().where(and_(window, hot_table.c.id <= max_id)))
+        self.db.commit()
+
+        logger.info(f"Archived {copied} transactions for {label} ({partition.size_bytes} bytes)")
+        return partition
+
+    def rewrite(
+        self,
+        partition: TransactionPartition,
+        apply: Callable[[sqlite3.Connection], int],
+        compression_level: Optional[int] = None
+    ) -> int:
+        """
+        Change rows of an archived month in place
+
+        The month is decompressed into a build file, ``apply`` runs on it and
+        commits, and the result is compressed and registered like a newly
+        archived month. The old file is replaced only if ``apply`` changed
+        rows. Readers keep their decompressed copy of the previous version
+        until the new checksum reaches them.
+
+        Args:
+            partition: Registry entry of the month to change
+            apply: Updates the ``transactions`` table of an open connection, returns rows changed
+            compression_level: gzip level (default: ARCHIVE_COMPRESSION_LEVEL setting)
+
+        Returns:
+            int: Rows changed
+        """
+        compression_level = compression_level or get_settings().archive.compression_level
+        archive_name = partition.archive_path
+        build_path = self.directory / f"{archive_name.removesuffix('.gz')}.building"
+        build_path.unlink(missing_ok=True)
+        self._materialize(partition, build_path)
+
+        conn = sqlite3.connect(build_path)
+        try:
+            changed = apply(conn)
+            conn.commit()
+            row_count = conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        finally:
+            conn.close()
+
+        if not changed:
+            build_path.unlink()
+            return 0
+
+        self._publish(partition, build_path, archive_name, row_count, compression_level)
+        self.db.commit()
+        logger.info(f"Rewrote {changed} archived transactions in {partition.month}")
+        return changed
+
+    def _publish(self, partition: TransactionPartition, build_path: Path, archive_name: str,
+                 row_count: int, compression_level: int) -> None:
+        """Compress a built month file into place and update its registry entry and counts (not committed)"""
+        self.record_counts(partition.month, build_path)
+
+        archive_path = self.directory / archive_name
+        tmp_path = self.directory / f"{archive_name}.tmp"
+        with open(build_path, "rb") as src, gzip.open(tmp_path, "wb", compresslevel=compression_level) as dst:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, archive_path)
+        build_path.unlink()
+
+        partition.row_count = row_count
+        partition.archive_path = archive_name
+        partition.size_bytes = archive_path.stat().st_size
+        partition.checksum = _file_checksum(archive_path)
+        partition.archived_at = datetime.now()
+        self.db.add(partition)
+
+    def record_counts(self, month: str, path: Path) -> int:
+        """
+        Replace a month's rows in ``transaction_partition_counts`` with the counts of a month file (not committed)
+
+        Args:
+            month: ``YYYY-MM`` of the partition
+            path: Uncompressed month file
+
+        Returns:
+            int: Count rows written
+        """
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = conn.execute(
+                "SELECT account_id, transaction_type, COUNT(*) FROM transactions GROUP BY account_id, transaction_type"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        self.db.execute(delete(TransactionPartitionCount).where(TransactionPartitionCount.month == month))
+        if rows:
+            self.db.execute(insert(TransactionPartitionCount), [
+                {"month": month, "account_id": account_id, "transaction_type": transaction_type, "row_count": count}
+                for account_id, transaction_type, count in rows
+            ])
+        return len(rows)
+
+    def cold_months(self, hot_months: int, now: Optional[datetime] = None) -> List[datetime]:
+        """
+        Get months with hot rows older than the retention window
+
+        Args:
+            hot_months: Number of recent months (including the current one) kept hot
+            now: Reference time (default: now)
+
+        Returns:
+            Month start datetimes, oldest first
+        """
+        cutoff = add_months(month_start(now or datetime.now()), -(hot_months - 1))
+        oldest = (
+            self.db.query(func.min(Transaction.transaction_date))
+            .filter(Transaction.transaction_date < cutoff)
+            .scalar()
+        )
+        if oldest is None:
+            return []
+
+        months = []
+        current = month_start(oldest)
+        while current < cutoff:
+            months.append(current)
+            current = add_months(current, 1)
+        return months
+
+
+def archive_cold_months(
+    db: Session,
+    hot_months: Optional[int] = None,
+    dry_run: bool = False
+) -> List[TransactionPartition]:
+    """
+    Archive every month that has fallen out of the hot retention window
+
+    Args:
+        db: Session on the hot database
+        hot_months: Months to keep hot (default: ARCHIVE_HOT_MONTHS setting)
+        dry_run: Only report the months that would be archived
+
+    Returns:
+        Partitions created or updated
+    """
+    archive = TransactionArchive(db)
+    months = archive.cold_months(hot_months or get_settings().archive.hot_months)
+
+    if dry_run:
+        for month in months:
+            logger.info(f"Would archive {month:%Y-%m}")
+        return []
+
+    partitions = []
+    for month in months:
+        partition = archive.archive_month(month)
+        if partition is not None:
+            partitions.append(partition)
+    return partitions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point for the archival job"""
+    parser = argparse.ArgumentParser(description="Move cold transaction months into compressed archive files")
+    parser.add_argument("--hot-months", type=int, default=None,
+                        help="Recent months kept in the hot table (default: ARCHIVE_HOT_MONTHS setting)")
+    parser.add_argument("--dry-run", action="store_true", help="List months without archiving them")
+    parser.add_argument("--database-url", default=None,
+                        help="Database URL (default: DATABASE_URL setting)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    from .connection import SessionLocal, get_engine
+
+    engine = create_engine(args.database_url) if args.database_url else get_engine()
+    TransactionPartition.__table__.create(bind=engine, checkfirst=True)
+    TransactionPartitionCount.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal(bind=engine)
+    try:
+        partitions = archive_cold_months(db, args.hot_months, args.dry_run)
+    finally:
+        db.close()
+
+    for partition in partitions:
+        print(f"✅ Archived {partition.month}: {partition.row_count:,} rows, {partition.size_bytes:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
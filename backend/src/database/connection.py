@@ -4,28 +4,72 @@ SQLite database setup for Banking App
 """
 
 import logging
-from sqlalchemy import create_engine, text, inspect
+import threading
+from typing import Optional
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from ..config.settings import settings
+from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
-# Create SQLite engine
-# Echo=True for development to see SQL queries
-logger.info(f"Creating database engine with URL: {settings.database.url}")
-engine = create_engine(
-    settings.database.url,
-    echo=settings.database.echo,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+# Engine is created on first use so importing the app (and every short-lived
+# worker process) does not pay for engine setup until a database call happens
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Get the process-wide SQLAlchemy engine, creating it on first call
+    
+    Returns:
+        Engine: Shared database engine
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                settings = get_settings()
+                # Create SQLite engine
+                # Echo=True for development to see SQL queries
+                logger.info(f"Creating database engine with URL: {settings.database.url}")
+                _engine = create_engine(
+                    settings.database.url,
+                    echo=settings.database.echo,
+                    connect_args={"check_same_thread": False}  # Needed for SQLite
+                )
+                if _engine.dialect.name == "sqlite":
+                    # Statements of requests past their deadline are interrupted
+                    from .deadline import install_progress_handler
+                    event.listen(_engine, "connect", install_progress_handler)
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+class _LazySessionMaker(sessionmaker):
+    """Session factory that binds to the engine the first time a session is opened"""
+    
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            get_engine()
+        return super().__call__(**local_kw)
+
 
 # Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = _LazySessionMaker(autocommit=False, autoflush=False)
 
 # Create Base class for database models
 Base = declarative_base()
 
+
+def __getattr__(name: str):
+    """Keep ``engine`` importable for existing callers while creating it lazily"""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Database dependency for FastAPI
 def get_db():
     """
@@ -55,6 +99,8 @@ def create_tables():
         from ..models import database_models
         logger.info("Database models imported successfully")
         
+        engine = get_engine()
+        
         # Check existing tables first
         inspector = inspect(engine)
         existing_tables = inspector.get_table_names()
@@ -84,9 +130,21 @@ def create_tables():
         logger.error(f"Error creating database tables: {str(e)}")
         raise
 
+# Dispose the engine (for testing/development)
+def reset_engine() -> None:
+    """Dispose the engine so the next use re-creates it from current settings"""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+        # Rebind sessions to the next engine too
+        SessionLocal.configure(bind=None)
+        SessionLocal.configure(bind=None)
+
 # Drop all tables (for testing/development)
 def drop_tables():
     """Drop all database tables"""
     logger.info("Dropping all database tables...")
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=get_engine())
     logger.info("All tables dropped successfully")
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Request Deadlines for Database Work
+SQLite progress handler that interrupts statements once the request's deadline has passed
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
+
+# Statements check the deadline every this many SQLite VM instructions
+PROGRESS_INSTRUCTIONS = 1000
+
+
+class SharedDeadline:
+    """
+    Deadline of work done for several requests at once: the latest of theirs
+
+    Work shared by coalesced requests must not be interrupted while any of
+    them still has time. Each request joining the work extends the deadline
+    to its own; a request without a deadline removes it. ``lapsed`` records
+    that the deadline was found passed, and statements may have been
+    interrupted, even if a later request extended it afterwards.
+
+    Args:
+        deadline: ``time.monotonic()`` value of the first request, or None for no deadline
+    """
+
+    __slots__ = ("deadline", "lapsed")
+
+    def __init__(self, deadline: Optional[float]):
+        self.deadline = deadline
+        self.lapsed = False
+
+    def extend(self, deadline: Optional[float]) -> None:
+        """Keep the work running until ``deadline`` as well"""
+        if self.deadline is not None:
+            self.deadline = None if deadline is None else max(self.deadline, deadline)
+
+    def exceeded(self) -> bool:
+        """Whether every request's deadline has passed"""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.lapsed = True
+        return self.lapsed
+
+
+# time.monotonic() after which the current request's statements are interrupted.
+# Context variables follow the request into run_in_threadpool and streaming
+# iterators; scheduler and transfer executor threads start without one.
+_deadline: ContextVar[Union[float, SharedDeadline, None]] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(deadline: Union[float, SharedDeadline, None]) -> Iterator[None]:
+    """
+    Interrupt database work in this context once ``deadline`` has passed
+
+    Args:
+        deadline: ``time.monotonic()`` value, a deadline shared by several requests, or None for no deadline
+    """
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    """``time.monotonic()`` value of the current context's deadline, or None"""
+    deadline = _deadline.get()
+    return deadline.deadline if isinstance(deadline, SharedDeadline) else deadline
+
+
+def deadline_exceeded() -> bool:
+    """Whether the current context's deadline has passed"""
+    deadline = _deadline.get()
+    if isinstance(deadline, SharedDeadline):
+        return deadline.exceeded()
+    return deadline is not None and time.monotonic() > deadline
+
+
+def _progress_handler() -> int:
+    # Non-zero aborts the running statement with "interrupted"
+    return 1 if deadline_exceeded() else 0
+
+
+def install_progress_handler(dbapi_connection, connection_record) -> None:
+    """``connect`` event listener: check request deadlines on every new SQLite connection"""
+    dbapi_connection.set_progress_handler(_progress_handler, PROGRESS_INSTRUCTIONS)
@@ -0,0 +1,86 @@
+"""
+Migration: Add Composite Indexes for Hot Query Shapes
+Date: 2025-11-10
+Description: Replace single-column account indexes with composite indexes that
+match how transactions, transfers and accounts are filtered and ordered
+"""
+
+from sqlalchemy import text
+
+
+# (index name, CREATE statement)
+COMPOSITE_INDEXES = [
+    (
+        "ix_transactions_account_date",
+        "CREATE INDEX IF NOT EXISTS ix_transactions_account_date "
+        "ON transactions (account_id, transaction_date)"
+    ),
+    (
+        "ix_transactions_account_type_date",
+        "CREATE INDEX IF NOT EXISTS ix_transactions_account_type_date "
+        "ON transactions (account_id, transaction_type, transaction_date)"
+    ),
+    (
+        "ix_transfers_from_account_created",
+        "CREATE INDEX IF NOT EXISTS ix_transfers_from_account_created "
+        "ON transfers (from_account_id, created_at)"
+    ),
+    (
+        "ix_transfers_from_account_status_created",
+        "CREATE INDEX IF NOT EXISTS ix_transfers_from_account_status_created "
+        "ON transfers (from_account_id, status, created_at)"
+    ),
+    (
+        "ix_accounts_created_at",
+        "CREATE INDEX IF NOT EXISTS ix_accounts_created_at ON accounts (created_at)"
+    ),
+]
+
+# Single-column indexes made redundant by the composite indexes' leading column
+REDUNDANT_INDEXES = [
+    ("ix_transactions_account_id", "CREATE INDEX IF NOT EXISTS ix_transactions_account_id ON transactions (account_id)"),
+    ("ix_transfers_from_account_id", "CREATE INDEX IF NOT EXISTS ix_transfers_from_account_id ON transfers (from_account_id)"),
+]
+
+
+def upgrade(engine):
+    """Create composite indexes and drop the redundant single-column ones"""
+
+    with engine.connect() as conn:
+        try:
+            for index_name, create_sql in COMPOSITE_INDEXES:
+                conn.execute(text(create_sql))
+                print(f"✅ Created index {index_name}")
+
+            for index_name, _ in REDUNDANT_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+                print(f"✅ Dropped redundant index {index_name}")
+
+            conn.commit()
+
+            # Refresh planner statistics for the new indexes where needed
+            conn.execute(text("PRAGMA optimize"))
+
+        except Exception:
+            conn.rollback()
+            raise
+
+
+def downgrade(engine):
+    """Restore single-column indexes and drop the composite ones"""
+
+    with engine.connect() as conn:
+        try:
+            for index_name, create_sql in REDUNDANT_INDEXES:
+                conn.execute(text(create_sql))
+                print(f"✅ Restored index {index_name}")
+
+            for index_name, _ in COMPOSITE_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+                print(f"✅ Dropped index {index_name}")
+
+            conn.commit()
+
+        except Exception:
+            conn.rollback()
+            raise
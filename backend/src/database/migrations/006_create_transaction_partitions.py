@@ -0,0 +1,22 @@
+"""
+Migration: Create Transaction Partitions Table
+Date: 2025-11-11
+Description: Create transaction_partitions registry for archived monthly transaction files
+"""
+
+
+def upgrade(engine):
+    """Create TransactionPartition table"""
+    from ...models.database_models import TransactionPartition
+
+    TransactionPartition.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Created transaction_partitions table")
+
+
+def downgrade(engine):
+    """Drop TransactionPartition table"""
+    from ...models.database_models import TransactionPartition
+
+    # Archived months are only reachable through the registry; keep the files
+    TransactionPartition.__table__.drop(bind=engine, checkfirst=True)
+    print("✅ Dropped transaction_partitions table")
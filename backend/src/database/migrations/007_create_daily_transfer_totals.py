@@ -0,0 +1,21 @@
+"""
+Migration: Create Daily Transfer Totals Table
+Date: 2025-11-12
+Description: Create daily_transfer_totals running-total table for daily transfer limits
+"""
+
+
+def upgrade(engine):
+    """Create DailyTransferTotal table"""
+    from ...models.transfer_limit import DailyTransferTotal
+
+    DailyTransferTotal.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Created daily_transfer_totals table")
+
+
+def downgrade(engine):
+    """Drop DailyTransferTotal table"""
+    from ...models.transfer_limit import DailyTransferTotal
+
+    DailyTransferTotal.__table__.drop(bind=engine, checkfirst=True)
+    print("✅ Dropped daily_transfer_totals table")
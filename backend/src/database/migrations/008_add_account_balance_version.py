@@ -0,0 +1,43 @@
+"""
+Migration: Add Balance Version to Account Table
+Date: 2025-11-13
+Description: Add per-account balance_version counter used to validate cached balances
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(engine):
+    """Add balance_version column to Account table"""
+    
+    with engine.connect() as conn:
+        try:
+            conn.execute(text(
+                "ALTER TABLE accounts ADD COLUMN balance_version INTEGER NOT NULL DEFAULT 0"
+            ))
+            conn.commit()
+            print("✅ Added balance_version column to accounts table")
+            
+        except Exception as e:
+            conn.rollback()
+            if "duplicate column name" in str(e).lower():
+                print("balance_version column already exists in accounts table")
+            else:
+                raise e
+
+
+def downgrade(engine):
+    """Remove balance_version column from Account table"""
+    
+    with engine.connect() as conn:
+        try:
+            conn.execute(text("ALTER TABLE accounts DROP COLUMN balance_version"))
+            conn.commit()
+            print("✅ Removed balance_version column from accounts table")
+            
+        except Exception as e:
+            conn.rollback()
+            if "no such column" in str(e).lower():
+                print("balance_version column does not exist in accounts table")
+            else:
+                raise e
@@ -0,0 +1,25 @@
+"""
+Migration: Create Outbox Tables
+Date: 2025-11-14
+Description: Create outbox_events and outbox_checkpoints tables for transfer event publishing
+"""
+
+
+def upgrade(engine):
+    """Create OutboxEvent and OutboxCheckpoint tables"""
+    from ...models.outbox import OutboxEvent, OutboxCheckpoint
+
+    OutboxEvent.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Created outbox_events table")
+    OutboxCheckpoint.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Created outbox_checkpoints table")
+
+
+def downgrade(engine):
+    """Drop OutboxEvent and OutboxCheckpoint tables"""
+    from ...models.outbox import OutboxEvent, OutboxCheckpoint
+
+    OutboxCheckpoint.__table__.drop(bind=engine, checkfirst=True)
+    print("✅ Dropped outbox_checkpoints table")
+    OutboxEvent.__table__.drop(bind=engine, checkfirst=True)
+    print("✅ Dropped outbox_events table")
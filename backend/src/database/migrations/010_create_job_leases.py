@@ -0,0 +1,21 @@
+"""
+Migration: Create Job Leases Table
+Date: 2025-11-15
+Description: Create job_leases table so exactly one worker runs each scheduled job
+"""
+
+
+def upgrade(engine):
+    """Create JobLease table"""
+    from ...models.job_lease import JobLease
+
+    JobLease.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Created job_leases table")
+
+
+def downgrade(engine):
+    """Drop JobLease table"""
+    from ...models.job_lease import JobLease
+
+    JobLease.__table__.drop(bind=engine, checkfirst=True)
+    print("✅ Dropped job_leases table")
@@ -0,0 +1,21 @@
+"""
+Migration: Create Balance Checkpoints Table
+Date: 2025-11-16
+Description: Create balance_checkpoints table for point-in-time balance lookups
+"""
+
+
+def upgrade(engine):
+    """Create BalanceCheckpoint table"""
+    from ...models.balance_checkpoint import BalanceCheckpoint
+
+    BalanceCheckpoint.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Created balance_checkpoints table")
+
+
+def downgrade(engine):
+    """Drop BalanceCheckpoint table"""
+    from ...models.balance_checkpoint import BalanceCheckpoint
+
+    BalanceCheckpoint.__table__.drop(bind=engine, checkfirst=True)
+    print("✅ Dropped balance_checkpoints table")
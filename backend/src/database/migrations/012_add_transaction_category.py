@@ -0,0 +1,45 @@
+"""
+Migration: Add Category to Transaction Table
+Date: 2025-11-17
+Description: Add category_id column linking transactions to transaction_categories
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(engine):
+    """Add category_id column to Transaction table"""
+    
+    with engine.connect() as conn:
+        try:
+            conn.execute(text(
+                "ALTER TABLE transactions ADD COLUMN category_id INTEGER "
+                "REFERENCES transaction_categories(id) ON DELETE SET NULL"
+            ))
+            conn.commit()
+            print("✅ Added category_id column to transactions table")
+            print("   Run `python -m src.services.categorization` to categorize existing transactions")
+            
+        except Exception as e:
+            conn.rollback()
+            if "duplicate column name" in str(e).lower():
+                print("category_id column already exists in transactions table")
+            else:
+                raise e
+
+
+def downgrade(engine):
+    """Remove category_id column from Transaction table"""
+    
+    with engine.connect() as conn:
+        try:
+            conn.execute(text("ALTER TABLE transactions DROP COLUMN category_id"))
+            conn.commit()
+            print("✅ Removed category_id column from transactions table")
+            
+        except Exception as e:
+            conn.rollback()
+            if "no such column" in str(e).lower():
+                print("category_id column does not exist in transactions table")
+            else:
+                raise e
@@ -0,0 +1,27 @@
+"""
+Migration: Create Monthly Category Spend Table
+Date: 2025-11-18
+Description: Create monthly_category_spend aggregate and fill it from existing transactions
+"""
+
+
+def upgrade(engine):
+    """Create MonthlyCategorySpend table and aggregate existing history"""
+    from sqlalchemy.orm import Session
+    from ...models.spending import MonthlyCategorySpend
+    from ...services.spending_service import SpendingService
+
+    MonthlyCategorySpend.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Created monthly_category_spend table")
+
+    with Session(bind=engine) as db:
+        rows = SpendingService(db).rebuild()
+    print(f"✅ Aggregated {rows:,} account/month/category rows")
+
+
+def downgrade(engine):
+    """Drop MonthlyCategorySpend table"""
+    from ...models.spending import MonthlyCategorySpend
+
+    MonthlyCategorySpend.__table__.drop(bind=engine, checkfirst=True)
+    print("✅ Dropped monthly_category_spend table")
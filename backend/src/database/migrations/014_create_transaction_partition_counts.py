@@ -0,0 +1,30 @@
+"""
+Migration: Create Transaction Partition Counts Table
+Date: 2025-11-19
+Description: Create transaction_partition_counts and fill it from the archived months already registered
+"""
+
+
+def upgrade(engine):
+    """Create TransactionPartitionCount table and count existing archive files"""
+    from sqlalchemy.orm import Session
+    from ..archive import TransactionArchive
+    from ...models.database_models import TransactionPartition, TransactionPartitionCount
+
+    TransactionPartitionCount.__table__.create(bind=engine, checkfirst=True)
+    print("✅ Created transaction_partition_counts table")
+
+    with Session(bind=engine) as db:
+        archive = TransactionArchive(db)
+        partitions = db.query(TransactionPartition).order_by(TransactionPartition.period_start).all()
+        rows = sum(archive.record_counts(partition.month, archive.local_path(partition)) for partition in partitions)
+        db.commit()
+    print(f"✅ Counted {len(partitions)} archived months ({rows:,} account/type rows)")
+
+
+def downgrade(engine):
+    """Drop TransactionPartitionCount table"""
+    from ...models.database_models import TransactionPartitionCount
+
+    TransactionPartitionCount.__table__.drop(bind=engine, checkfirst=True)
+    print("✅ Dropped transaction_partition_counts table")
@@ -13,6 +13,7 @@ CREATE TABLE IF NOT EXISTS accounts (
     account_name VARCHAR(100) NOT NULL,
     account_type VARCHAR(20) NOT NULL CHECK (account_type IN ('checking', 'savings', 'investment')),
     balance DECIMAL(15, 2) DEFAULT 0.00 NOT NULL,
+    balance_version INTEGER DEFAULT 0 NOT NULL, -- Bumped on every balance change (balance cache validation)
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
@@ -30,9 +31,11 @@ CREATE TABLE IF NOT EXISTS transactions (
     balance_after DECIMAL(15, 2) NOT NULL,
     reference_number VARCHAR(50) UNIQUE,
     status VARCHAR(20) DEFAULT 'completed' CHECK (status IN ('completed', 'pending', 'failed')),
+    category_id INTEGER,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     
-    FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE
+    FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE,
+    FOREIGN KEY (category_id) REFERENCES transaction_categories(id) ON DELETE SET NULL
 );
 
 -- Table: transaction_categories
@@ -45,12 +48,101 @@ CREATE TABLE IF NOT EXISTS transaction_categories (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Table: transaction_partitions
+-- Registry of monthly transaction partitions moved to compressed archive files
+CREATE TABLE IF NOT EXISTS transaction_partitions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    month VARCHAR(7) UNIQUE NOT NULL, -- YYYY-MM
+    period_start DATETIME NOT NULL,
+    period_end DATETIME NOT NULL, -- Exclusive upper bound
+    row_count INTEGER NOT NULL DEFAULT 0,
+    archive_path VARCHAR(255) NOT NULL, -- Relative to the archive directory
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    checksum VARCHAR(64) NOT NULL, -- SHA-256 of the compressed file
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Table: daily_transfer_totals
+-- Running total of outgoing transfers per account per day (daily limit accounting)
+CREATE TABLE IF NOT EXISTS daily_transfer_totals (
+    account_id INTEGER NOT NULL,
+    transfer_date DATE NOT NULL,
+    total_amount REAL NOT NULL DEFAULT 0.0,
+    transfer_count INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (account_id, transfer_date),
+    FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE
+);
+
+-- Table: outbox_events
+-- Events written in the same commit as the transfer/transaction rows they describe
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id INTEGER PRIMARY KEY, -- Delivery order; dispatchers tail by id
+    event_type VARCHAR(50) NOT NULL,
+    aggregate_type VARCHAR(20) NOT NULL,
+    aggregate_id INTEGER NOT NULL,
+    payload TEXT NOT NULL, -- JSON document
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Table: outbox_checkpoints
+-- Last event id delivered to each outbox consumer
+CREATE TABLE IF NOT EXISTS outbox_checkpoints (
+    consumer VARCHAR(50) PRIMARY KEY,
+    last_event_id INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Table: job_leases
+-- Lease and run statistics per scheduled job; the lease holder is the only worker running it
+CREATE TABLE IF NOT EXISTS job_leases (
+    job_name VARCHAR(50) PRIMARY KEY,
+    owner VARCHAR(100) NOT NULL,
+    lease_expires_at DATETIME NOT NULL,
+    last_started_at DATETIME,
+    last_finished_at DATETIME,
+    last_duration_ms REAL,
+    last_status VARCHAR(20),
+    last_error TEXT,
+    run_count INTEGER NOT NULL DEFAULT 0,
+    failure_count INTEGER NOT NULL DEFAULT 0,
+    total_duration_ms REAL NOT NULL DEFAULT 0.0
+);
+
+-- Table: balance_checkpoints
+-- Balance after selected ledger rows (day ends and every N rows) for point-in-time lookups
+CREATE TABLE IF NOT EXISTS balance_checkpoints (
+    account_id INTEGER NOT NULL,
+    checkpoint_at DATETIME NOT NULL,
+    transaction_id INTEGER NOT NULL,
+    balance REAL NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (account_id, checkpoint_at, transaction_id),
+    FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE
+);
+
+-- Table: monthly_category_spend
+-- Debit totals per account, month and category (0 = uncategorized) for spending analytics
+CREATE TABLE IF NOT EXISTS monthly_category_spend (
+    account_id INTEGER NOT NULL,
+    month VARCHAR(7) NOT NULL,
+    category_id INTEGER NOT NULL,
+    total_amount REAL NOT NULL DEFAULT 0.0,
+    transaction_count INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (account_id, month, category_id),
+    FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE CASCADE
+);
+
 -- Indexes for performance optimization
-CREATE INDEX IF NOT EXISTS idx_transactions_account_id ON transactions(account_id);
+CREATE INDEX IF NOT EXISTS idx_transactions_account_date ON transactions(account_id, transaction_date);
+CREATE INDEX IF NOT EXISTS idx_transactions_account_type_date ON transactions(account_id, transaction_type, transaction_date);
 CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date DESC);
 CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(transaction_type);
+CREATE INDEX IF NOT EXISTS idx_transaction_partitions_period_start ON transaction_partitions(period_start);
 CREATE INDEX IF NOT EXISTS idx_transactions_reference ON transactions(reference_number);
 CREATE INDEX IF NOT EXISTS idx_accounts_number ON accounts(account_number);
+CREATE INDEX IF NOT EXISTS idx_accounts_created_at ON accounts(created_at);
 
 -- Triggers for automatic updated_at timestamp
 CREATE TRIGGER IF NOT EXISTS update_accounts_timestamp
@@ -5,12 +5,14 @@ FastAPI application main module
 
 import logging
 import traceback
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from .api import transaction_router, account_router
+from .api import transaction_router, account_router, dashboard_router
+from .api.admin import router as admin_router
 from .api.transfer import router as transfer_router
 from .middleware.cors import setup_middleware
 
@@ -21,8 +23,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the database and background jobs; drain queued work on shutdown"""
+    logger.info("Application starting up...")
+    try:
+        from .config.settings import get_settings
+        from .database.connection import create_tables
+        from .database.sample_data import create_sample_data
+        
+        get_settings().ensure_directories()
+        
+        logger.info("Initializing database tables...")
+        create_tables()
+        logger.info("Database initialization completed successfully")
+        
+        logger.info("Creating sample data if needed...")
+        create_sample_data()
+        logger.info("Sample data initialization completed")
+        
+        from .services.scheduler import start_scheduler
+        
+        if start_scheduler() is not None:
+            logger.info("Job scheduler started")
+        
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {str(e)}")
+        import traceback
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        # Don't raise here to allow app to start even with DB issues for debugging
+    
+    yield
+    
+    # Apply queued transfers and stop background jobs before the process exits
+    from .services.outbox_dispatcher import close_outbox_dispatcher
+    from .services.scheduler import stop_scheduler
+    from .services.transfer_executor import shutdown_transfer_executor
+    
+    stop_scheduler()
+    shutdown_transfer_executor()
+    close_outbox_dispatcher()
+
+
 # Create FastAPI application instance
 app = FastAPI(
+    lifespan=lifespan,
     title="Banking App API",
     description="Transaction History API for Banking App Prototype",
     version="0.1.0",
@@ -90,33 +136,12 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 # Setup middleware (includes CORS and other middleware)
 setup_middleware(app)
 
-# Initialize database tables on startup
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database and perform startup tasks"""
-    logger.info("Application starting up...")
-    try:
-        from .database.connection import create_tables
-        from .database.sample_data import create_sample_data
-        
-        logger.info("Initializing database tables...")
-        create_tables()
-        logger.info("Database initialization completed successfully")
-        
-        logger.info("Creating sample data if needed...")
-        create_sample_data()
-        logger.info("Sample data initialization completed")
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {str(e)}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        # Don't raise here to allow app to start even with DB issues for debugging
-        
 # Include API routers
 app.include_router(transaction_router, prefix="/api", tags=["transactions"])
 app.include_router(account_router, prefix="/api", tags=["accounts"])
+app.include_router(dashboard_router, prefix="/api", tags=["dashboard"])
 app.include_router(transfer_router, tags=["transfers"])
+app.include_router(admin_router, tags=["admin"])
 
 @app.get("/")
 async def root():
@@ -11,6 +11,7 @@ from .cors import (
     LoggingMiddleware,
     SecurityHeadersMiddleware
 )
+from .admission import AdmissionControlMiddleware, add_admission_middleware, get_admission_stats
 
 __all__ = [
     "setup_middleware",
@@ -18,5 +19,8 @@ __all__ = [
     "add_security_middleware",
     "add_performance_middleware", 
     "LoggingMiddleware",
-    "SecurityHeadersMiddleware"
+    "SecurityHeadersMiddleware",
+    "AdmissionControlMiddleware",
+    "add_admission_middleware",
+    "get_admission_stats"
 ]
\ No newline at end of file
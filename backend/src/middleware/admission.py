@@ -0,0 +1,341 @@
+"""
+Admission Control Middleware
+Per-route-class concurrency limits, bounded queues, priorities and request deadlines
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import FastAPI
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config.settings import get_settings
+from ..database.deadline import request_deadline
+
+logger = logging.getLogger(__name__)
+
+# Never queued or shed: health checks, docs and read-only status endpoints
+# must stay reachable while the API is overloaded
+EXEMPT_PATHS = re.compile(r"^/(health|docs|redoc|openapi\.json)?$")
+EXEMPT_STATUS_PATHS = re.compile(r"^/admin/(jobs|reconciliation|single-flight|admission)$")
+EXEMPT_STATUS_METHODS = ("GET", "HEAD")
+
+
+class RouteClass:
+    """
+    Admission policy for a group of routes
+
+    Args:
+        name: Class name (metrics, logs)
+        priority: Lower is served first when slots free up
+        max_concurrent: Requests of this class running at once
+        max_queue: Requests of this class waiting for a slot; more are rejected at once
+        deadline_seconds: Budget from arrival, or None for no deadline (streaming responses)
+        interruptible: Whether database work past the deadline is interrupted
+    """
+
+    def __init__(self, name: str, priority: int, max_concurrent: int, max_queue: int,
+                 deadline_seconds: Optional[float], interruptible: bool = True):
+        self.name = name
+        self.priority = priority
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.deadline_seconds = deadline_seconds
+        self.interruptible = interruptible
+
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.deadline_exceeded = 0
+        self.service_seconds = 0.0  # Moving average of admitted request durations
+
+    def record_duration(self, seconds: float) -> None:
+        self.service_seconds = seconds if not self.service_seconds else 0.9 * self.service_seconds + 0.1 * seconds
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "priority": self.priority,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "deadline_seconds": self.deadline_seconds,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "deadline_exceeded": self.deadline_exceeded,
+            "avg_service_ms": round(self.service_seconds * 1000, 1),
+        }
+
+
+def default_route_classes(max_concurrent: int, max_queue: int,
+                          deadline_seconds: float) -> List[Tuple[RouteClass, Optional[str], str]]:
+    """
+    Built-in route classes, first match wins: ``(class, HTTP method or None, path regex)``
+
+    Transfers may use every slot, plain reads three quarters and analytics
+    a quarter, so a burst of reports cannot take the capacity transfers
+    need. Transfers are not interrupted once running: the executor owns the
+    write, and a rolled-back transfer is worse than a slow one.
+    """
+    transfers = RouteClass("transfers", 0, max_concurrent, max_queue * 2, deadline_seconds, interruptible=False)
+    reads = RouteClass("reads", 1, max(1, max_concurrent * 3 // 4), max_queue, deadline_seconds)
+    analytics = RouteClass("analytics", 2, max(1, max_concurrent // 4), max(1, max_queue // 8), deadline_seconds)
+    exports = RouteClass("exports", 2, max(1, max_concurrent // 8), 0, None)
+    return [
+        (transfers, "POST", r"^/api/v1/transfers/?$"),
+        (exports, None, r"^/api/transactions/export$"),
+        (analytics, None, r"^/api/(transactions/statistics/|dashboard/|accounts/[^/]+/(spending|balance-series))"),
+        (reads, None, r""),
+    ]
+
+
+class AdmissionController:
+    """
+    Slot accounting for route classes sharing one worker's capacity
+
+    A request runs when both the worker and its class have a free slot.
+    Otherwise it waits in a queue ordered by class priority, then arrival,
+    unless its class queue is full, in which case it is rejected at once.
+    Waiting ends when a slot is handed over or the request's deadline
+    passes. All methods run on the event loop thread.
+
+    Args:
+        max_concurrent: Requests running at once in this worker
+    """
+
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max(1, max_concurrent)
+        self.active = 0
+        self._waiters: List[Tuple[int, int, RouteClass, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    def _can_run(self, route_class: RouteClass) -> bool:
+        return self.active < self.max_concurrent and route_class.active < route_class.max_concurrent
+
+    async def acquire(self, route_class: RouteClass, deadline: Optional[float]) -> bool:
+        """
+        Wait for a slot
+
+        Returns:
+            bool: True when admitted, False when the class queue is full or the deadline passed
+        """
+        # Free slots are handed to waiters as soon as they free up, so a
+        # runnable request only queues behind earlier requests of its class
+        if self._can_run(route_class) and not route_class.waiting:
+            self._admit(route_class)
+            return True
+
+        if route_class.waiting >= route_class.max_queue:
+            route_class.rejected += 1
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (route_class.priority, next(self._sequence), route_class, future))
+        route_class.waiting += 1
+        try:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+            return True
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # Granted at the same moment the wait timed out: give the slot back
+                self.release(route_class, admitted=True)
+            else:
+                future.cancel()
+            route_class.timed_out += 1
+            return False
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(route_class, admitted=True)
+            else:
+                future.cancel()
+            raise
+        finally:
+            route_class.waiting -= 1
+
+    def release(self, route_class: RouteClass, admitted: bool = True) -> None:
+        """Free a slot and hand it to the most important waiter that may run"""
+        if admitted:
+            self.active -= 1
+            route_class.active -= 1
+
+        blocked = []
+        while self._waiters and self.active < self.max_concurrent:
+            waiter = heapq.heappop(self._waiters)
+            _, _, waiting_class, future = waiter
+            if future.done():
+                continue
+            if not self._can_run(waiting_class):
+                blocked.append(waiter)
+                continue
+            self._admit(waiting_class)
+            future.set_result(None)
+        for waiter in blocked:
+            heapq.heappush(self._waiters, waiter)
+
+    def _admit(self, route_class: RouteClass) -> None:
+        self.active += 1
+        route_class.active += 1
+        route_class.admitted += 1
+
+    def retry_after(self, route_class: RouteClass) -> int:
+        """Seconds until the class queue should have drained, at least 1"""
+        backlog = route_class.waiting + route_class.active + 1
+        return max(1, math.ceil(route_class.service_seconds * backlog / route_class.max_concurrent))
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware that admits, queues or sheds requests before they reach the routes
+
+    Every request is matched to a route class. It gets a deadline when it
+    arrives. It then waits for a slot in priority order. A full class
+    queue, or a deadline that passes while queued, gets an immediate 503
+    with ``Retry-After``. Admitted requests run with the deadline in a
+    context variable. The SQLite progress handler interrupts their
+    statements once it passes, in handlers on the event loop as well as
+    in ``run_in_threadpool``. A request that fails or errors after its
+    deadline is answered with 504.
+
+    Args:
+        app: Wrapped ASGI application
+        route_classes: ``(class, HTTP method or None, path regex)``, first match wins
+        max_concurrent: Requests running at once in this worker
+    """
+
+    def __init__(self, app: ASGIApp, route_classes: Sequence[Tuple[RouteClass, Optional[str], str]],
+                 max_concurrent: int):
+        self.app = app
+        self.rules = [(route_class, method, re.compile(pattern)) for route_class, method, pattern in route_classes]
+        self.controller = AdmissionController(max_concurrent)
+        # Starlette builds the middleware stack lazily; remember the instance for /admin/admission
+        global _admission
+        _admission = self
+
+    @property
+    def route_classes(self) -> List[RouteClass]:
+        return list({id(route_class): route_class for route_class, _, _ in self.rules}.values())
+
+    @staticmethod
+    def exempt(method: str, path: str) -> bool:
+        """Whether a request bypasses admission control"""
+        return bool(EXEMPT_PATHS.match(path)) or (
+            method in EXEMPT_STATUS_METHODS and bool(EXEMPT_STATUS_PATHS.match(path))
+        )
+
+    def classify(self, method: str, path: str) -> Optional[RouteClass]:
+        for route_class, rule_method, pattern in self.rules:
+            if (rule_method is None or rule_method == method) and pattern.match(path):
+                return route_class
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.exempt(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.classify(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        arrived = time.monotonic()
+        deadline = arrived + route_class.deadline_seconds if route_class.deadline_seconds is not None else None
+        if not await self.controller.acquire(route_class, deadline):
+            logger.warning(f"Shed {scope['method']} {scope['path']} ({route_class.name} saturated)")
+            await self._respond(scope, receive, send, 503, "Server is busy, retry later", {
+                "Retry-After": str(self.controller.retry_after(route_class))
+            })
+            return
+
+        started = replaced = False
+
+        async def send_within_deadline(message: Message) -> None:
+            nonlocal started, replaced
+            if message["type"] == "http.response.start":
+                if message["status"] >= 500 and self._expired(deadline):
+                    # The handler failed because its database work was interrupted
+                    replaced = True
+                    route_class.deadline_exceeded += 1
+                    await self._respond(scope, receive, send, 504, "Request deadline exceeded")
+                    return
+                started = True
+            elif replaced:
+                return
+            await send(message)
+
+        running = time.monotonic()
+        try:
+            with request_deadline(deadline if route_class.interruptible else None):
+                await self.app(scope, receive, send_within_deadline)
+        except Exception:
+            if started or replaced or not self._expired(deadline):
+                raise
+            route_class.deadline_exceeded += 1
+            await self._respond(scope, receive, send, 504, "Request deadline exceeded")
+        finally:
+            route_class.record_duration(time.monotonic() - running)
+            self.controller.release(route_class)
+
+    @staticmethod
+    def _expired(deadline: Optional[float]) -> bool:
+        return deadline is not None and time.monotonic() > deadline
+
+    @staticmethod
+    async def _respond(scope: Scope, receive: Receive, send: Send, status_code: int, detail: str,
+                       headers: Optional[Dict[str, str]] = None) -> None:
+        # Same body shape as the application's HTTP exception handler
+        response = JSONResponse(
+            status_code=status_code,
+            content={
+                "detail": detail,
+                "status_code": status_code,
+                "path": scope["path"],
+                "method": scope["method"],
+            },
+            headers=headers
+        )
+        await response(scope, receive, send)
+
+    def stats(self) -> Dict[str, Any]:
+        """Worker-wide and per-class admission counters"""
+        return {
+            "max_concurrent": self.controller.max_concurrent,
+            "active": self.controller.active,
+            "classes": {route_class.name: route_class.stats() for route_class in self.route_classes},
+        }
+
+
+_admission: Optional[AdmissionControlMiddleware] = None
+
+
+def get_admission_stats() -> Optional[Dict[str, Any]]:
+    """Admission counters of this worker, or None if admission control is disabled"""
+    return _admission.stats() if _admission is not None else None
+
+
+def _configured_admission_middleware(app: ASGIApp) -> ASGIApp:
+    """Admission middleware factory; reads settings when the middleware stack is built"""
+    config = get_settings().admission
+    if not config.enabled:
+        return app
+    return AdmissionControlMiddleware(
+        app,
+        route_classes=default_route_classes(config.max_concurrent, config.max_queue, config.deadline_seconds),
+        max_concurrent=config.max_concurrent
+    )
+
+
+def add_admission_middleware(app: FastAPI) -> None:
+    """Add admission control configured from settings (no-op when disabled)"""
+    app.add_middleware(_configured_admission_middleware)
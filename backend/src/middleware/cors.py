@@ -8,10 +8,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
 import time
 import logging
 from typing import Callable
-from ..config.settings import settings
+from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -62,11 +63,12 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
-def add_cors_middleware(app: FastAPI) -> None:
-    """Add CORS middleware with proper configuration"""
+def _configured_cors_middleware(app: ASGIApp) -> ASGIApp:
+    """CORS middleware factory; reads settings when the middleware stack is built"""
+    settings = get_settings()
     
-    app.add_middleware(
-        CORSMiddleware,
+    return CORSMiddleware(
+        app,
         allow_origins=settings.security.allowed_origins,
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
@@ -85,15 +87,26 @@ def add_cors_middleware(app: FastAPI) -> None:
     )
 
 
+def _configured_trusted_host_middleware(app: ASGIApp) -> ASGIApp:
+    """Trusted host middleware factory; a no-op in development"""
+    settings = get_settings()
+    
+    if settings.is_development:
+        return app
+    return TrustedHostMiddleware(app, allowed_hosts=settings.security.allowed_hosts)
+
+
+def add_cors_middleware(app: FastAPI) -> None:
+    """Add CORS middleware with proper configuration"""
+    # Starlette builds the middleware stack on the first request (or lifespan
+    # startup), so settings are not loaded while importing the app
+    app.add_middleware(_configured_cors_middleware)
+
+
 def add_security_middleware(app: FastAPI) -> None:
     """Add security-related middleware"""
-    
     # Trusted host middleware
-    if not settings.is_development:
-        app.add_middleware(
-            TrustedHostMiddleware, 
-            allowed_hosts=settings.security.allowed_hosts
-        )
+    app.add_middleware(_configured_trusted_host_middleware)
     
     # Security headers middleware
     app.add_middleware(SecurityHeadersMiddleware)
@@ -111,12 +124,16 @@ def add_performance_middleware(app: FastAPI) -> None:
 def setup_middleware(app: FastAPI) -> None:
     """Setup all middleware in correct order"""
     # Order matters: last added is executed first
+    from .admission import add_admission_middleware
+    
+    # 1. Admission control (innermost, so shed responses are logged and get CORS headers)
+    add_admission_middleware(app)
     
-    # 1. Performance middleware (innermost)
+    # 2. Performance middleware
     add_performance_middleware(app)
     
-    # 2. Security middleware
+    # 3. Security middleware
     add_security_middleware(app)
     
-    # 3. CORS middleware (outermost)
+    # 4. CORS middleware (outermost)
     add_cors_middleware(app)
\ No newline at end of file
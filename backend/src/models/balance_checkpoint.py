@@ -0,0 +1,23 @@
+"""
+Balance Checkpoint Models for Banking App
+SQLAlchemy ORM models for point-in-time balance lookups
+"""
+
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from ..database.connection import Base
+
+
+class BalanceCheckpoint(Base):
+    """Recorded balance of an account after one transaction of its ledger"""
+    __tablename__ = "balance_checkpoints"
+
+    # Primary key order is the lookup order: latest checkpoint of an account before a date
+    account_id = Column(Integer, ForeignKey('accounts.id'), primary_key=True)
+    checkpoint_at = Column(DateTime(timezone=True), primary_key=True)  # Copy of transactions.transaction_date
+    transaction_id = Column(Integer, primary_key=True)  # Last transaction included in the balance
+    balance = Column(Float, nullable=False)  # That transaction's balance_after
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<BalanceCheckpoint(account_id={self.account_id}, at={self.checkpoint_at}, balance={self.balance})>"
@@ -3,7 +3,7 @@ Database Models for Banking App
 SQLAlchemy ORM models for transaction history
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index
 from sqlalchemy.sql import func
 from ..database import Base
 
@@ -17,7 +17,8 @@ class Account(Base):
     account_name = Column(String(100), nullable=False)
     account_type = Column(String(20), nullable=False)  # checking, savings, etc.
     balance = Column(Float, default=0.0, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    balance_version = Column(Integer, server_default="0", nullable=False)  # Bumped on every balance change
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 
@@ -26,7 +27,7 @@ class Transaction(Base):
     __tablename__ = "transactions"
     
     id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, nullable=False, index=True)  # Foreign key to Account
+    account_id = Column(Integer, nullable=False)  # Foreign key to Account
     transaction_type = Column(String(20), nullable=False)  # deposit, withdrawal, transfer
     amount = Column(Float, nullable=False)
     description = Column(Text)
@@ -35,12 +36,51 @@ class Transaction(Base):
     balance_after = Column(Float, nullable=False)  # Account balance after transaction
     reference_number = Column(String(50), unique=True, index=True)
     status = Column(String(20), default="completed")  # completed, pending, failed
+    category_id = Column(Integer)  # transaction_categories.id, assigned by TransactionCategorizer
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    __table_args__ = (
+        # Account history ordered by date (list, count, statistics, summary)
+        Index("ix_transactions_account_date", "account_id", "transaction_date"),
+        # Account history filtered by type and date range (type filter, monthly summary)
+        Index("ix_transactions_account_type_date", "account_id", "transaction_type", "transaction_date"),
+    )
+    
     def __repr__(self):
         return f"<Transaction(id={self.id}, type={self.transaction_type}, amount={self.amount})>"
 
 
+class TransactionPartition(Base):
+    """Registry of monthly transaction partitions moved to the archive tier"""
+    __tablename__ = "transaction_partitions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    month = Column(String(7), unique=True, nullable=False)  # YYYY-MM
+    period_start = Column(DateTime, nullable=False, index=True)
+    period_end = Column(DateTime, nullable=False)  # Exclusive upper bound
+    row_count = Column(Integer, nullable=False, default=0)
+    archive_path = Column(String(255), nullable=False)  # Relative to the archive directory
+    size_bytes = Column(Integer, nullable=False, default=0)
+    checksum = Column(String(64), nullable=False)  # SHA-256 of the compressed file
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<TransactionPartition(month={self.month}, rows={self.row_count})>"
+
+
+class TransactionPartitionCount(Base):
+    """Rows of an archived month per account and transaction type, so counts never open archive files"""
+    __tablename__ = "transaction_partition_counts"
+
+    month = Column(String(7), primary_key=True)  # transaction_partitions.month
+    account_id = Column(Integer, primary_key=True)
+    transaction_type = Column(String(20), primary_key=True)
+    row_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<TransactionPartitionCount(month={self.month}, account={self.account_id}, rows={self.row_count})>"
+
+
 class TransactionCategory(Base):
     """Category model for transaction categorization"""
     __tablename__ = "transaction_categories"
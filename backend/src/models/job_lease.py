@@ -0,0 +1,27 @@
+"""
+Job Lease Models for Banking App
+SQLAlchemy ORM models for the background job scheduler
+"""
+
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime
+from ..database.connection import Base
+
+
+class JobLease(Base):
+    """Lease and run statistics for one scheduled job, shared by all workers"""
+    __tablename__ = "job_leases"
+
+    job_name = Column(String(50), primary_key=True)
+    owner = Column(String(100), nullable=False)  # host:pid:token of the worker holding the lease
+    lease_expires_at = Column(DateTime, nullable=False)  # No other worker runs the job before this
+    last_started_at = Column(DateTime)
+    last_finished_at = Column(DateTime)
+    last_duration_ms = Column(Float)
+    last_status = Column(String(20))  # running, succeeded, failed
+    last_error = Column(Text)
+    run_count = Column(Integer, default=0, nullable=False)
+    failure_count = Column(Integer, default=0, nullable=False)
+    total_duration_ms = Column(Float, default=0.0, nullable=False)
+
+    def __repr__(self):
+        return f"<JobLease(job={self.job_name}, owner={self.owner}, expires={self.lease_expires_at})>"
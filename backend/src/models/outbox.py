@@ -0,0 +1,35 @@
+"""
+Outbox Models for Banking App
+SQLAlchemy ORM models for the transactional event outbox
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from ..database.connection import Base
+
+
+class OutboxEvent(Base):
+    """Event written in the same commit as the rows it describes"""
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True)  # Delivery order; dispatchers tail by id
+    event_type = Column(String(50), nullable=False)  # transfer.completed, transaction.created
+    aggregate_type = Column(String(20), nullable=False)  # transfer, transaction
+    aggregate_id = Column(Integer, nullable=False)
+    payload = Column(Text, nullable=False)  # JSON document
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, type={self.event_type}, aggregate_id={self.aggregate_id})>"
+
+
+class OutboxCheckpoint(Base):
+    """Last event id delivered to each outbox consumer"""
+    __tablename__ = "outbox_checkpoints"
+
+    consumer = Column(String(50), primary_key=True)
+    last_event_id = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<OutboxCheckpoint(consumer={self.consumer}, last_event_id={self.last_event_id})>"
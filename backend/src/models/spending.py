@@ -0,0 +1,23 @@
+"""
+Spending Models for Banking App
+SQLAlchemy ORM models for pre-aggregated category spending
+"""
+
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from ..database.connection import Base
+
+
+class MonthlyCategorySpend(Base):
+    """Total debits of an account per month and category"""
+    __tablename__ = "monthly_category_spend"
+
+    account_id = Column(Integer, ForeignKey('accounts.id'), primary_key=True)
+    month = Column(String(7), primary_key=True)  # YYYY-MM
+    category_id = Column(Integer, primary_key=True)  # 0 = uncategorized
+    total_amount = Column(Float, default=0.0, nullable=False)
+    transaction_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<MonthlyCategorySpend(account_id={self.account_id}, month={self.month}, category={self.category_id}, total={self.total_amount})>"
@@ -3,7 +3,7 @@ Transfer Models for Banking App
 SQLAlchemy ORM models for transfer functionality
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database.connection import Base
@@ -14,7 +14,7 @@ class Transfer(Base):
     __tablename__ = "transfers"
     
     id = Column(Integer, primary_key=True, index=True)
-    from_account_id = Column(Integer, ForeignKey('accounts.id'), nullable=False, index=True)
+    from_account_id = Column(Integer, ForeignKey('accounts.id'), nullable=False)
     to_account_number = Column(String(20), nullable=False, index=True)
     to_bank_id = Column(Integer, ForeignKey('virtual_banks.id'), nullable=True, index=True)  # None for internal transfers
     amount = Column(Float, nullable=False)
@@ -26,6 +26,13 @@ class Transfer(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
     error_message = Column(Text)
     
+    __table_args__ = (
+        # Transfer history per account, newest first
+        Index("ix_transfers_from_account_created", "from_account_id", "created_at"),
+        # Transfer history per account filtered by status, newest first
+        Index("ix_transfers_from_account_status_created", "from_account_id", "status", "created_at"),
+    )
+    
     # Relationships
     virtual_bank = relationship("VirtualBank", back_populates="transfers")
     
@@ -0,0 +1,22 @@
+"""
+Transfer Limit Models for Banking App
+SQLAlchemy ORM models for daily transfer-limit accounting
+"""
+
+from sqlalchemy import Column, Integer, Float, Date, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from ..database.connection import Base
+
+
+class DailyTransferTotal(Base):
+    """Running total of outgoing transfers per account per day"""
+    __tablename__ = "daily_transfer_totals"
+
+    account_id = Column(Integer, ForeignKey('accounts.id'), primary_key=True)
+    transfer_date = Column(Date, primary_key=True)
+    total_amount = Column(Float, default=0.0, nullable=False)
+    transfer_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<DailyTransferTotal(account_id={self.account_id}, date={self.transfer_date}, total={self.total_amount})>"
@@ -0,0 +1,134 @@
+"""
+Account Directory
+In-memory index of internal account numbers for transfer destination resolution
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.database_models import Account
+
+logger = logging.getLogger(__name__)
+
+
+class AccountDirectory:
+    """
+    Process-wide map of account number -> account id
+
+    The first lookup loads every account number. Later refreshes only read
+    accounts with ``id`` above the highest id already loaded, which is a
+    primary-key range scan. Account numbers are never reassigned, so new
+    rows are the only change to pick up.
+
+    The directory holds every account number up to the last refresh, so
+    it answers hits and misses alike in O(1) without touching the
+    database. A miss triggers an incremental refresh at most once per
+    ``refresh_interval`` seconds, and the ``refresh_account_directory``
+    job refreshes every worker periodically. An account created in
+    another worker therefore resolves within ``refresh_interval``
+    seconds, and a stream of unknown numbers costs at most one
+    primary-key range scan per interval.
+
+    Args:
+        refresh_interval: Minimum seconds between refreshes triggered by misses
+    """
+
+    def __init__(self, refresh_interval: float = 1.0):
+        self.refresh_interval = refresh_interval
+        self._ids: Dict[str, int] = {}
+        self._max_id = 0
+        self._last_refresh: Optional[float] = None
+        self._bind = None
+        self._lock = threading.Lock()
+
+    def resolve(self, db: Session, account_number: str) -> Optional[int]:
+        """
+        Resolve an internal account number to its account id
+
+        Args:
+            db: Session used if a refresh is needed
+            account_number: Account number to resolve
+
+        Returns:
+            Account id, or None if the account number is unknown as of the last refresh
+        """
+        if db.get_bind() is not self._bind:
+            # First use, or a different database (engine reset)
+            self.refresh(db)
+        account_id = self._ids.get(account_number)
+        if account_id is None and self._refresh_due():
+            self.refresh(db)
+            account_id = self._ids.get(account_number)
+        return account_id
+
+    def __contains__(self, account_number: str) -> bool:
+        return account_number in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def refresh(self, db: Session) -> int:
+        """
+        Load accounts created since the last refresh
+
+        Args:
+            db: Session to read from
+
+        Returns:
+            int: Number of accounts added
+        """
+        with self._lock:
+            bind = db.get_bind()
+            same_database = bind is self._bind
+            # A different database gets a new map, published whole: concurrent
+            # readers must never answer a miss from a half-loaded directory
+            ids = self._ids if same_database else {}
+            max_id = self._max_id if same_database else 0
+
+            rows = db.execute(
+                select(Account.id, Account.account_number)
+                .where(Account.id > max_id)
+                .order_by(Account.id)
+            ).all()
+            for account_id, account_number in rows:
+                ids[account_number] = account_id
+            if rows:
+                max_id = rows[-1][0]
+
+            self._ids = ids
+            self._max_id = max_id
+            self._last_refresh = time.monotonic()
+            # Last: resolve() refreshes (and waits for the lock) until the bind matches
+            self._bind = bind
+
+        if rows:
+            logger.debug(f"Account directory loaded {len(rows)} accounts (max id {self._max_id})")
+        return len(rows)
+
+    def forget(self, account_number: str) -> None:
+        """Drop an entry that no longer matches the database"""
+        with self._lock:
+            self._ids.pop(account_number, None)
+
+    def _refresh_due(self) -> bool:
+        return self._last_refresh is None or time.monotonic() - self._last_refresh >= self.refresh_interval
+
+
+_directory: Optional[AccountDirectory] = None
+_directory_lock = threading.Lock()
+
+
+def get_account_directory() -> AccountDirectory:
+    """Get the process-wide account directory, creating it on first call"""
+    global _directory
+    if _directory is None:
+        with _directory_lock:
+            if _directory is None:
+                from ..config.settings import get_settings
+                _directory = AccountDirectory(get_settings().transfer.directory_refresh_seconds)
+    return _directory
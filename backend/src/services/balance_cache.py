@@ -0,0 +1,228 @@
+"""
+Balance Cache
+Process-wide cache of account balances for the balance endpoint
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, Engine
+
+from ..database.connection import get_engine
+from ..models.database_models import Account
+from ..utils.formatting import CurrencyFormatter
+
+logger = logging.getLogger(__name__)
+
+_BALANCE_COLUMNS = (
+    Account.id,
+    Account.balance,
+    Account.balance_version,
+    Account.account_name,
+    Account.updated_at,
+    Account.created_at,
+)
+
+
+class _CacheConnection:
+    """A connection reserved for cache lookups and the ``data_version`` it last saw"""
+
+    __slots__ = ("engine", "connection", "data_version")
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.connection: Connection = engine.connect()
+        self.data_version: Optional[int] = None
+
+
+class BalanceCache:
+    """
+    In-memory cache of ``/accounts/{id}/balance`` payloads keyed by account id
+
+    Each entry remembers the account's ``balance_version``, which transfers
+    bump in the same commit that moves the money. Lookups run on a small
+    set of dedicated SQLite connections, and each reads ``PRAGMA
+    data_version`` first; SQLite changes that value whenever any other
+    connection, in this process or another worker, commits to the database.
+    When it changed since that connection last looked, the cached ids are
+    re-checked against ``balance_version`` in a single query and entries
+    whose version moved are dropped. A transfer that has returned its
+    response has committed, so the next lookup in any worker sees the new
+    ``data_version`` and cannot serve the old balance.
+
+    The lock only guards the entry dict and the connection list; queries
+    run outside it, so lookups from several threads do not wait for each
+    other's database reads. Every revalidation bumps a generation counter,
+    and a row loaded before a revalidation began is returned but not
+    cached, since it may predate the commit that triggered it.
+
+    Databases without ``data_version`` (non-SQLite, in-memory) are read
+    through without caching.
+
+    Args:
+        max_entries: Maximum number of cached accounts (least recently used evicted)
+        max_idle_connections: Dedicated connections kept open between lookups
+    """
+
+    def __init__(self, max_entries: int = 1024, max_idle_connections: int = 4):
+        self.max_entries = max_entries
+        self.max_idle_connections = max_idle_connections
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._idle: List[_CacheConnection] = []
+
+    def get(self, account_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the balance payload for an account
+
+        Args:
+            account_id: Account ID
+
+        Returns:
+            Balance dict, or None if the account does not exist
+        """
+        engine = get_engine()
+        if engine.dialect.name != "sqlite" or engine.url.database in (None, "", ":memory:"):
+            with engine.connect() as uncached:
+                entry = self._load(uncached, account_id)
+            return entry[1] if entry else None
+
+        cache_connection = self._checkout(engine)
+        try:
+            self._revalidate(cache_connection)
+
+            with self._lock:
+                entry = self._entries.get(account_id)
+                if entry is not None:
+                    self._entries.move_to_end(account_id)
+                    self.hits += 1
+                    return dict(entry[1])
+                self.misses += 1
+                generation = self._generation
+
+            entry = self._load(cache_connection.connection, account_id)
+            if entry is None:
+                return None
+
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[account_id] = entry
+                    if len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            return dict(entry[1])
+
+        except Exception:
+            self._discard(cache_connection)
+            cache_connection = None
+            raise
+        finally:
+            if cache_connection is not None:
+                # End the implicit transaction so the next lookup reads fresh data
+                cache_connection.connection.rollback()
+                self._checkin(cache_connection)
+
+    def clear(self) -> None:
+        """Drop every cached entry (for writers that change balances outside transfers)"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Release the idle connections and drop every cached entry"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._generation += 1
+            self._entries.clear()
+        for cache_connection in idle:
+            self._discard(cache_connection)
+
+    def _checkout(self, engine: Engine) -> _CacheConnection:
+        with self._lock:
+            stale = [cache_connection for cache_connection in self._idle if cache_connection.engine is not engine]
+            if stale:
+                # The engine was reset (tests, settings change): entries may be from another database
+                self._idle = [cache_connection for cache_connection in self._idle if cache_connection.engine is engine]
+                self._generation += 1
+                self._entries.clear()
+            cache_connection = self._idle.pop() if self._idle else None
+        for connection in stale:
+            self._discard(connection)
+        return cache_connection if cache_connection is not None else _CacheConnection(engine)
+
+    def _checkin(self, cache_connection: _CacheConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle_connections:
+                self._idle.append(cache_connection)
+                return
+        self._discard(cache_connection)
+
+    @staticmethod
+    def _discard(cache_connection: Optional[_CacheConnection]) -> None:
+        if cache_connection is None:
+            return
+        try:
+            cache_connection.connection.close()
+        except Exception:
+            logger.warning("Failed to close balance cache connection", exc_info=True)
+
+    def _revalidate(self, cache_connection: _CacheConnection) -> None:
+        connection = cache_connection.connection
+        data_version = connection.exec_driver_sql("PRAGMA data_version").scalar()
+        if data_version == cache_connection.data_version:
+            # Nothing committed since this connection last revalidated
+            return
+
+        with self._lock:
+            # Loads that started before this point must not be cached
+            self._generation += 1
+            cached = list(self._entries)
+
+        if cached:
+            versions = dict(
+                connection.execute(
+                    select(Account.id, Account.balance_version).where(Account.id.in_(cached))
+                ).all()
+            )
+            with self._lock:
+                for account_id in cached:
+                    entry = self._entries.get(account_id)
+                    if entry is not None and versions.get(account_id) != entry[0]:
+                        del self._entries[account_id]
+
+        cache_connection.data_version = data_version
+
+    @staticmethod
+    def _load(connection: Connection, account_id: int) -> Optional[Tuple[int, Dict[str, Any]]]:
+        row = connection.execute(select(*_BALANCE_COLUMNS).where(Account.id == account_id)).first()
+        if row is None:
+            return None
+
+        last_updated = row.updated_at if row.updated_at else row.created_at
+        return row.balance_version, {
+            "account_id": row.id,
+            "balance": float(row.balance),
+            "formatted_balance": CurrencyFormatter.format_amount(row.balance, "won"),
+            "account_name": row.account_name,
+            "last_updated": last_updated.isoformat()
+        }
+
+
+_balance_cache: Optional[BalanceCache] = None
+_balance_cache_lock = threading.Lock()
+
+
+def get_balance_cache() -> BalanceCache:
+    """Get the process-wide balance cache, creating it on first call"""
+    global _balance_cache
+    if _balance_cache is None:
+        with _balance_cache_lock:
+            if _balance_cache is None:
+                from ..config.settings import get_settings
+                _balance_cache = BalanceCache(get_settings().api.balance_cache_size)
+    return _balance_cache
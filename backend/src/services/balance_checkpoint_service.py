@@ -0,0 +1,410 @@
+"""
+Balance Checkpoint Service
+Point-in-time balances from periodic ledger checkpoints
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from ..models.balance_checkpoint import BalanceCheckpoint
+from ..models.database_models import Account
+from ..utils.downsampling import lttb_indices
+from ..utils.formatting import CurrencyFormatter
+
+logger = logging.getLogger(__name__)
+
+# Deposits add to the balance; withdrawals and outgoing transfers subtract
+_SIGNED_AMOUNT = "CASE WHEN transaction_type = 'deposit' THEN amount ELSE -amount END"
+_COMPLETED = "COALESCE(status, 'completed') = 'completed'"
+
+# Raw SQL keeps stored timestamps as stored strings, so a checkpoint compares
+# byte-for-byte with the transaction_date it was copied from
+_LATEST_CHECKPOINT = text(f"""
+    SELECT checkpoint_at, transaction_id, balance
+    FROM {BalanceCheckpoint.__tablename__}
+    WHERE account_id = :account_id AND checkpoint_at < :before
+    ORDER BY checkpoint_at DESC, transaction_id DESC
+    LIMIT 1
+""")
+
+_FIRST_TRANSACTION = text(f"""
+    SELECT transaction_date, id, balance_after - ({_SIGNED_AMOUNT})
+    FROM transactions
+    WHERE account_id = :account_id AND {_COMPLETED}
+    ORDER BY transaction_date, id
+    LIMIT 1
+""")
+
+_SUM_FROM_START = text(f"""
+    SELECT COUNT(*), COALESCE(SUM({_SIGNED_AMOUNT}), 0)
+    FROM transactions
+    WHERE account_id = :account_id AND {_COMPLETED} AND transaction_date < :before
+""")
+
+_SUM_AFTER_CHECKPOINT = text(f"""
+    SELECT COUNT(*), COALESCE(SUM({_SIGNED_AMOUNT}), 0)
+    FROM transactions
+    WHERE account_id = :account_id AND {_COMPLETED}
+      AND transaction_date >= :after_at AND (transaction_date > :after_at OR id > :after_id)
+      AND transaction_date < :before
+""")
+
+_ROWS_AFTER_CHECKPOINT = text(f"""
+    SELECT id, date(transaction_date)
+    FROM transactions
+    WHERE account_id = :account_id AND {_COMPLETED}
+      AND transaction_date >= :after_at AND (transaction_date > :after_at OR id > :after_id)
+    ORDER BY transaction_date, id
+""")
+
+_ALL_ROWS = text(f"""
+    SELECT id, date(transaction_date)
+    FROM transactions
+    WHERE account_id = :account_id AND {_COMPLETED}
+    ORDER BY transaction_date, id
+""")
+
+_CHECKPOINTS_IN_RANGE = text(f"""
+    SELECT checkpoint_at, balance
+    FROM {BalanceCheckpoint.__tablename__}
+    WHERE account_id = :account_id AND checkpoint_at >= :start AND checkpoint_at < :before
+    ORDER BY checkpoint_at, transaction_id
+""")
+
+_LEDGER_IN_RANGE = text(f"""
+    SELECT transaction_date, balance_after
+    FROM transactions
+    WHERE account_id = :account_id AND {_COMPLETED}
+      AND transaction_date >= :start AND transaction_date < :before
+    ORDER BY transaction_date, id
+""")
+
+_LEDGER_IN_RANGE_AFTER_CHECKPOINT = text(f"""
+    SELECT transaction_date, balance_after
+    FROM transactions
+    WHERE account_id = :account_id AND {_COMPLETED}
+      AND transaction_date >= :after_at AND (transaction_date > :after_at OR id > :after_id)
+      AND transaction_date >= :start AND transaction_date < :before
+    ORDER BY transaction_date, id
+""")
+
+# Capped: only whether the account has reached checkpoint_every rows matters
+_ROWS_SINCE_CHECKPOINT = text(f"""
+    SELECT COUNT(*) FROM (
+        SELECT 1
+        FROM transactions
+        WHERE account_id = :account_id AND {_COMPLETED}
+          AND transaction_date >= :after_at AND (transaction_date > :after_at OR id > :after_id)
+        LIMIT :limit
+    )
+""")
+
+_ROWS_SINCE_START = text(f"""
+    SELECT COUNT(*) FROM (
+        SELECT 1
+        FROM transactions
+        WHERE account_id = :account_id AND {_COMPLETED}
+        LIMIT :limit
+    )
+""")
+
+_INSERT_CHECKPOINTS = text(f"""
+    INSERT INTO {BalanceCheckpoint.__tablename__} (account_id, checkpoint_at, transaction_id, balance)
+    SELECT account_id, transaction_date, id, balance_after
+    FROM transactions
+    WHERE id IN :ids
+""").bindparams(bindparam("ids", expanding=True))
+
+# Upper bound for "any time": sorts after every stored timestamp
+_END_OF_TIME = "9999-12-31 23:59:59.999999"
+
+
+class BalanceCheckpointService:
+    """
+    Service class for point-in-time balances
+
+    A checkpoint records an account's ``balance_after`` at one ledger row,
+    written for the last row of each day and after every
+    ``checkpoint_every`` rows. Transfers write the count-based checkpoints
+    themselves, in their own commit (see ``record``); the scheduled job adds
+    the end-of-day ones and covers rows written outside transfers. The
+    balance at the end of a day is the latest
+    checkpoint before the next midnight (one primary-key probe) plus the sum
+    of the account's rows after it and before midnight. That is an index
+    range of at most ``checkpoint_every`` rows, plus rows newer than the
+    last checkpoint run. Checkpoints outlive archived months, so history
+    moved to the archive tier still answers from the hot database. Days
+    before an account's first checkpoint replay its ledger from the start,
+    archived months included.
+
+    Args:
+        db: Database session
+        checkpoint_every: Maximum ledger rows between checkpoints
+    """
+
+    CHECKPOINT_EVERY = 200
+    ACCOUNT_BATCH_SIZE = 500
+    INSERT_BATCH_SIZE = 500
+
+    def __init__(self, db: Session, checkpoint_every: Optional[int] = None):
+        self.db = db
+        self.checkpoint_every = checkpoint_every or self.CHECKPOINT_EVERY
+
+    def balance_as_of(self, account_id: int, as_of: date) -> Optional[Dict[str, Any]]:
+        """
+        Get an account's balance at the end of a day
+
+        Args:
+            account_id: Account ID
+            as_of: Day whose closing balance to return
+
+        Returns:
+            Balance dict, or None if the account does not exist
+        """
+        account = self.db.get(Account, account_id)
+        if account is None:
+            return None
+
+        before = datetime.combine(as_of + timedelta(days=1), time.min).isoformat(" ")
+        params = {"account_id": account_id, "before": before}
+
+        checkpoint = self.db.execute(_LATEST_CHECKPOINT, params).first()
+        if checkpoint is not None:
+            after_at, after_id, opening = checkpoint
+            scanned, delta = self.db.execute(
+                _SUM_AFTER_CHECKPOINT, {**params, "after_at": after_at, "after_id": after_id}
+            ).one()
+        else:
+            opening, scanned, delta = self._replay_from_start(account, as_of, params)
+
+        balance = opening + delta
+        return {
+            "account_id": account_id,
+            "as_of": as_of.isoformat(),
+            "balance": float(balance),
+            "formatted_balance": CurrencyFormatter.format_amount(balance, "won"),
+            "account_name": account.account_name,
+            "checkpoint": {
+                "transaction_id": checkpoint[1],
+                "checkpoint_at": str(checkpoint[0]),
+            } if checkpoint is not None else None,
+            "transactions_scanned": scanned,
+        }
+
+    def _replay_from_start(self, account: Account, as_of: date,
+                           params: Dict[str, Any]) -> Tuple[float, int, float]:
+        """
+        Opening balance, rows and signed sum of an account's ledger before ``params['before']``
+
+        Without a checkpoint the whole ledger is replayed, archived months
+        included: the opening balance is implied by the account's first row
+        in the hot table or the archive, whichever is older.
+        """
+        from ..database.archive import TransactionArchive
+
+        archive = TransactionArchive(self.db)
+        first = self.db.execute(_FIRST_TRANSACTION, params).first()
+        for partition in reversed(archive.partitions_for_range()):
+            with archive.session(partition) as archive_db:
+                archived_first = archive_db.execute(_FIRST_TRANSACTION, params).first()
+            if archived_first is not None:
+                # Oldest archived month with rows; hot rows may still predate it
+                if first is None or tuple(archived_first[:2]) < tuple(first[:2]):
+                    first = archived_first
+                break
+        if first is None:
+            # No ledger to replay; the balance has never changed
+            return account.balance, 0, 0.0
+
+        scanned, delta = self.db.execute(_SUM_FROM_START, params).one()
+        for partition in archive.partitions_for_range(to_date=as_of):
+            with archive.session(partition) as archive_db:
+                archived_scanned, archived_delta = archive_db.execute(_SUM_FROM_START, params).one()
+            scanned += archived_scanned
+            delta += archived_delta
+        return first[2], scanned, delta
+
+    def balance_series(self, account_id: int, start: date, end: date,
+                       points: int = 200) -> Optional[Dict[str, Any]]:
+        """
+        Get an account's balance over a date range, downsampled for charting
+
+        Checkpointed history is read from the checkpoints alone, at most one
+        point per day plus one per ``checkpoint_every`` rows. Only rows newer
+        than the last checkpoint come from the ledger. The source size
+        therefore depends on the number of days in the range, not on the
+        number of transactions. The source series is reduced to ``points``
+        points with LTTB. The series starts with the closing balance of the
+        day before ``start``, when the account has history before then.
+
+        Args:
+            account_id: Account ID
+            start: First day of the range
+            end: Last day of the range (inclusive)
+            points: Maximum number of points returned
+
+        Returns:
+            Series dict, or None if the account does not exist
+        """
+        opening = self.balance_as_of(account_id, start - timedelta(days=1))
+        if opening is None:
+            return None
+
+        params = {
+            "account_id": account_id,
+            "start": datetime.combine(start, time.min).isoformat(" "),
+            "before": datetime.combine(end + timedelta(days=1), time.min).isoformat(" "),
+        }
+        source = []
+        if opening["checkpoint"] is not None or opening["transactions_scanned"]:
+            source.append((datetime.combine(start, time.min), opening["balance"]))
+
+        source.extend(self.db.execute(_CHECKPOINTS_IN_RANGE, params).all())
+        last = self.db.execute(
+            _LATEST_CHECKPOINT, {"account_id": account_id, "before": _END_OF_TIME}
+        ).first()
+        if last is None:
+            from ..database.archive import TransactionArchive
+
+            archive = TransactionArchive(self.db)
+            ledger = []
+            for partition in reversed(archive.partitions_for_range(start, end)):
+                with archive.session(partition) as archive_db:
+                    ledger.extend(archive_db.execute(_LEDGER_IN_RANGE, params).all())
+            ledger.extend(self.db.execute(_LEDGER_IN_RANGE, params).all())
+            # Rows added to a month after it was archived are still hot
+            source.extend(sorted(ledger, key=lambda point: str(point[0])))
+        else:
+            source.extend(self.db.execute(
+                _LEDGER_IN_RANGE_AFTER_CHECKPOINT, {**params, "after_at": last[0], "after_id": last[1]}
+            ).all())
+
+        timestamps = [
+            value if isinstance(value, datetime) else datetime.fromisoformat(value)
+            for value, _ in source
+        ]
+        balances = [float(balance) for _, balance in source]
+        selected = lttb_indices([timestamp.timestamp() for timestamp in timestamps], balances, points)
+
+        return {
+            "account_id": account_id,
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "source_points": len(source),
+            "points": len(selected),
+            "series": [
+                {"timestamp": timestamps[index].isoformat(), "balance": balances[index]}
+                for index in selected
+            ],
+        }
+
+    def record(self, transactions: Iterable[Any]) -> int:
+        """
+        Checkpoint accounts that reached ``checkpoint_every`` rows since their last checkpoint
+
+        Called on the transfer path with the flushed ledger rows of one
+        transfer, before its commit. Each account costs a primary-key probe
+        and a count of at most ``checkpoint_every`` index entries, so the
+        rows ``balance_as_of`` sums after a checkpoint stay bounded between
+        scheduled runs.
+
+        Args:
+            transactions: Flushed transaction rows
+
+        Returns:
+            int: Number of checkpoints written
+        """
+        latest: Dict[int, int] = {}
+        for transaction in transactions:
+            latest[transaction.account_id] = max(transaction.id, latest.get(transaction.account_id, 0))
+
+        due = []
+        for account_id, transaction_id in latest.items():
+            params = {"account_id": account_id, "limit": self.checkpoint_every}
+            last = self.db.execute(
+                _LATEST_CHECKPOINT, {"account_id": account_id, "before": _END_OF_TIME}
+            ).first()
+            if last is not None:
+                rows = self.db.execute(
+                    _ROWS_SINCE_CHECKPOINT, {**params, "after_at": last[0], "after_id": last[1]}
+                ).scalar()
+            else:
+                rows = self.db.execute(_ROWS_SINCE_START, params).scalar()
+            if rows >= self.checkpoint_every:
+                due.append(transaction_id)
+        return self._insert(due)
+
+    def build_checkpoints(self, account_ids: Optional[Iterable[int]] = None,
+                          today: Optional[date] = None) -> int:
+        """
+        Write checkpoints for ledger rows added since each account's last checkpoint
+
+        A row gets a checkpoint if it is the last row of a finished day, or
+        if ``checkpoint_every`` rows have passed since the previous
+        checkpoint. Commits every ``ACCOUNT_BATCH_SIZE`` accounts.
+
+        Args:
+            account_ids: Accounts to process (default: all)
+            today: Current day; its rows only get count-based checkpoints (default: today)
+
+        Returns:
+            int: Number of checkpoints written
+        """
+        if account_ids is None:
+            account_ids = [row[0] for row in self.db.query(Account.id).order_by(Account.id)]
+        today_key = (today or date.today()).isoformat()
+
+        written = 0
+        pending: List[int] = []
+        try:
+            for index, account_id in enumerate(account_ids, 1):
+                pending.extend(self._select_checkpoint_rows(account_id, today_key))
+                if len(pending) >= self.INSERT_BATCH_SIZE:
+                    written += self._insert(pending)
+                    pending = []
+                if index % self.ACCOUNT_BATCH_SIZE == 0:
+                    written += self._insert(pending)
+                    pending = []
+                    self.db.commit()
+            written += self._insert(pending)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        if written:
+            logger.info(f"Wrote {written:,} balance checkpoints")
+        return written
+
+    def _select_checkpoint_rows(self, account_id: int, today_key: str) -> List[int]:
+        last = self.db.execute(
+            _LATEST_CHECKPOINT, {"account_id": account_id, "before": _END_OF_TIME}
+        ).first()
+        if last is not None:
+            rows = self.db.execute(
+                _ROWS_AFTER_CHECKPOINT,
+                {"account_id": account_id, "after_at": last[0], "after_id": last[1]}
+            ).all()
+        else:
+            rows = self.db.execute(_ALL_ROWS, {"account_id": account_id}).all()
+
+        selected = []
+        since_checkpoint = 0
+        for index, (transaction_id, day) in enumerate(rows):
+            since_checkpoint += 1
+            next_day = rows[index + 1][1] if index + 1 < len(rows) else None
+            day_closed = day != next_day if next_day is not None else day < today_key
+            if day_closed or since_checkpoint >= self.checkpoint_every:
+                selected.append(transaction_id)
+                since_checkpoint = 0
+        return selected
+
+    def _insert(self, transaction_ids: List[int]) -> int:
+        if not transaction_ids:
+            return 0
+        self.db.execute(_INSERT_CHECKPOINTS, {"ids": transaction_ids})
+        return len(transaction_ids)
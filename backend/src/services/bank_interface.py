@@ -9,6 +9,7 @@ from typing import Dict, Any, List, Optional
 import random
 import time
 from ..models.virtual_bank import VirtualBank
+from ..utils.validators import TransferValidator
 
 
 class AbstractBankInterface(ABC):
@@ -48,11 +49,14 @@ class VirtualBankInterface(AbstractBankInterface):
     
     def validate_account(self, account_number: str) -> bool:
         """
-        Simulate account validation
-        Implementation will be added in Phase 4 (User Story 2)
+        Pre-validate an account number for this bank without a round trip
+        
+        Virtual banks do not publish their account lists, so this checks the
+        bank's account number format (precompiled patterns); the bank itself
+        decides on transfer.
         """
-        # TODO: Implement in Phase 4
-        raise NotImplementedError("Account validation not implemented yet")
+        is_valid, _ = TransferValidator.validate_account_number_for_transfer(account_number, self.bank.bank_code)
+        return is_valid
     
     def get_transfer_fee(self, amount: float) -> float:
         """
@@ -0,0 +1,370 @@
+"""
+Transaction Categorization
+Keyword rules compiled into an Aho-Corasick automaton over transaction descriptions
+
+Usage:
+    python -m src.services.categorization                     # categorize uncategorized history
+    python -m src.services.categorization --workers 8 --recategorize
+"""
+
+import argparse
+import logging
+import multiprocessing
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..models.database_models import TransactionCategory
+
+logger = logging.getLogger(__name__)
+
+# Category name -> keywords. Earlier categories win ties between equally long matches.
+DEFAULT_RULES: Dict[str, List[str]] = {
+    "급여": ["월급", "급여", "보너스", "상여금", "salary", "payroll"],
+    "저축": ["적금", "예금", "저축"],
+    "투자": ["투자", "주식", "펀드", "배당", "증권"],
+    "식비": ["식사", "점심", "저녁", "아침", "커피", "카페", "편의점", "마트", "장보기", "배달",
+             "음식", "식당", "식료품", "외식", "베이커리", "치킨", "피자"],
+    "교통비": ["택시", "지하철", "버스", "주유", "교통", "기차", "ktx", "주차", "톨게이트"],
+    "쇼핑": ["쇼핑", "옷", "의류", "도서", "온라인", "백화점", "생활용품", "구매"],
+    "이체": ["이체", "송금", "transfer"],
+}
+
+# Used for descriptions that match no rule, if the category exists
+FALLBACK_CATEGORIES = ("기타", "일반")
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a set of keywords
+
+    Finds every keyword occurrence in one left-to-right pass. The cost is
+    O(text length + matches), independent of the number of keywords.
+
+    Args:
+        keywords: Keyword -> value reported when it matches
+    """
+
+    def __init__(self, keywords: Dict[str, Any]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Any]]] = [[]]
+
+        for keyword, value in keywords.items():
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(keyword), value))
+
+        # Breadth-first failure links; each state also reports its suffixes' keywords
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Yield ``(end index, keyword length, value)`` for every keyword occurrence
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in output[state]:
+                yield index, length, value
+
+
+class TransactionCategorizer:
+    """
+    Assigns a category to a transaction description
+
+    The longest matching keyword decides. Equally long keywords go to the
+    category listed first in the rules. Descriptions with no match get the
+    fallback category, or None if no fallback category exists. Matching is
+    case-insensitive.
+
+    Args:
+        rules: Category name -> keywords (rules for categories missing from ``category_ids`` are ignored)
+        category_ids: Category name -> id
+    """
+
+    def __init__(self, rules: Dict[str, Sequence[str]], category_ids: Dict[str, int]):
+        self.category_ids = dict(category_ids)
+        keywords: Dict[str, Tuple[int, int]] = {}
+        for priority, (name, words) in enumerate(rules.items()):
+            category_id = self.category_ids.get(name)
+            if category_id is None:
+                continue
+            for word in words:
+                keywords.setdefault(word.lower(), (-priority, category_id))
+        self._automaton = KeywordAutomaton(keywords)
+        self.fallback_id = next(
+            (self.category_ids[name] for name in FALLBACK_CATEGORIES if name in self.category_ids), None
+        )
+
+    @classmethod
+    def from_db(cls, db: Session, rules: Optional[Dict[str, Sequence[str]]] = None) -> "TransactionCategorizer":
+        """Build a categorizer for the categories stored in the database"""
+        category_ids = dict(db.query(TransactionCategory.name, TransactionCategory.id).all())
+        return cls(rules or DEFAULT_RULES, category_ids)
+
+    def categorize(self, description: Optional[str], fallback: Optional[str] = None) -> Optional[int]:
+        """
+        Get the category id for a description
+
+        Args:
+            description: Transaction description
+            fallback: Category name to use instead of the default fallback when nothing matches
+
+        Returns:
+            Category id, or None
+        """
+        best = None
+        if description:
+            for _, length, (priority, category_id) in self._automaton.matches(description.lower()):
+                if best is None or (length, priority) > best[:2]:
+                    best = (length, priority, category_id)
+        if best is not None:
+            return best[2]
+        if fallback is not None and fallback in self.category_ids:
+            return self.category_ids[fallback]
+        return self.fallback_id
+
+    def categorize_many(self, rows: Sequence[Tuple[int, Optional[str]]]) -> List[Tuple[int, int]]:
+        """
+        Categorize ``(id, description)`` rows
+
+        Descriptions repeat heavily (merchants, salary, recurring transfers),
+        so each distinct description is matched once per call.
+
+        Returns:
+            ``(category_id, id)`` pairs for rows that got a category, ready for executemany
+        """
+        categorize = self.categorize
+        seen: Dict[Optional[str], Optional[int]] = {}
+        pairs = []
+        for row_id, description in rows:
+            category_id = seen.get(description, seen)
+            if category_id is seen:
+                category_id = seen[description] = categorize(description)
+            if category_id is not None:
+                pairs.append((category_id, row_id))
+        return pairs
+
+
+_categorizer: Optional[TransactionCategorizer] = None
+_categorizer_bind = None
+_categorizer_lock = threading.Lock()
+
+
+def get_categorizer(db: Session) -> TransactionCategorizer:
+    """Get the process-wide categorizer, building it from the database on first use"""
+    global _categorizer, _categorizer_bind
+    bind = db.get_bind()
+    if _categorizer is None or _categorizer_bind is not bind:
+        with _categorizer_lock:
+            if _categorizer is None or _categorizer_bind is not bind:
+                _categorizer = TransactionCategorizer.from_db(db)
+                _categorizer_bind = bind
+    return _categorizer
+
+
+def reset_categorizer() -> None:
+    """Rebuild the categorizer on next use (after categories or rules change)"""
+    global _categorizer
+    _categorizer = None
+
+
+# ---------------------------------------------------------------------------
+# Backfill
+# ---------------------------------------------------------------------------
+
+_worker_categorizer: Optional[TransactionCategorizer] = None
+
+
+def _init_worker(rules: Dict[str, List[str]], category_ids: Dict[str, int]) -> None:
+    global _worker_categorizer
+    _worker_categorizer = TransactionCategorizer(rules, category_ids)
+
+
+def _categorize_chunk(database_path: str, first_id: int, last_id: int,
+                      recategorize: bool) -> Tuple[int, List[Tuple[int, int]]]:
+    """Read one id range read-only and categorize it (process pool task)"""
+    conn = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True, timeout=30)
+    try:
+        condition = "" if recategorize else " AND category_id IS NULL"
+        rows = conn.execute(
+            f"SELECT id, description FROM transactions WHERE id BETWEEN ? AND ?{condition}",
+            (first_id, last_id)
+        ).fetchall()
+    finally:
+        conn.close()
+    return len(rows), _worker_categorizer.categorize_many(rows)
+
+
+def _backfill_archive(database_path: str, categorizer: TransactionCategorizer,
+                      recategorize: bool) -> Tuple[int, int]:
+    """Categorize archived months, rewriting the archive files that change"""
+    from sqlalchemy import create_engine, inspect
+
+    from ..database.archive import TransactionArchive
+    from ..models.database_models import TransactionPartition
+
+    engine = create_engine(f"sqlite:///{database_path}")
+    scanned = updated = 0
+    try:
+        if not inspect(engine).has_table(TransactionPartition.__tablename__):
+            return 0, 0
+        with Session(bind=engine) as db:
+            archive = TransactionArchive(db)
+            for partition in archive.partitions_for_range():
+                def apply(conn: sqlite3.Connection) -> int:
+                    nonlocal scanned
+                    condition = "" if recategorize else " WHERE category_id IS NULL"
+                    rows = conn.execute(f"SELECT id, description FROM transactions{condition}").fetchall()
+                    pairs = categorizer.categorize_many(rows)
+                    conn.executemany("UPDATE transactions SET category_id = ? WHERE id = ?", pairs)
+                    scanned += len(rows)
+                    return len(pairs)
+
+                updated += archive.rewrite(partition, apply)
+    finally:
+        engine.dispose()
+    return scanned, updated
+
+
+def backfill(database_path: str, workers: int = 1, chunk_size: int = 20000,
+             recategorize: bool = False, rules: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+    """
+    Categorize existing transactions in id-range chunks
+
+    Worker processes read and categorize chunks in parallel over read-only
+    connections. This process is the single writer. It applies each
+    chunk's result with one executemany UPDATE by primary key, one commit
+    per chunk, so the write lock is held briefly and the run can be resumed.
+    Archived months are then categorized one archive file at a time.
+
+    Args:
+        database_path: SQLite file
+        workers: Categorizing processes (1 runs in this process)
+        chunk_size: Transaction id range per chunk
+        recategorize: Also re-categorize rows that already have a category
+        rules: Category rules (default: DEFAULT_RULES)
+
+    Returns:
+        Summary dict
+    """
+    rules = rules or DEFAULT_RULES
+    started = time.perf_counter()
+    conn = sqlite3.connect(database_path, timeout=30)
+    try:
+        category_ids = dict(conn.execute("SELECT name, id FROM transaction_categories"))
+        first_id, last_id = conn.execute("SELECT MIN(id), MAX(id) FROM transactions").fetchone()
+        chunks = [] if first_id is None else [
+            (low, min(low + chunk_size - 1, last_id)) for low in range(first_id, last_id + 1, chunk_size)
+        ]
+
+        scanned = updated = 0
+        if workers > 1:
+            # Spawn: the caller may be a threaded server process
+            pool = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker, initargs=(rules, category_ids)
+            )
+            results = pool.map(
+                _categorize_chunk,
+                [database_path] * len(chunks),
+                [low for low, _ in chunks],
+                [high for _, high in chunks],
+                [recategorize] * len(chunks),
+            )
+        else:
+            pool = None
+            _init_worker(rules, category_ids)
+            results = (_categorize_chunk(database_path, low, high, recategorize) for low, high in chunks)
+
+        try:
+            for index, (rows, pairs) in enumerate(results, 1):
+                conn.executemany("UPDATE transactions SET category_id = ? WHERE id = ?", pairs)
+                conn.commit()
+                scanned += rows
+                updated += len(pairs)
+                if index % 50 == 0:
+                    logger.info(f"Categorized {index}/{len(chunks)} chunks ({updated:,} transactions)")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    finally:
+        conn.close()
+
+    archived_scanned, archived_updated = _backfill_archive(
+        database_path, TransactionCategorizer(rules, category_ids), recategorize
+    )
+    scanned += archived_scanned
+    updated += archived_updated
+
+    return {
+        "chunks": len(chunks),
+        "scanned": scanned,
+        "updated": updated,
+        "duration_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: backfill transaction categories"""
+    from ..config.settings import get_settings
+    from .reconciliation import sqlite_database_path
+
+    parser = argparse.ArgumentParser(description="Assign categories to existing transactions")
+    parser.add_argument("--database-url", default=None, help="Database URL (default: DATABASE_URL setting)")
+    parser.add_argument("--workers", type=int, default=1, help="Categorizing processes")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="Transaction id range per chunk")
+    parser.add_argument("--recategorize", action="store_true", help="Also redo already categorized rows")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    database_path = sqlite_database_path(args.database_url or get_settings().database.url)
+    summary = backfill(database_path, args.workers, args.chunk_size, args.recategorize)
+    print(f"✅ Categorized {summary['updated']:,} of {summary['scanned']:,} transactions "
+          f"in {summary['duration_seconds']}s")
+
+    if summary["updated"]:
+        # Categories changed under existing spending totals
+        from sqlalchemy import create_engine
+        from ..models.spending import MonthlyCategorySpend
+        from .spending_service import SpendingService
+
+        engine = create_engine(f"sqlite:///{database_path}")
+        MonthlyCategorySpend.__table__.create(bind=engine, checkfirst=True)
+        with Session(bind=engine) as db:
+            written = SpendingService(db).rebuild()
+        engine.dispose()
+        print(f"✅ Rebuilt {written:,} monthly category spend rows")
+
+
+if __name__ == "__main__":
+    main()
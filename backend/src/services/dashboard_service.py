@@ -0,0 +1,284 @@
+"""
+Dashboard Service
+Everything the account dashboard's first paint needs, read from one snapshot
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, case, desc, func
+from sqlalchemy.orm import Session
+
+from ..models.database_models import Account, Transaction, TransactionPartition
+from ..utils.formatting import BatchFormatter, CurrencyFormatter
+from ..utils.validators import SecurityUtils
+
+
+class DashboardService:
+    """
+    Service class for the combined dashboard payload
+
+    Replaces the account list, account detail, recent transactions and
+    statistics calls the dashboard used to make separately. All reads run
+    in one read transaction, so the balance, the recent rows and the totals
+    describe the same moment. The account summary and the period statistics
+    come from a single conditional aggregate over the account's rows, which
+    also serves the total count. Archived months add their stored row
+    counts to the total; only the months reaching into the summary month or
+    the statistics period are aggregated, and only as many months as the
+    recent rows need are read. The separate endpoints re-scan the ledger
+    for each figure and load every row of the month and of the period.
+
+    SQLite runs one statement at a time per connection, and a second
+    connection would read a different snapshot, so the queries run one
+    after another. There are four of them, plus two registry queries while
+    the archive tier is enabled.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._archive = None
+
+    @property
+    def archive(self):
+        """Archive tier router, created on first use"""
+        if self._archive is None:
+            from ..database.archive import TransactionArchive
+            self._archive = TransactionArchive(self.db)
+        return self._archive
+
+    def get_dashboard(
+        self,
+        account_id: int,
+        accounts_limit: int = 10,
+        transactions_limit: int = 20,
+        period_days: int = 30
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the dashboard payload for an account
+
+        Args:
+            account_id: Account ID
+            accounts_limit: Accounts in the account list
+            transactions_limit: Most recent transactions returned
+            period_days: Statistics period in days
+
+        Returns:
+            Dashboard dict, or None if the account does not exist
+        """
+        self._begin_snapshot()
+        now = datetime.now()
+
+        account = self.db.get(Account, account_id)
+        if account is None:
+            return None
+
+        accounts = self.db.query(Account).order_by(Account.created_at).limit(accounts_limit).all()
+        total_accounts = self.db.query(func.count(Account.id)).scalar()
+
+        # Archived months holding rows of the account, newest first
+        partitions = self.archive.partitions_for_range()
+        archived_counts = self.archive.partition_counts(
+            partitions, [Transaction.account_id == account_id], account_id
+        )
+        archived = [(partition, count) for partition, count in zip(partitions, archived_counts) if count]
+
+        recent = self._recent(account_id, transactions_limit, archived)
+        totals = self._aggregate(account_id, now, period_days, archived)
+
+        return {
+            "snapshot_at": now.isoformat(),
+            "account": {
+                "id": account.id,
+                "account_number": account.account_number,
+                "account_name": account.account_name,
+                "account_type": account.account_type,
+                "balance": float(account.balance),
+                "formatted_balance": CurrencyFormatter.format_amount(account.balance, "won"),
+                "created_at": account.created_at.isoformat(),
+                "updated_at": account.updated_at.isoformat() if account.updated_at else None,
+                "masked_account_number": SecurityUtils.mask_account_number(account.account_number)
+            },
+            "summary": self._summary(totals),
+            "accounts": self._account_list(accounts, total_accounts, accounts_limit),
+            "recent_transactions": [self._transaction(transaction) for transaction in recent],
+            "statistics": self._statistics(totals, now, period_days),
+        }
+
+    def _begin_snapshot(self) -> None:
+        """
+        Open the read transaction every dashboard query runs in
+
+        pysqlite only begins transactions for writes, so each SELECT would
+        otherwise see the database as of its own start. The transaction ends
+        when the session is closed.
+        """
+        connection = self.db.connection()
+        if connection.dialect.name == "sqlite" and not connection.connection.dbapi_connection.in_transaction:
+            connection.exec_driver_sql("BEGIN")
+
+    def _recent(self, account_id: int, limit: int,
+                archived: List[Tuple[TransactionPartition, int]]) -> List[Transaction]:
+        """Newest transactions of the account, from the hot table and as many archived months as needed"""
+        recent_query = (
+            self.db.query(Transaction)
+            .filter(Transaction.account_id == account_id)
+            .order_by(desc(Transaction.transaction_date))
+            .limit(limit)
+        )
+        recent = recent_query.all()
+        for partition, _ in archived:
+            # Months are newest first: once the page is full of rows newer than
+            # this month, neither it nor any older month can contribute
+            if len(recent) >= limit and recent[limit - 1].transaction_date >= partition.period_end:
+                break
+            with self.archive.session(partition) as archive_db:
+                recent.extend(recent_query.with_session(archive_db).all())
+            recent.sort(key=lambda transaction: transaction.transaction_date, reverse=True)
+            del recent[limit:]
+        return recent
+
+    def _aggregate(self, account_id: int, now: datetime, period_days: int,
+                   archived: List[Tuple[TransactionPartition, int]]) -> Dict[str, Any]:
+        """Counts and sums for the summary and the statistics in one pass"""
+        today_start = now.replace(hour=0, minute=0, second=0)
+        month_start = now.replace(day=1, hour=0, minute=0, second=0)
+        period_start = now - timedelta(days=period_days)
+
+        windows = {"today": today_start, "month": month_start, "period": period_start}
+        columns = [func.count(Transaction.id).label("total")]
+        for window, start in windows.items():
+            in_window = Transaction.transaction_date >= start
+            columns.append(func.coalesce(func.sum(case((in_window, 1), else_=0)), 0).label(f"{window}_count"))
+            for transaction_type in ("deposit", "withdrawal", "transfer"):
+                matches = and_(in_window, Transaction.transaction_type == transaction_type)
+                label = f"{window}_{transaction_type}"
+                columns.append(func.coalesce(func.sum(case((matches, 1), else_=0)), 0).label(f"{label}_count"))
+                columns.append(func.coalesce(func.sum(case((matches, Transaction.amount), else_=0)), 0).label(f"{label}_amount"))
+
+        query = self.db.query(*columns).filter(Transaction.account_id == account_id)
+        totals = dict(query.one()._mapping)
+
+        # Archived months count towards the total from their stored counts;
+        # only months reaching into the summary month or the period are read
+        totals["total"] += sum(count for _, count in archived)
+        earliest = min(month_start, period_start)
+        for partition, _ in archived:
+            if partition.period_end <= earliest:
+                continue
+            with self.archive.session(partition) as archive_db:
+                for key, value in query.with_session(archive_db).one()._mapping.items():
+                    if key != "total":
+                        totals[key] += value
+
+        totals["period_start"] = period_start
+        return totals
+
+    @staticmethod
+    def _summary(totals: Dict[str, Any]) -> Dict[str, Any]:
+        """Same shape as ``TransactionService.get_account_summary()['summary']``"""
+        deposits = totals["month_deposit_amount"]
+        withdrawals = totals["month_withdrawal_amount"]
+        return {
+            "total_transactions": totals["total"],
+            "recent_transactions_today": totals["today_count"],
+            "monthly_deposits": {
+                "count": totals["month_deposit_count"],
+                "amount": deposits,
+                "formatted_amount": CurrencyFormatter.format_amount(deposits)
+            },
+            "monthly_withdrawals": {
+                "count": totals["month_withdrawal_count"],
+                "amount": withdrawals,
+                "formatted_amount": CurrencyFormatter.format_amount(withdrawals)
+            },
+            "monthly_net": {
+                "amount": deposits - withdrawals,
+                "formatted_amount": CurrencyFormatter.format_amount(deposits - withdrawals, "accounting")
+            }
+        }
+
+    @staticmethod
+    def _statistics(totals: Dict[str, Any], now: datetime, period_days: int) -> Dict[str, Any]:
+        """Same shape as ``TransactionService.get_transaction_statistics()``"""
+        deposits = totals["period_deposit_amount"]
+        withdrawals = totals["period_withdrawal_amount"]
+        transfers = totals["period_transfer_amount"]
+        deposit_count = totals["period_deposit_count"]
+        withdrawal_count = totals["period_withdrawal_count"]
+        avg_deposit = deposits / deposit_count if deposit_count else 0
+        avg_withdrawal = withdrawals / withdrawal_count if withdrawal_count else 0
+        return {
+            "period_days": period_days,
+            "from_date": totals["period_start"].isoformat(),
+            "to_date": now.isoformat(),
+            "total_transactions": totals["period_count"],
+            "deposits": {
+                "count": deposit_count,
+                "total_amount": deposits,
+                "average_amount": avg_deposit,
+                "formatted_total": CurrencyFormatter.format_amount(deposits),
+                "formatted_average": CurrencyFormatter.format_amount(avg_deposit)
+            },
+            "withdrawals": {
+                "count": withdrawal_count,
+                "total_amount": withdrawals,
+                "average_amount": avg_withdrawal,
+                "formatted_total": CurrencyFormatter.format_amount(withdrawals),
+                "formatted_average": CurrencyFormatter.format_amount(avg_withdrawal)
+            },
+            "transfers": {
+                "count": totals["period_transfer_count"],
+                "total_amount": transfers,
+                "formatted_total": CurrencyFormatter.format_amount(transfers)
+            },
+            "net_change": {
+                "amount": deposits - withdrawals - transfers,
+                "formatted_amount": CurrencyFormatter.format_amount(deposits - withdrawals - transfers, "accounting")
+            }
+        }
+
+    @staticmethod
+    def _account_list(accounts: List[Account], total_count: int, limit: int) -> Dict[str, Any]:
+        """Same shape as ``GET /api/accounts/`` (first page)"""
+        formatted_balances = BatchFormatter.format_amounts([account.balance for account in accounts], "won")
+        return {
+            "data": [
+                {
+                    "id": account.id,
+                    "account_number": account.account_number,
+                    "account_name": account.account_name,
+                    "account_type": account.account_type,
+                    "balance": float(account.balance),
+                    "formatted_balance": formatted_balance,
+                    "masked_account_number": SecurityUtils.mask_account_number(account.account_number),
+                    "created_at": account.created_at.isoformat()
+                }
+                for account, formatted_balance in zip(accounts, formatted_balances)
+            ],
+            "pagination": {
+                "current_page": 1,
+                "total_pages": (total_count + limit - 1) // limit,
+                "page_size": limit,
+                "total_items": total_count,
+                "has_next": limit < total_count,
+                "has_previous": False
+            }
+        }
+
+    @staticmethod
+    def _transaction(transaction: Transaction) -> Dict[str, Any]:
+        """Same shape as the items of ``GET /api/transactions``"""
+        return {
+            "id": transaction.id,
+            "account_id": transaction.account_id,
+            "transaction_date": transaction.transaction_date.isoformat(),
+            "transaction_type": transaction.transaction_type,
+            "amount": float(transaction.amount),
+            "description": transaction.description,
+            "recipient_account": transaction.recipient_account,
+            "balance_after": float(transaction.balance_after),
+            "reference_number": transaction.reference_number,
+            "status": transaction.status,
+            "created_at": transaction.created_at.isoformat()
+        }
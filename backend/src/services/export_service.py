@@ -0,0 +1,125 @@
+"""
+Transaction Export Service
+Encodes streamed transaction batches as CSV or JSON Lines, optionally gzipped,
+one chunk per batch so exports never hold more than a batch in memory
+"""
+
+import codecs
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator, List
+
+from .transaction_service import EXPORT_COLUMNS
+from ..utils.formatting import BatchFormatter
+
+# Rows fetched per cursor round trip and encoded per response chunk
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+}
+
+# Display fields from BatchFormatter.format_transaction_summaries, renamed for export
+FORMATTED_FIELDS = {
+    "date": "formatted_date",
+    "description": "formatted_description",
+    "amount": "formatted_amount",
+    "balance": "formatted_balance",
+    "type_icon": "type_icon",
+}
+
+EXPORT_FIELDS = EXPORT_COLUMNS + tuple(FORMATTED_FIELDS.values())
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+class TransactionExporter:
+    """
+    Encoder for transaction export streams
+
+    Args:
+        export_format: Output format (csv, jsonl)
+        compress: Gzip the encoded stream
+        compression_level: zlib compression level used when compressing
+    """
+
+    def __init__(self, export_format: str = "csv", compress: bool = False, compression_level: int = 6):
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
+        self.export_format = export_format
+        self.compress = compress
+        self.compression_level = compression_level
+
+    @property
+    def media_type(self) -> str:
+        """Content type of the encoded stream"""
+        return "application/gzip" if self.compress else EXPORT_FORMATS[self.export_format]
+
+    def filename(self, stem: str) -> str:
+        """Download file name for ``stem``"""
+        return f"{stem}.{self.export_format}" + (".gz" if self.compress else "")
+
+    @staticmethod
+    def format_batch(batch: list) -> List[dict]:
+        """Build export records from a batch of streamed transaction rows"""
+        summaries = BatchFormatter.format_transaction_summaries(
+            [row.transaction_date for row in batch],
+            [row.description or "" for row in batch],
+            [row.amount for row in batch],
+            [row.transaction_type for row in batch],
+            [row.balance_after for row in batch]
+        )
+        records = []
+        for row, summary in zip(batch, summaries):
+            record = {column: getattr(row, column) for column in EXPORT_COLUMNS}
+            record.update({FORMATTED_FIELDS[key]: value for key, value in summary.items()})
+            record["transaction_date"] = _isoformat(row.transaction_date)
+            record["created_at"] = _isoformat(row.created_at)
+            records.append(record)
+        return records
+
+    def encode(self, batches: Iterable[list]) -> Iterator[bytes]:
+        """
+        Encode row batches into response body chunks
+
+        Args:
+            batches: Lists of transaction rows
+
+        Yields:
+            Encoded (and compressed, if enabled) byte chunks
+        """
+        chunks = self._encode_csv(batches) if self.export_format == "csv" else self._encode_jsonl(batches)
+        return self._gzip(chunks) if self.compress else chunks
+
+    def _encode_csv(self, batches: Iterable[list]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        # BOM so spreadsheet applications detect UTF-8 (Korean descriptions)
+        yield codecs.BOM_UTF8 + buffer.getvalue().encode("utf-8")
+
+        for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(self.format_batch(batch))
+            yield buffer.getvalue().encode("utf-8")
+
+    def _encode_jsonl(self, batches: Iterable[list]) -> Iterator[bytes]:
+        for batch in batches:
+            lines = [json.dumps(record, ensure_ascii=False) for record in self.format_batch(batch)]
+            if lines:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    def _gzip(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        # wbits=31 writes a gzip header/trailer around a single incremental deflate stream
+        compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
@@ -0,0 +1,391 @@
+"""
+Outbox Dispatcher
+Streams committed outbox events, in order and in batches, to pluggable sinks
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..database.connection import SessionLocal
+from ..models.outbox import OutboxCheckpoint, OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE ... WHERE
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+class OutboxSink(ABC):
+    """Destination for outbox event batches"""
+
+    @abstractmethod
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        """Deliver a batch; must raise unless the events are durably stored or acknowledged"""
+        pass
+
+    def close(self) -> None:
+        """Release the sink's resources"""
+        pass
+
+
+class FileSink(OutboxSink):
+    """
+    Append events to a local JSON Lines file
+
+    Args:
+        path: File to append to
+        fsync: Flush each batch to disk before it is checkpointed
+    """
+
+    def __init__(self, path, fsync: bool = True):
+        self.path = Path(path)
+        self.fsync = fsync
+        self._file = None
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "ab")
+        self._file.write("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events).encode("utf-8"))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class UnixSocketSink(OutboxSink):
+    """
+    Write events as JSON Lines to a Unix stream socket
+
+    The connection is opened on first send and re-opened after a failure;
+    the failed batch is re-sent from the checkpoint.
+
+    Args:
+        path: Socket path
+        timeout: Connect/send timeout in seconds
+    """
+
+    def __init__(self, path, timeout: float = 5.0):
+        self.path = str(path)
+        self.timeout = timeout
+        self._socket: Optional[socket.socket] = None
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events).encode("utf-8")
+        try:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.settimeout(self.timeout)
+                self._socket.connect(self.path)
+            self._socket.sendall(data)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+class OutboxBatch:
+    """A batch handed to an in-process consumer, waiting for its acknowledgement"""
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self.events = events
+        self.error: Optional[BaseException] = None
+        self._done = threading.Event()
+
+    def ack(self) -> None:
+        """The consumer has finished with every event of the batch"""
+        self._done.set()
+
+    def nack(self, error: BaseException) -> None:
+        """The consumer failed; the batch is re-sent from the checkpoint"""
+        self.error = error
+        self._done.set()
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        return self._done.wait(timeout)
+
+
+class QueueSink(OutboxSink):
+    """
+    Hand batches to a consumer thread in the same process
+
+    ``send`` blocks until the consumer acknowledges the batch, so the
+    checkpoint only advances over events the consumer has finished with.
+    Batches still in memory when the process dies are re-sent from the
+    checkpoint after a restart. A batch that is nacked, or not acknowledged
+    within ``ack_timeout``, fails the send and is re-sent later; a consumer
+    may therefore see a batch twice and should de-duplicate by event ``id``.
+
+    Args:
+        ack_timeout: Seconds to wait for the consumer to take and acknowledge a batch
+    """
+
+    def __init__(self, ack_timeout: float = 30.0):
+        self.ack_timeout = ack_timeout
+        self._queue: "queue.Queue[OutboxBatch]" = queue.Queue()
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        batch = OutboxBatch(events)
+        self._queue.put(batch)
+        if not batch.wait(self.ack_timeout):
+            raise TimeoutError(f"Outbox queue consumer did not acknowledge {len(events)} events "
+                               f"within {self.ack_timeout}s")
+        if batch.error is not None:
+            raise batch.error
+
+    def get(self, timeout: Optional[float] = None) -> OutboxBatch:
+        """
+        Take the next batch; call ``ack()`` (or ``nack(error)``) on it when done
+
+        Raises:
+            queue.Empty: If no batch arrives within ``timeout``
+        """
+        return self._queue.get(timeout=timeout)
+
+    def consume(self, handler, stop: threading.Event, poll_interval: float = 0.5) -> None:
+        """Run ``handler(events)`` for each batch until ``stop`` is set, acknowledging it on success"""
+        while not stop.is_set():
+            try:
+                batch = self.get(timeout=poll_interval)
+            except queue.Empty:
+                continue
+            try:
+                handler(batch.events)
+            except Exception as e:
+                logger.exception("Outbox queue consumer failed; the batch will be re-sent")
+                batch.nack(e)
+            else:
+                batch.ack()
+
+
+def create_sink(spec: str, ack_timeout: float = 30.0) -> OutboxSink:
+    """
+    Build a sink from a ``file:<path>``, ``unix:<path>`` or ``queue`` spec
+
+    Args:
+        spec: Sink spec (OUTBOX_SINK)
+        ack_timeout: Seconds a ``queue`` sink waits for its consumer's acknowledgement
+
+    Raises:
+        ValueError: If the spec is not recognized
+    """
+    kind, _, target = spec.partition(":")
+    if kind == "file" and target:
+        return FileSink(target)
+    if kind == "unix" and target:
+        return UnixSocketSink(target)
+    if kind == "queue" and not target:
+        return QueueSink(ack_timeout)
+    raise ValueError(f"Unknown outbox sink: {spec!r} (expected file:<path>, unix:<path> or queue)")
+
+
+class OutboxDispatcher:
+    """
+    At-least-once delivery of outbox events to one sink
+
+    Each round reads the next batch after the consumer's checkpoint with a
+    single primary-key range read (``id > checkpoint ORDER BY id``). It
+    sends the batch and only then advances the checkpoint. A crash between
+    send and checkpoint re-sends that batch, so consumers should de-duplicate
+    by event ``id``. On SQLite, event ids are assigned under the database
+    write lock and so follow commit order; the tail never skips a
+    late-committing event.
+
+    Args:
+        sink: Destination for events
+        consumer: Checkpoint name (one per independent sink)
+        batch_size: Maximum events per read and send
+        poll_interval: Seconds to wait when the outbox is drained or a send failed
+        session_factory: Session factory (default: SessionLocal)
+    """
+
+    def __init__(self, sink: OutboxSink, consumer: str = "default", batch_size: int = 500,
+                 poll_interval: float = 0.5, session_factory=None):
+        self.sink = sink
+        self.consumer = consumer
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.delivered = 0
+        self._session_factory = session_factory or SessionLocal
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def dispatch_once(self) -> int:
+        """
+        Deliver the next batch of events
+
+        Returns:
+            int: Number of events delivered (0 when caught up)
+        """
+        db = self._session_factory()
+        try:
+            last_event_id = (
+                db.query(OutboxCheckpoint.last_event_id)
+                .filter(OutboxCheckpoint.consumer == self.consumer)
+                .scalar()
+            ) or 0
+
+            table = OutboxEvent.__table__
+            rows = db.execute(
+                select(table).where(table.c.id > last_event_id).order_by(table.c.id).limit(self.batch_size)
+            ).all()
+            if not rows:
+                return 0
+
+            events = [
+                {
+                    "id": row.id,
+                    "event_type": row.event_type,
+                    "aggregate_type": row.aggregate_type,
+                    "aggregate_id": row.aggregate_id,
+                    "created_at": row.created_at.isoformat() if row.created_at else None,
+                    "payload": json.loads(row.payload),
+                }
+                for row in rows
+            ]
+            self.sink.send(events)
+
+            self._advance_checkpoint(db, events[-1]["id"])
+            db.commit()
+            self.delivered += len(events)
+            return len(events)
+
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def drain(self) -> int:
+        """Deliver batches until caught up; returns the number of events delivered"""
+        total = 0
+        while True:
+            delivered = self.dispatch_once()
+            total += delivered
+            if delivered < self.batch_size:
+                return total
+
+    def start(self) -> None:
+        """Run the dispatcher in a background thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"outbox-{self.consumer}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread after its current batch and close the sink"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.sink.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                delivered = self.dispatch_once()
+            except Exception:
+                logger.exception(f"Outbox dispatch to {self.consumer} failed; retrying")
+                delivered = 0
+            if delivered < self.batch_size:
+                self._stop.wait(self.poll_interval)
+
+    def _advance_checkpoint(self, db, last_event_id: int) -> None:
+        table = OutboxCheckpoint.__table__
+        insert = _UPSERT_INSERTS[db.get_bind().dialect.name]
+        statement = insert(table).values(
+            consumer=self.consumer, last_event_id=last_event_id, updated_at=func.now()
+        )
+        # Never move backwards if another dispatcher for the same consumer got further
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[table.c.consumer],
+            set_={"last_event_id": statement.excluded.last_event_id, "updated_at": statement.excluded.updated_at},
+            where=table.c.last_event_id < statement.excluded.last_event_id
+        ))
+
+
+_dispatcher: Optional[OutboxDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """
+    Get this worker's dispatcher for the sink configured by OUTBOX_SINK
+
+    The scheduler's ``dispatch_outbox`` job drains it under a lease, so only
+    one worker delivers at a time. With ``OUTBOX_SINK=queue`` the in-process
+    consumer reads ``get_outbox_dispatcher().sink`` in every worker.
+
+    Raises:
+        ValueError: If no sink is configured
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                from ..config.settings import get_settings
+                config = get_settings().outbox
+                if not config.sink:
+                    raise ValueError("OUTBOX_SINK is not configured")
+                _dispatcher = OutboxDispatcher(
+                    create_sink(config.sink, config.ack_timeout), config.consumer, config.batch_size,
+                    config.poll_interval
+                )
+    return _dispatcher
+
+
+def close_outbox_dispatcher() -> None:
+    """Close this worker's dispatcher sink if it was created"""
+    global _dispatcher
+    with _dispatcher_lock:
+        dispatcher, _dispatcher = _dispatcher, None
+    if dispatcher is not None:
+        dispatcher.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: deliver pending outbox events to a sink"""
+    parser = argparse.ArgumentParser(description="Deliver committed transfer events from the outbox")
+    parser.add_argument("--sink", required=True, help="file:<path> or unix:<path>")
+    parser.add_argument("--consumer", default="default", help="Checkpoint name")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--follow", action="store_true", help="Keep tailing the outbox until interrupted")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    dispatcher = OutboxDispatcher(create_sink(args.sink), args.consumer, args.batch_size)
+    try:
+        if args.follow:
+            dispatcher.start()
+            threading.Event().wait()
+        else:
+            print(f"✅ Delivered {dispatcher.drain():,} events to {args.sink}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dispatcher.stop()
+
+
+if __name__ == "__main__":
+    main()
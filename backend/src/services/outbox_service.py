@@ -0,0 +1,122 @@
+"""
+Outbox Service
+Records domain events in the same database transaction as the rows they describe
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy.orm import Session
+
+from ..models.database_models import Transaction
+from ..models.outbox import OutboxCheckpoint, OutboxEvent
+from ..models.transfer import Transfer
+
+TRANSFER_COMPLETED = "transfer.completed"
+TRANSACTION_CREATED = "transaction.created"
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OutboxService:
+    """
+    Service class for the transactional outbox
+
+    Events are added to the caller's session and commit or roll back with
+    it, so consumers see an event exactly when its rows are committed.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, event_type: str, aggregate_type: str, aggregate_id: int,
+               payload: Dict[str, Any]) -> OutboxEvent:
+        """
+        Add an event to the current transaction
+
+        Args:
+            event_type: Event name (e.g. transfer.completed)
+            aggregate_type: Kind of row the event describes (transfer, transaction)
+            aggregate_id: ID of that row
+            payload: JSON-serializable event body
+
+        Returns:
+            OutboxEvent: The pending event
+        """
+        event = OutboxEvent(
+            event_type=event_type,
+            aggregate_type=aggregate_type,
+            aggregate_id=aggregate_id,
+            payload=json.dumps(payload, ensure_ascii=False, default=_json_default)
+        )
+        self.db.add(event)
+        return event
+
+    def record_transfer(self, transfer: Transfer, transactions: List[Transaction]) -> None:
+        """
+        Add events for a completed transfer and its transaction records
+
+        Rows must be flushed so their IDs are assigned.
+
+        Args:
+            transfer: Completed transfer
+            transactions: Transaction records created for it
+        """
+        self.record(TRANSFER_COMPLETED, "transfer", transfer.id, {
+            "id": transfer.id,
+            "reference_number": transfer.reference_number,
+            "from_account_id": transfer.from_account_id,
+            "to_account_number": transfer.to_account_number,
+            "to_bank_id": transfer.to_bank_id,
+            "amount": transfer.amount,
+            "description": transfer.description,
+            "transfer_type": transfer.transfer_type,
+            "status": transfer.status,
+            "completed_at": transfer.completed_at,
+            "transaction_ids": [transaction.id for transaction in transactions],
+        })
+        for transaction in transactions:
+            self.record(TRANSACTION_CREATED, "transaction", transaction.id, {
+                "id": transaction.id,
+                "account_id": transaction.account_id,
+                "transaction_type": transaction.transaction_type,
+                "amount": transaction.amount,
+                "description": transaction.description,
+                "recipient_account": transaction.recipient_account,
+                "balance_after": transaction.balance_after,
+                "reference_number": transaction.reference_number,
+                "status": transaction.status,
+                "transfer_id": transfer.id,
+            })
+
+    def purge_delivered(self, consumers: Iterable[str] = ()) -> int:
+        """
+        Delete events every consumer has already been sent
+
+        Only events below the lowest checkpoint are deleted. The event at
+        that checkpoint is kept so the largest id never drops under a
+        checkpoint, which SQLite would otherwise reuse for new events.
+
+        Args:
+            consumers: Consumers that must have a checkpoint before anything
+                is deleted (e.g. the configured OUTBOX_CONSUMER)
+
+        Returns:
+            int: Number of events deleted
+        """
+        checkpoints = dict(self.db.query(OutboxCheckpoint.consumer, OutboxCheckpoint.last_event_id))
+        if not checkpoints or any(consumer not in checkpoints for consumer in consumers):
+            return 0
+        lowest = min(checkpoints.values())
+        deleted = (
+            self.db.query(OutboxEvent)
+            .filter(OutboxEvent.id < lowest)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
@@ -0,0 +1,393 @@
+"""
+Balance Reconciliation
+Checks every account's balance against its transaction ledger
+
+Usage:
+    python -m src.services.reconciliation                 # all accounts, RECONCILE_WORKERS processes
+    python -m src.services.reconciliation --workers 8 --json report.json
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import accumulate, groupby
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+MIN_ACCOUNT_ID = -(2 ** 63)
+MAX_ACCOUNT_ID = 2 ** 63 - 1
+
+# Deposits add to the balance; withdrawals and outgoing transfers subtract.
+# Ordered by the (account_id, transaction_date) index, whose implicit rowid
+# suffix is ``id``, so SQLite streams rows without a sort. Archive files copy
+# the index, so their streams merge with the hot one on the first three columns.
+_LEDGER_QUERY = """
+    SELECT account_id, transaction_date, id,
+           CASE WHEN transaction_type = 'deposit' THEN amount ELSE -amount END,
+           balance_after
+    FROM transactions
+    WHERE account_id > ? AND account_id <= ? AND COALESCE(status, 'completed') = 'completed'
+    ORDER BY account_id, transaction_date, id
+"""
+
+_BALANCE_QUERY = "SELECT id, balance FROM accounts WHERE id > ? AND id <= ?"
+
+
+def sqlite_database_path(url) -> str:
+    """
+    File path of a SQLite database URL
+
+    Raises:
+        ValueError: If the URL is not a file-backed SQLite database
+    """
+    from sqlalchemy.engine import make_url
+
+    url = make_url(url)
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        raise ValueError(f"Reconciliation needs a file-backed SQLite database, not {url.render_as_string()}")
+    return os.path.abspath(url.database)
+
+
+def _connect_read_only(database_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def _stream(cursor: sqlite3.Cursor, fetch_size: int) -> Iterator[tuple]:
+    while True:
+        rows = cursor.fetchmany(fetch_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def reconcile_account(account_id: int, ids: Sequence[int], signed_amounts: Sequence[float],
+                      balances_after: Sequence[float], account_balance: Optional[float],
+                      tolerance: float = 0.01) -> Optional[Dict[str, Any]]:
+    """
+    Reconcile one account's ledger
+
+    The opening balance is implied by the first row (``balance_after - amount``).
+    The running balance is ``opening + cumulative sum of amounts``.
+    ``balance_after - running`` is the ledger's drift. The drift changes
+    exactly at rows whose ``balance_after`` does not follow from the previous
+    row. A wrong amount is therefore one break and a wrong ``balance_after``
+    two (into and out of the row), rather than an error on every later row.
+    An account without ledger rows must have a zero balance.
+
+    Args:
+        account_id: Account id
+        ids: Transaction ids in ledger order (empty for an account without history)
+        signed_amounts: Amounts, negative for debits
+        balances_after: Recorded balance after each row
+        account_balance: ``accounts.balance`` (None if the account row is missing)
+        tolerance: Largest difference treated as equal
+
+    Returns:
+        Mismatch details, or None if the account reconciles
+    """
+    opening = balances_after[0] - signed_amounts[0] if ids else 0.0
+    running = list(accumulate(signed_amounts, initial=opening))
+    drift = [actual - expected for actual, expected in zip(balances_after, running[1:])]
+    breaks = [
+        index for index in range(1, len(drift))
+        if abs(drift[index] - drift[index - 1]) > tolerance
+    ]
+
+    computed_balance = running[-1]
+    ledger_balance = balances_after[-1] if ids else opening
+    balance_difference = None if account_balance is None else account_balance - ledger_balance
+    if not breaks and balance_difference is not None and abs(balance_difference) <= tolerance:
+        return None
+
+    mismatch = {
+        "account_id": account_id,
+        "transactions": len(ids),
+        "opening_balance": opening,
+        "computed_balance": computed_balance,
+        "ledger_balance": ledger_balance,
+        "account_balance": account_balance,
+        "balance_difference": balance_difference,
+        "chain_breaks": len(breaks),
+        "first_break": None,
+        "missing_account": account_balance is None,
+        "missing_history": not ids,
+    }
+    if breaks:
+        index = breaks[0]
+        mismatch["first_break"] = {
+            "transaction_id": ids[index],
+            "expected_balance_after": balances_after[index - 1] + signed_amounts[index],
+            "balance_after": balances_after[index],
+        }
+    return mismatch
+
+
+def reconcile_range(database_path: str, after_id: int, through_id: int,
+                    tolerance: float = 0.01, fetch_size: int = 10000,
+                    archive_paths: Sequence[str] = ()) -> Tuple[int, int, List[Dict[str, Any]]]:
+    """
+    Reconcile accounts with ``after_id < id <= through_id`` (process pool task)
+
+    Every account row is checked, including accounts without ledger rows,
+    as is every ledger of an account id without an account row.
+
+    Args:
+        database_path: SQLite file, opened read-only
+        after_id: Exclusive lower account id bound
+        through_id: Inclusive upper account id bound
+        tolerance: Largest difference treated as equal
+        fetch_size: Rows fetched per cursor round trip
+        archive_paths: Decompressed archived months, merged into each account's ledger
+
+    Returns:
+        (accounts checked, transactions checked, mismatches)
+    """
+    connections = [_connect_read_only(path) for path in (database_path, *archive_paths)]
+    try:
+        account_balances = dict(connections[0].execute(_BALANCE_QUERY, (after_id, through_id)))
+        streams = [
+            _stream(conn.execute(_LEDGER_QUERY, (after_id, through_id)), fetch_size)
+            for conn in connections
+        ]
+        ledger = heapq.merge(*streams, key=itemgetter(0, 1, 2)) if archive_paths else streams[0]
+
+        accounts = transactions = 0
+        mismatches = []
+        without_history = set(account_balances)
+        for account_id, rows in groupby(ledger, key=itemgetter(0)):
+            _, _, ids, signed_amounts, balances_after = zip(*rows)
+            accounts += 1
+            transactions += len(ids)
+            without_history.discard(account_id)
+            mismatch = reconcile_account(
+                account_id, ids, signed_amounts, balances_after,
+                account_balances.get(account_id), tolerance
+            )
+            if mismatch is not None:
+                mismatches.append(mismatch)
+
+        for account_id in without_history:
+            accounts += 1
+            mismatch = reconcile_account(account_id, (), (), (), account_balances[account_id], tolerance)
+            if mismatch is not None:
+                mismatches.append(mismatch)
+        mismatches.sort(key=itemgetter("account_id"))
+        return accounts, transactions, mismatches
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+def archived_ledger_paths(database_path: str) -> List[str]:
+    """Decompressed copies of every archived month of a database, decompressing as needed"""
+    from sqlalchemy import create_engine, inspect
+    from sqlalchemy.orm import Session
+
+    from ..database.archive import TransactionArchive
+    from ..models.database_models import TransactionPartition
+
+    engine = create_engine(f"sqlite:///file:{database_path}?mode=ro&uri=true")
+    try:
+        if not inspect(engine).has_table(TransactionPartition.__tablename__):
+            return []
+        with Session(bind=engine) as db:
+            archive = TransactionArchive(db)
+            return [str(archive.local_path(partition)) for partition in archive.partitions_for_range()]
+    finally:
+        engine.dispose()
+
+
+def _account_ranges(database_path: str, chunks: int) -> List[Tuple[int, int]]:
+    """Split the account id space into ``chunks`` contiguous ranges of similar account counts"""
+    conn = _connect_read_only(database_path)
+    try:
+        account_ids = [row[0] for row in conn.execute("SELECT id FROM accounts ORDER BY id")]
+    finally:
+        conn.close()
+
+    step = max(1, -(-len(account_ids) // max(1, chunks)))
+    bounds = account_ids[step - 1::step]
+    ranges = []
+    after_id = MIN_ACCOUNT_ID
+    for through_id in bounds:
+        ranges.append((after_id, through_id))
+        after_id = through_id
+    # Open-ended last range also catches transactions of accounts that no longer exist
+    ranges.append((after_id, MAX_ACCOUNT_ID))
+    return ranges
+
+
+def reconcile(database_path: str, workers: Optional[int] = None, tolerance: float = 0.01,
+              fetch_size: int = 10000, max_mismatches: Optional[int] = 1000,
+              archive_paths: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Reconcile every account in a SQLite database
+
+    Account id ranges are spread over a process pool, several ranges per
+    worker so a few large accounts do not leave the other workers idle.
+    Every worker streams its ranges through its own read-only connections,
+    merging archived months into each account's ledger.
+
+    Args:
+        database_path: SQLite file
+        workers: Worker processes (default: CPU count; 1 runs in this process)
+        tolerance: Largest difference treated as equal
+        fetch_size: Rows fetched per cursor round trip
+        max_mismatches: Mismatches kept in the report (None keeps all; the count is always exact)
+        archive_paths: Decompressed archived months (default: every month in the archive registry)
+
+    Returns:
+        Report dict
+    """
+    workers = workers or os.cpu_count() or 1
+    started_at = datetime.now()
+    started = time.perf_counter()
+    if archive_paths is None:
+        archive_paths = archived_ledger_paths(database_path)
+    ranges = _account_ranges(database_path, workers * 8 if workers > 1 else 1)
+
+    if workers == 1:
+        results = [
+            reconcile_range(database_path, low, high, tolerance, fetch_size, archive_paths)
+            for low, high in ranges
+        ]
+    else:
+        # Spawn: the caller may be a threaded server process
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(
+                reconcile_range,
+                [database_path] * len(ranges),
+                [low for low, _ in ranges],
+                [high for _, high in ranges],
+                [tolerance] * len(ranges),
+                [fetch_size] * len(ranges),
+                [archive_paths] * len(ranges),
+            ))
+
+    mismatches = [mismatch for _, _, chunk in results for mismatch in chunk]
+    duration = time.perf_counter() - started
+    transactions = sum(result[1] for result in results)
+    return {
+        "started_at": started_at.isoformat(),
+        "duration_seconds": round(duration, 3),
+        "workers": workers,
+        "accounts_checked": sum(result[0] for result in results),
+        "transactions_checked": transactions,
+        "transactions_per_second": round(transactions / duration) if duration else None,
+        "mismatch_count": len(mismatches),
+        "mismatches": mismatches if max_mismatches is None else mismatches[:max_mismatches],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Background runs for the admin endpoint
+# ---------------------------------------------------------------------------
+
+_last_report: Optional[Dict[str, Any]] = None
+_last_error: Optional[str] = None
+_run_thread: Optional[threading.Thread] = None
+_run_lock = threading.Lock()
+
+
+def _run_in_background(database_path: str, workers: int, tolerance: float) -> None:
+    global _last_report, _last_error
+    try:
+        _last_report = reconcile(database_path, workers, tolerance)
+        _last_error = None
+        logger.info(
+            f"Reconciliation checked {_last_report['transactions_checked']:,} transactions, "
+            f"{_last_report['mismatch_count']} mismatched accounts"
+        )
+    except Exception as e:
+        _last_error = f"{type(e).__name__}: {e}"
+        logger.exception("Reconciliation failed")
+
+
+def start_reconciliation() -> bool:
+    """
+    Start a reconciliation of the application database in a background thread
+
+    Returns:
+        bool: False if a run is already in progress in this worker
+
+    Raises:
+        ValueError: If the database is not a file-backed SQLite database
+    """
+    global _run_thread
+    from ..config.settings import get_settings
+
+    settings = get_settings()
+    database_path = sqlite_database_path(settings.database.url)
+    with _run_lock:
+        if _run_thread is not None and _run_thread.is_alive():
+            return False
+        _run_thread = threading.Thread(
+            target=_run_in_background,
+            args=(database_path, settings.reconciliation.workers, settings.reconciliation.tolerance),
+            name="reconciliation",
+            daemon=True
+        )
+        _run_thread.start()
+    return True
+
+
+def reconciliation_status() -> Dict[str, Any]:
+    """State of this worker's latest reconciliation run"""
+    return {
+        "running": _run_thread is not None and _run_thread.is_alive(),
+        "last_error": _last_error,
+        "report": _last_report,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: reconcile all accounts and print mismatches"""
+    from ..config.settings import get_settings
+
+    config = get_settings().reconciliation
+    parser = argparse.ArgumentParser(description="Check account balances against the transaction ledger")
+    parser.add_argument("--database-url", default=None, help="Database URL (default: DATABASE_URL setting)")
+    parser.add_argument("--workers", type=int, default=config.workers, help="Worker processes")
+    parser.add_argument("--tolerance", type=float, default=config.tolerance)
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the full report to this file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    database_path = sqlite_database_path(args.database_url or get_settings().database.url)
+    report = reconcile(database_path, args.workers, args.tolerance, max_mismatches=None)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+
+    for mismatch in report["mismatches"][:20]:
+        detail = f"balance differs by {mismatch['balance_difference']}" if mismatch["balance_difference"] else ""
+        if mismatch["missing_account"]:
+            detail = "account row missing"
+        if mismatch["first_break"]:
+            detail = (f"{mismatch['chain_breaks']} chain breaks, first at transaction "
+                      f"{mismatch['first_break']['transaction_id']}" + (f"; {detail}" if detail else ""))
+        print(f"❌ Account {mismatch['account_id']}: {detail}")
+    if report["mismatch_count"] > 20:
+        print(f"... and {report['mismatch_count'] - 20} more")
+
+    print(f"{'✅' if not report['mismatch_count'] else '⚠️ '} Checked {report['accounts_checked']:,} accounts, "
+          f"{report['transactions_checked']:,} transactions in {report['duration_seconds']}s: "
+          f"{report['mismatch_count']} mismatched")
+
+
+if __name__ == "__main__":
+    main()
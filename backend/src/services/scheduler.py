@@ -0,0 +1,437 @@
+"""
+Job Scheduler
+Periodic background maintenance, started in every worker, with a database lease
+so each exclusive job runs in exactly one worker per interval
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..database.connection import SessionLocal
+from ..models.job_lease import JobLease
+
+logger = logging.getLogger(__name__)
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE ... WHERE
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+class ScheduledJob:
+    """
+    A periodic job and this worker's runtime metrics for it
+
+    Args:
+        name: Unique job name (lease key)
+        interval_seconds: Time between runs, measured from the start of the previous run
+        func: Zero-argument callable; its return value is kept as ``last_result``
+        exclusive: Run in one worker at a time via the database lease; False runs in
+            every worker (e.g. warming per-process caches)
+        lease_seconds: How long a running job holds the lease before another worker
+            may assume it died (default: max(interval, 60s))
+    """
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], Any],
+                 exclusive: bool = True, lease_seconds: Optional[float] = None):
+        self.name = name
+        self.interval = timedelta(seconds=interval_seconds)
+        self.func = func
+        self.exclusive = exclusive
+        self.lease = timedelta(seconds=lease_seconds or max(interval_seconds, 60.0))
+        self.next_check_at: Optional[datetime] = None
+        self.runs = 0
+        self.failures = 0
+        self.total_duration_ms = 0.0
+        self.last_started_at: Optional[datetime] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_status: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_result: Any = None
+
+    def local_status(self) -> Dict[str, Any]:
+        """This worker's view of the job"""
+        return {
+            "name": self.name,
+            "interval_seconds": self.interval.total_seconds(),
+            "exclusive": self.exclusive,
+            "next_check_at": self.next_check_at.isoformat() if self.next_check_at else None,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_duration_ms": self.last_duration_ms,
+            "avg_duration_ms": self.total_duration_ms / self.runs if self.runs else None,
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+            "last_result": self.last_result,
+        }
+
+
+class JobScheduler:
+    """
+    In-process scheduler, safe to start in every worker
+
+    Every worker runs its own scheduler thread. An exclusive job is run by
+    the worker that wins a conditional upsert on its ``job_leases`` row
+    (``WHERE lease_expires_at <= now``). While the job runs, the lease
+    lasts ``lease_seconds``; when it finishes it is shortened to
+    ``started_at + interval``, so no worker runs the job again before then.
+    A worker that dies mid-run gives the job up when its lease expires.
+    Workers re-read a lease only when their copy of its expiry has passed,
+    so idle ticks do not touch the database.
+
+    Run statistics (count, failures, durations, last error) are stored on
+    the lease row for the cluster-wide view; each worker also keeps its own.
+
+    Args:
+        tick_seconds: How often due jobs are checked
+        session_factory: Session factory (default: SessionLocal)
+        owner: Lease owner id (default: host:pid:random)
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, session_factory=None, owner: Optional[str] = None):
+        self.tick_seconds = tick_seconds
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._session_factory = session_factory or SessionLocal
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_job(self, job: ScheduledJob) -> ScheduledJob:
+        """Register a job (before or after start)"""
+        self.jobs[job.name] = job
+        return job
+
+    def start(self) -> None:
+        """Run the scheduler in a background thread"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="job-scheduler", daemon=True)
+        self._thread.start()
+        logger.info(f"Job scheduler started as {self.owner} with {len(self.jobs)} jobs")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop after the job currently running, if any"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_pending(self) -> List[str]:
+        """
+        Run every job that is due and whose lease this worker wins
+
+        Returns:
+            List[str]: Names of the jobs run
+        """
+        ran = []
+        for job in list(self.jobs.values()):
+            if self._stop.is_set():
+                break
+            now = datetime.now()
+            if job.next_check_at is not None and now < job.next_check_at:
+                continue
+            try:
+                if job.exclusive and not self._acquire(job, now):
+                    continue
+            except Exception:
+                logger.exception(f"Failed to acquire lease for job {job.name}")
+                job.next_check_at = now + timedelta(seconds=self.tick_seconds)
+                continue
+            self._execute(job, now)
+            ran.append(job.name)
+        return ran
+
+    def status(self, db: Session) -> Dict[str, Any]:
+        """
+        Cluster-wide job status from the lease table merged with this worker's metrics
+
+        Args:
+            db: Database session
+
+        Returns:
+            Status dict for the admin endpoint
+        """
+        leases = {lease.job_name: lease for lease in db.query(JobLease).all()}
+        jobs = []
+        for name in sorted(set(self.jobs) | set(leases)):
+            job = self.jobs.get(name)
+            lease = leases.get(name)
+            entry = {"name": name, "worker": job.local_status() if job else None, "cluster": None}
+            if lease is not None:
+                entry["cluster"] = {
+                    "owner": lease.owner,
+                    "lease_expires_at": lease.lease_expires_at.isoformat(),
+                    "last_started_at": lease.last_started_at.isoformat() if lease.last_started_at else None,
+                    "last_finished_at": lease.last_finished_at.isoformat() if lease.last_finished_at else None,
+                    "last_duration_ms": lease.last_duration_ms,
+                    "avg_duration_ms": lease.total_duration_ms / lease.run_count if lease.run_count else None,
+                    "last_status": lease.last_status,
+                    "last_error": lease.last_error,
+                    "run_count": lease.run_count,
+                    "failure_count": lease.failure_count,
+                }
+            jobs.append(entry)
+        return {"worker": self.owner, "running": self.running, "jobs": jobs}
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception:
+                logger.exception("Job scheduler tick failed")
+            self._stop.wait(self.tick_seconds)
+
+    def _acquire(self, job: ScheduledJob, now: datetime) -> bool:
+        db = self._session_factory()
+        try:
+            # Cheap read first so idle checks never take the write lock
+            expires_at = (
+                db.query(JobLease.lease_expires_at).filter(JobLease.job_name == job.name).scalar()
+            )
+            if expires_at is not None and expires_at > now:
+                job.next_check_at = expires_at
+                return False
+
+            table = JobLease.__table__
+            insert = _UPSERT_INSERTS[db.get_bind().dialect.name]
+            statement = insert(table).values(
+                job_name=job.name,
+                owner=self.owner,
+                lease_expires_at=now + job.lease,
+                last_started_at=now,
+                last_status="running",
+                run_count=0,
+                failure_count=0,
+                total_duration_ms=0.0
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.job_name],
+                set_={
+                    "owner": statement.excluded.owner,
+                    "lease_expires_at": statement.excluded.lease_expires_at,
+                    "last_started_at": statement.excluded.last_started_at,
+                    "last_status": statement.excluded.last_status,
+                },
+                where=table.c.lease_expires_at <= now
+            ).returning(table.c.job_name)
+            acquired = db.execute(statement).first() is not None
+            db.commit()
+
+            if not acquired:
+                # Another worker won the race; re-read its lease next tick
+                job.next_check_at = now + timedelta(seconds=self.tick_seconds)
+            return acquired
+
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _execute(self, job: ScheduledJob, started_at: datetime) -> None:
+        job.last_started_at = started_at
+        job.next_check_at = started_at + job.interval
+        started = time.perf_counter()
+        error = None
+        try:
+            job.last_result = job.func()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.exception(f"Job {job.name} failed")
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        job.runs += 1
+        job.failures += 1 if error else 0
+        job.total_duration_ms += duration_ms
+        job.last_duration_ms = duration_ms
+        job.last_status = "failed" if error else "succeeded"
+        job.last_error = error
+
+        if job.exclusive:
+            try:
+                self._finish(job, started_at, duration_ms, error)
+            except Exception:
+                logger.exception(f"Failed to record run of job {job.name}")
+
+    def _finish(self, job: ScheduledJob, started_at: datetime, duration_ms: float, error: Optional[str]) -> None:
+        db = self._session_factory()
+        try:
+            db.query(JobLease).filter(
+                JobLease.job_name == job.name, JobLease.owner == self.owner
+            ).update({
+                JobLease.lease_expires_at: started_at + job.interval,
+                JobLease.last_finished_at: datetime.now(),
+                JobLease.last_duration_ms: duration_ms,
+                JobLease.last_status: "failed" if error else "succeeded",
+                JobLease.last_error: error,
+                JobLease.run_count: JobLease.run_count + 1,
+                JobLease.failure_count: JobLease.failure_count + (1 if error else 0),
+                JobLease.total_duration_ms: JobLease.total_duration_ms + duration_ms,
+            }, synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# ---------------------------------------------------------------------------
+# Built-in maintenance jobs
+# ---------------------------------------------------------------------------
+
+def checkpoint_wal() -> Optional[Dict[str, int]]:
+    """Checkpoint and truncate the SQLite write-ahead log (no-op outside WAL mode)"""
+    from ..database.connection import get_engine
+
+    engine = get_engine()
+    if engine.dialect.name != "sqlite":
+        return None
+    with engine.connect() as conn:
+        busy, log_frames, checkpointed = conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)").first()
+    return {"busy": busy, "log_frames": log_frames, "checkpointed_frames": checkpointed}
+
+
+def archive_transactions() -> Dict[str, Any]:
+    """Move cold transaction months into the archive tier"""
+    from ..database.archive import archive_cold_months
+
+    db = SessionLocal()
+    try:
+        partitions = archive_cold_months(db)
+    finally:
+        db.close()
+    return {"archived_months": [partition.month for partition in partitions]}
+
+
+def dispatch_outbox() -> Dict[str, int]:
+    """Deliver pending outbox events to the configured sink"""
+    from .outbox_dispatcher import get_outbox_dispatcher
+
+    return {"delivered": get_outbox_dispatcher().drain()}
+
+
+def purge_outbox() -> Dict[str, int]:
+    """Delete outbox events below the lowest consumer checkpoint"""
+    from ..config.settings import get_settings
+    from .outbox_service import OutboxService
+
+    db = SessionLocal()
+    try:
+        deleted = OutboxService(db).purge_delivered([get_settings().outbox.consumer])
+    finally:
+        db.close()
+    return {"deleted": deleted}
+
+
+def purge_transfer_limits(retention_days: int = 7) -> Dict[str, int]:
+    """Delete daily transfer totals older than the retention window"""
+    from .transfer_limit_service import TransferLimitService
+
+    db = SessionLocal()
+    try:
+        deleted = TransferLimitService(db).purge_before(date.today() - timedelta(days=retention_days))
+    finally:
+        db.close()
+    return {"deleted": deleted}
+
+
+def refresh_account_directory() -> Dict[str, int]:
+    """Warm this worker's account directory with newly created accounts"""
+    from .account_directory import get_account_directory
+
+    db = SessionLocal()
+    try:
+        added = get_account_directory().refresh(db)
+    finally:
+        db.close()
+    return {"added": added}
+
+
+def build_balance_checkpoints() -> Dict[str, int]:
+    """Checkpoint ledger rows added since the last run for point-in-time balances"""
+    from .balance_checkpoint_service import BalanceCheckpointService
+
+    db = SessionLocal()
+    try:
+        written = BalanceCheckpointService(db).build_checkpoints()
+    finally:
+        db.close()
+    return {"written": written}
+
+
+def default_jobs(settings) -> List[ScheduledJob]:
+    """Built-in jobs, minus SCHEDULER_DISABLED_JOBS"""
+    config = settings.scheduler
+    jobs = [
+        ScheduledJob("wal_checkpoint", config.wal_checkpoint_seconds, checkpoint_wal),
+        ScheduledJob("purge_transfer_limits", 24 * 3600, purge_transfer_limits),
+        ScheduledJob("build_balance_checkpoints", config.balance_checkpoint_seconds, build_balance_checkpoints,
+                     lease_seconds=6 * 3600),
+        ScheduledJob("refresh_account_directory", config.directory_refresh_seconds,
+                     refresh_account_directory, exclusive=False),
+    ]
+    if settings.archive.enabled:
+        jobs.append(ScheduledJob("archive_transactions", config.archive_seconds, archive_transactions,
+                                 lease_seconds=6 * 3600))
+    if settings.outbox.sink:
+        from .outbox_dispatcher import create_sink
+
+        try:
+            create_sink(settings.outbox.sink).close()
+        except ValueError as e:
+            # Undelivered events stay in the outbox until a supported sink is configured
+            logger.error(f"Outbox dispatch disabled: {e}")
+        else:
+            jobs.append(ScheduledJob("dispatch_outbox", settings.outbox.poll_interval, dispatch_outbox))
+            jobs.append(ScheduledJob("purge_outbox", config.outbox_purge_seconds, purge_outbox))
+    return [job for job in jobs if job.name not in config.disabled_jobs]
+
+
+_scheduler: Optional[JobScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> JobScheduler:
+    """Get this worker's scheduler (built with the default jobs on first call)"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                from ..config.settings import get_settings
+                settings = get_settings()
+                scheduler = JobScheduler(settings.scheduler.tick_seconds)
+                for job in default_jobs(settings):
+                    scheduler.add_job(job)
+                _scheduler = scheduler
+    return _scheduler
+
+
+def start_scheduler() -> Optional[JobScheduler]:
+    """Start this worker's scheduler unless SCHEDULER_ENABLED is false"""
+    from ..config.settings import get_settings
+
+    if not get_settings().scheduler.enabled:
+        return None
+    scheduler = get_scheduler()
+    scheduler.start()
+    return scheduler
+
+
+def stop_scheduler() -> None:
+    """Stop this worker's scheduler if it was started"""
+    if _scheduler is not None:
+        _scheduler.stop()
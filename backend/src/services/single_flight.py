@@ -0,0 +1,173 @@
+"""
+Single-Flight Request Coalescing
+Concurrent identical reads share one in-flight computation
+"""
+
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from ..database.deadline import SharedDeadline, current_deadline, deadline_exceeded, request_deadline
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Flight:
+    """One in-flight computation and the callers waiting for it"""
+
+    __slots__ = ("done", "result", "error", "waiters", "deadline")
+
+    def __init__(self, deadline: Optional[float]):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+        self.deadline = SharedDeadline(deadline)
+
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time
+
+    The first caller for a key runs the function. Callers that arrive with
+    the same key while it runs block until it finishes and get the same
+    result, or the same exception. Nothing is cached: once the computation
+    returns, the next caller runs it again. A coalesced result can
+    therefore be older than the caller's request by at most one
+    computation's duration.
+
+    The computation runs under the latest request deadline of its callers
+    (``SharedDeadline``), so one caller's short deadline does not interrupt
+    the work for the others. A caller that joined after the flight's
+    deadline had already lapsed, and whose own deadline has not passed,
+    does not get the flight's error: it runs the call again.
+
+    Args:
+        name: Name reported in ``single_flight_stats``
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.executions = 0
+        self.coalesced = 0
+        self.max_waiters = 0
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call ``func(*args, **kwargs)``, or wait for the running call with the same key
+
+        Returns:
+            The function's result (shared by every coalesced caller; treat as read-only)
+        """
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                if flight is None:
+                    flight = self._flights[key] = _Flight(current_deadline())
+                    leader = True
+                    self.executions += 1
+                else:
+                    leader = False
+                    flight.waiters += 1
+                    flight.deadline.extend(current_deadline())
+                    self.coalesced += 1
+                    self.max_waiters = max(self.max_waiters, flight.waiters)
+
+            if leader:
+                break
+
+            flight.done.wait()
+            if flight.error is None:
+                return flight.result
+            if not flight.deadline.lapsed or deadline_exceeded():
+                raise flight.error
+            # The flight ran out of time before this caller did: run the call again
+
+        try:
+            with request_deadline(flight.deadline):
+                flight.result = func(*args, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Execution and coalescing counters"""
+        with self._lock:
+            in_flight = len(self._flights)
+        calls = self.executions + self.coalesced
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / calls, 4) if calls else 0.0,
+            "max_waiters": self.max_waiters,
+            "in_flight": in_flight,
+        }
+
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable, order-normalized form of an argument value"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def single_flight(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Coalesce concurrent identical calls of a service method
+
+    For methods of service classes holding a ``db`` session. The key is
+    the database the session is bound to plus the call's arguments, bound
+    to the signature with defaults applied. Positional and keyword forms of
+    the same call, or a call that spells out a default, share one flight.
+    Only the leader's session runs queries, and every caller gets the
+    leader's return value. Decorated methods must therefore return plain
+    data built inside the call (dicts, tuples, scalars), never ORM
+    instances: those stay bound to the leader's session, which another
+    thread may be using or closing.
+
+    Args:
+        name: Group name in ``single_flight_stats`` (default: the method's qualified name)
+    """
+    def decorate(method: F) -> F:
+        group_name = name or method.__qualname__
+        with _groups_lock:
+            group = _groups.setdefault(group_name, SingleFlight(group_name))
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple(
+                (parameter, _freeze(value)) for parameter, value in bound.arguments.items()
+                if parameter != "self"
+            )
+            return group.do((self.db.get_bind(), arguments), method, self, *args, **kwargs)
+
+        wrapper.flight = group
+        return wrapper
+
+    return decorate
+
+
+def single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters of every single-flight group in this process"""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.stats() for group in groups}
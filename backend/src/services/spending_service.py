@@ -0,0 +1,295 @@
+"""
+Spending Service
+Per-account spending by category and month from an incrementally maintained aggregate
+
+Usage:
+    python -m src.services.spending_service          # rebuild the aggregate from all transactions
+"""
+
+import argparse
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models.database_models import Transaction, TransactionCategory
+from ..models.spending import MonthlyCategorySpend
+from ..utils.formatting import BatchFormatter, CurrencyFormatter
+
+logger = logging.getLogger(__name__)
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+DEBIT_TYPES = ("withdrawal", "transfer")
+UNCATEGORIZED = 0
+
+_REBUILD_DELETE = text(f"DELETE FROM {MonthlyCategorySpend.__tablename__} WHERE month >= :first_month")
+
+_MONTHLY_SPEND = f"""
+    SELECT account_id, strftime('%Y-%m', transaction_date), COALESCE(category_id, {UNCATEGORIZED}),
+           SUM(amount), COUNT(*)
+    FROM transactions
+    WHERE transaction_type IN {DEBIT_TYPES}
+      AND COALESCE(status, 'completed') = 'completed'
+      AND strftime('%Y-%m', transaction_date) >= :first_month
+    GROUP BY 1, 2, 3
+"""
+
+_REBUILD_INSERT = text(f"""
+    INSERT INTO {MonthlyCategorySpend.__tablename__}
+        (account_id, month, category_id, total_amount, transaction_count, updated_at)
+    SELECT *, CURRENT_TIMESTAMP FROM ({_MONTHLY_SPEND})
+""")
+
+_ARCHIVED_SPEND = text(_MONTHLY_SPEND)
+
+_REBUILT_ROWS = text(f"SELECT COUNT(*) FROM {MonthlyCategorySpend.__tablename__} WHERE month >= :first_month")
+
+
+def shift_month(month: str, months: int) -> str:
+    """``YYYY-MM`` ``months`` months after (or before, if negative) ``month``"""
+    year, month_number = int(month[:4]), int(month[5:7])
+    index = year * 12 + month_number - 1 + months
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+class SpendingService:
+    """
+    Service class for category spending analytics
+
+    ``monthly_category_spend`` holds one row per (account, month, category)
+    with the month's debit total and count. Transfers add their debit in
+    the transfer's own transaction with a single upsert, the same way
+    daily transfer totals are kept. Rows loaded or re-categorized in bulk
+    are folded in by ``rebuild``, which recomputes months from the hot table
+    and the archived months' files. A spending
+    report reads categories × months aggregate rows, however many
+    transactions the account has.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Add debit transactions to the aggregate
+
+        Must run inside the transactions' own database transaction, before
+        their dates are loaded back from the database. Rows without a
+        ``transaction_date`` are charged to the current UTC month, which is
+        the month the database default stamps them with.
+
+        Args:
+            transactions: New transaction records (credits are ignored)
+        """
+        current_month = datetime.now(timezone.utc).strftime("%Y-%m")
+        charges: Dict[Tuple[int, str, int], List[float]] = {}
+        for transaction in transactions:
+            if transaction.transaction_type not in DEBIT_TYPES:
+                continue
+            # Instance state only: a flushed row's server default is not loaded back
+            transaction_date = inspect(transaction).dict.get("transaction_date")
+            month = transaction_date.strftime("%Y-%m") if transaction_date else current_month
+            key = (transaction.account_id, month, transaction.category_id or UNCATEGORIZED)
+            charge = charges.setdefault(key, [0.0, 0])
+            charge[0] += transaction.amount
+            charge[1] += 1
+
+        self._add(charges)
+
+    def _add(self, charges: Dict[Tuple[int, str, int], List[float]]) -> None:
+        """Upsert ``(account_id, month, category_id) -> [amount, count]`` onto the aggregate"""
+        if not charges:
+            return
+        table = MonthlyCategorySpend.__table__
+        statement = _UPSERT_INSERTS[self.db.get_bind().dialect.name](table).values(updated_at=func.now())
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.account_id, table.c.month, table.c.category_id],
+            set_={
+                "total_amount": table.c.total_amount + statement.excluded.total_amount,
+                "transaction_count": table.c.transaction_count + statement.excluded.transaction_count,
+                "updated_at": statement.excluded.updated_at,
+            }
+        )
+        self.db.execute(statement, [
+            {
+                "account_id": account_id,
+                "month": month,
+                "category_id": category_id,
+                "total_amount": amount,
+                "transaction_count": count,
+            }
+            for (account_id, month, category_id), (amount, count) in charges.items()
+        ])
+
+    def rebuild(self, first_month: Optional[str] = None) -> int:
+        """
+        Recompute the aggregate from the transactions table and the archive
+
+        Archived months in range are aggregated from their archive files and
+        added onto the hot table's totals for the same months.
+
+        Args:
+            first_month: First ``YYYY-MM`` to recompute (default: the oldest month with transactions)
+
+        Returns:
+            int: Number of aggregate rows written
+        """
+        from ..database.archive import TransactionArchive
+
+        archive = TransactionArchive(self.db)
+        if first_month is None:
+            oldest = self.db.query(func.min(Transaction.transaction_date)).scalar()
+            months = [partition.month for partition in archive.partitions_for_range()]
+            if oldest is not None:
+                months.append(oldest.strftime("%Y-%m"))
+            if not months:
+                return 0
+            first_month = min(months)
+
+        params = {"first_month": first_month}
+        first_day = datetime.strptime(first_month, "%Y-%m").date()
+        try:
+            self.db.execute(_REBUILD_DELETE, params)
+            self.db.execute(_REBUILD_INSERT, params)
+            for partition in archive.partitions_for_range(first_day):
+                with archive.session(partition) as archive_db:
+                    self._add({
+                        (account_id, month, category_id): [amount, count]
+                        for account_id, month, category_id, amount, count in archive_db.execute(_ARCHIVED_SPEND, params)
+                    })
+            written = self.db.execute(_REBUILT_ROWS, params).scalar()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        logger.info(f"Rebuilt {written:,} monthly category spend rows from {first_month}")
+        return written
+
+    def get_spending(self, account_id: int, first_month: str, last_month: str) -> Dict[str, Any]:
+        """
+        Spending by category and month, with month-over-month changes
+
+        Args:
+            account_id: Account ID
+            first_month: First ``YYYY-MM`` of the report
+            last_month: Last ``YYYY-MM`` of the report
+
+        Returns:
+            Report dict
+        """
+        months = [first_month]
+        while months[-1] < last_month:
+            months.append(shift_month(months[-1], 1))
+        # The month before the report is read only for the first month's change
+        previous_month = shift_month(first_month, -1)
+
+        rows = (
+            self.db.query(
+                MonthlyCategorySpend.month,
+                MonthlyCategorySpend.category_id,
+                MonthlyCategorySpend.total_amount,
+                MonthlyCategorySpend.transaction_count
+            )
+            .filter(
+                MonthlyCategorySpend.account_id == account_id,
+                MonthlyCategorySpend.month >= previous_month,
+                MonthlyCategorySpend.month <= last_month
+            )
+            .all()
+        )
+        amounts: Dict[int, Dict[str, Tuple[float, int]]] = {}
+        for month, category_id, total_amount, transaction_count in rows:
+            amounts.setdefault(category_id, {})[month] = (total_amount, transaction_count)
+
+        category_info = {
+            category.id: category
+            for category in self.db.query(TransactionCategory).filter(
+                TransactionCategory.id.in_([category_id for category_id in amounts if category_id])
+            )
+        } if amounts else {}
+
+        monthly_totals = {
+            month: sum(by_month.get(month, (0.0, 0))[0] for by_month in amounts.values())
+            for month in [previous_month] + months
+        }
+
+        categories = []
+        for category_id, by_month in amounts.items():
+            series = []
+            previous = by_month.get(previous_month, (0.0, 0))[0]
+            for month in months:
+                amount, count = by_month.get(month, (0.0, 0))
+                series.append({
+                    "month": month,
+                    "amount": amount,
+                    "transaction_count": count,
+                    "change_percent": float(CurrencyFormatter.calculate_percentage_change(previous, amount)),
+                })
+                previous = amount
+            total = sum(entry["amount"] for entry in series)
+            if not total:
+                continue
+            category = category_info.get(category_id)
+            categories.append({
+                "category_id": category_id or None,
+                "name": category.name if category else None,
+                "color": category.color if category else None,
+                "total": total,
+                "share_percent": 0.0,
+                "months": series,
+            })
+
+        grand_total = sum(monthly_totals[month] for month in months)
+        for entry in categories:
+            entry["share_percent"] = round(entry["total"] / grand_total * 100, 2) if grand_total else 0.0
+        categories.sort(key=lambda entry: entry["total"], reverse=True)
+        for entry, formatted in zip(categories, BatchFormatter.format_amounts([entry["total"] for entry in categories])):
+            entry["formatted_total"] = formatted
+
+        return {
+            "account_id": account_id,
+            "from_month": first_month,
+            "to_month": last_month,
+            "total": grand_total,
+            "formatted_total": CurrencyFormatter.format_amount(grand_total),
+            "monthly_totals": [
+                {
+                    "month": month,
+                    "amount": monthly_totals[month],
+                    "change_percent": float(CurrencyFormatter.calculate_percentage_change(
+                        monthly_totals[shift_month(month, -1)], monthly_totals[month]
+                    )),
+                }
+                for month in months
+            ],
+            "categories": categories,
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: rebuild the monthly category spend aggregate"""
+    parser = argparse.ArgumentParser(description="Rebuild per-account monthly category spending")
+    parser.add_argument("--from-month", default=None, help="First YYYY-MM to rebuild (default: oldest month)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    from ..database.connection import SessionLocal, get_engine
+
+    MonthlyCategorySpend.__table__.create(bind=get_engine(), checkfirst=True)
+    db = SessionLocal()
+    try:
+        written = SpendingService(db).rebuild(args.from_month)
+    finally:
+        db.close()
+    print(f"✅ Rebuilt {written:,} monthly category spend rows")
+
+
+if __name__ == "__main__":
+    main()
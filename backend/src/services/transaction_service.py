@@ -3,21 +3,71 @@ Transaction Service Layer
 Business logic for transaction operations
 """
 
-from typing import List, Optional, Tuple
+import base64
+import binascii
+import heapq
+from contextlib import ExitStack
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, and_, or_
+from sqlalchemy import String, bindparam, desc, asc, and_, func, or_, select, true, type_coerce
 
 from ..models.database_models import Transaction, Account
-from ..utils.validators import ValidationUtils
+from ..utils.validators import ValidationUtils, SecurityUtils
+from ..utils.fieldsets import load_only_options, serialize_fields
+from .single_flight import single_flight
 from ..utils.formatting import CurrencyFormatter
 
+# Columns streamed by iter_transaction_batches, in export order
+EXPORT_COLUMNS = (
+    "id", "account_id", "transaction_date", "transaction_type", "amount", "description",
+    "recipient_account", "balance_after", "reference_number", "status", "created_at"
+)
+
+# Rows fetched per account stream per round trip while merging a feed page
+FEED_FETCH_SIZE = 16
+
+# transaction_date as stored: keyset comparisons must match stored strings
+# byte-for-byte, which a bound datetime does not for second-precision rows
+_STORED_DATE = type_coerce(Transaction.transaction_date, String)
+
+
+def encode_feed_cursor(date_key: str, transaction_id: int) -> str:
+    """Opaque cursor for the feed position after ``(date_key, transaction_id)``"""
+    return base64.urlsafe_b64encode(f"{date_key}|{transaction_id}".encode()).decode().rstrip("=")
+
+
+def decode_feed_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a feed cursor
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        date_key, transaction_id = raw.rsplit("|", 1)
+        date.fromisoformat(date_key[:10])
+        return date_key, int(transaction_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
 
 class TransactionService:
     """Service class for transaction-related business logic"""
     
     def __init__(self, db: Session):
         self.db = db
+        self._archive = None
+    
+    @property
+    def archive(self):
+        """Archive tier router, created on first use"""
+        if self._archive is None:
+            from ..database.archive import TransactionArchive
+            self._archive = TransactionArchive(self.db)
+        return self._archive
     
     def get_transactions(
         self,
@@ -28,7 +78,8 @@ class TransactionService:
         limit: int = 20,
         offset: int = 0,
         sort_by: str = "transaction_date",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        columns: Optional[Sequence[str]] = None
     ) -> Tuple[List[Transaction], int]:
         """
         Get filtered and paginated transactions
@@ -42,6 +93,7 @@ class TransactionService:
             offset: Number of records to skip
             sort_by: Field to sort by (transaction_date, amount)
             sort_order: Sort order (asc, desc)
+            columns: Only load these columns (default: all)
         
         Returns:
             Tuple of (transactions list, total count)
@@ -74,9 +126,6 @@ class TransactionService:
         if filters:
             query = query.filter(and_(*filters))
         
-        # Get total count before pagination
-        total_count = query.count()
-        
         # Apply sorting
         if sort_by == "transaction_date":
             sort_column = Transaction.transaction_date
@@ -85,16 +134,296 @@ class TransactionService:
         else:
             sort_column = Transaction.transaction_date  # Default
         
-        if sort_order.lower() == "asc":
-            query = query.order_by(asc(sort_column))
-        else:
-            query = query.order_by(desc(sort_column))
+        ascending = sort_order.lower() == "asc"
+        order = asc(sort_column) if ascending else desc(sort_column)
+        options = load_only_options(Transaction, columns, sort_column)
+        
+        # Archived months in the date range (every archived month for undated
+        # queries) are read from their archive files
+        partitions = self.archive.partitions_for_range(from_date, to_date)
+        if partitions:
+            archived_counts = self.archive.partition_counts(
+                partitions, filters, account_id, transaction_type, from_date, to_date
+            )
+            return self._get_archived_transactions(
+                filters, partitions, archived_counts, sort_column, ascending, limit, offset, options
+            )
+        
+        # Get total count before pagination
+        total_count = query.count()
         
         # Apply pagination
-        transactions = query.offset(offset).limit(limit).all()
+        transactions = query.options(*options).order_by(order).offset(offset).limit(limit).all()
         
         return transactions, total_count
     
+    @single_flight()
+    def get_transaction_page(
+        self,
+        fields: Sequence[str],
+        account_id: Optional[int] = None,
+        transaction_type: Optional[str] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        limit: int = 20,
+        offset: int = 0,
+        sort_by: str = "transaction_date",
+        sort_order: str = "desc",
+        columns: Optional[Sequence[str]] = None
+    ) -> Tuple[List[dict], int]:
+        """
+        Get one serialized page of ``get_transactions``
+        
+        Concurrent identical calls share one query (``single_flight``). The
+        rows are serialized inside the flight, so every caller gets plain
+        dicts and no caller touches another request's session.
+        
+        Args:
+            fields: Transaction fields to serialize (``TRANSACTION_FIELDS`` names)
+            (other arguments as for ``get_transactions``)
+        
+        Returns:
+            Tuple of (serialized transactions, total count)
+        """
+        transactions, total_count = self.get_transactions(
+            account_id=account_id,
+            transaction_type=transaction_type,
+            from_date=from_date,
+            to_date=to_date,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            columns=columns
+        )
+        return [serialize_fields(transaction, fields) for transaction in transactions], total_count
+    
+    def _get_archived_transactions(
+        self,
+        filters: list,
+        partitions: list,
+        archived_counts: Sequence[int],
+        sort_column,
+        ascending: bool,
+        limit: int,
+        offset: int,
+        options: Sequence = ()
+    ) -> Tuple[List[Transaction], int]:
+        """
+        Page across the hot table and archived monthly partitions
+        
+        Totals come from ``archived_counts``, so an archive file is opened
+        only to read rows of the page. When the hot rows are all newer than
+        the archived months, date ordering walks the sources in date order
+        and skips them whole by count; only the partitions overlapping the
+        requested page are opened. Amount ordering, or hot rows inside or
+        before archived months, interleave the sources, so each non-empty
+        source contributes its top rows to a merge.
+        
+        Args:
+            filters: Filter expressions on Transaction
+            partitions: Archived partitions in range, newest first
+            archived_counts: Rows matching ``filters`` in each partition
+            sort_column: Transaction column to order by
+            ascending: Sort direction
+            limit: Maximum number of records to return
+            offset: Number of records to skip
+            options: Loader options for the page queries (column projection)
+        
+        Returns:
+            Tuple of (transactions list, total count)
+        """
+        direction = asc if ascending else desc
+        order = (direction(sort_column), direction(Transaction.id))
+        
+        hot = self.db.query(Transaction).filter(and_(*filters))
+        counts = [hot.count()] + list(archived_counts)
+        oldest_hot = hot.with_entities(func.min(Transaction.transaction_date)).scalar() if counts[0] else None
+        disjoint = oldest_hot is None or oldest_hot >= partitions[0].period_end
+        
+        with ExitStack() as stack:
+            def query_for(source: int):
+                if source == 0:
+                    return hot
+                archive_db = stack.enter_context(self.archive.session(partitions[source - 1]))
+                return archive_db.query(Transaction).filter(and_(*filters))
+            
+            if sort_column is Transaction.transaction_date and disjoint:
+                sources = list(range(len(counts)))
+                if ascending:
+                    sources.reverse()
+                
+                transactions = []
+                skip, remaining = offset, limit
+                for source in sources:
+                    if remaining <= 0:
+                        break
+                    if skip >= counts[source]:
+                        skip -= counts[source]
+                        continue
+                    page = query_for(source).options(*options).order_by(*order).offset(skip).limit(remaining).all()
+                    transactions.extend(page)
+                    skip, remaining = 0, remaining - len(page)
+            else:
+                window = offset + limit
+                streams = [
+                    query_for(source).options(*options).order_by(*order).limit(window).all()
+                    for source, count in enumerate(counts) if count
+                ]
+                merged = heapq.merge(
+                    *streams, key=lambda t: (getattr(t, sort_column.key), t.id), reverse=not ascending
+                )
+                transactions = list(islice(merged, offset, window))
+        
+        return transactions, sum(counts)
+    
+    def iter_transaction_batches(
+        self,
+        account_id: Optional[int] = None,
+        transaction_type: Optional[str] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        batch_size: int = 1000
+    ) -> Iterator[list]:
+        """
+        Stream matching transactions oldest first in fixed-size batches
+        
+        Rows are read through a server-side cursor (``yield_per``) as plain
+        column rows, so memory stays flat however long the range is. Archived
+        months in the date range (all of them without ``from_date``) are
+        streamed alongside the hot table and merged in date order.
+        
+        Args:
+            account_id: Filter by account ID
+            transaction_type: Filter by transaction type (deposit, withdrawal, transfer)
+            from_date: Start date filter
+            to_date: End date filter
+            batch_size: Rows fetched per round trip
+        
+        Yields:
+            Lists of rows with the ``EXPORT_COLUMNS`` attributes
+        """
+        filters = []
+        
+        if account_id:
+            filters.append(Transaction.account_id == account_id)
+        
+        if transaction_type:
+            is_valid, error_msg = ValidationUtils.validate_transaction_type(transaction_type)
+            if not is_valid:
+                raise ValueError(error_msg)
+            filters.append(Transaction.transaction_type == transaction_type)
+        
+        if from_date:
+            filters.append(Transaction.transaction_date >= from_date)
+        
+        if to_date:
+            filters.append(Transaction.transaction_date <= datetime.combine(to_date, datetime.max.time()))
+        
+        statement = (
+            select(*(getattr(Transaction, column) for column in EXPORT_COLUMNS))
+            .where(and_(true(), *filters))
+            .order_by(asc(Transaction.transaction_date), asc(Transaction.id))
+            .execution_options(yield_per=batch_size)
+        )
+        
+        partitions = self.archive.partitions_for_range(from_date, to_date)
+        if not partitions:
+            yield from self.db.execute(statement).partitions()
+            return
+        
+        # Hot rows can fall inside or before archived months: merge the streams
+        with ExitStack() as stack:
+            streams = [self.db.execute(statement)] + [
+                stack.enter_context(self.archive.session(partition)).execute(statement)
+                for partition in partitions
+            ]
+            merged = heapq.merge(*streams, key=lambda row: (row.transaction_date, row.id))
+            while True:
+                batch = list(islice(merged, batch_size))
+                if not batch:
+                    return
+                yield batch
+    
+    def get_feed(
+        self,
+        account_ids: Sequence[int],
+        limit: int = 20,
+        cursor: Optional[Tuple[str, int]] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Transaction], Optional[Tuple[str, int]]]:
+        """
+        Get one page of several accounts' transactions merged newest first
+        
+        Each account is read as its own stream in ``ix_transactions_account_date``
+        order, from the keyset position after ``cursor``, and the streams are
+        k-way merged with a heap on ``(transaction_date, id)``. Streams are
+        fetched lazily ``FEED_FETCH_SIZE`` rows at a time, so a page reads
+        about ``limit`` rows plus one fetch per account and costs
+        O(limit × log k) however long the histories are. Archived months are
+        merged in newest first, and only while they can still reach the
+        page: a month is skipped once the page is full with rows at or after
+        its end.
+        
+        Args:
+            account_ids: Accounts to merge
+            limit: Page size
+            cursor: ``(stored transaction_date, id)`` of the last row of the previous page
+            columns: Only load these columns (default: all)
+        
+        Returns:
+            Tuple of (transactions, cursor for the next page or None on the last page)
+        """
+        statement = (
+            select(Transaction, _STORED_DATE.label("date_key"))
+            .options(*load_only_options(Transaction, columns, Transaction.transaction_date))
+            .order_by(desc(Transaction.transaction_date), desc(Transaction.id))
+            .limit(limit + 1)
+            .execution_options(yield_per=min(FEED_FETCH_SIZE, limit + 1))
+        )
+        if cursor is not None:
+            after_date = bindparam("after_date", cursor[0], type_=String)
+            statement = statement.where(
+                _STORED_DATE <= after_date,
+                or_(_STORED_DATE < after_date, Transaction.id < cursor[1])
+            )
+        
+        page = self._merge_feed(self.db, statement, account_ids, limit + 1)
+        
+        to_date = date.fromisoformat(cursor[0][:10]) if cursor is not None else None
+        with ExitStack() as stack:
+            for partition in self.archive.partitions_for_range(to_date=to_date):
+                if len(page) > limit and page[limit][1] >= str(partition.period_end):
+                    break
+                archive_db = stack.enter_context(self.archive.session(partition))
+                archived = self._merge_feed(archive_db, statement, account_ids, limit + 1)
+                page = list(islice(
+                    heapq.merge(page, archived, key=lambda row: (row[1], row[0].id), reverse=True),
+                    limit + 1
+                ))
+        
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = (page[-1][1], page[-1][0].id)
+        return [transaction for transaction, _ in page], next_cursor
+    
+    @staticmethod
+    def _merge_feed(db: Session, statement, account_ids: Sequence[int], size: int) -> list:
+        """First ``size`` ``(transaction, date_key)`` rows of the accounts' streams in one database"""
+        streams = [
+            db.execute(statement.where(Transaction.account_id == account_id)).tuples()
+            for account_id in account_ids
+        ]
+        try:
+            merged = heapq.merge(
+                *streams, key=lambda row: (row[1], row[0].id), reverse=True
+            )
+            return list(islice(merged, size))
+        finally:
+            for stream in streams:
+                stream.close()
+    
     def get_transaction_by_id(self, transaction_id: int) -> Optional[Transaction]:
         """
         Get a specific transaction by ID
@@ -107,10 +436,13 @@ class TransactionService:
         """
         return self.db.query(Transaction).filter(Transaction.id == transaction_id).first()
     
+    @single_flight()
     def get_account_summary(self, account_id: int) -> Optional[dict]:
         """
         Get account summary information including balance and recent activity
         
+        Concurrent calls for the same account share one computation.
+        
         Args:
             account_id: Account ID
         
@@ -130,12 +462,12 @@ class TransactionService:
             .count()
         )
         
-        # Get total transactions count
+        # Get total transactions count, archived months included
         total_transactions = (
             self.db.query(Transaction)
             .filter(Transaction.account_id == account_id)
             .count()
-        )
+        ) + self.archive.count(account_id=account_id)
         
         # Calculate monthly summary
         current_month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0)
@@ -202,7 +534,8 @@ class TransactionService:
         search_term: str,
         account_id: Optional[int] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        columns: Optional[Sequence[str]] = None
     ) -> Tuple[List[Transaction], int]:
         """
         Search transactions by description or recipient account
@@ -212,12 +545,13 @@ class TransactionService:
             account_id: Optional account ID filter
             limit: Maximum number of records to return
             offset: Number of records to skip
+            columns: Only load these columns (default: all)
         
         Returns:
             Tuple of (transactions list, total count)
         """
         # Sanitize search term
-        safe_search_term = ValidationUtils.sanitize_input(search_term)
+        safe_search_term = SecurityUtils.sanitize_input(search_term)
         
         if not safe_search_term:
             return [], 0
@@ -236,13 +570,24 @@ class TransactionService:
         )
         
         query = query.filter(search_filter)
+        options = load_only_options(Transaction, columns, Transaction.transaction_date)
+        
+        partitions = self.archive.partitions_for_range()
+        if partitions:
+            filters = [search_filter] + ([Transaction.account_id == account_id] if account_id else [])
+            # Search terms are not in the stored counts: files are counted once per version
+            archived_counts = self.archive.partition_counts(partitions, filters, stored=False)
+            return self._get_archived_transactions(
+                filters, partitions, archived_counts, Transaction.transaction_date, False, limit, offset, options
+            )
         
         # Get total count
         total_count = query.count()
         
         # Order by transaction date (newest first) and apply pagination
         transactions = (
-            query.order_by(desc(Transaction.transaction_date))
+            query.options(*options)
+            .order_by(desc(Transaction.transaction_date))
             .offset(offset)
             .limit(limit)
             .all()
@@ -266,16 +611,17 @@ class TransactionService:
             Dictionary with transaction statistics
         """
         from_date = datetime.now() - timedelta(days=period_days)
-        
-        transactions = (
-            self.db.query(Transaction)
-            .filter(and_(
-                Transaction.account_id == account_id,
-                Transaction.transaction_date >= from_date
-            ))
-            .all()
+        period = and_(
+            Transaction.account_id == account_id,
+            Transaction.transaction_date >= from_date
         )
         
+        transactions = self.db.query(Transaction).filter(period).all()
+        # Long periods reach into archived months
+        for partition in self.archive.partitions_for_range(from_date.date()):
+            with self.archive.session(partition) as archive_db:
+                transactions.extend(archive_db.query(Transaction).filter(period).all())
+        
         deposits = [t for t in transactions if t.transaction_type == "deposit"]
         withdrawals = [t for t in transactions if t.transaction_type == "withdrawal"]
         transfers = [t for t in transactions if t.transaction_type == "transfer"]
@@ -331,13 +677,15 @@ class AccountService:
         """Get account by ID"""
         return self.db.query(Account).filter(Account.id == account_id).first()
     
-    def get_accounts(self, limit: int = 50, offset: int = 0) -> Tuple[List[Account], int]:
-        """Get all accounts with pagination"""
+    def get_accounts(self, limit: int = 50, offset: int = 0,
+                     columns: Optional[Sequence[str]] = None) -> Tuple[List[Account], int]:
+        """Get all accounts with pagination, optionally loading only ``columns``"""
         query = self.db.query(Account)
         total_count = query.count()
         
         accounts = (
-            query.order_by(Account.created_at)
+            query.options(*load_only_options(Account, columns, Account.created_at))
+            .order_by(Account.created_at)
             .offset(offset)
             .limit(limit)
             .all()
@@ -0,0 +1,163 @@
+"""
+Transfer Limit Service
+Daily transfer-limit accounting backed by per-account, per-day running totals
+"""
+
+from datetime import date
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models.database_models import Account
+from ..models.transfer_limit import DailyTransferTotal
+from ..utils.formatting import CurrencyFormatter
+from ..utils.validators import TransferValidator
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE ... WHERE
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+class TransferLimitService:
+    """
+    Service class for daily transfer limits
+
+    Each account has one ``daily_transfer_totals`` row per day. Transfers
+    reserve their amount with a single conditional upsert in the transfer's
+    own transaction. The row only changes if the new total stays within the
+    limit, so concurrent workers cannot overshoot it, and a rolled-back
+    transfer releases its reservation automatically. Reading the remaining
+    limit is a primary-key lookup.
+    """
+
+    DAILY_LIMIT = float(TransferValidator.MAX_DAILY_TRANSFER)
+    PER_TRANSACTION_LIMIT = 1000000.0  # Same as TransferBase.amount maximum
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_daily_used(self, account_id: int, transfer_date: Optional[date] = None) -> float:
+        """
+        Get the amount already transferred from an account on a day
+
+        Args:
+            account_id: Source account ID
+            transfer_date: Day to read (default: today)
+
+        Returns:
+            float: Total transferred amount
+        """
+        total = (
+            self.db.query(DailyTransferTotal.total_amount)
+            .filter(
+                DailyTransferTotal.account_id == account_id,
+                DailyTransferTotal.transfer_date == (transfer_date or date.today())
+            )
+            .scalar()
+        )
+        return total or 0.0
+
+    def reserve(self, account_id: int, amount: float, transfer_date: Optional[date] = None) -> float:
+        """
+        Add a transfer amount to the account's daily total if it fits the limit
+
+        Must run inside the transfer's transaction; the reservation commits
+        or rolls back with it.
+
+        Args:
+            account_id: Source account ID
+            amount: Transfer amount
+            transfer_date: Day to charge (default: today)
+
+        Returns:
+            float: New daily total
+
+        Raises:
+            ValueError: If the daily limit would be exceeded
+        """
+        transfer_date = transfer_date or date.today()
+        table = DailyTransferTotal.__table__
+
+        insert = _UPSERT_INSERTS[self.db.get_bind().dialect.name]
+        statement = insert(table).values(
+            account_id=account_id,
+            transfer_date=transfer_date,
+            total_amount=amount,
+            transfer_count=1,
+            updated_at=func.now()
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.account_id, table.c.transfer_date],
+            set_={
+                "total_amount": table.c.total_amount + statement.excluded.total_amount,
+                "transfer_count": table.c.transfer_count + 1,
+                "updated_at": statement.excluded.updated_at,
+            },
+            where=table.c.total_amount + statement.excluded.total_amount <= self.DAILY_LIMIT
+        ).returning(table.c.total_amount)
+
+        new_total = None
+        if amount <= self.DAILY_LIMIT:
+            new_total = self.db.execute(statement).scalar()
+
+        if new_total is None:
+            daily_used = self.get_daily_used(account_id, transfer_date)
+            _, error_msg = TransferValidator.validate_transfer_amount(amount, daily_used)
+            raise ValueError(error_msg or "일일 이체 한도를 초과합니다.")
+
+        return new_total
+
+    def get_limits(self, account_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get today's transfer limits and usage for an account
+
+        Args:
+            account_id: Account ID
+
+        Returns:
+            Limits dict, or None if the account does not exist
+        """
+        if self.db.query(Account.id).filter(Account.id == account_id).first() is None:
+            return None
+
+        today = date.today()
+        usage = (
+            self.db.query(DailyTransferTotal.total_amount, DailyTransferTotal.transfer_count)
+            .filter(DailyTransferTotal.account_id == account_id, DailyTransferTotal.transfer_date == today)
+            .first()
+        )
+        daily_used, transfer_count = usage if usage else (0.0, 0)
+        daily_remaining = max(self.DAILY_LIMIT - daily_used, 0.0)
+
+        return {
+            "account_id": account_id,
+            "date": today.isoformat(),
+            "daily_limit": self.DAILY_LIMIT,
+            "daily_used": daily_used,
+            "daily_remaining": daily_remaining,
+            "per_transaction_limit": self.PER_TRANSACTION_LIMIT,
+            "transfer_count": transfer_count,
+            "formatted_daily_limit": CurrencyFormatter.format_amount(self.DAILY_LIMIT),
+            "formatted_daily_used": CurrencyFormatter.format_amount(daily_used),
+            "formatted_daily_remaining": CurrencyFormatter.format_amount(daily_remaining),
+            "formatted_per_transaction_limit": CurrencyFormatter.format_amount(self.PER_TRANSACTION_LIMIT)
+        }
+
+    def purge_before(self, cutoff: date) -> int:
+        """
+        Delete running totals for days before ``cutoff``
+
+        Args:
+            cutoff: First day to keep
+
+        Returns:
+            int: Number of rows deleted
+        """
+        deleted = (
+            self.db.query(DailyTransferTotal)
+            .filter(DailyTransferTotal.transfer_date < cutoff)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
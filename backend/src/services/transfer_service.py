@@ -3,14 +3,19 @@ Transfer Service
 Business logic for transfer operations
 """
 
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from datetime import datetime
-import uuid
 from ..models.transfer import Transfer
 from ..models.virtual_bank import VirtualBank
 from ..models.database_models import Account, Transaction
-from .bank_interface import BankInterface
+from .balance_checkpoint_service import BalanceCheckpointService
+from .outbox_service import OutboxService
+from .spending_service import SpendingService
+from .transfer_limit_service import TransferLimitService
+from ..utils.fieldsets import load_only_options
+from ..utils.id_generator import generate_reference_number
 
 
 class TransferService:
@@ -18,7 +23,34 @@ class TransferService:
     
     def __init__(self, db: Session):
         self.db = db
-        self.bank_interface = BankInterface(db)
+        self._bank_interface = None
+        self._directory = None
+        self.limits = TransferLimitService(db)
+        self.outbox = OutboxService(db)
+        self.spending = SpendingService(db)
+        self.checkpoints = BalanceCheckpointService(db)
+    
+    @property
+    def directory(self):
+        """Process-wide account directory for destination lookups"""
+        if self._directory is None:
+            from .account_directory import get_account_directory
+            self._directory = get_account_directory()
+        return self._directory
+    
+    @property
+    def categorizer(self):
+        """Process-wide transaction categorizer for new transaction records"""
+        from .categorization import get_categorizer
+        return get_categorizer(self.db)
+    
+    @property
+    def bank_interface(self):
+        """Bank interface for external transfers, imported on first use"""
+        if self._bank_interface is None:
+            from .bank_interface import BankInterface
+            self._bank_interface = BankInterface(self.db)
+        return self._bank_interface
     
     def create_internal_transfer(self, from_account_id: int, to_account_number: str, 
                                amount: float, description: Optional[str] = None) -> Transfer:
@@ -40,65 +72,77 @@ class TransferService:
         """
         try:
             print(f"Creating internal transfer: from_account_id={from_account_id}, to_account_number={to_account_number}, amount={amount}, description={description}")
-            # Validate amount
-            if amount <= 0:
-                raise ValueError("Transfer amount must be positive")
-            if amount > 1000000:  # 1M KRW limit
-                raise ValueError("Transfer amount exceeds maximum limit")
-            
-            # Check if source account exists and has sufficient balance
-            if not self._check_account_balance(from_account_id, amount):
-                raise ValueError("Insufficient balance")
-            
-            # Find destination account to get recipient name
-            to_account = self.db.query(Account).filter(
-                Account.account_number == to_account_number
-            ).first()
-            
-            if not to_account:
-                raise ValueError("Destination account not found")
-            
-            # Prevent self-transfer
-            from_account = self.db.query(Account).filter(
-                Account.id == from_account_id
-            ).first()
-            
-            if not from_account:
-                raise ValueError("Source account not found")
-                
-            if from_account.account_number == to_account_number:
-                raise ValueError("Cannot transfer to the same account")
-            
-            # Create transfer record
-            transfer = Transfer(
-                from_account_id=from_account_id,
-                to_account_number=to_account_number,
-                amount=amount,
-                status="PENDING",
-                description=description,
-                transfer_type="INTERNAL",
-                reference_number=self._generate_reference_number()
-            )
-            
-            self.db.add(transfer)
-            self.db.flush()  # Get transfer ID
-            
-            # Execute the transfer
-            self._execute_internal_transfer(transfer)
+            transfer = self._apply_internal_transfer(from_account_id, to_account_number, amount, description)
             
             self.db.commit()
             return transfer
             
-        except Exception as e:
+        except Exception:
+            # Nothing of a failed transfer is kept: the transfer row, balance
+            # changes and daily limit charge roll back together
             self.db.rollback()
-            # Update transfer status to failed if it was created
-            if 'transfer' in locals():
-                transfer.status = "FAILED"
-                transfer.error_message = str(e)
-                transfer.completed_at = datetime.now()
-                self.db.commit()
             raise
     
+    def _apply_internal_transfer(self, from_account_id: int, to_account_number: str,
+                                 amount: float, description: Optional[str] = None) -> Transfer:
+        """
+        Validate and apply an internal transfer in the current transaction without committing
+        
+        Shared by create_internal_transfer (one commit per transfer) and the
+        group-commit executor (one commit per batch, one savepoint per transfer).
+        
+        Raises:
+            ValueError: If validation fails
+            RuntimeError: If transfer execution fails
+        """
+        # Validate amount
+        if amount <= 0:
+            raise ValueError("Transfer amount must be positive")
+        if amount > TransferLimitService.PER_TRANSACTION_LIMIT:  # 1M KRW limit
+            raise ValueError("Transfer amount exceeds maximum limit")
+        
+        # Check if source account exists and has sufficient balance
+        if not self._check_account_balance(from_account_id, amount):
+            raise ValueError("Insufficient balance")
+        
+        # Find destination account to get recipient name
+        to_account = self._get_destination_account(to_account_number)
+        
+        if not to_account:
+            raise ValueError("Destination account not found")
+        
+        # Prevent self-transfer (already loaded by the balance check)
+        from_account = self.db.get(Account, from_account_id)
+        
+        if not from_account:
+            raise ValueError("Source account not found")
+            
+        if from_account.account_number == to_account_number:
+            raise ValueError("Cannot transfer to the same account")
+        
+        # Charge today's daily limit; part of this transaction, so a
+        # failed transfer releases it on rollback
+        self.limits.reserve(from_account_id, amount)
+        
+        # Create transfer record
+        transfer = Transfer(
+            from_account_id=from_account_id,
+            to_account_number=to_account_number,
+            amount=amount,
+            status="PENDING",
+            description=description,
+            transfer_type="INTERNAL",
+            reference_number=self._generate_reference_number()
+        )
+        
+        self.db.add(transfer)
+        self.db.flush()  # Get transfer ID
+        
+        # Execute the transfer
+        self._execute_internal_transfer(transfer)
+        
+        return transfer
+    
     def create_external_transfer(self, from_account_id: int, to_account_number: str,
                                to_bank_id: int, amount: float, 
                                description: Optional[str] = None) -> Transfer:
@@ -119,7 +163,8 @@ class TransferService:
     
     def get_transfers_by_account(self, account_id: int, 
                                status: Optional[str] = None,
-                               limit: int = 50, offset: int = 0) -> List[Transfer]:
+                               limit: int = 50, offset: int = 0,
+                               columns: Optional[Sequence[str]] = None) -> List[Transfer]:
         """
         Get transfer history for an account
         
@@ -128,12 +173,17 @@ class TransferService:
             status: Optional status filter
             limit: Maximum number of records to return
             offset: Number of records to skip
+            columns: Only load these columns (default: all)
             
         Returns:
             List[Transfer]: List of transfer records
         """
         try:
-            query = self.db.query(Transfer).filter(Transfer.from_account_id == account_id)
+            query = (
+                self.db.query(Transfer)
+                .options(*load_only_options(Transfer, columns, Transfer.created_at))
+                .filter(Transfer.from_account_id == account_id)
+            )
             
             if status:
                 query = query.filter(Transfer.status == status)
@@ -219,9 +269,7 @@ class TransferService:
                 raise RuntimeError("Failed to debit source account")
             
             # Find destination account and credit
-            to_account = self.db.query(Account).filter(
-                Account.account_number == transfer.to_account_number
-            ).first()
+            to_account = self._get_destination_account(transfer.to_account_number)
             
             if not to_account:
                 # Rollback the debit
@@ -233,40 +281,42 @@ class TransferService:
                 self._update_account_balance(transfer.from_account_id, transfer.amount, "credit")
                 raise RuntimeError("Failed to credit destination account")
             
-            # Create transaction records
-            self._create_transaction_record(transfer)
+            # Create transaction records and add the debit to monthly category spending
+            transactions = self._create_transaction_record(transfer)
+            self.spending.record(transactions)
             
             # Update transfer status to completed
             transfer.status = "COMPLETED"
             transfer.completed_at = datetime.now()
             
+            # Publish through the outbox and checkpoint busy accounts in this same commit
+            self.db.flush()
+            self.outbox.record_transfer(transfer, transactions)
+            self.checkpoints.record(transactions)
+            
         except Exception as e:
             transfer.status = "FAILED"
             transfer.error_message = str(e)
             transfer.completed_at = datetime.now()
             raise
     
-    def _generate_reference_number(self) -> str:
-        """Generate unique reference number for transfer"""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        unique_id = str(uuid.uuid4())[:8].upper()
-        return f"TXF{timestamp}{unique_id}"
+    def _generate_reference_number(self, prefix: str = "TXF") -> str:
+        """Generate unique, sortable reference number (TXF for transfers, TXN for transactions)"""
+        return generate_reference_number(prefix)
     
-    def _create_transaction_record(self, transfer: Transfer) -> Transaction:
+    def _create_transaction_record(self, transfer: Transfer) -> List[Transaction]:
         """
-        Create transaction record for completed transfer
+        Create transaction records for completed transfer
         
         Args:
             transfer: Completed transfer record
             
         Returns:
-            Transaction: Created transaction record
+            List[Transaction]: Sender record, followed by the recipient record for internal transfers
         """
         try:
             # Get updated account balance
-            account = self.db.query(Account).filter(
-                Account.id == transfer.from_account_id
-            ).first()
+            account = self.db.get(Account, transfer.from_account_id)
             
             if not account:
                 raise ValueError("Account not found for transaction record")
@@ -280,8 +330,9 @@ class TransferService:
                           (f": {transfer.description}" if transfer.description else ""),
                 recipient_account=transfer.to_account_number,
                 balance_after=account.balance,
-                reference_number=self._generate_reference_number(),
-                status="completed"
+                reference_number=self._generate_reference_number("TXN"),
+                status="completed",
+                category_id=self.categorizer.categorize(transfer.description, fallback="이체")
             )
             
             self.db.add(transaction)
@@ -289,12 +340,11 @@ class TransferService:
             
             # Update transfer with transaction reference
             transfer.transaction_id = transaction.id
+            transactions = [transaction]
             
             # For internal transfers, also create a transaction record for the recipient
             if transfer.transfer_type == "INTERNAL":
-                to_account = self.db.query(Account).filter(
-                    Account.account_number == transfer.to_account_number
-                ).first()
+                to_account = self._get_destination_account(transfer.to_account_number)
                 
                 if to_account:
                     recipient_transaction = Transaction(
@@ -305,17 +355,43 @@ class TransferService:
                                   (f": {transfer.description}" if transfer.description else ""),
                         recipient_account=account.account_number,
                         balance_after=to_account.balance,
-                        reference_number=self._generate_reference_number(),
-                        status="completed"
+                        reference_number=self._generate_reference_number("TXN"),
+                        status="completed",
+                        category_id=self.categorizer.categorize(transfer.description, fallback="이체")
                     )
                     
                     self.db.add(recipient_transaction)
+                    transactions.append(recipient_transaction)
             
-            return transaction
+            return transactions
             
         except Exception as e:
             raise RuntimeError(f"Failed to create transaction record: {str(e)}")
     
+    def _get_destination_account(self, account_number: str) -> Optional[Account]:
+        """
+        Resolve an internal destination account through the account directory
+        
+        Account numbers missing from the directory are rejected without a
+        query; known ones are loaded by primary key (from the session
+        identity map when already loaded).
+        
+        Args:
+            account_number: Destination account number
+            
+        Returns:
+            Account, or None if no internal account has that number
+        """
+        account_id = self.directory.resolve(self.db, account_number)
+        if account_id is None:
+            return None
+        
+        account = self.db.get(Account, account_id)
+        if account is None or account.account_number != account_number:
+            self.directory.forget(account_number)
+            return None
+        return account
+    
     def _check_account_balance(self, account_id: int, amount: float) -> bool:
         """
         Check if account has sufficient balance for transfer
@@ -328,7 +404,7 @@ class TransferService:
             bool: True if sufficient balance, False otherwise
         """
         try:
-            account = self.db.query(Account).filter(Account.id == account_id).first()
+            account = self.db.get(Account, account_id)
             if not account:
                 return False
             
@@ -352,22 +428,33 @@ class TransferService:
             bool: True if update successful, False otherwise
         """
         try:
-            account = self.db.query(Account).filter(Account.id == account_id).first()
-            if not account:
-                return False
-            
             if operation == "debit":
-                # Check for sufficient balance before debiting
-                if account.balance < amount:
-                    return False
-                account.balance -= amount
+                delta = -amount
             elif operation == "credit":
-                account.balance += amount
+                delta = amount
             else:
                 raise ValueError(f"Invalid operation: {operation}")
-            
-            account.updated_at = datetime.now()
-            return True
+
+            # One conditional UPDATE instead of read-modify-write: the account
+            # may have been loaded before this transfer's write transaction
+            # began, and concurrent transfers must not overwrite each other
+            statement = (
+                update(Account)
+                .where(Account.id == account_id)
+                .values(
+                    balance=Account.balance + delta,
+                    # Committed with the transfer; invalidates cached balances in every worker
+                    balance_version=func.coalesce(Account.balance_version, 0) + 1,
+                    updated_at=datetime.now()
+                )
+                # Loaded accounts get the new balance for balance_after
+                .returning(Account)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            if operation == "debit":
+                # Check for sufficient balance before debiting
+                statement = statement.where(Account.balance >= amount)
+            return self.db.execute(statement).scalar_one_or_none() is not None
             
         except Exception:
             return False
\ No newline at end of file
@@ -11,6 +11,12 @@ from .formatting import (
     format_relative_date
 )
 
+from .downsampling import lttb_indices
+
+from .fieldsets import FieldSet, load_only_options, serialize_fields
+
+from .id_generator import generate_reference_number
+
 from .validators import (
     ValidationUtils,
     SecurityUtils,
@@ -26,6 +32,17 @@ __all__ = [
     "format_korean_date", 
     "format_relative_date",
     
+    # Time series downsampling
+    "lttb_indices",
+    
+    # Sparse fieldsets
+    "FieldSet",
+    "load_only_options",
+    "serialize_fields",
+    
+    # ID generation
+    "generate_reference_number",
+    
     # Validation utilities
     "ValidationUtils",
     "SecurityUtils",
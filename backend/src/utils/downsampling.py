@@ -0,0 +1,60 @@
+"""
+Time Series Downsampling
+Largest-Triangle-Three-Buckets (LTTB) selection of chart points
+"""
+
+from typing import List, Sequence
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """
+    Pick ``threshold`` points that preserve the visual shape of a series
+
+    The first and last points are always kept. The points in between are
+    split into ``threshold - 2`` equal buckets. From each bucket, LTTB keeps
+    the point that forms the largest triangle with the previously kept
+    point and the average of the next bucket. This keeps peaks and troughs
+    that plain striding or averaging would flatten. Runs in O(n).
+
+    Args:
+        xs: Ascending x values (e.g. POSIX timestamps)
+        ys: y values
+        threshold: Number of points to keep
+
+    Returns:
+        List[int]: Ascending indices of the kept points (all indices if the
+        series already has ``threshold`` points or fewer)
+    """
+    count = len(xs)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    bucket_size = (count - 2) / (threshold - 2)
+    selected = [0]
+    anchor = 0
+
+    for bucket in range(threshold - 2):
+        # Average of the next bucket (the last point for the final bucket)
+        next_start = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        if next_start >= next_end:
+            next_start, next_end = count - 1, count
+        span = next_end - next_start
+        average_x = sum(xs[next_start:next_end]) / span
+        average_y = sum(ys[next_start:next_end]) / span
+
+        anchor_x, anchor_y = xs[anchor], ys[anchor]
+        dx = anchor_x - average_x
+        dy = average_y - anchor_y
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Twice the triangle area; the constant factor does not change the argmax
+        anchor = max(
+            range(start, end),
+            key=lambda index: abs(dx * (ys[index] - anchor_y) - (anchor_x - xs[index]) * dy)
+        )
+        selected.append(anchor)
+
+    selected.append(count - 1)
+    return selected
@@ -0,0 +1,114 @@
+"""
+Sparse Fieldsets
+``fields=`` query parameter support: column projection and partial serialization
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy.orm import load_only
+
+
+class FieldSet:
+    """
+    Response fields of a list endpoint and the model columns each one reads
+
+    Endpoints parse ``fields=`` with ``parse`` and hand ``columns`` to the
+    service, which loads only those columns (``load_only_options``). Only
+    the selected fields are serialized. Without ``fields=`` every field is
+    returned, as before.
+
+    Args:
+        model: ORM model the rows are loaded as
+        fields: Response field -> model columns it is computed from
+            (plain columns map to themselves)
+    """
+
+    def __init__(self, model, fields: Mapping[str, Sequence[str]]):
+        self.model = model
+        self.fields = dict(fields)
+
+    @classmethod
+    def of_columns(cls, model, columns: Sequence[str], **derived: Sequence[str]) -> "FieldSet":
+        """Field set of plain columns plus ``derived`` fields computed from other columns"""
+        fields = {column: (column,) for column in columns}
+        fields.update(derived)
+        return cls(model, fields)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.fields)
+
+    def parse(self, fields: Optional[str]) -> List[str]:
+        """
+        Parse a comma-separated ``fields=`` value
+
+        Args:
+            fields: Requested fields, or None for all fields
+
+        Returns:
+            Selected field names in declaration order
+
+        Raises:
+            ValueError: If a requested field does not exist
+        """
+        if not fields:
+            return self.names
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(requested - self.fields.keys())
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(unknown)}. Available fields: {', '.join(self.fields)}"
+            )
+        if not requested:
+            return self.names
+        return [name for name in self.fields if name in requested]
+
+    def columns(self, selected: Sequence[str]) -> Optional[List[str]]:
+        """
+        Model columns the selected fields read
+
+        Returns:
+            Column names, or None when the fields need every column
+        """
+        columns = {column for name in selected for column in self.fields[name]}
+        if columns >= set(self.model.__table__.columns.keys()):
+            return None
+        return sorted(columns)
+
+
+def load_only_options(model, columns: Optional[Sequence[str]], *extra_columns) -> list:
+    """
+    Query options that load only ``columns`` of ``model``
+
+    Args:
+        model: ORM model being queried
+        columns: Column names from ``FieldSet.columns`` (None loads every column)
+        extra_columns: Column attributes the query needs besides the fields (e.g. sort keys)
+
+    Returns:
+        Options for ``Query.options``
+    """
+    if columns is None:
+        return []
+    names = set(columns).union(column.key for column in extra_columns)
+    # Primary keys are always loaded; sorting keeps the SELECT list stable
+    return [load_only(*(getattr(model, name) for name in sorted(names)))]
+
+
+def serialize_fields(row: Any, selected: Sequence[str],
+                     derived: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Serialize the selected fields of a row
+
+    Plain fields are read from ``row`` attributes, dates become ISO strings.
+    Fields in ``derived`` are computed by calling ``derived[name](row)``.
+    """
+    result = {}
+    for name in selected:
+        if derived and name in derived:
+            result[name] = derived[name](row)
+            continue
+        value = getattr(row, name)
+        result[name] = value.isoformat() if isinstance(value, date) else value
+    return result
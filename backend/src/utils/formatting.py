@@ -3,9 +3,19 @@ Common utility functions for date and currency formatting
 """
 
 from datetime import datetime, date
-from typing import Optional, Union, Dict
+from functools import lru_cache
+from typing import Optional, Union, Dict, List, Sequence
 from decimal import Decimal, ROUND_HALF_UP
 
+# Bounded memo size for repeated values (identical balances, same-day dates)
+FORMAT_CACHE_SIZE = 4096
+
+# Date-only formats: every datetime on the same day formats identically
+_DATE_ONLY_FORMATS = frozenset({"standard", "korean", "short", "full"})
+
+# Amount formats with an exact integer fast path (no Decimal round trip)
+_INTEGER_AMOUNT_FORMATS = frozenset({"standard", "accounting", "no_decimal", "won"})
+
 
 class DateFormatter:
     """Utility class for date formatting in Korean locale"""
@@ -33,6 +43,16 @@ class DateFormatter:
             except ValueError:
                 return date_obj
         
+        if format_type != "relative":
+            if isinstance(date_obj, datetime):
+                date_obj = date_obj.date()
+            return _cached_format_date(date_obj, format_type)
+        
+        return DateFormatter._format_date(date_obj, format_type)
+    
+    @staticmethod
+    def _format_date(date_obj: Union[datetime, date], format_type: str) -> str:
+        """Uncached implementation of format_date"""
         if format_type == "standard":
             return date_obj.strftime("%Y-%m-%d")
         
@@ -136,6 +156,7 @@ class DateFormatter:
                 - "standard": 2024-01-15 14:30:15
                 - "korean": 2024년 1월 15일 오후 2시 30분
                 - "transaction": 01/15 14:30 (거래내역용)
+                - "detail": 2024년 01월 15일 14시 30분 (거래 상세용)
         
         Returns:
             Formatted datetime string
@@ -146,6 +167,16 @@ class DateFormatter:
             except ValueError:
                 return datetime_obj
         
+        # Only the displayed precision is part of the cache key
+        if format_type == "standard" or format_type not in ("korean", "transaction", "detail"):
+            key = datetime_obj.replace(microsecond=0)
+        else:
+            key = datetime_obj.replace(second=0, microsecond=0)
+        return _cached_format_datetime(key, format_type)
+    
+    @staticmethod
+    def _format_datetime(datetime_obj: datetime, format_type: str) -> str:
+        """Uncached implementation of format_datetime"""
         if format_type == "standard":
             return datetime_obj.strftime("%Y-%m-%d %H:%M:%S")
         
@@ -155,7 +186,11 @@ class DateFormatter:
             return f"{date_str} {time_str}"
         
         elif format_type == "transaction":
-            return datetime_obj.strftime("%m/%d %H:%M")
+            # Same as strftime("%m/%d %H:%M"), without strftime's per-call overhead
+            return f"{datetime_obj.month:02d}/{datetime_obj.day:02d} {datetime_obj.hour:02d}:{datetime_obj.minute:02d}"
+        
+        elif format_type == "detail":
+            return datetime_obj.strftime("%Y년 %m월 %d일 %H시 %M분")
         
         else:
             return datetime_obj.strftime("%Y-%m-%d %H:%M:%S")
@@ -180,11 +215,35 @@ class CurrencyFormatter:
                 - "compact": 123만원, 12억원
                 - "accounting": +1,234,567원 / -1,234,567원
                 - "no_decimal": 1,234,567원 (정수로 표시)
+                - "won": 1,234,567원 (원 단위로 반올림, 잔액 표시용)
             show_currency: Whether to show currency symbol
         
         Returns:
             Formatted amount string
         """
+        return _cached_format_amount(amount, format_type, show_currency)
+    
+    @staticmethod
+    def _format_amount(
+        amount: Union[int, float, Decimal, str],
+        format_type: str,
+        show_currency: bool
+    ) -> str:
+        """Uncached implementation of format_amount"""
+        # Whole-won amounts (the common case) skip the Decimal round trip
+        if format_type in _INTEGER_AMOUNT_FORMATS and (
+            type(amount) is int
+            or (type(amount) is float and amount.is_integer() and abs(amount) < 1e15)
+        ):
+            value = int(amount)
+            formatted = f"{value:+,}" if format_type == "accounting" else f"{value:,}"
+            return f"{formatted}원" if show_currency else formatted
+        
+        if format_type == "won" and not isinstance(amount, str):
+            # Same rounding as f"{amount:,.0f}", which balance displays have always used
+            formatted = f"{amount:,.0f}"
+            return f"{formatted}원" if show_currency else formatted
+        
         # Convert to Decimal for precise calculations
         if isinstance(amount, str):
             try:
@@ -331,8 +390,94 @@ class TransactionFormatter:
             "description": TransactionFormatter.format_transaction_description(description),
             "amount": TransactionFormatter.format_transaction_amount(amount, transaction_type),
             "balance": CurrencyFormatter.format_amount(balance_after) if balance_after is not None else "",
-            "type_icon": "↑" if transaction_type == "deposit" else "↓" if transaction_type == "withdrawal" else "→"
+            "type_icon": TransactionFormatter.type_icon(transaction_type)
         }
+    
+    @staticmethod
+    def type_icon(transaction_type: str) -> str:
+        """Display icon for a transaction type"""
+        return "↑" if transaction_type == "deposit" else "↓" if transaction_type == "withdrawal" else "→"
+
+
+class BatchFormatter:
+    """
+    Column-at-a-time formatting for list responses and exports
+    
+    Each method formats a whole column of values in one call through the
+    same memoized formatters as the single-value APIs, so output is identical
+    and repeated values (balances, same-day dates) are formatted once.
+    """
+    
+    @staticmethod
+    def format_amounts(
+        amounts: Sequence[Union[int, float, Decimal, str]],
+        format_type: str = "standard",
+        show_currency: bool = True
+    ) -> List[str]:
+        """Format a column of amounts (see CurrencyFormatter.format_amount)"""
+        fmt = _cached_format_amount
+        return [fmt(amount, format_type, show_currency) for amount in amounts]
+    
+    @staticmethod
+    def format_dates(
+        dates: Sequence[Union[datetime, date, str]],
+        format_type: str = "standard"
+    ) -> List[str]:
+        """Format a column of dates (see DateFormatter.format_date)"""
+        fmt = DateFormatter.format_date
+        return [fmt(value, format_type) for value in dates]
+    
+    @staticmethod
+    def format_datetimes(
+        datetimes: Sequence[Union[datetime, str]],
+        format_type: str = "standard"
+    ) -> List[str]:
+        """Format a column of datetimes (see DateFormatter.format_datetime)"""
+        fmt = DateFormatter.format_datetime
+        return [fmt(value, format_type) for value in datetimes]
+    
+    @staticmethod
+    def format_transaction_amounts(
+        amounts: Sequence[Union[int, float, Decimal]],
+        transaction_types: Sequence[str]
+    ) -> List[str]:
+        """Format a column of signed transaction amounts"""
+        fmt = TransactionFormatter.format_transaction_amount
+        return [fmt(amount, transaction_type) for amount, transaction_type in zip(amounts, transaction_types)]
+    
+    @staticmethod
+    def type_icons(transaction_types: Sequence[str]) -> List[str]:
+        """Display icons for a column of transaction types"""
+        icon = TransactionFormatter.type_icon
+        return [icon(transaction_type) for transaction_type in transaction_types]
+    
+    @staticmethod
+    def format_transaction_summaries(
+        transaction_dates: Sequence[datetime],
+        descriptions: Sequence[str],
+        amounts: Sequence[Union[int, float, Decimal]],
+        transaction_types: Sequence[str],
+        balances: Sequence[Optional[Union[int, float, Decimal]]]
+    ) -> List[Dict[str, str]]:
+        """Format whole columns like TransactionFormatter.format_transaction_summary"""
+        shorten = TransactionFormatter.format_transaction_description
+        columns = zip(
+            BatchFormatter.format_datetimes(transaction_dates, "transaction"),
+            [shorten(description) for description in descriptions],
+            BatchFormatter.format_transaction_amounts(amounts, transaction_types),
+            [_cached_format_amount(balance, "standard", True) if balance is not None else "" for balance in balances],
+            BatchFormatter.type_icons(transaction_types)
+        )
+        return [
+            {"date": d, "description": text, "amount": amount, "balance": balance, "type_icon": icon}
+            for d, text, amount, balance, icon in columns
+        ]
+
+
+# Memoized cores shared by the single-value and batch APIs
+_cached_format_amount = lru_cache(maxsize=FORMAT_CACHE_SIZE, typed=True)(CurrencyFormatter._format_amount)
+_cached_format_date = lru_cache(maxsize=FORMAT_CACHE_SIZE)(DateFormatter._format_date)
+_cached_format_datetime = lru_cache(maxsize=FORMAT_CACHE_SIZE)(DateFormatter._format_datetime)
 
 
 # Convenience functions for quick formatting
@@ -0,0 +1,123 @@
+"""
+Sortable ID Generator
+Snowflake-style reference numbers that are unique across worker processes and
+sort in creation order
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+# Crockford base32: no I, L, O, U; ascending in ASCII so string order matches numeric order
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+TIMESTAMP_BITS = 48  # Milliseconds since the Unix epoch (good until year 10889)
+WORKER_BITS = 24
+SEQUENCE_BITS = 16
+
+_WORKER_MASK = (1 << WORKER_BITS) - 1
+_SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+
+# 88-bit IDs encode to 18 base32 characters
+ENCODED_LENGTH = 18
+
+
+# Worker ids from WORKER_ID have the top bit set; process ids never do
+# (Linux pid_max is at most 2**22), so the two ranges cannot collide
+_CONFIGURED_WORKER_BIT = 1 << (WORKER_BITS - 1)
+_PROCESS_WORKER_MASK = _CONFIGURED_WORKER_BIT - 1
+
+
+def _process_worker_id() -> int:
+    """Worker id of this process: WORKER_ID if set, else the process id"""
+    configured = os.getenv("WORKER_ID")
+    if configured:
+        worker_id = int(configured)
+        if not 0 <= worker_id < _CONFIGURED_WORKER_BIT:
+            raise ValueError(f"WORKER_ID must be between 0 and {_CONFIGURED_WORKER_BIT - 1}, got {configured}")
+        return _CONFIGURED_WORKER_BIT | worker_id
+    # Unique among the live processes of this host, which are the only
+    # processes that can open the same SQLite database file
+    return os.getpid() & _PROCESS_WORKER_MASK
+
+
+def _encode(value: int) -> str:
+    chars = []
+    for _ in range(ENCODED_LENGTH):
+        value, index = divmod(value, 32)
+        chars.append(_ALPHABET[index])
+    return "".join(reversed(chars))
+
+
+class IdGenerator:
+    """
+    Monotonic ID generator: timestamp | worker id | sequence
+
+    IDs from one generator strictly increase. IDs from different workers
+    interleave by millisecond, so inserts land at the right-hand edge of the
+    ``reference_number`` index instead of at random pages. The sequence
+    allows 65,536 IDs per worker per millisecond. Past that, or if the
+    clock steps backwards, the generator borrows the next millisecond
+    instead of blocking or going backwards.
+
+    The default worker id is the process id, which no other live process
+    on the host shares; a process that later reuses a pid starts at a
+    later millisecond. Processes in separate PID namespaces (containers)
+    sharing one database must set distinct ``WORKER_ID`` values instead.
+
+    Args:
+        worker_id: 24-bit worker id (default: from WORKER_ID or the process id)
+    """
+
+    def __init__(self, worker_id: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._sequence = 0
+        self.worker_id: Optional[int] = _process_worker_id() if worker_id is None else worker_id & _WORKER_MASK
+
+    def reseed(self) -> None:
+        """Take the worker id of a forked child, which must not reuse its parent's"""
+        # Fresh lock: another parent thread may have held it at fork time
+        self._lock = threading.Lock()
+        # WORKER_ID names a single process: a child that inherited it cannot generate IDs
+        self.worker_id = None if os.getenv("WORKER_ID") else _process_worker_id()
+        # Keep _last_ms: IDs of the child still sort after those the parent generated before the fork
+
+    def next_int(self) -> int:
+        """Generate the next ID as an integer"""
+        if self.worker_id is None:
+            raise RuntimeError("Forked from a process with WORKER_ID set; give each worker process its own WORKER_ID")
+        now_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            else:
+                self._sequence = (self._sequence + 1) & _SEQUENCE_MASK
+                if self._sequence == 0:
+                    self._last_ms += 1
+            return (self._last_ms << (WORKER_BITS + SEQUENCE_BITS)) | (self.worker_id << SEQUENCE_BITS) | self._sequence
+
+    def next_id(self, prefix: str = "") -> str:
+        """Generate the next ID as ``prefix`` + 18 Crockford base32 characters"""
+        return prefix + _encode(self.next_int())
+
+
+_generator = IdGenerator()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_generator.reseed)
+
+
+def generate_reference_number(prefix: str) -> str:
+    """
+    Generate a unique, sortable reference number
+
+    Args:
+        prefix: Reference type prefix (e.g. TXF for transfers, TXN for transactions)
+
+    Returns:
+        str: Prefix followed by 18 base32 characters
+    """
+    return _generator.next_id(prefix)
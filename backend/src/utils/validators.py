@@ -4,9 +4,21 @@ Validation utilities for banking data
 
 import re
 from datetime import datetime
-from typing import Union, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Union, Optional, Tuple
 from decimal import Decimal, InvalidOperation
 
+# Patterns are compiled once at import; validators run on every request
+ACCOUNT_NUMBER_RE = re.compile(r'^\d{4}-\d{4}-\d{4}$')
+
+# Characters stripped by SecurityUtils.sanitize_input
+UNSAFE_INPUT_RE = re.compile(r'[<>"\']')
+
+TRANSACTION_TYPES = ("deposit", "withdrawal", "transfer")
+VALID_TRANSACTION_TYPES = frozenset(TRANSACTION_TYPES)
+
+# Bank codes accepted for external transfers when no active list is given
+DEFAULT_ACTIVE_BANKS = frozenset({"KB", "SH", "WR", "HN", "IBK", "NH"})
+
 
 class ValidationUtils:
     """Common validation utilities for banking application"""
@@ -26,9 +38,7 @@ class ValidationUtils:
             return False, "계좌번호가 입력되지 않았습니다."
         
         # Korean bank account format: XXXX-XXXX-XXXX (or similar patterns)
-        pattern = r'^\d{4}-\d{4}-\d{4}$'
-        
-        if not re.match(pattern, account_number):
+        if not ACCOUNT_NUMBER_RE.match(account_number):
             return False, "계좌번호는 XXXX-XXXX-XXXX 형식이어야 합니다."
         
         return True, ""
@@ -75,10 +85,8 @@ class ValidationUtils:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        valid_types = ["deposit", "withdrawal", "transfer"]
-        
-        if transaction_type not in valid_types:
-            return False, f"거래 유형은 {', '.join(valid_types)} 중 하나여야 합니다."
+        if transaction_type not in VALID_TRANSACTION_TYPES:
+            return False, f"거래 유형은 {', '.join(TRANSACTION_TYPES)} 중 하나여야 합니다."
         
         return True, ""
     
@@ -137,7 +145,7 @@ class SecurityUtils:
             return ""
         
         # Remove potentially dangerous characters
-        sanitized = re.sub(r'[<>"\']', '', input_str)
+        sanitized = UNSAFE_INPUT_RE.sub('', input_str)
         
         # Truncate to max length
         sanitized = sanitized[:max_length]
@@ -301,6 +309,12 @@ class TransferValidator:
         "INTERNAL": r"^\d{10,20}$"  # 내부 계좌: 10-20자리 숫자
     }
     
+    # ACCOUNT_PATTERNS compiled once for the per-request checks
+    COMPILED_ACCOUNT_PATTERNS = {code: re.compile(pattern) for code, pattern in ACCOUNT_PATTERNS.items()}
+    
+    # 이체 설명에 사용할 수 없는 문자
+    FORBIDDEN_DESCRIPTION_CHARS = frozenset('<>&"\'\\')
+    
     # Transfer amount limits
     MIN_TRANSFER_AMOUNT = Decimal('1.00')  # 최소 1원
     MAX_TRANSFER_AMOUNT = Decimal('50000000.00')  # 최대 5천만원 (일반적 한도)
@@ -334,9 +348,9 @@ class TransferValidator:
             return False, "계좌번호는 숫자만 포함해야 합니다."
         
         # 은행별 패턴 검증
-        if bank_code and bank_code in cls.ACCOUNT_PATTERNS:
-            pattern = cls.ACCOUNT_PATTERNS[bank_code]
-            if not re.match(pattern, account_number):
+        pattern = cls.COMPILED_ACCOUNT_PATTERNS.get(bank_code) if bank_code else None
+        if pattern is not None:
+            if not pattern.match(account_number):
                 return False, f"{bank_code} 은행의 계좌번호 형식이 올바르지 않습니다."
         
         return True, ""
@@ -385,13 +399,13 @@ class TransferValidator:
         return True, ""
     
     @classmethod
-    def validate_bank_code(cls, bank_code: str, active_banks: list) -> Tuple[bool, str]:
+    def validate_bank_code(cls, bank_code: str, active_banks: Iterable[str]) -> Tuple[bool, str]:
         """
         은행 코드 검증
         
         Args:
             bank_code: 검증할 은행 코드
-            active_banks: 활성화된 은행 코드 목록
+            active_banks: 활성화된 은행 코드 (frozenset 권장)
             
         Returns:
             Tuple of (is_valid, error_message)
@@ -429,13 +443,116 @@ class TransferValidator:
             return False, "이체 설명은 100자를 초과할 수 없습니다."
         
         # 특수문자 검증 (선택적)
-        forbidden_chars = ['<', '>', '&', '"', "'", '\\']
-        if any(char in description for char in forbidden_chars):
+        if not cls.FORBIDDEN_DESCRIPTION_CHARS.isdisjoint(description):
             return False, "이체 설명에 사용할 수 없는 문자가 포함되어 있습니다."
         
         return True, ""
 
 
+class TransferRuleEngine:
+    """
+    Transfer request validator for single requests and batches of requests
+    
+    Runs the TransferValidator rules in order and stops at the first failure.
+    The active bank set is frozen once per engine instead of per request.
+    
+    Args:
+        active_banks: Active bank codes (default: DEFAULT_ACTIVE_BANKS)
+    """
+    
+    def __init__(self, active_banks: Optional[Iterable[str]] = None):
+        self.active_banks = (
+            frozenset(code.upper().strip() for code in active_banks) if active_banks else DEFAULT_ACTIVE_BANKS
+        )
+    
+    def validate(self, from_account_id: int, to_account_number: str,
+                 amount: float, bank_code: Optional[str] = None,
+                 description: Optional[str] = None,
+                 daily_used: float = 0.0,
+                 account_limit: Optional[float] = None) -> Tuple[bool, str]:
+        """
+        전체 이체 정보 검증
+        
+        Args:
+            from_account_id: 출금 계좌 ID
+            to_account_number: 입금 계좌번호
+            amount: 이체 금액
+            bank_code: 은행 코드 (외부 이체용)
+            description: 이체 설명
+            daily_used: 일일 이체 사용량
+            account_limit: 계좌 한도
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        
+        # 출금 계좌 검증
+        if not from_account_id or from_account_id <= 0:
+            return False, "출금 계좌를 선택해주세요."
+        
+        # 계좌번호 검증
+        is_valid, error_msg = TransferValidator.validate_account_number_for_transfer(to_account_number, bank_code)
+        if not is_valid:
+            return False, error_msg
+        
+        # 금액 검증
+        is_valid, error_msg = TransferValidator.validate_transfer_amount(amount, daily_used, account_limit)
+        if not is_valid:
+            return False, error_msg
+        
+        # 은행 코드 검증 (외부 이체인 경우)
+        if bank_code:
+            is_valid, error_msg = TransferValidator.validate_bank_code(bank_code, self.active_banks)
+            if not is_valid:
+                return False, error_msg
+        
+        # 설명 검증
+        is_valid, error_msg = TransferValidator.validate_transfer_description(description)
+        if not is_valid:
+            return False, error_msg
+        
+        return True, "모든 이체 정보가 유효합니다."
+    
+    def validate_many(self, requests: Iterable[Mapping],
+                      daily_used: Optional[Mapping[int, float]] = None) -> List[Tuple[bool, str]]:
+        """
+        여러 이체 요청 일괄 검증
+        
+        Requests are checked in order. Each valid request's amount is added to
+        its source account's daily usage, so later requests in the same batch
+        are checked against the daily limit including earlier ones.
+        
+        Args:
+            requests: 이체 요청 목록 (validate()의 인자 이름을 키로 사용, daily_used 제외)
+            daily_used: 계좌 ID별 오늘 이미 이체한 금액
+            
+        Returns:
+            List of (is_valid, error_message), one per request
+        """
+        used: Dict[int, float] = dict(daily_used or {})
+        results = []
+        
+        for request in requests:
+            from_account_id = request.get("from_account_id")
+            result = self.validate(
+                from_account_id,
+                request.get("to_account_number"),
+                request.get("amount"),
+                bank_code=request.get("bank_code"),
+                description=request.get("description"),
+                daily_used=used.get(from_account_id, 0.0),
+                account_limit=request.get("account_limit")
+            )
+            if result[0]:
+                used[from_account_id] = used.get(from_account_id, 0.0) + float(request["amount"])
+            results.append(result)
+        
+        return results
+
+
+_default_rule_engine = TransferRuleEngine()
+
+
 def validate_complete_transfer_request(from_account_id: int, to_account_number: str,
                                      amount: float, bank_code: Optional[str] = None,
                                      description: Optional[str] = None,
@@ -458,32 +575,8 @@ def validate_complete_transfer_request(from_account_id: int, to_account_number:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    
-    # 출금 계좌 검증
-    if not from_account_id or from_account_id <= 0:
-        return False, "출금 계좌를 선택해주세요."
-    
-    # 계좌번호 검증
-    is_valid, error_msg = TransferValidator.validate_account_number_for_transfer(to_account_number, bank_code)
-    if not is_valid:
-        return False, error_msg
-    
-    # 금액 검증
-    is_valid, error_msg = TransferValidator.validate_transfer_amount(amount, daily_used, account_limit)
-    if not is_valid:
-        return False, error_msg
-    
-    # 은행 코드 검증 (외부 이체인 경우)
-    if bank_code:
-        if not active_banks:
-            active_banks = ["KB", "SH", "WR", "HN", "IBK", "NH"]
-        is_valid, error_msg = TransferValidator.validate_bank_code(bank_code, active_banks)
-        if not is_valid:
-            return False, error_msg
-    
-    # 설명 검증
-    is_valid, error_msg = TransferValidator.validate_transfer_description(description)
-    if not is_valid:
-        return False, error_msg
-    
-    return True, "모든 이체 정보가 유효합니다."
\ No newline at end of file
+    engine = TransferRuleEngine(active_banks) if active_banks else _default_rule_engine
+    return engine.validate(
+        from_account_id, to_account_number, amount, bank_code,
+        description, daily_used, account_limit
+    )
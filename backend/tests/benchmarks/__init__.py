@@ -0,0 +1,3 @@
+"""
+Performance benchmark suite for the Banking App API
+"""
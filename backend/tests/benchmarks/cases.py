@@ -0,0 +1,309 @@
+"""
+Benchmark cases
+Registry of measured operations shared by the pytest suite and the standalone runner
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .dataset import BenchmarkContext
+from .harness import ABSOLUTE_CHECKS, DEFAULT_TOLERANCE, check_regression, measure, measure_against
+
+
+class BenchmarkCase:
+    """
+    A named benchmark: ``build(ctx)`` returns the zero-argument callable to time
+
+    ``relative_to`` names a case timed again in alternating rounds with this
+    one; the regression check then compares the ratio of the two medians. Cases with
+    ``gate=False`` are recorded but never fail (in-run references whose
+    absolute time depends on the machine).
+    """
+
+    def __init__(self, name: str, build: Callable[[BenchmarkContext], Callable[[], object]],
+                 rounds: int = 20, warmup: int = 2, ops: int = 1,
+                 relative_to: Optional[str] = None, gate: bool = True):
+        self.name = name
+        self.build = build
+        self.rounds = rounds
+        self.warmup = warmup
+        self.ops = ops
+        self.relative_to = relative_to
+        self.gate = gate
+
+    def run(self, ctx: BenchmarkContext, baseline: Dict[str, Dict[str, float]],
+            tolerance: float = DEFAULT_TOLERANCE,
+            absolute: bool = ABSOLUTE_CHECKS) -> Tuple[Dict[str, float], Optional[str]]:
+        """Measure the case and check it against the baseline: ``(result, regression or None)``"""
+        if not self.gate or self.relative_to is None:
+            result = measure(self.build(ctx), self.rounds, self.warmup, self.ops)
+            if not self.gate:
+                return result, None
+            return result, check_regression(self.name, result, baseline, tolerance, absolute=absolute)
+        reference = CASES_BY_NAME[self.relative_to]
+        result, reference_result = measure_against(
+            self.build(ctx), reference.build(ctx), self.rounds, self.warmup, self.ops, reference.ops
+        )
+        # Stored with the result so a new baseline records the ratio it is gated on
+        result["reference_ratio"] = round(result["median_ms"] / reference_result["median_ms"], 4)
+        return result, check_regression(
+            self.name, result, baseline, tolerance, self.relative_to, reference_result, absolute
+        )
+
+CASES: List[BenchmarkCase] = []
+CASES_BY_NAME: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark_case(name: str, rounds: int = 20, warmup: int = 2, ops: int = 1,
+                   relative_to: Optional[str] = None, gate: bool = True):
+    """Register a benchmark case builder"""
+    def decorator(build: Callable[[BenchmarkContext], Callable[[], object]]):
+        case = BenchmarkCase(name, build, rounds, warmup, ops, relative_to, gate)
+        CASES.append(case)
+        CASES_BY_NAME[name] = case
+        return build
+    return decorator
+
+
+def _expect(response, status_code: int = 200):
+    assert response.status_code == status_code, f"{response.status_code}: {response.text[:200]}"
+    return response
+
+
+def _transactions_per_account(ctx: BenchmarkContext) -> int:
+    return max(ctx.transactions // ctx.accounts, 1)
+
+
+def _get_transactions(ctx: BenchmarkContext, **params) -> Callable[[], object]:
+    params.setdefault("account_id", ctx.account_ids[0])
+    return lambda: _expect(ctx.client.get("/api/transactions/", params=params))
+
+
+# In-run references: read API cases are gated on their ratio to a request
+# through the same client and middleware that does no application work,
+# transfers on their ratio to a raw SQLite commit on the same database, and
+# service cases on their ratio to a raw SQLite query over the same dataset
+API_REFERENCE = "reference_api_health"
+COMMIT_REFERENCE = "reference_sqlite_commit"
+SERVICE_REFERENCE = "reference_sqlite_query"
+
+
+@benchmark_case(API_REFERENCE, gate=False)
+def bench_reference_api_health(ctx):
+    return lambda: _expect(ctx.client.get("/health"))
+
+
+@benchmark_case(COMMIT_REFERENCE, gate=False)
+def bench_reference_sqlite_commit(ctx):
+    from sqlalchemy import text
+
+    with ctx.session() as db:
+        db.execute(text("CREATE TABLE IF NOT EXISTS benchmark_reference (id INTEGER PRIMARY KEY, value TEXT)"))
+        db.commit()
+
+    def run():
+        with ctx.session() as db:
+            db.execute(text("INSERT INTO benchmark_reference (value) VALUES ('벤치마크')"))
+            db.commit()
+    return run
+
+
+@benchmark_case(SERVICE_REFERENCE, gate=False)
+def bench_reference_sqlite_query(ctx):
+    from sqlalchemy import text
+
+    query = text(
+        "SELECT id, transaction_date, amount, balance_after FROM transactions "
+        "WHERE account_id = :account_id ORDER BY transaction_date DESC LIMIT 200"
+    )
+
+    def run():
+        with ctx.session() as db:
+            db.execute(query, {"account_id": ctx.account_ids[0]}).all()
+    return run
+
+
+@benchmark_case("api_transactions_offset_first_page", relative_to=API_REFERENCE)
+def bench_transactions_first_page(ctx):
+    return _get_transactions(ctx, limit=20, offset=0)
+
+
+@benchmark_case("api_transactions_offset_middle", relative_to=API_REFERENCE)
+def bench_transactions_middle_page(ctx):
+    return _get_transactions(ctx, limit=20, offset=_transactions_per_account(ctx) // 2)
+
+
+@benchmark_case("api_transactions_offset_last_page", relative_to=API_REFERENCE)
+def bench_transactions_last_page(ctx):
+    return _get_transactions(ctx, limit=20, offset=max(_transactions_per_account(ctx) - 20, 0))
+
+
+@benchmark_case("api_transactions_filter_type", relative_to=API_REFERENCE)
+def bench_transactions_filter_type(ctx):
+    return _get_transactions(ctx, type="withdrawal", limit=50)
+
+
+@benchmark_case("api_transactions_filter_date_range", relative_to=API_REFERENCE)
+def bench_transactions_filter_date_range(ctx):
+    today = date.today()
+    return _get_transactions(
+        ctx, from_date=(today - timedelta(days=30)).isoformat(), to_date=today.isoformat(), limit=50
+    )
+
+
+@benchmark_case("api_transactions_search", relative_to=API_REFERENCE)
+def bench_transactions_search(ctx):
+    return _get_transactions(ctx, search="마트", limit=20)
+
+
+@benchmark_case("service_account_summary", relative_to=SERVICE_REFERENCE)
+def bench_account_summary(ctx):
+    from src.services.transaction_service import TransactionService
+
+    def run():
+        with ctx.session() as db:
+            assert TransactionService(db).get_account_summary(ctx.account_ids[0]) is not None
+    return run
+
+
+@benchmark_case("service_transaction_statistics", relative_to=SERVICE_REFERENCE)
+def bench_transaction_statistics(ctx):
+    from src.services.transaction_service import TransactionService
+
+    def run():
+        with ctx.session() as db:
+            TransactionService(db).get_transaction_statistics(ctx.account_ids[0], 90)
+    return run
+
+
+def _transfer_payload(ctx: BenchmarkContext, index: int) -> dict:
+    from_account_id = ctx.account_ids[index % len(ctx.account_ids)]
+    to_account_id = ctx.account_ids[(index + 1) % len(ctx.account_ids)]
+    return {
+        "from_account_id": from_account_id,
+        "to_account_number": ctx.account_numbers[to_account_id],
+        "amount": 1000,
+        "description": "벤치마크 이체",
+    }
+
+
+@benchmark_case("api_transfer_single", relative_to=COMMIT_REFERENCE)
+def bench_transfer_single(ctx):
+    payload = _transfer_payload(ctx, 0)
+    return lambda: _expect(ctx.client.post("/api/v1/transfers/", json=payload), 201)
+
+
+CONCURRENT_TRANSFERS = 16
+CONCURRENT_WORKERS = 4
+
+
+@benchmark_case("api_transfer_concurrent", rounds=5, warmup=1, ops=CONCURRENT_TRANSFERS,
+                relative_to=COMMIT_REFERENCE)
+def bench_transfer_concurrent(ctx):
+    payloads = [_transfer_payload(ctx, i) for i in range(CONCURRENT_TRANSFERS)]
+
+    def run():
+        with ThreadPoolExecutor(max_workers=CONCURRENT_WORKERS) as pool:
+            responses = list(pool.map(
+                lambda payload: ctx.client.post("/api/v1/transfers/", json=payload), payloads
+            ))
+        for response in responses:
+            _expect(response, 201)
+    return run
+
+
+@benchmark_case("api_accounts_list", relative_to=API_REFERENCE)
+def bench_accounts_list(ctx):
+    return lambda: _expect(ctx.client.get("/api/accounts/", params={"limit": 50}))
+
+
+@benchmark_case("api_account_balance", relative_to=API_REFERENCE)
+def bench_account_balance(ctx):
+    return lambda: _expect(ctx.client.get(f"/api/accounts/{ctx.account_ids[0]}/balance"))
+
+
+VALIDATION_BATCH_SIZE = 10000
+
+
+def _transfer_requests(count: int) -> List[dict]:
+    """Mixed internal/external transfer requests, roughly one in ten invalid"""
+    banks = ["KB", "SH", "WR", "HN", "IBK", "NH"]
+    account_numbers = {
+        "KB": "12345678901234", "SH": "12345678901", "WR": "1234567890123",
+        "HN": "12345678901234", "IBK": "123-456789-01-234", "NH": "1234567890123",
+    }
+    requests = []
+    for i in range(count):
+        bank_code = banks[i % len(banks)] if i % 3 else None
+        requests.append({
+            "from_account_id": i % 500 + 1,
+            "to_account_number": account_numbers[bank_code] if bank_code else f"3000-{i % 10000:04d}-{i:04d}",
+            "amount": 5000 + (i % 97) * 1000 if i % 10 else 99000000,
+            "bank_code": bank_code,
+            "description": f"급여 이체 {i}" if i % 7 else "<script>",
+        })
+    return requests
+
+
+# Pure CPU: the per-request path is the in-run reference for the batch path
+@benchmark_case("validator_single_requests", rounds=10, warmup=1, ops=VALIDATION_BATCH_SIZE, gate=False)
+def bench_validator_single_requests(ctx):
+    from src.utils.validators import validate_complete_transfer_request
+
+    requests = _transfer_requests(VALIDATION_BATCH_SIZE)
+    return lambda: [validate_complete_transfer_request(**request) for request in requests]
+
+
+@benchmark_case("validator_batch_requests", rounds=10, warmup=1, ops=VALIDATION_BATCH_SIZE,
+                relative_to="validator_single_requests")
+def bench_validator_batch_requests(ctx):
+    from src.utils.validators import TransferRuleEngine
+
+    engine = TransferRuleEngine()
+    requests = _transfer_requests(VALIDATION_BATCH_SIZE)
+    return lambda: engine.validate_many(requests)
+
+
+FORMATTING_ROWS = 10000
+
+
+def _formatting_columns(count: int):
+    """Transaction columns shaped like a year of account history (date, description, amount, type, balance)"""
+    from datetime import datetime
+
+    types = ["deposit", "withdrawal", "withdrawal", "transfer"]
+    start = datetime(2024, 1, 1, 9, 0)
+    balance = 5000000.0
+    columns = ([], [], [], [], [])
+    for i in range(count):
+        transaction_type = types[i % len(types)]
+        amount = float(1000 * (i % 250 + 1))
+        balance += amount if transaction_type == "deposit" else -amount / 2
+        for column, value in zip(columns, (
+            start + timedelta(minutes=i * 53, seconds=i % 60),
+            f"편의점 결제 {i % 40}번 매장" if i % 5 else "월급 입금",
+            amount,
+            transaction_type,
+            balance,
+        )):
+            column.append(value)
+    return columns
+
+
+# Pure CPU: row-at-a-time formatting is the in-run reference for the batch path
+@benchmark_case("formatting_row_summaries", rounds=10, warmup=1, ops=FORMATTING_ROWS, gate=False)
+def bench_formatting_row_summaries(ctx):
+    from src.utils.formatting import TransactionFormatter
+
+    rows = list(zip(*_formatting_columns(FORMATTING_ROWS)))
+    return lambda: [TransactionFormatter.format_transaction_summary(*row) for row in rows]
+
+
+@benchmark_case("formatting_batch_summaries", rounds=10, warmup=1, ops=FORMATTING_ROWS,
+                relative_to="formatting_row_summaries")
+def bench_formatting_batch_summaries(ctx):
+    from src.utils.formatting import BatchFormatter
+
+    columns = _formatting_columns(FORMATTING_ROWS)
+    return lambda: BatchFormatter.format_transaction_summaries(*columns)
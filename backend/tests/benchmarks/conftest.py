@@ -0,0 +1,34 @@
+"""
+Pytest fixtures for the benchmark suite
+"""
+
+import pytest
+
+from .dataset import BenchmarkContext
+from .harness import load_baseline, write_results
+
+_results = {}
+_regressions = []
+
+
+@pytest.fixture(scope="session")
+def bench_context():
+    ctx = BenchmarkContext().setup()
+    yield ctx
+    write_results(_results, dataset=ctx.dataset, regressions=_regressions)
+    ctx.teardown()
+
+
+@pytest.fixture(scope="session")
+def bench_baseline():
+    return load_baseline()
+
+
+@pytest.fixture(scope="session")
+def bench_recorder():
+    """Collect results for the JSON report written at the end of the session"""
+    def record(name, result, regression=None):
+        _results[name] = result
+        if regression:
+            _regressions.append(regression)
+    return record
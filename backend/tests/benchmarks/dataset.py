@@ -0,0 +1,97 @@
+"""
+Benchmark dataset
+Seeds a sized SQLite database and wires the application to it
+"""
+
+import os
+import shutil
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional
+
+# Dataset size can be scaled up for local profiling runs
+DEFAULT_ACCOUNTS = int(os.getenv("BENCH_ACCOUNTS", "50"))
+DEFAULT_TRANSACTIONS = int(os.getenv("BENCH_TRANSACTIONS", "100000"))
+DEFAULT_SEED = int(os.getenv("BENCH_SEED", "42"))
+
+
+class BenchmarkContext:
+    """Seeded database, test client and helpers shared by benchmark cases"""
+
+    def __init__(
+        self,
+        accounts: int = DEFAULT_ACCOUNTS,
+        transactions: int = DEFAULT_TRANSACTIONS,
+        seed: int = DEFAULT_SEED
+    ):
+        self.accounts = accounts
+        self.transactions = transactions
+        self.seed = seed
+        self.tmp_dir: Optional[Path] = None
+        self.client = None
+        self.account_ids = []
+        self.account_numbers: Dict[int, str] = {}
+        self._previous_database_url: Optional[str] = None
+
+    @property
+    def dataset(self) -> Dict[str, int]:
+        return {"accounts": self.accounts, "transactions": self.transactions, "seed": self.seed}
+
+    def setup(self) -> "BenchmarkContext":
+        """Create the database, load the dataset and build the test client"""
+        from fastapi.testclient import TestClient
+
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix="banking-bench-"))
+        self._previous_database_url = os.environ.get("DATABASE_URL")
+        os.environ["DATABASE_URL"] = f"sqlite:///{self.tmp_dir / 'bench.db'}"
+        self._reset_app_state()
+
+        from src.main import app
+        from src.data.bulk_generator import BulkDataGenerator
+        from src.database.connection import create_tables, get_engine, SessionLocal
+        from src.models.database_models import Account
+
+        create_tables()
+        BulkDataGenerator(
+            accounts=self.accounts,
+            transactions=self.transactions,
+            seed=self.seed,
+            end_date=date.today(),
+        ).load(get_engine())
+
+        db = SessionLocal()
+        try:
+            for account in db.query(Account).order_by(Account.id):
+                self.account_ids.append(account.id)
+                self.account_numbers[account.id] = account.account_number
+        finally:
+            db.close()
+
+        # Not used as a context manager: the startup hook would seed sample data
+        self.client = TestClient(app)
+        return self
+
+    def teardown(self) -> None:
+        """Dispose the engine and remove the temporary database"""
+        self._reset_app_state()
+        if self._previous_database_url is None:
+            os.environ.pop("DATABASE_URL", None)
+        else:
+            os.environ["DATABASE_URL"] = self._previous_database_url
+        if self.tmp_dir is not None:
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def session(self):
+        """Open a new database session on the benchmark database"""
+        from src.database.connection import SessionLocal
+
+        return SessionLocal()
+
+    @staticmethod
+    def _reset_app_state() -> None:
+        from src.config.settings import get_settings
+        from src.database.connection import reset_engine
+
+        get_settings.cache_clear()
+        reset_engine()
@@ -0,0 +1,161 @@
+"""
+Benchmark harness
+Timing, JSON result output and baseline comparison shared by pytest and the runner
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = BENCHMARK_DIR.parent.parent
+
+DEFAULT_BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+DEFAULT_OUTPUT_PATH = BACKEND_DIR / ".benchmarks" / "latest.json"
+
+# A benchmark regresses when its median (ratio to its in-run reference)
+# exceeds the baseline's * tolerance
+DEFAULT_TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "1.5"))
+
+# Also compare absolute medians with the baseline's: only meaningful on the
+# machine that recorded the baseline
+ABSOLUTE_CHECKS = os.getenv("BENCHMARK_ABSOLUTE", "false").lower() == "true"
+
+
+def _timings(durations: List[float], ops: int) -> Dict[str, float]:
+    durations = sorted(durations)
+    median_ms = statistics.median(durations)
+    return {
+        "rounds": len(durations),
+        "ops_per_round": ops,
+        "min_ms": round(durations[0], 4),
+        "median_ms": round(median_ms, 4),
+        "mean_ms": round(statistics.fmean(durations), 4),
+        "p95_ms": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 4),
+        "max_ms": round(durations[-1], 4),
+        "ops_per_second": round(ops / (median_ms / 1000), 2) if median_ms else None,
+    }
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def measure(fn: Callable[[], object], rounds: int, warmup: int = 1, ops: int = 1) -> Dict[str, float]:
+    """
+    Time ``fn`` over several rounds
+
+    Args:
+        fn: Zero-argument callable to time
+        rounds: Number of timed rounds
+        warmup: Untimed rounds run first (caches, prepared statements)
+        ops: Operations performed by a single call, for throughput
+
+    Returns:
+        Dictionary of timing statistics in milliseconds
+    """
+    for _ in range(warmup):
+        fn()
+    return _timings([_timed(fn) for _ in range(rounds)], ops)
+
+
+def measure_against(fn: Callable[[], object], reference: Callable[[], object], rounds: int,
+                    warmup: int = 1, ops: int = 1, reference_ops: int = 1) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Time ``fn`` and ``reference`` in alternating rounds
+
+    Interleaving puts both under the same machine conditions (frequency
+    scaling, neighbours), so the ratio of their medians holds steady even
+    when each absolute median drifts.
+
+    Returns:
+        ``(result, reference_result)`` timing statistics
+    """
+    for _ in range(warmup):
+        fn()
+        reference()
+    durations, reference_durations = [], []
+    for _ in range(rounds):
+        durations.append(_timed(fn))
+        reference_durations.append(_timed(reference))
+    return _timings(durations, ops), _timings(reference_durations, reference_ops)
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE_PATH) -> Dict[str, Dict[str, float]]:
+    """Load stored baseline results, or an empty mapping if none exist"""
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("benchmarks", {})
+
+
+def check_regression(
+    name: str,
+    result: Dict[str, float],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    relative_to: Optional[str] = None,
+    reference_result: Optional[Dict[str, float]] = None,
+    absolute: bool = ABSOLUTE_CHECKS
+) -> Optional[str]:
+    """
+    Compare a result with its baseline entry
+
+    With ``relative_to``, the result is compared as a ratio to the named
+    case timed in alternating rounds with it (``reference_result``), against the ratio
+    recorded the same way in the baseline (``reference_ratio``). Cases compared this way do not fail on a slower
+    machine, only when they lose ground against their reference. Absolute
+    medians are compared only with ``absolute`` (``BENCHMARK_ABSOLUTE``).
+
+    Returns:
+        Description of the regression, or None if within tolerance
+        (benchmarks without a baseline entry never regress)
+    """
+    reference = baseline.get(name)
+    if not reference:
+        return None
+    if relative_to is not None and reference_result:
+        ratio = result["median_ms"] / reference_result["median_ms"]
+        baseline_ratio = reference.get("reference_ratio")
+        if baseline_ratio and ratio > baseline_ratio * tolerance:
+            return (
+                f"{name}: median {ratio:.3f}x {relative_to} exceeds baseline "
+                f"{baseline_ratio:.3f}x x {tolerance} = {baseline_ratio * tolerance:.3f}x"
+            )
+    if not absolute:
+        return None
+    limit = reference["median_ms"] * tolerance
+    if result["median_ms"] > limit:
+        return (
+            f"{name}: median {result['median_ms']:.3f}ms exceeds baseline "
+            f"{reference['median_ms']:.3f}ms x {tolerance} = {limit:.3f}ms"
+        )
+    return None
+
+
+def write_results(
+    results: Dict[str, Dict[str, float]],
+    path: Path = DEFAULT_OUTPUT_PATH,
+    dataset: Optional[Dict[str, int]] = None,
+    regressions: Optional[List[str]] = None
+) -> Path:
+    """Write machine-readable benchmark results as JSON"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dataset": dataset or {},
+        "regressions": regressions or [],
+        "benchmarks": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return path
@@ -0,0 +1,74 @@
+"""
+Standalone benchmark runner
+
+Usage:
+    python -m tests.benchmarks.run                    # compare against baseline.json
+    python -m tests.benchmarks.run --update-baseline  # record a new baseline
+    python -m tests.benchmarks.run --absolute         # also gate absolute medians (baseline's machine)
+    python -m tests.benchmarks.run --only api_transfer --transactions 1000000
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from .cases import CASES
+from .dataset import DEFAULT_ACCOUNTS, DEFAULT_SEED, DEFAULT_TRANSACTIONS, BenchmarkContext
+from .harness import (
+    ABSOLUTE_CHECKS, DEFAULT_BASELINE_PATH, DEFAULT_OUTPUT_PATH, DEFAULT_TOLERANCE, load_baseline, write_results
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run banking API benchmarks")
+    parser.add_argument("--accounts", type=int, default=DEFAULT_ACCOUNTS)
+    parser.add_argument("--transactions", type=int, default=DEFAULT_TRANSACTIONS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--only", default=None, help="Run cases whose name contains this text")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_PATH, help="JSON results path")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--absolute", action="store_true", default=ABSOLUTE_CHECKS,
+                        help="Also fail on absolute medians (only on the baseline's machine)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write results to the baseline file instead of comparing "
+                             "(with --only, other baseline entries are kept)")
+    args = parser.parse_args(argv)
+
+    # Keep request logging from drowning the report
+    logging.disable(logging.INFO)
+
+    cases = [case for case in CASES if not args.only or args.only in case.name]
+    baseline = {} if args.update_baseline else load_baseline(args.baseline)
+
+    ctx = BenchmarkContext(args.accounts, args.transactions, args.seed).setup()
+    results, regressions = {}, []
+    try:
+        for case in cases:
+            result, regression = case.run(ctx, baseline, args.tolerance, args.absolute)
+            results[case.name] = result
+            status = "REGRESSION" if regression else "ok" if case.gate else "recorded"
+            if regression:
+                regressions.append(regression)
+            print(f"{case.name:<40} median {result['median_ms']:>10.3f}ms  "
+                  f"p95 {result['p95_ms']:>10.3f}ms  {status}")
+    finally:
+        ctx.teardown()
+
+    output = args.baseline if args.update_baseline else args.output
+    if args.update_baseline and args.only:
+        results = {**load_baseline(args.baseline), **results}
+    write_results(results, output, dataset=ctx.dataset, regressions=regressions)
+    print(f"\nResults written to {output}")
+
+    if regressions:
+        print("\nRegressions:", file=sys.stderr)
+        for regression in regressions:
+            print(f"  - {regression}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+"""
+API and service benchmarks
+Run with ``pytest -m benchmark``; fails when a median's ratio to its in-run reference
+regresses past the stored baseline (absolute medians too with ``BENCHMARK_ABSOLUTE=true``)
+"""
+
+import pytest
+
+from .cases import CASES
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_benchmark(case, bench_context, bench_baseline, bench_recorder):
+    result, regression = case.run(bench_context, bench_baseline)
+    bench_recorder(case.name, result, regression)
+    assert regression is None, regression
@@ -0,0 +1,65 @@
+"""
+Shared fixtures: a file-backed SQLite database with every table, and settings
+isolated per test
+"""
+
+import pytest
+from sqlalchemy import create_engine
+
+from src.config.settings import get_settings
+from src.database.connection import Base
+from src.models import (  # noqa: F401 - register tables
+    balance_checkpoint, database_models, job_lease, outbox, spending, transfer, transfer_limit, virtual_bank
+)
+
+
+@pytest.fixture()
+def settings_env(monkeypatch, tmp_path):
+    """
+    Set environment variables for ``get_settings()``
+
+    Data directories point into ``tmp_path``. Call the returned function
+    with overrides before the code under test first reads settings.
+    """
+    monkeypatch.setenv("ARCHIVE_DIR", str(tmp_path / "archive"))
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+    get_settings.cache_clear()
+
+    def configure(**overrides):
+        for name, value in overrides.items():
+            monkeypatch.setenv(name, str(value))
+        get_settings.cache_clear()
+        return get_settings()
+
+    yield configure
+    get_settings.cache_clear()
+
+
+@pytest.fixture()
+def db_path(tmp_path, settings_env):
+    """File-backed database with every table created, at the DATABASE_URL setting"""
+    path = tmp_path / "app.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return path
+
+
+@pytest.fixture()
+def engine(db_path):
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def client(engine):
+    """API client on the test database; the app's lifespan (sample data, scheduler) does not run"""
+    from fastapi.testclient import TestClient
+
+    from src.database import connection
+    from src.main import app
+
+    connection.reset_engine()
+    yield TestClient(app)
+    connection.reset_engine()
@@ -0,0 +1,132 @@
+"""
+Account directory tests
+Hits and misses from memory, rate-limited refreshes, and accounts created by
+another worker
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from src.models.database_models import Account
+from src.services.account_directory import AccountDirectory
+
+
+def _account(account_id):
+    return Account(id=account_id, account_number=f"1001-0000-{account_id:04d}", account_name=f"계좌 {account_id}",
+                   account_type="checking", balance=0.0)
+
+
+@pytest.fixture()
+def accounts(engine):
+    with Session(engine) as db:
+        db.add_all([_account(account_id) for account_id in (1, 2, 3)])
+        db.commit()
+    return engine
+
+
+def _count_queries(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_hits_resolve_from_memory(accounts):
+    directory = AccountDirectory(refresh_interval=3600)
+    with Session(accounts) as db:
+        assert directory.resolve(db, "1001-0000-0002") == 2
+        statements = _count_queries(accounts)
+        assert [directory.resolve(db, f"1001-0000-{i:04d}") for i in (1, 2, 3)] == [1, 2, 3]
+    assert statements == []
+    assert len(directory) == 3
+
+
+def _create_in_another_worker(db_path, account_id):
+    other_worker = create_engine(f"sqlite:///{db_path}")
+    with Session(other_worker) as other_db:
+        other_db.add(_account(account_id))
+        other_db.commit()
+    other_worker.dispose()
+
+
+def test_account_from_another_worker_resolves_after_the_next_refresh(accounts, db_path):
+    directory = AccountDirectory(refresh_interval=3600)
+    with Session(accounts) as db:
+        assert directory.resolve(db, "1001-0000-0001") == 1
+        _create_in_another_worker(db_path, 4)
+
+        statements = _count_queries(accounts)
+        # Not due for a refresh: the miss is answered from memory
+        assert directory.resolve(db, "1001-0000-0004") is None
+        assert statements == []
+
+        # The periodic refresh job picks it up
+        assert directory.refresh(db) == 1
+        assert directory.resolve(db, "1001-0000-0004") == 4
+    assert len(statements) == 1 and "accounts.id >" in statements[0]
+
+
+def test_misses_refresh_at_most_once_per_interval(accounts, db_path):
+    directory = AccountDirectory(refresh_interval=0.2)
+    with Session(accounts) as db:
+        directory.refresh(db)
+        _create_in_another_worker(db_path, 4)
+
+        statements = _count_queries(accounts)
+        assert [directory.resolve(db, f"9999-9999-{i:04d}") for i in range(50)] == [None] * 50
+        assert statements == []
+
+        time.sleep(0.25)
+        assert directory.resolve(db, "1001-0000-0004") == 4
+        assert directory.resolve(db, "9999-9999-9999") is None
+    assert len(statements) == 1
+
+
+def test_unknown_numbers_are_answered_from_memory(accounts):
+    directory = AccountDirectory(refresh_interval=3600)
+    with Session(accounts) as db:
+        directory.refresh(db)
+        statements = _count_queries(accounts)
+        assert directory.resolve(db, "9999-9999-9999") is None
+    assert statements == []
+    assert "9999-9999-9999" not in directory
+
+
+def test_forget_drops_an_entry(accounts):
+    directory = AccountDirectory(refresh_interval=3600)
+    with Session(accounts) as db:
+        directory.refresh(db)
+        directory.forget("1001-0000-0003")
+        assert "1001-0000-0003" not in directory
+        assert directory.resolve(db, "1001-0000-0003") is None
+        assert directory.resolve(db, "1001-0000-0002") == 2
+
+
+def test_concurrent_resolves_never_see_a_half_loaded_database(accounts, tmp_path):
+    directory = AccountDirectory(refresh_interval=3600)
+    with Session(accounts) as db:
+        directory.refresh(db)
+
+    # A different database (engine reset) is loaded while other threads resolve
+    other = create_engine(f"sqlite:///{tmp_path / 'other.db'}", connect_args={"check_same_thread": False})
+    Account.__table__.create(bind=other)
+    with Session(other) as db:
+        db.add_all([_account(account_id) for account_id in range(1, 3001)])
+        db.commit()
+
+    start = threading.Event()
+
+    def resolve(account_id):
+        start.wait(5)
+        with Session(other) as db:
+            return directory.resolve(db, f"1001-0000-{account_id:04d}")
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(resolve, account_id) for account_id in range(2993, 3001)]
+        start.set()
+        assert [future.result() for future in futures] == list(range(2993, 3001))
+    other.dispose()
@@ -0,0 +1,182 @@
+"""
+Admission control tests
+Slot accounting, priorities and queue limits, load shedding with Retry-After,
+the 504 rewrite after a deadline, exempt routes and class limits
+"""
+
+import asyncio
+import sqlite3
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from src.database.deadline import install_progress_handler, request_deadline
+from src.middleware.admission import (
+    AdmissionController, AdmissionControlMiddleware, RouteClass, default_route_classes
+)
+
+
+def _classes(**limits):
+    return {name: RouteClass(name, priority, **limits) for name, priority in (("high", 0), ("low", 1))}
+
+
+async def test_requests_queue_in_priority_order():
+    controller = AdmissionController(max_concurrent=1)
+    classes = _classes(max_concurrent=1, max_queue=4, deadline_seconds=None)
+    assert await controller.acquire(classes["low"], None)
+
+    order = []
+
+    async def wait(name):
+        assert await controller.acquire(classes[name], None)
+        order.append(name)
+
+    waiters = [asyncio.create_task(wait(name)) for name in ("low", "high")]
+    await asyncio.sleep(0)
+    assert (classes["low"].waiting, classes["high"].waiting) == (1, 1)
+
+    controller.release(classes["low"])
+    await asyncio.wait_for(waiters[1], 1)
+    assert order == ["high"] and not waiters[0].done()
+    controller.release(classes["high"])
+    await asyncio.gather(*waiters)
+    assert order == ["high", "low"]
+    assert controller.active == 1 and classes["low"].admitted == 2
+
+
+async def test_full_queue_rejects_and_deadline_times_out():
+    controller = AdmissionController(max_concurrent=4)
+    route_class = RouteClass("reads", 1, max_concurrent=1, max_queue=1, deadline_seconds=0.05)
+    assert await controller.acquire(route_class, None)
+
+    queued = asyncio.create_task(controller.acquire(route_class, time.monotonic() + 0.05))
+    await asyncio.sleep(0)
+    # The class is at its limit even though the worker has free slots
+    assert not await controller.acquire(route_class, None)
+    assert not await queued
+
+    assert route_class.stats() | {"avg_service_ms": None} == {
+        "priority": 1, "max_concurrent": 1, "max_queue": 1, "deadline_seconds": 0.05,
+        "active": 1, "waiting": 0, "admitted": 1, "rejected": 1, "timed_out": 1,
+        "deadline_exceeded": 0, "avg_service_ms": None,
+    }
+    controller.release(route_class)
+    assert controller.active == 0 and route_class.active == 0
+
+
+@pytest.mark.parametrize("max_concurrent, max_queue", [(1, 0), (2, 3), (3, 7)])
+def test_class_limits_are_at_least_one(max_concurrent, max_queue):
+    classes = {route_class.name: route_class for route_class, _, _ in default_route_classes(max_concurrent, max_queue, 1.0)}
+    assert classes["reads"].max_concurrent >= 1
+    assert classes["analytics"].max_concurrent >= 1
+    assert classes["analytics"].max_queue >= 1
+    assert classes["exports"].max_concurrent >= 1
+
+
+def _app(route_classes=None, max_concurrent=4):
+    app = FastAPI()
+    gate = asyncio.Event()
+
+    @app.get("/api/accounts")
+    async def accounts():
+        await gate.wait()
+        return {"ok": True}
+
+    @app.get("/api/slow-failure")
+    async def slow_failure():
+        await asyncio.sleep(0.1)
+        raise HTTPException(status_code=500, detail="database interrupted")
+
+    @app.get("/api/slow-error")
+    async def slow_error():
+        await asyncio.sleep(0.1)
+        raise sqlite3.OperationalError("interrupted")
+
+    @app.get("/api/fast-failure")
+    async def fast_failure():
+        raise HTTPException(status_code=500, detail="broken")
+
+    @app.get("/admin/jobs")
+    async def jobs():
+        return {"jobs": []}
+
+    @app.post("/admin/reconciliation")
+    async def reconciliation():
+        await gate.wait()
+        return {"started": True}
+
+    if route_classes is None:
+        route_classes = [(RouteClass("reads", 1, 1, 1, deadline_seconds=0.05), None, r"")]
+    middleware = AdmissionControlMiddleware(app, route_classes, max_concurrent=max_concurrent)
+    return middleware, gate
+
+
+def _client(middleware):
+    transport = httpx.ASGITransport(app=middleware, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def test_saturated_class_is_shed_with_retry_after():
+    middleware, gate = _app([(RouteClass("reads", 1, 1, 0, deadline_seconds=5.0), None, r"")])
+    async with _client(middleware) as client:
+        running = asyncio.create_task(client.get("/api/accounts"))
+        while middleware.controller.active == 0:
+            await asyncio.sleep(0.001)
+
+        shed = await client.get("/api/accounts")
+        assert shed.status_code == 503
+        assert int(shed.headers["Retry-After"]) >= 1
+        assert shed.json()["detail"] == "Server is busy, retry later"
+
+        gate.set()
+        assert (await running).status_code == 200
+    assert middleware.stats()["classes"]["reads"]["rejected"] == 1
+
+
+async def test_failures_after_the_deadline_become_504():
+    middleware, _ = _app()
+    async with _client(middleware) as client:
+        for path in ("/api/slow-failure", "/api/slow-error"):
+            response = await client.get(path)
+            assert response.status_code == 504, path
+            assert response.json() == {
+                "detail": "Request deadline exceeded", "status_code": 504, "path": path, "method": "GET",
+            }
+        # Within the deadline the handler's own error stands
+        assert (await client.get("/api/fast-failure")).status_code == 500
+    assert middleware.stats()["classes"]["reads"]["deadline_exceeded"] == 2
+
+
+async def test_only_read_only_admin_status_routes_are_exempt():
+    middleware, gate = _app([(RouteClass("reads", 1, 1, 0, deadline_seconds=5.0), None, r"")])
+    assert middleware.exempt("GET", "/admin/jobs")
+    assert middleware.exempt("GET", "/health")
+    assert not middleware.exempt("POST", "/admin/reconciliation")
+    assert middleware.classify("POST", "/admin/reconciliation").name == "reads"
+
+    async with _client(middleware) as client:
+        running = asyncio.create_task(client.post("/admin/reconciliation"))
+        while middleware.controller.active == 0:
+            await asyncio.sleep(0.001)
+        # The slot is taken: status reads still answer, a second run is shed
+        assert (await client.get("/admin/jobs")).status_code == 200
+        assert (await client.post("/admin/reconciliation")).status_code == 503
+        gate.set()
+        assert (await running).status_code == 200
+
+
+def test_deadline_interrupts_sqlite_statements():
+    connection = sqlite3.connect(":memory:")
+    install_progress_handler(connection, None)
+    endless = "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT count(*) FROM n"
+
+    started = time.monotonic()
+    with request_deadline(started + 0.05), pytest.raises(sqlite3.OperationalError, match="interrupted"):
+        connection.execute(endless).fetchone()
+    assert time.monotonic() - started < 2
+
+    # Outside the request context statements are not interrupted
+    assert connection.execute("SELECT count(*) FROM (SELECT 1 UNION ALL SELECT 2)").fetchone() == (2,)
+    connection.close()
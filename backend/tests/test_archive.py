@@ -0,0 +1,299 @@
+"""
+Archive tier tests
+Archives one month and asserts every reader of transaction history returns
+the same results as before: lists, counts, exports, feed, dashboard,
+reconciliation, spending and point-in-time balances
+"""
+
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from src.database.archive import TransactionArchive
+from src.models.database_models import Account, Transaction, TransactionCategory, TransactionPartition
+from src.models.spending import MonthlyCategorySpend
+from src.services import categorization
+from src.services.balance_checkpoint_service import BalanceCheckpointService
+from src.services.dashboard_service import DashboardService
+from src.services.reconciliation import reconcile
+from src.services.scheduler import default_jobs
+from src.services.spending_service import SpendingService
+from src.services.transaction_service import TransactionService
+
+ACCOUNT_IDS = (1, 2)
+ARCHIVED_MONTH = datetime(2024, 2, 1)
+
+
+@pytest.fixture()
+def ledger(engine, settings_env):
+    """Two accounts with consistent ledgers from January 2024 to today, archive tier enabled"""
+    settings_env(ARCHIVE_ENABLED="true")
+    with Session(engine) as db:
+        db.add_all([
+            TransactionCategory(id=1, name="식비", color="#f00"),
+            TransactionCategory(id=2, name="급여", color="#0f0"),
+        ])
+        for account_id in ACCOUNT_IDS:
+            balance = 100000.0
+            day = datetime(2024, 1, 1, 9, 30)
+            rows = []
+            index = 0
+            while day < datetime.now() - timedelta(days=1):
+                kind = ("deposit", "withdrawal", "transfer")[index % 3]
+                amount = 1000.0 + 10 * index
+                balance += amount if kind == "deposit" else -amount
+                rows.append(Transaction(
+                    account_id=account_id, transaction_type=kind, amount=amount,
+                    description=("급여 입금", "마트 결제", "친구 송금")[index % 3],
+                    balance_after=balance, transaction_date=day,
+                    reference_number=f"A{account_id}-{index:05d}"
+                ))
+                # Several rows share a timestamp so keyset paging sees ties
+                day += timedelta(days=3) if index % 4 else timedelta(0)
+                index += 1
+            db.add_all(rows)
+            db.add(Account(id=account_id, account_number=f"1001-0000-000{account_id}",
+                           account_name=f"계좌 {account_id}", account_type="checking", balance=balance))
+        db.commit()
+    return engine
+
+
+def _archive(engine, month=ARCHIVED_MONTH):
+    with Session(engine) as db:
+        partition = TransactionArchive(db).archive_month(month)
+        assert partition is not None and partition.row_count > 0
+        return partition.row_count
+
+
+def _hot_count(engine):
+    with Session(engine) as db:
+        return db.query(func.count(Transaction.id)).scalar()
+
+
+def _ids(transactions):
+    return [transaction.id for transaction in transactions]
+
+
+def _feed(db, limit=7):
+    service, cursor, ids = TransactionService(db), None, []
+    while True:
+        page, cursor = service.get_feed(list(ACCOUNT_IDS), limit=limit, cursor=cursor)
+        ids.extend(_ids(page))
+        if cursor is None:
+            return ids
+
+
+def _reads(engine, db_path):
+    """Results of every history reader, in comparable form"""
+    with Session(engine) as db:
+        service = TransactionService(db)
+        results = {
+            "list": [(_ids(rows), total) for rows, total in (
+                service.get_transactions(account_id=1, limit=500),
+                service.get_transactions(account_id=1, limit=10, offset=20, sort_order="asc"),
+                service.get_transactions(account_id=1, limit=15, sort_by="amount"),
+                service.get_transactions(account_id=2, from_date=date(2024, 1, 20), to_date=date(2024, 3, 10)),
+            )],
+            "search": [(_ids(rows), total) for rows, total in (
+                service.search_transactions("마트", account_id=1, limit=200),
+                service.search_transactions("송금", limit=5, offset=3),
+            )],
+            "summary_total": service.get_account_summary(1)["summary"]["total_transactions"],
+            "statistics": service.get_transaction_statistics(1, period_days=3650)["total_transactions"],
+            "export": [
+                tuple(row) for batch in service.iter_transaction_batches(account_id=1, batch_size=16) for row in batch
+            ],
+            "feed": _feed(db),
+        }
+        dashboard = DashboardService(db).get_dashboard(1, transactions_limit=20, period_days=3650)
+        results["dashboard"] = (
+            dashboard["summary"]["total_transactions"],
+            dashboard["statistics"]["total_transactions"],
+            [transaction["id"] for transaction in dashboard["recent_transactions"]],
+        )
+        checkpoints = BalanceCheckpointService(db)
+        results["balance_as_of"] = [
+            checkpoints.balance_as_of(1, day)["balance"]
+            for day in (date(2023, 12, 31), date(2024, 1, 15), date(2024, 2, 14), date(2024, 3, 20))
+        ]
+
+        SpendingService(db).rebuild()
+        results["spending"] = sorted(db.execute(select(
+            MonthlyCategorySpend.account_id, MonthlyCategorySpend.month, MonthlyCategorySpend.category_id,
+            MonthlyCategorySpend.total_amount, MonthlyCategorySpend.transaction_count
+        )).all())
+
+    report = reconcile(str(db_path), workers=1)
+    results["reconcile"] = (report["transactions_checked"], report["mismatch_count"])
+    return results
+
+
+def test_archiving_a_month_keeps_every_reader_unchanged(ledger, db_path):
+    before = _reads(ledger, db_path)
+    hot_rows = _hot_count(ledger)
+
+    archived = _archive(ledger)
+
+    assert _hot_count(ledger) == hot_rows - archived
+    after = _reads(ledger, db_path)
+    for reader in before:
+        assert after[reader] == before[reader], reader
+    assert before["reconcile"][1] == 0
+
+
+def test_feed_merges_hot_rows_added_to_an_archived_month(ledger):
+    _archive(ledger)
+    with Session(ledger) as db:
+        db.add(Transaction(account_id=2, transaction_type="deposit", amount=1.0, balance_after=0.0,
+                           transaction_date=datetime(2024, 2, 10), reference_number="LATE"))
+        db.commit()
+        expected = [
+            row.id for row in sorted(
+                db.query(Transaction).filter(Transaction.account_id.in_(ACCOUNT_IDS)).all()
+                + [row for partition in TransactionArchive(db).partitions_for_range()
+                   for row in _archived_rows(db, partition)],
+                key=lambda row: (str(row.transaction_date), row.id), reverse=True
+            )
+        ]
+        assert _feed(db, limit=5) == expected
+
+
+def _archived_rows(db, partition):
+    with TransactionArchive(db).session(partition) as archive_db:
+        return archive_db.query(Transaction).all()
+
+
+def test_backfill_categorizes_archived_months(ledger, db_path):
+    _archive(ledger)
+
+    summary = categorization.backfill(str(db_path), rules={"식비": ["마트"], "급여": ["급여"]})
+
+    with Session(ledger) as db:
+        partition = db.query(TransactionPartition).one()
+        archived = _archived_rows(db, partition)
+        hot = db.query(Transaction).all()
+    assert summary["scanned"] == len(archived) + len(hot)
+    for row in archived + hot:
+        expected = 1 if "마트" in row.description else 2 if "급여" in row.description else None
+        assert row.category_id == expected
+    assert partition.row_count == len(archived)
+
+
+def test_archival_job_is_opt_in(settings_env):
+    assert "archive_transactions" not in {job.name for job in default_jobs(settings_env())}
+    settings = settings_env(ARCHIVE_ENABLED="true")
+    assert "archive_transactions" in {job.name for job in default_jobs(settings)}
+
+
+@contextmanager
+def _opened_partitions(monkeypatch):
+    """Months whose archive files are opened for reading"""
+    opened = []
+    session = TransactionArchive.session
+
+    def counting(self, partition):
+        opened.append(partition.month)
+        return session(self, partition)
+
+    monkeypatch.setattr(TransactionArchive, "session", counting)
+    yield opened
+
+
+def test_totals_come_from_stored_counts(ledger, monkeypatch):
+    _archive(ledger, datetime(2024, 1, 1))
+    _archive(ledger)
+    with Session(ledger) as db:
+        archived = {
+            account_id: sum(len([row for row in _archived_rows(db, partition) if row.account_id == account_id])
+                            for partition in db.query(TransactionPartition))
+            for account_id in ACCOUNT_IDS
+        }
+        service = TransactionService(db)
+        with _opened_partitions(monkeypatch) as opened:
+            newest, total = service.get_transactions(account_id=1, limit=10)
+            summary_total = service.get_account_summary(1)["summary"]["total_transactions"]
+            # The first page is all hot rows: no archive file is opened, counted or read
+            assert opened == []
+
+            _, window_total = service.get_transactions(account_id=2, from_date=date(2024, 1, 20),
+                                                       to_date=date(2024, 3, 10), limit=1)
+            # February lies wholly inside the range; only the cut January file is counted
+            assert opened == ["2024-01"]
+
+            opened.clear()
+            oldest, _ = service.get_transactions(account_id=1, limit=3, sort_order="asc")
+            assert opened == ["2024-01"]
+
+            opened.clear()
+            first = service.search_transactions("마트", account_id=1, limit=5)
+            again = service.search_transactions("마트", account_id=1, limit=5)
+            # Search counts scan each file once per version
+            assert sorted(opened) == ["2024-01", "2024-02"] and again == first
+
+        hot = db.query(Transaction).filter(Transaction.account_id == 1).count()
+        in_window = db.query(Transaction).filter(
+            Transaction.account_id == 2, Transaction.transaction_date >= datetime(2024, 3, 1),
+            Transaction.transaction_date < datetime(2024, 3, 11)
+        ).count() + sum(
+            1 for partition in db.query(TransactionPartition) for row in _archived_rows(db, partition)
+            if row.account_id == 2 and row.transaction_date >= datetime(2024, 1, 20)
+        )
+    assert total == summary_total == hot + archived[1]
+    assert window_total == in_window
+    assert oldest[0].transaction_date == datetime(2024, 1, 1, 9, 30)
+    assert newest[0].transaction_date > datetime(2024, 3, 1)
+
+
+def test_dashboard_reads_only_the_months_it_shows(ledger, monkeypatch):
+    _archive(ledger, datetime(2024, 1, 1))
+    _archive(ledger)
+    with Session(ledger) as db:
+        service = DashboardService(db)
+        with _opened_partitions(monkeypatch) as opened:
+            recent = service.get_dashboard(1, transactions_limit=20, period_days=30)
+            assert opened == []
+
+            # A period reaching into February reads February only
+            days = (datetime.now() - datetime(2024, 2, 20)).days
+            reaching = service.get_dashboard(1, transactions_limit=20, period_days=days)
+            assert opened == ["2024-02"]
+
+            opened.clear()
+            everything = service.get_dashboard(1, transactions_limit=10000, period_days=3650)
+            assert opened == ["2024-02", "2024-01", "2024-02", "2024-01"]
+
+    total = everything["summary"]["total_transactions"]
+    assert recent["summary"]["total_transactions"] == reaching["summary"]["total_transactions"] == total
+    assert len(everything["recent_transactions"]) == total
+    assert everything["statistics"]["total_transactions"] == total
+    assert reaching["statistics"]["total_transactions"] == len([
+        row for row in everything["recent_transactions"]
+        if datetime.fromisoformat(row["transaction_date"]) >= datetime.fromisoformat(reaching["statistics"]["from_date"])
+    ])
+
+
+def test_disabled_archive_never_queries_the_registry(ledger, settings_env):
+    settings_env(ARCHIVE_ENABLED="false")
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(ledger, "before_cursor_execute", capture)
+    try:
+        with Session(ledger) as db:
+            service = TransactionService(db)
+            service.get_transactions(account_id=1, limit=10)
+            service.search_transactions("마트", account_id=1)
+            service.get_account_summary(1)
+            DashboardService(db).get_dashboard(1)
+            with pytest.raises(ValueError, match="ARCHIVE_ENABLED"):
+                TransactionArchive(db).archive_month(ARCHIVED_MONTH)
+    finally:
+        event.remove(ledger, "before_cursor_execute", capture)
+
+    assert statements
+    assert not [statement for statement in statements if "transaction_partition" in statement]
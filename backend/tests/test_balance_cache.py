@@ -0,0 +1,103 @@
+"""
+Balance cache tests
+A balance read after a transfer has returned is never stale, whether the
+transfer committed on another connection of this process or in another worker
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.database import connection
+from src.models.database_models import Account
+from src.services.balance_cache import BalanceCache
+from src.services.transfer_service import TransferService
+
+OPENING_BALANCE = 1000000.0
+TRANSFERS = 40
+READERS = 4
+
+
+@pytest.fixture()
+def accounts(engine):
+    with Session(engine) as db:
+        db.add_all([
+            Account(id=1, account_number="1001-0000-0001", account_name="보내는 계좌",
+                    account_type="checking", balance=OPENING_BALANCE),
+            Account(id=2, account_number="1001-0000-0002", account_name="받는 계좌",
+                    account_type="checking", balance=0.0),
+        ])
+        db.commit()
+    connection.reset_engine()
+    yield engine
+    connection.reset_engine()
+
+
+def _transfer(engine, amount):
+    with Session(engine) as db:
+        transfer = TransferService(db).create_internal_transfer(1, "1001-0000-0002", amount)
+        assert transfer.status == "COMPLETED"
+
+
+def test_reads_after_a_transfer_see_its_balance(accounts, db_path):
+    cache = BalanceCache()
+    assert cache.get(1)["balance"] == OPENING_BALANCE
+    assert cache.get(1)["balance"] == OPENING_BALANCE
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Another worker: its own engine and connections
+    other_worker = create_engine(f"sqlite:///{db_path}")
+    try:
+        _transfer(other_worker, 2500.0)
+    finally:
+        other_worker.dispose()
+    assert cache.get(1)["balance"] == OPENING_BALANCE - 2500.0
+
+    # This process, through the shared engine's pool
+    _transfer(connection.get_engine(), 500.0)
+    assert cache.get(1)["balance"] == OPENING_BALANCE - 3000.0
+    assert cache.get(2)["balance"] == 3000.0
+    cache.close()
+
+
+def test_concurrent_readers_never_see_a_balance_older_than_a_returned_transfer(accounts, db_path):
+    cache = BalanceCache(max_idle_connections=2)
+    writer = create_engine(f"sqlite:///{db_path}")
+    # Lowest balance already reported committed by the writer
+    committed = {"balance": OPENING_BALANCE}
+    done = threading.Event()
+    stale = []
+
+    def write():
+        try:
+            for _ in range(TRANSFERS):
+                _transfer(writer, 100.0)
+                committed["balance"] -= 100.0
+        finally:
+            done.set()
+
+    def read():
+        reads = 0
+        while not done.is_set() or reads < 5:
+            floor = committed["balance"]
+            balance = cache.get(1)["balance"]
+            if balance > floor:
+                stale.append((floor, balance))
+            reads += 1
+        return reads
+
+    try:
+        with ThreadPoolExecutor(READERS + 1) as pool:
+            readers = [pool.submit(read) for _ in range(READERS)]
+            pool.submit(write).result()
+            assert all(reader.result() >= 5 for reader in readers)
+    finally:
+        writer.dispose()
+        cache.close()
+
+    assert stale == []
+    assert cache.hits > 0
+    assert cache.get(1)["balance"] == OPENING_BALANCE - TRANSFERS * 100.0
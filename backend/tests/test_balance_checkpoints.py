@@ -0,0 +1,103 @@
+"""
+Balance checkpoint tests
+Point-in-time balances against a full-scan oracle, with checkpoints from the
+scheduled job and from the transfer path
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.models.balance_checkpoint import BalanceCheckpoint
+from src.models.database_models import Account, Transaction
+from src.services.balance_checkpoint_service import BalanceCheckpointService
+from src.services.transfer_service import TransferService
+
+CHECKPOINT_EVERY = 10
+OPENING = {1: 500000.0, 2: 20000.0}
+HISTORY_START = date.today() - timedelta(days=20)
+
+
+@pytest.fixture()
+def ledger(engine, monkeypatch):
+    """Two accounts with three weeks of history and no checkpoints"""
+    monkeypatch.setattr(BalanceCheckpointService, "CHECKPOINT_EVERY", CHECKPOINT_EVERY)
+    with Session(engine) as db:
+        for account_id, balance in OPENING.items():
+            rows = []
+            for index in range(45):
+                kind = "deposit" if index % 3 else "withdrawal"
+                amount = 100.0 + index
+                balance += amount if kind == "deposit" else -amount
+                rows.append(Transaction(
+                    account_id=account_id, transaction_type=kind, amount=amount, balance_after=balance,
+                    transaction_date=datetime.combine(HISTORY_START, datetime.min.time())
+                    + timedelta(hours=10 * index + account_id),
+                    reference_number=f"H{account_id}-{index:03d}", status="completed",
+                ))
+            db.add_all(rows)
+            db.add(Account(id=account_id, account_number=f"1001-0000-000{account_id}",
+                           account_name=f"계좌 {account_id}", account_type="checking", balance=balance))
+        db.commit()
+    return engine
+
+
+def _oracle(db, account_id, as_of):
+    """Opening balance plus every completed row before the next midnight"""
+    before = datetime.combine(as_of + timedelta(days=1), datetime.min.time()).isoformat(" ")
+    delta = db.execute(text("""
+        SELECT COALESCE(SUM(CASE WHEN transaction_type = 'deposit' THEN amount ELSE -amount END), 0)
+        FROM transactions
+        WHERE account_id = :account_id AND COALESCE(status, 'completed') = 'completed'
+          AND transaction_date < :before
+    """), {"account_id": account_id, "before": before}).scalar()
+    return OPENING[account_id] + delta
+
+
+def _days():
+    return [HISTORY_START + timedelta(days=offset) for offset in range(-1, 22)]
+
+
+def _assert_matches_oracle(engine):
+    with Session(engine) as db:
+        service = BalanceCheckpointService(db)
+        for account_id in OPENING:
+            for day in _days():
+                result = service.balance_as_of(account_id, day)
+                assert result["balance"] == pytest.approx(_oracle(db, account_id, day)), (account_id, day)
+
+
+def test_balance_as_of_matches_a_full_scan(ledger):
+    _assert_matches_oracle(ledger)
+
+    with Session(ledger) as db:
+        written = BalanceCheckpointService(db).build_checkpoints()
+        assert written > 0
+    _assert_matches_oracle(ledger)
+
+    with Session(ledger) as db:
+        result = BalanceCheckpointService(db).balance_as_of(1, HISTORY_START + timedelta(days=10))
+    assert result["checkpoint"] is not None
+    assert result["transactions_scanned"] < CHECKPOINT_EVERY
+
+
+def test_transfers_checkpoint_busy_accounts(ledger):
+    with Session(ledger) as db:
+        for _ in range(3 * CHECKPOINT_EVERY + 5):
+            TransferService(db).create_internal_transfer(1, "1001-0000-0002", 1000.0)
+
+    with Session(ledger) as db:
+        checkpoints = db.query(BalanceCheckpoint).count()
+        # History rows reached the threshold first; then one per CHECKPOINT_EVERY transfers
+        assert checkpoints == 2 * 4
+        service = BalanceCheckpointService(db)
+        for account_id in OPENING:
+            # Transfer rows are stamped in UTC: tomorrow covers them in any local time zone
+            result = service.balance_as_of(account_id, date.today() + timedelta(days=1))
+            account = db.get(Account, account_id)
+            assert result["checkpoint"] is not None
+            assert result["transactions_scanned"] < CHECKPOINT_EVERY
+            assert result["balance"] == pytest.approx(account.balance)
+    _assert_matches_oracle(ledger)
@@ -0,0 +1,81 @@
+"""
+Bulk data generator tests
+Generated ledgers chain from an opening balance to the account balance, and
+a seed produces the same dataset however it is chunked or sharded
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.data.bulk_generator import BulkDataGenerator, generate_account_history
+from src.database.connection import Base
+from src.models import database_models  # noqa: F401 - register tables
+
+END_DATE = date(2025, 6, 30)
+
+
+def _load(path, workers, chunk_size=37):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    try:
+        stats = BulkDataGenerator(accounts=9, transactions=1000, seed=7, days=90, end_date=END_DATE,
+                                  chunk_size=chunk_size, workers=workers).load(engine)
+        with engine.connect() as conn:
+            accounts = conn.execute(text("SELECT * FROM accounts ORDER BY id")).all()
+            transactions = conn.execute(text("SELECT * FROM transactions ORDER BY id")).all()
+    finally:
+        engine.dispose()
+    return stats, accounts, transactions
+
+
+def test_balance_after_chains_to_the_account_balance(tmp_path):
+    stats, accounts, _ = _load(tmp_path / "bulk.db", workers=1)
+    assert (stats["accounts"], stats["transactions"]) == (9, 1000)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    with engine.connect() as conn:
+        for account_id, balance in conn.execute(text("SELECT id, balance FROM accounts")):
+            rows = conn.execute(text(
+                "SELECT transaction_type, amount, balance_after, transaction_date FROM transactions "
+                "WHERE account_id = :account_id ORDER BY transaction_date, id"
+            ), {"account_id": account_id}).all()
+            assert len(rows) in (111, 112)
+
+            kind, amount, balance_after, _ = rows[0]
+            running = balance_after - (amount if kind == "deposit" else -amount)
+            assert running > 0
+            for kind, amount, balance_after, transaction_date in rows:
+                running += amount if kind == "deposit" else -amount
+                assert balance_after == running
+                assert balance_after >= 0
+                assert transaction_date[:10] <= END_DATE.isoformat()
+            assert balance == running
+    engine.dispose()
+    assert len(accounts) == 9
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 1000), (3, 37), (4, 5)])
+def test_seed_gives_the_same_dataset_for_any_workers(tmp_path, workers, chunk_size):
+    _, accounts, transactions = _load(tmp_path / "one.db", workers=1)
+    _, sharded_accounts, sharded_transactions = _load(tmp_path / "many.db", workers, chunk_size)
+
+    assert sharded_accounts == accounts
+    assert sharded_transactions == transactions
+
+
+def test_account_history_is_yielded_in_chunks():
+    chunks = list(generate_account_history(7, 1, 23, END_DATE, 30, chunk_size=5))
+    assert [(len(accounts), len(transactions)) for accounts, transactions in chunks] == [
+        (0, 5), (0, 5), (0, 5), (0, 5), (1, 3)
+    ]
+    whole = list(generate_account_history(7, 1, 23, END_DATE, 30, chunk_size=1000))
+    assert [row for _, rows in chunks for row in rows] == whole[0][1]
+    account = chunks[-1][0][0]
+    assert account == whole[0][0][0]
+    # The account row closes on the last transaction's balance and date
+    assert (account[4], account[6]) == (whole[0][1][-1][6], whole[0][1][-1][5])
+
+    (empty_account,), empty_rows = next(generate_account_history(7, 2, 0, END_DATE, 30))
+    assert empty_rows == [] and empty_account[6] == empty_account[5]
@@ -0,0 +1,98 @@
+"""
+Categorization tests
+The automaton finds exactly the occurrences a substring scan finds, the
+longest keyword wins, ties go to the earlier category, and unmatched
+descriptions get the fallback
+"""
+
+import random
+
+import pytest
+
+from src.services.categorization import DEFAULT_RULES, KeywordAutomaton, TransactionCategorizer
+
+CATEGORY_IDS = {name: index for index, name in enumerate([*DEFAULT_RULES, "기타"], start=1)}
+
+
+def _occurrences(keywords, text):
+    """Brute force: every (end index, length, value) of every keyword"""
+    return sorted(
+        (start + len(keyword) - 1, len(keyword), value)
+        for keyword, value in keywords.items()
+        for start in range(len(text) - len(keyword) + 1)
+        if text.startswith(keyword, start)
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_automaton_finds_every_occurrence(seed):
+    rng = random.Random(seed)
+    # A small alphabet makes overlapping, nested and suffix-sharing keywords common
+    keywords = {"".join(rng.choices("abc", k=rng.randint(1, 5))): index for index in range(25)}
+    keywords.update({"he": "he", "she": "she", "his": "his", "hers": "hers"})
+    automaton = KeywordAutomaton(keywords)
+
+    for text in ["ushers", *("".join(rng.choices("abch", k=60)) for _ in range(20))]:
+        assert sorted(automaton.matches(text)) == _occurrences(keywords, text)
+
+
+def _categorizer(rules=DEFAULT_RULES, category_ids=CATEGORY_IDS):
+    return TransactionCategorizer(rules, category_ids)
+
+
+@pytest.mark.parametrize("description, category", [
+    ("스타벅스 커피", "식비"),
+    ("3월 월급", "급여"),
+    ("MONTHLY PAYROLL", "급여"),
+    # Equally long matches go to the category listed first, wherever they occur
+    ("점심 택시비", "식비"),
+    ("택시 타고 점심", "식비"),
+    ("주식 이체", "투자"),
+    ("적금 이체", "저축"),
+])
+def test_default_rules(description, category):
+    assert _categorizer().categorize(description) == CATEGORY_IDS[category]
+
+
+def test_longest_keyword_wins_over_rule_order():
+    rules = {"카드": ["카드"], "카드대금": ["카드대금"], "대금": ["대금 납부"]}
+    categorizer = _categorizer(rules, {"카드": 1, "카드대금": 2, "대금": 3})
+
+    assert categorizer.categorize("카드 결제") == 1
+    assert categorizer.categorize("신한카드대금") == 2
+    # Overlapping matches: the five-character keyword beats the four-character one
+    assert categorizer.categorize("카드대금 납부") == 3
+
+
+def test_keyword_listed_twice_belongs_to_the_first_category():
+    categorizer = _categorizer({"A": ["공과금"], "B": ["공과금", "전기"]}, {"A": 1, "B": 2})
+    assert categorizer.categorize("7월 공과금") == 1
+    assert categorizer.categorize("전기 공과금") == 1
+
+
+def test_unmatched_descriptions_get_the_fallback():
+    categorizer = _categorizer()
+    assert categorizer.categorize("알 수 없는 거래") == CATEGORY_IDS["기타"]
+    assert categorizer.categorize(None) == CATEGORY_IDS["기타"]
+    assert categorizer.categorize("") == CATEGORY_IDS["기타"]
+    assert categorizer.categorize("알 수 없는 거래", fallback="이체") == CATEGORY_IDS["이체"]
+    # An unknown fallback name falls back to the default
+    assert categorizer.categorize("알 수 없는 거래", fallback="없는 분류") == CATEGORY_IDS["기타"]
+    # A match always beats the fallback
+    assert categorizer.categorize("마트 장보기", fallback="이체") == CATEGORY_IDS["식비"]
+
+    without_fallback = _categorizer(category_ids={"식비": 1})
+    assert without_fallback.categorize("알 수 없는 거래") is None
+    # Rules of categories missing from the database are ignored
+    assert without_fallback.categorize("택시") is None
+
+
+def test_categorize_many_matches_row_by_row():
+    categorizer = _categorizer()
+    descriptions = ["커피", "월급", None, "알 수 없음", "커피", "택시", "월급", "편의점 커피"]
+    rows = list(enumerate(descriptions, start=100))
+
+    assert categorizer.categorize_many(rows) == [
+        (categorizer.categorize(description), row_id) for row_id, description in rows
+    ]
+    assert _categorizer(category_ids={"식비": 1}).categorize_many(rows) == [(1, 100), (1, 104), (1, 107)]
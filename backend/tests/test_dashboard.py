@@ -0,0 +1,98 @@
+"""
+Dashboard tests
+Every part of the combined dashboard equals the response of the endpoint it
+replaces, with and without archived history
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.database.archive import TransactionArchive
+from src.models.database_models import Account, Transaction
+
+ACCOUNTS = 4
+TRANSACTIONS_LIMIT = 15
+PERIOD_DAYS = 45
+
+
+@pytest.fixture()
+def ledger(engine):
+    """Accounts with history from today back to four months ago, none on a window boundary"""
+    now = datetime.now()
+    with Session(engine) as db:
+        for account_id in range(1, ACCOUNTS + 1):
+            db.add(Account(id=account_id, account_number=f"1001-0000-{account_id:04d}",
+                           account_name=f"계좌 {account_id}", account_type="checking",
+                           balance=100000.0 * account_id, created_at=now - timedelta(days=200 - account_id)))
+        for index in range(90):
+            kind = ("deposit", "withdrawal", "transfer")[index % 3]
+            # Every 33 hours from a minute ago: rows today, this month, inside and outside the period
+            transaction_date = now - timedelta(minutes=1) - timedelta(hours=33 * index)
+            db.add(Transaction(
+                account_id=1 + index % 2, transaction_type=kind, amount=1000.0 + 37 * index,
+                description=f"거래 {index}", balance_after=50000.0 + index,
+                transaction_date=transaction_date, reference_number=f"D{index:03d}", status="completed",
+            ))
+        db.commit()
+    return engine
+
+
+def _get(client, path, **params):
+    response = client.get(path, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _without_window(statistics):
+    # Each call stamps its own "now"; the windows are compared separately
+    return {key: value for key, value in statistics.items() if key not in ("from_date", "to_date")}
+
+
+@pytest.mark.parametrize("archived", [False, True])
+def test_dashboard_matches_the_separate_endpoints(ledger, client, settings_env, archived):
+    if archived:
+        settings_env(ARCHIVE_ENABLED="true")
+        with Session(ledger) as db:
+            month = (datetime.now().replace(day=1) - timedelta(days=75)).replace(day=1)
+            assert TransactionArchive(db).archive_month(month).row_count > 0
+
+    dashboard = _get(client, "/api/dashboard/1", accounts_limit=3,
+                     transactions_limit=TRANSACTIONS_LIMIT, period_days=PERIOD_DAYS)
+
+    detail = _get(client, "/api/accounts/1")
+    assert dashboard["account"] == detail["account"]
+    assert dashboard["summary"] == detail["summary"]
+
+    assert dashboard["accounts"] == _get(client, "/api/accounts/", limit=3)
+
+    transactions = _get(client, "/api/transactions/", account_id=1, limit=TRANSACTIONS_LIMIT)
+    assert dashboard["recent_transactions"] == transactions["data"]
+    assert dashboard["summary"] == transactions["summary"]
+
+    statistics = _get(client, "/api/transactions/statistics/1", period_days=PERIOD_DAYS)
+    assert _without_window(dashboard["statistics"]) == _without_window(statistics)
+    for bound in ("from_date", "to_date"):
+        apart = datetime.fromisoformat(statistics[bound]) - datetime.fromisoformat(dashboard["statistics"][bound])
+        assert timedelta(0) <= apart < timedelta(seconds=5)
+
+
+def test_dashboard_figures(ledger, client):
+    dashboard = _get(client, "/api/dashboard/2", transactions_limit=TRANSACTIONS_LIMIT, period_days=PERIOD_DAYS)
+
+    assert dashboard["summary"]["total_transactions"] == 45
+    assert len(dashboard["recent_transactions"]) == TRANSACTIONS_LIMIT
+    dates = [transaction["transaction_date"] for transaction in dashboard["recent_transactions"]]
+    assert dates == sorted(dates, reverse=True)
+    assert {transaction["account_id"] for transaction in dashboard["recent_transactions"]} == {2}
+    # Rows every 66 hours for account 2: the first is 34 hours ago
+    assert dashboard["statistics"]["total_transactions"] == len(
+        [index for index in range(1, 90, 2) if 33 * index / 24 + 1 / 1440 < PERIOD_DAYS]
+    )
+    assert dashboard["accounts"]["pagination"]["total_items"] == ACCOUNTS
+
+
+def test_unknown_account_is_404(ledger, client):
+    assert client.get("/api/dashboard/999").status_code == 404
+    assert client.get("/api/dashboard/1", params={"transactions_limit": 0}).status_code == 422
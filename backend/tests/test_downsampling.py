@@ -0,0 +1,126 @@
+"""
+LTTB downsampling tests
+Endpoints and the threshold are honoured, one point is kept per bucket,
+peaks survive, and the balance series endpoint returns the shape it promises
+"""
+
+import math
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models.database_models import Account, Transaction
+from src.services.balance_checkpoint_service import BalanceCheckpointService
+from src.utils.downsampling import lttb_indices
+
+
+def _reference_lttb(xs, ys, threshold):
+    """LTTB as published: bucket edges by floor, triangle areas by the shoelace formula"""
+    count = len(xs)
+    every = (count - 2) / (threshold - 2)
+    selected = [0]
+    for bucket in range(threshold - 2):
+        start, end = math.floor(bucket * every) + 1, math.floor((bucket + 1) * every) + 1
+        next_start, next_end = end, min(math.floor((bucket + 2) * every) + 1, count)
+        if next_start >= next_end:
+            next_start, next_end = count - 1, count
+        next_x = sum(xs[next_start:next_end]) / (next_end - next_start)
+        next_y = sum(ys[next_start:next_end]) / (next_end - next_start)
+        a = selected[-1]
+        areas = [
+            abs((xs[a] - next_x) * (ys[i] - ys[a]) - (xs[a] - xs[i]) * (next_y - ys[a])) / 2
+            for i in range(start, end)
+        ]
+        selected.append(start + areas.index(max(areas)))
+    return selected + [count - 1]
+
+
+@pytest.mark.parametrize("count, threshold", [(10, 3), (100, 7), (1000, 50), (1001, 999), (5000, 200)])
+def test_keeps_endpoints_and_one_point_per_bucket(count, threshold):
+    rng = random.Random(count)
+    xs = [float(i * 60) for i in range(count)]
+    ys = [rng.uniform(-1000, 1000) for _ in range(count)]
+
+    selected = lttb_indices(xs, ys, threshold)
+
+    assert len(selected) == threshold
+    assert selected[0] == 0 and selected[-1] == count - 1
+    assert selected == sorted(set(selected))
+    every = (count - 2) / (threshold - 2)
+    for bucket, index in enumerate(selected[1:-1]):
+        assert int(bucket * every) + 1 <= index < int((bucket + 1) * every) + 1
+    assert selected == _reference_lttb(xs, ys, threshold)
+
+
+@pytest.mark.parametrize("count, threshold", [(0, 10), (1, 10), (5, 5), (5, 9), (50, 2), (50, 0)])
+def test_short_series_and_small_thresholds_are_returned_whole(count, threshold):
+    xs = [float(i) for i in range(count)]
+    assert lttb_indices(xs, xs, threshold) == list(range(count))
+
+
+def test_isolated_peaks_and_troughs_survive():
+    xs = [float(i) for i in range(1000)]
+    ys = [100.0] * 1000
+    ys[123], ys[640] = 5000.0, -4000.0
+
+    selected = lttb_indices(xs, ys, 20)
+
+    assert 123 in selected and 640 in selected
+
+
+def test_uneven_timestamps_use_x_distance():
+    # A dense burst followed by sparse points: buckets split by count, areas by time
+    xs = [float(i) for i in range(100)] + [100.0 + 1000 * i for i in range(1, 21)]
+    ys = [float(i % 7) for i in range(120)]
+    assert lttb_indices(xs, ys, 12) == _reference_lttb(xs, ys, 12)
+
+
+@pytest.fixture()
+def history(engine):
+    started = datetime.combine(date.today() - timedelta(days=60), datetime.min.time())
+    with Session(engine) as db:
+        balance = 100000.0
+        for index in range(600):
+            amount = 500.0 + (index * 37) % 900
+            kind = "withdrawal" if index % 4 == 0 else "deposit"
+            balance += amount if kind == "deposit" else -amount
+            db.add(Transaction(account_id=1, transaction_type=kind, amount=amount, balance_after=balance,
+                               transaction_date=started + timedelta(hours=2 * index),
+                               reference_number=f"S{index:04d}", status="completed"))
+        db.add(Account(id=1, account_number="1001-0000-0001", account_name="계좌",
+                       account_type="checking", balance=balance))
+        db.commit()
+    return engine
+
+
+@pytest.mark.parametrize("checkpointed", [False, True])
+def test_balance_series_is_downsampled_to_the_requested_points(history, checkpointed):
+    start, end = date.today() - timedelta(days=45), date.today()
+    with Session(history) as db:
+        service = BalanceCheckpointService(db)
+        if checkpointed:
+            service.build_checkpoints()
+        full = service.balance_series(1, start, end, points=100000)
+        series = service.balance_series(1, start, end, points=20)
+
+    assert full["points"] == full["source_points"] == series["source_points"] > 20
+    assert series["points"] == len(series["series"]) == 20
+    # The opening point and the latest balance are always part of the chart
+    assert series["series"][0] == full["series"][0]
+    assert series["series"][-1] == full["series"][-1]
+    assert series["series"][0]["timestamp"] == datetime.combine(start, datetime.min.time()).isoformat()
+    assert {point["timestamp"] for point in series["series"]} <= {point["timestamp"] for point in full["series"]}
+
+
+def test_balance_series_endpoint_validates_its_range(history, client):
+    response = client.get("/api/accounts/1/balance-series", params={"points": 25})
+    assert response.status_code == 200
+    assert response.json()["points"] == 25
+
+    assert client.get("/api/accounts/1/balance-series", params={"points": 2}).status_code == 422
+    reversed_range = client.get("/api/accounts/1/balance-series",
+                                params={"from": date.today().isoformat(), "to": "2024-01-01"})
+    assert reversed_range.status_code == 400
+    assert client.get("/api/accounts/999/balance-series").status_code == 404
@@ -0,0 +1,124 @@
+"""
+Transaction export tests
+CSV and JSON Lines streams, gzip, filters, and one encoded chunk per batch
+"""
+
+import codecs
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.api import transactions as transactions_api
+from src.models.database_models import Account, Transaction
+from src.services.export_service import EXPORT_FIELDS, TransactionExporter
+from src.utils.formatting import TransactionFormatter
+
+ROWS = 23
+START = datetime(2024, 3, 1, 9, 0)
+
+
+@pytest.fixture()
+def history(engine, monkeypatch):
+    monkeypatch.setattr(transactions_api, "EXPORT_BATCH_SIZE", 5)
+    with Session(engine) as db:
+        db.add_all([
+            Account(id=1, account_number="1001-0000-0001", account_name="계좌",
+                    account_type="checking", balance=0.0),
+            Account(id=2, account_number="1001-0000-0002", account_name="다른 계좌",
+                    account_type="checking", balance=0.0),
+        ])
+        balance = 0.0
+        for index in range(ROWS):
+            kind = ("deposit", "withdrawal", "transfer")[index % 3]
+            amount = 1000.0 * (index + 1) + 0.5 * (index % 2)
+            balance += amount if kind == "deposit" else -amount
+            db.add(Transaction(
+                account_id=1, transaction_type=kind, amount=amount, balance_after=balance,
+                description=f'거래, "{index}"', transaction_date=START + timedelta(days=index),
+                reference_number=f"EX{index:03d}", status="completed",
+            ))
+        db.add(Transaction(account_id=2, transaction_type="deposit", amount=1.0, balance_after=1.0,
+                           transaction_date=START, reference_number="OTHER"))
+        db.commit()
+    return engine
+
+
+def _expected(engine, **filters):
+    with Session(engine) as db:
+        query = db.query(Transaction).filter(Transaction.account_id == 1)
+        if "type" in filters:
+            query = query.filter(Transaction.transaction_type == filters["type"])
+        return query.order_by(Transaction.transaction_date, Transaction.id).all()
+
+
+def test_csv_export_streams_every_row_oldest_first(history, client):
+    response = client.get("/api/transactions/export", params={"account_id": 1})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="transactions_1_start_latest.csv"' in response.headers["content-disposition"]
+    assert response.content.startswith(codecs.BOM_UTF8)
+
+    reader = csv.DictReader(io.StringIO(response.content.decode("utf-8-sig")))
+    rows = list(reader)
+    assert tuple(reader.fieldnames) == EXPORT_FIELDS
+
+    expected = _expected(history)
+    assert [int(row["id"]) for row in rows] == [transaction.id for transaction in expected]
+    first, summary = rows[1], TransactionFormatter.format_transaction_summary(
+        expected[1].transaction_date, expected[1].description, expected[1].amount,
+        expected[1].transaction_type, expected[1].balance_after
+    )
+    assert first["description"] == '거래, "1"'
+    assert (first["formatted_amount"], first["formatted_balance"], first["formatted_date"]) == (
+        summary["amount"], summary["balance"], summary["date"]
+    )
+    assert first["transaction_date"] == expected[1].transaction_date.isoformat()
+
+
+def test_gzipped_jsonl_export_with_filters(history, client):
+    response = client.get("/api/transactions/export", params={
+        "account_id": 1, "type": "deposit", "from_date": "2024-03-04", "to_date": "2024-03-20",
+        "format": "jsonl", "gzip": "true",
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    lines = gzip.decompress(response.content).decode("utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    expected = [
+        transaction for transaction in _expected(history, type="deposit")
+        if datetime(2024, 3, 4) <= transaction.transaction_date < datetime(2024, 3, 21)
+    ]
+    assert [record["id"] for record in records] == [transaction.id for transaction in expected]
+    assert {record["transaction_type"] for record in records} == {"deposit"}
+    assert set(records[0]) == set(EXPORT_FIELDS)
+
+
+@pytest.mark.parametrize("params", [
+    {"type": "refund"},
+    {"from_date": "2024-03-10", "to_date": "2024-03-01"},
+    {"format": "xml"},
+])
+def test_invalid_exports_are_rejected_before_streaming(history, client, params):
+    response = client.get("/api/transactions/export", params={"account_id": 1, **params})
+    assert response.status_code in (400, 422)
+
+
+def test_encoder_emits_one_chunk_per_batch(history):
+    batches = [_expected(history)[start:start + 5] for start in range(0, ROWS, 5)]
+
+    chunks = list(TransactionExporter("jsonl").encode(batches))
+    assert [chunk.count(b"\n") for chunk in chunks] == [len(batch) for batch in batches]
+
+    csv_chunks = list(TransactionExporter("csv").encode(batches))
+    # Header first, then one chunk per batch
+    assert len(csv_chunks) == len(batches) + 1
+
+    with pytest.raises(ValueError):
+        TransactionExporter("xlsx")
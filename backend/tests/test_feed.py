@@ -0,0 +1,139 @@
+"""
+Transaction feed tests
+Cursor paging over several accounts returns every row once, newest first,
+whatever the page size, and stays stable while rows are added
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.api.transactions import MAX_FEED_ACCOUNTS
+from src.models.database_models import Transaction
+from src.services.transaction_service import TransactionService, decode_feed_cursor, encode_feed_cursor
+
+FEED_ACCOUNTS = [1, 2, 3]
+
+
+@pytest.fixture()
+def ledger(engine):
+    """Interleaved histories of four accounts; account 4 is never part of the feed"""
+    started = datetime(2024, 5, 1, 9, 0)
+    with Session(engine) as db:
+        for index in range(120):
+            account_id = 1 + (index * 7) % 4
+            # Several accounts share timestamps, and some have microseconds
+            transaction_date = started + timedelta(minutes=10 * (index // 3))
+            if index % 5 == 0:
+                transaction_date += timedelta(microseconds=250000)
+            db.add(Transaction(account_id=account_id, transaction_type="deposit", amount=100.0 + index,
+                               balance_after=0.0, transaction_date=transaction_date,
+                               reference_number=f"F{index:03d}", status="completed"))
+        # Account 3 has a burst of rows all at one moment
+        db.add_all([
+            Transaction(account_id=3, transaction_type="withdrawal", amount=5.0, balance_after=0.0,
+                        transaction_date=started + timedelta(hours=3), reference_number=f"B{index}",
+                        status="completed")
+            for index in range(6)
+        ])
+        db.commit()
+    return engine
+
+
+def _expected(db, account_ids):
+    rows = db.query(Transaction).filter(Transaction.account_id.in_(account_ids)).all()
+    return [row.id for row in sorted(rows, key=lambda row: (row.transaction_date, row.id), reverse=True)]
+
+
+def _pages(db, account_ids, limit):
+    service, cursor, pages = TransactionService(db), None, []
+    while True:
+        page, cursor = service.get_feed(account_ids, limit=limit, cursor=cursor)
+        pages.append([transaction.id for transaction in page])
+        if cursor is None:
+            return pages
+        assert len(pages) < 1000
+
+
+@pytest.mark.parametrize("limit", [1, 4, 7, 25, 500])
+def test_pages_cover_every_row_once_newest_first(ledger, limit):
+    with Session(ledger) as db:
+        pages = _pages(db, FEED_ACCOUNTS, limit)
+        expected = _expected(db, FEED_ACCOUNTS)
+
+    assert [row_id for page in pages for row_id in page] == expected
+    assert all(len(page) == limit for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= limit
+
+
+def test_single_account_and_empty_feeds(ledger):
+    with Session(ledger) as db:
+        assert [row_id for page in _pages(db, [4], 6) for row_id in page] == _expected(db, [4])
+        assert TransactionService(db).get_feed([999], limit=5) == ([], None)
+
+
+def test_cursor_is_stable_while_rows_are_added(ledger):
+    with Session(ledger) as db:
+        service = TransactionService(db)
+        first, cursor = service.get_feed(FEED_ACCOUNTS, limit=10)
+        boundary = first[-1]
+
+        db.add_all([
+            # Newer than the cursor: belongs to pages already read
+            Transaction(account_id=1, transaction_type="deposit", amount=1.0, balance_after=0.0,
+                        transaction_date=datetime(2030, 1, 1), reference_number="NEW"),
+            # Same moment as the cursor row but a higher id: also before the cursor
+            Transaction(account_id=2, transaction_type="deposit", amount=1.0, balance_after=0.0,
+                        transaction_date=boundary.transaction_date, reference_number="TIE"),
+            # Older than the cursor: still ahead
+            Transaction(account_id=3, transaction_type="deposit", amount=1.0, balance_after=0.0,
+                        transaction_date=datetime(2024, 4, 1), reference_number="OLD"),
+        ])
+        db.commit()
+
+        rest = []
+        while cursor is not None:
+            page, cursor = service.get_feed(FEED_ACCOUNTS, limit=10, cursor=cursor)
+            rest.extend(page)
+
+        references = [transaction.reference_number for transaction in rest]
+        assert "NEW" not in references and "TIE" not in references
+        assert references[-1] == "OLD"
+        skipped = {row.id for row in db.query(Transaction).filter(Transaction.reference_number.in_(["NEW", "TIE"]))}
+        assert [transaction.id for transaction in first + rest] == [
+            row_id for row_id in _expected(db, FEED_ACCOUNTS) if row_id not in skipped
+        ]
+
+
+def test_cursor_round_trips():
+    for date_key in ("2024-05-01 09:00:00", "2024-05-01 09:00:00.250000"):
+        assert decode_feed_cursor(encode_feed_cursor(date_key, 42)) == (date_key, 42)
+    for cursor in ("", "not base64!", encode_feed_cursor("yesterday", 1), "MjAyNC0wNS0wMXxhYmM"):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_feed_cursor(cursor)
+
+
+def test_feed_endpoint_pages_and_validates(ledger, client):
+    ids, cursor = [], None
+    while True:
+        params = {"account_ids": "3,1,2,1", "limit": 9}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/transactions/feed", params=params).json()
+        assert body["account_ids"] == [3, 1, 2]
+        ids.extend(row["id"] for row in body["data"])
+        cursor = body["next_cursor"]
+        assert body["has_next"] == (cursor is not None)
+        if cursor is None:
+            break
+    with Session(ledger) as db:
+        assert ids == _expected(db, FEED_ACCOUNTS)
+
+    for params in (
+        {"account_ids": "1,x"},
+        {"account_ids": " , "},
+        {"account_ids": ",".join(str(i) for i in range(MAX_FEED_ACCOUNTS + 1))},
+        {"account_ids": "1", "cursor": "garbage"},
+    ):
+        assert client.get("/api/transactions/feed", params=params).status_code == 400, params
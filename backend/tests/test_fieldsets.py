@@ -0,0 +1,107 @@
+"""
+Sparse fieldset tests
+``fields=`` is validated the same way on every list endpoint, returns only
+the requested fields, and reads only the columns they need
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.api.accounts import ACCOUNT_FIELDS
+from src.api.transactions import TRANSACTION_FIELDS
+from src.models.database_models import Account
+from src.services.transfer_service import TransferService
+from src.utils.fieldsets import FieldSet
+
+
+def test_parse_keeps_declaration_order_and_ignores_blanks():
+    assert ACCOUNT_FIELDS.parse(None) == ACCOUNT_FIELDS.names
+    assert ACCOUNT_FIELDS.parse("") == ACCOUNT_FIELDS.names
+    assert ACCOUNT_FIELDS.parse(" , ,") == ACCOUNT_FIELDS.names
+    assert ACCOUNT_FIELDS.parse(" balance ,id,,balance") == ["id", "balance"]
+
+
+def test_parse_rejects_unknown_fields_with_the_available_ones():
+    with pytest.raises(ValueError) as error:
+        ACCOUNT_FIELDS.parse("id,password,Balance")
+    assert str(error.value) == (
+        "Unknown fields: Balance, password. Available fields: " + ", ".join(ACCOUNT_FIELDS.names)
+    )
+
+
+def test_columns_cover_derived_fields():
+    assert ACCOUNT_FIELDS.columns(["masked_account_number", "formatted_balance"]) == ["account_number", "balance"]
+    assert ACCOUNT_FIELDS.columns(["id", "balance", "masked_account_number"]) == ["account_number", "balance", "id"]
+    assert "category_id" not in TRANSACTION_FIELDS.columns(TRANSACTION_FIELDS.names)
+    # Fields that need every column load the whole row
+    every_column = FieldSet.of_columns(Account, Account.__table__.columns.keys())
+    assert every_column.columns(every_column.names) is None
+
+
+@pytest.fixture()
+def transfers(engine):
+    with Session(engine) as db:
+        db.add_all([
+            Account(id=account_id, account_number=f"1001-0000-000{account_id}", account_name=f"계좌 {account_id}",
+                    account_type="checking", balance=100000.0)
+            for account_id in (1, 2)
+        ])
+        db.commit()
+        service = TransferService(db)
+        for amount in (1000.0, 2500.0, 4000.0):
+            service.create_internal_transfer(1, "1001-0000-0002", amount, "점심")
+    return engine
+
+
+@contextmanager
+def _captured_selects(table):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        # Row counts wrap the entity query in a subquery SQLite does not materialize
+        if statement.lstrip().startswith(f"SELECT {table}.") and f"FROM {table}" in statement:
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", capture)
+
+
+ENDPOINTS = [
+    ("/api/accounts/", {}, "accounts", ["masked_account_number", "id"], ["id", "masked_account_number"]),
+    ("/api/transactions/", {"account_id": 1}, "transactions", ["amount", "id"], ["id", "amount"]),
+    ("/api/transactions/feed", {"account_ids": "1,2"}, "transactions", ["amount", "id"], ["id", "amount"]),
+    ("/api/v1/transfers/", {"account_id": 1}, "transfers", ["status", "amount"], ["amount", "status"]),
+]
+
+
+@pytest.mark.parametrize("path, params, table, requested, returned", ENDPOINTS)
+def test_endpoints_return_only_the_requested_fields(transfers, client, path, params, table, requested, returned):
+    with _captured_selects(table) as statements:
+        response = client.get(path, params={**params, "fields": ",".join(requested)})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    rows = body if isinstance(body, list) else body["data"]
+    assert rows and all(list(row) == returned for row in rows)
+
+    # Descriptions, timestamps and the other unrequested columns are not read
+    assert statements
+    select_list = statements[0].split(" FROM ")[0]
+    assert f"{table}.id" in select_list
+    assert f"{table}.description" not in select_list and f"{table}.updated_at" not in select_list
+
+
+@pytest.mark.parametrize("path, params", [(path, params) for path, params, _, _, _ in ENDPOINTS])
+def test_endpoints_reject_unknown_fields(transfers, client, path, params):
+    response = client.get(path, params={**params, "fields": "id,secret"})
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Unknown fields: secret. Available fields: ")
+
+    everything = client.get(path, params=params)
+    assert everything.status_code == 200
@@ -0,0 +1,62 @@
+"""
+Formatting tests
+Pins the displayed formats: balances in whole won, the same output from the
+batch and single-value APIs, and the transaction summary fields
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.utils.formatting import BatchFormatter, CurrencyFormatter, DateFormatter, TransactionFormatter
+
+BALANCES = [1234.56, 1234.4, 1234.5, 1235.5, 0, 1500000, 999999.99, Decimal("1234.56"), -2500.7]
+WHOLE_WON = ["1,235원", "1,234원", "1,234원", "1,236원", "0원", "1,500,000원", "1,000,000원", "1,235원", "-2,501원"]
+
+
+def test_balances_are_shown_in_whole_won():
+    assert [CurrencyFormatter.format_amount(balance, "won") for balance in BALANCES] == WHOLE_WON
+    assert [f"{balance:,.0f}원" for balance in BALANCES] == WHOLE_WON
+
+
+def test_batch_amounts_match_the_single_value_api():
+    assert BatchFormatter.format_amounts(BALANCES, "won") == WHOLE_WON
+    for format_type in ("standard", "accounting", "no_decimal", "compact"):
+        assert BatchFormatter.format_amounts(BALANCES, format_type) == [
+            CurrencyFormatter.format_amount(balance, format_type) for balance in BALANCES
+        ]
+
+
+@pytest.mark.parametrize("amount, format_type, expected", [
+    (1234.56, "standard", "1,234.56원"),
+    (1234.0, "standard", "1,234원"),
+    (-0.0, "standard", "0원"),
+    (1500.5, "accounting", "+1,500.50원"),
+    (-1500, "accounting", "-1,500원"),
+    (1234.99, "no_decimal", "1,234원"),
+    (123456789, "compact", "1.2억원"),
+    (35000, "compact", "3.5만원"),
+])
+def test_amount_formats(amount, format_type, expected):
+    assert CurrencyFormatter.format_amount(amount, format_type) == expected
+
+
+def test_transaction_summaries_match_row_at_a_time_formatting():
+    dates = [datetime(2024, 1, 15, 14, 30, 15), datetime(2024, 1, 15, 9, 5), datetime(2024, 12, 1)]
+    descriptions = ["급여 입금", "아주 긴 설명이 들어간 온라인 쇼핑몰 결제 내역", ""]
+    amounts = [3000000.0, 45000.5, 1000]
+    types = ["deposit", "withdrawal", "transfer"]
+    balances = [3000000.0, 2954999.5, None]
+
+    summaries = BatchFormatter.format_transaction_summaries(dates, descriptions, amounts, types, balances)
+
+    assert summaries == [
+        TransactionFormatter.format_transaction_summary(*row)
+        for row in zip(dates, descriptions, amounts, types, balances)
+    ]
+    assert summaries[1] == {
+        "date": "01/15 09:05", "description": "아주 긴 설명이 들어간 온라인 ...",
+        "amount": "-45,000.50원", "balance": "2,954,999.50원", "type_icon": "↓",
+    }
+    assert DateFormatter.format_datetime(dates[0], "detail") == "2024년 01월 15일 14시 30분"
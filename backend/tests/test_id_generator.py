@@ -0,0 +1,98 @@
+"""
+Reference number generator tests
+IDs stay unique and increasing within a process, across processes and
+across a fork
+"""
+
+import multiprocessing
+import os
+
+import pytest
+
+from src.utils.id_generator import ENCODED_LENGTH, IdGenerator, generate_reference_number
+
+PER_PROCESS = 20000
+
+
+def _generate(count):
+    return os.getpid(), [generate_reference_number("TXF") for _ in range(count)]
+
+
+def test_ids_are_fixed_width_and_strictly_increasing():
+    generator = IdGenerator(worker_id=7)
+    ids = [generator.next_id("TXN") for _ in range(100000)]
+    assert all(len(value) == 3 + ENCODED_LENGTH for value in ids)
+    assert ids == sorted(set(ids))
+
+
+def test_worker_id_is_the_process_id_unless_configured(monkeypatch):
+    monkeypatch.delenv("WORKER_ID", raising=False)
+    assert IdGenerator().worker_id == os.getpid()
+
+    monkeypatch.setenv("WORKER_ID", "3")
+    assert IdGenerator().worker_id == (1 << 23) | 3
+    monkeypatch.setenv("WORKER_ID", str(1 << 23))
+    with pytest.raises(ValueError, match="WORKER_ID"):
+        IdGenerator()
+
+
+def test_ids_are_unique_across_worker_processes(monkeypatch):
+    monkeypatch.delenv("WORKER_ID", raising=False)
+    with multiprocessing.get_context("spawn").Pool(4) as pool:
+        results = pool.map(_generate, [PER_PROCESS] * 4)
+
+    assert len({pid for pid, _ in results}) == 4
+    every_id = [value for _, ids in results for value in ids]
+    assert len(set(every_id)) == len(every_id)
+    for _, ids in results:
+        assert ids == sorted(ids)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_does_not_reuse_the_parent_worker_id(monkeypatch):
+    monkeypatch.delenv("WORKER_ID", raising=False)
+    before_fork = generate_reference_number("TXF")
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: generate while the parent does too, report the IDs and exit
+        try:
+            os.close(read_fd)
+            child_ids = [generate_reference_number("TXF") for _ in range(PER_PROCESS)]
+            os.write(write_fd, "\n".join(child_ids).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    parent_ids = [generate_reference_number("TXF") for _ in range(PER_PROCESS)]
+    with os.fdopen(read_fd) as pipe:
+        child_ids = pipe.read().split("\n")
+    os.waitpid(pid, 0)
+
+    assert len(child_ids) == PER_PROCESS
+    assert not set(child_ids) & set(parent_ids)
+    assert child_ids == sorted(child_ids) and min(child_ids) > before_fork
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_with_a_configured_worker_id_refuses_to_generate(monkeypatch):
+    monkeypatch.setenv("WORKER_ID", "5")
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            try:
+                generate_reference_number("TXF")
+                os.write(write_fd, b"generated")
+            except RuntimeError:
+                os.write(write_fd, b"refused")
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        outcome = pipe.read()
+    os.waitpid(pid, 0)
+    assert outcome == "refused"
@@ -0,0 +1,150 @@
+"""
+Import-time budget tests
+Guards worker boot time by profiling ``import src.main`` with ``python -X importtime``
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Budgets are generous defaults for CI machines; tighten them locally via env vars
+APP_IMPORT_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "3000"))
+SRC_SELF_BUDGET_MS = float(os.getenv("SRC_IMPORT_TIME_BUDGET_MS", "300"))
+
+# Modules that must only be loaded on first use, never while booting the app
+DEFERRED_MODULES = [
+    "src.database.crud",
+    "src.database.sample_data",
+    "src.database.init_db",
+    "src.services.bank_interface",
+]
+
+
+def _run_python(code: str, tmp_path: Path, importtime: bool = False) -> subprocess.CompletedProcess:
+    """Run a snippet in a fresh interpreter from the backend directory"""
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{tmp_path / 'import_time.db'}"
+    args = [sys.executable]
+    if importtime:
+        args += ["-X", "importtime"]
+    args += ["-c", code]
+    return subprocess.run(
+        args, cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _parse_importtime(stderr: str) -> dict:
+    """Parse ``-X importtime`` output into {module: (self_us, cumulative_us)}"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+@pytest.fixture(scope="module")
+def app_import_timings(tmp_path_factory) -> dict:
+    tmp_path = tmp_path_factory.mktemp("importtime")
+    result = _run_python("import src.main", tmp_path, importtime=True)
+    return _parse_importtime(result.stderr)
+
+
+def test_app_import_within_budget(app_import_timings):
+    _, cumulative_us = app_import_timings["src.main"]
+    assert cumulative_us / 1000 < APP_IMPORT_BUDGET_MS, (
+        f"import src.main took {cumulative_us / 1000:.1f}ms "
+        f"(budget {APP_IMPORT_BUDGET_MS:.0f}ms)"
+    )
+
+
+def test_src_modules_self_time_within_budget(app_import_timings):
+    src_self_us = {
+        name: self_us
+        for name, (self_us, _) in app_import_timings.items()
+        if name == "src" or name.startswith("src.")
+    }
+    total_ms = sum(src_self_us.values()) / 1000
+    slowest = sorted(src_self_us.items(), key=lambda item: item[1], reverse=True)[:5]
+    assert total_ms < SRC_SELF_BUDGET_MS, (
+        f"src.* modules spent {total_ms:.1f}ms importing "
+        f"(budget {SRC_SELF_BUDGET_MS:.0f}ms), slowest: {slowest}"
+    )
+
+
+@pytest.mark.parametrize("module_name", DEFERRED_MODULES)
+def test_rarely_used_modules_are_deferred(app_import_timings, module_name):
+    assert module_name not in app_import_timings
+
+
+def test_data_package_defers_the_bulk_generator(tmp_path):
+    result = _run_python(
+        "import sys\n"
+        "import src.data\n"
+        "print('src.data.bulk_generator' in sys.modules, src.data.BulkDataGenerator.__name__)",
+        tmp_path,
+    )
+    assert result.stdout.strip() == "False BulkDataGenerator"
+
+
+def test_app_import_does_not_create_engine(tmp_path):
+    result = _run_python(
+        "import src.main\n"
+        "from src.database import connection\n"
+        "print(connection._engine is None)",
+        tmp_path,
+    )
+    assert result.stdout.strip() == "True"
+
+
+def test_settings_module_is_side_effect_free(tmp_path):
+    result = _run_python(
+        "import sys\n"
+        "import src.config\n"
+        "settings_module = sys.modules['src.config.settings']\n"
+        "print(settings_module.get_settings.cache_info().currsize)",
+        tmp_path,
+    )
+    assert result.stdout.strip() == "0"
+
+
+def test_app_import_does_not_load_settings(tmp_path):
+    result = _run_python(
+        "import src.main\n"
+        "import src.config.settings as settings_module\n"
+        "print(type(settings_module).__name__, settings_module.get_settings.cache_info().misses)",
+        tmp_path,
+    )
+    assert result.stdout.strip() == "module 0"
+
+
+def test_middleware_loads_settings_on_startup(tmp_path):
+    result = _run_python(
+        "from fastapi.testclient import TestClient\n"
+        "from src.config.settings import get_settings\n"
+        "from src.main import app\n"
+        "client = TestClient(app)\n"
+        "response = client.get('/health', headers={'Origin': 'http://localhost:3000'})\n"
+        "print(response.status_code, get_settings.cache_info().misses,\n"
+        "      response.headers.get('access-control-allow-origin'))",
+        tmp_path,
+    )
+    assert result.stdout.strip() == "200 1 http://localhost:3000"
+
+
+def test_session_factory_binds_engine_on_first_use(tmp_path):
+    result = _run_python(
+        "from sqlalchemy import text\n"
+        "from src.database import connection\n"
+        "db = connection.SessionLocal()\n"
+        "print(db.execute(text('SELECT 1')).scalar(), connection._engine is not None)\n"
+        "db.close()",
+        tmp_path,
+    )
+    assert result.stdout.strip() == "1 True"
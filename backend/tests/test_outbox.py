@@ -0,0 +1,212 @@
+"""
+Transfer outbox tests
+Events commit with their transfer, and delivery is in order and at least
+once: the checkpoint only advances after the sink accepted a batch
+"""
+
+import json
+import threading
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.models.database_models import Account
+from src.models.outbox import OutboxCheckpoint, OutboxEvent
+from src.services.outbox_dispatcher import FileSink, OutboxDispatcher, OutboxSink, QueueSink, create_sink
+from src.services.outbox_service import TRANSACTION_CREATED, TRANSFER_COMPLETED, OutboxService
+from src.services.scheduler import default_jobs
+from src.services.transfer_service import TransferService
+
+TRANSFERS = 5
+
+
+class RecordingSink(OutboxSink):
+    """Keeps delivered batches; fails the sends listed in ``fail_on``"""
+
+    def __init__(self, fail_on=()):
+        self.batches = []
+        self.sends = 0
+        self.fail_on = set(fail_on)
+
+    def send(self, events):
+        self.sends += 1
+        if self.sends in self.fail_on:
+            raise ConnectionError("consumer unavailable")
+        self.batches.append([event["id"] for event in events])
+
+
+@pytest.fixture()
+def transfers(engine):
+    with Session(engine) as db:
+        db.add_all([
+            Account(id=1, account_number="1001-0000-0001", account_name="보내는 계좌",
+                    account_type="checking", balance=100000.0),
+            Account(id=2, account_number="1001-0000-0002", account_name="받는 계좌",
+                    account_type="checking", balance=0.0),
+        ])
+        db.commit()
+        service = TransferService(db)
+        for index in range(TRANSFERS):
+            service.create_internal_transfer(1, "1001-0000-0002", 1000.0 + index)
+        with pytest.raises(ValueError):
+            service.create_internal_transfer(1, "1001-0000-0002", 10000000.0)
+    return engine
+
+
+def _checkpoint(engine, consumer="default"):
+    with Session(engine) as db:
+        return db.get(OutboxCheckpoint, consumer)
+
+
+def _dispatcher(engine, sink, **kwargs):
+    return OutboxDispatcher(sink, session_factory=sessionmaker(bind=engine), **kwargs)
+
+
+def test_each_transfer_commits_its_events(transfers):
+    with Session(transfers) as db:
+        events = db.query(OutboxEvent).order_by(OutboxEvent.id).all()
+    # The failed transfer rolled back without leaving events
+    assert len(events) == 3 * TRANSFERS
+    assert [event.event_type for event in events[:3]] == [TRANSFER_COMPLETED, TRANSACTION_CREATED, TRANSACTION_CREATED]
+    payload = json.loads(events[0].payload)
+    assert payload["amount"] == 1000.0 and payload["status"] == "COMPLETED"
+    assert payload["transaction_ids"] == [events[1].aggregate_id, events[2].aggregate_id]
+
+
+def test_events_are_delivered_in_order_and_checkpointed(transfers):
+    sink = RecordingSink()
+    dispatcher = _dispatcher(transfers, sink, batch_size=4)
+
+    assert dispatcher.drain() == 3 * TRANSFERS
+    assert [len(batch) for batch in sink.batches] == [4, 4, 4, 3]
+    delivered = [event_id for batch in sink.batches for event_id in batch]
+    assert delivered == sorted(delivered) and len(set(delivered)) == 3 * TRANSFERS
+    assert _checkpoint(transfers).last_event_id == delivered[-1]
+
+    # Caught up: nothing is sent again
+    assert dispatcher.dispatch_once() == 0
+    assert sink.sends == 4
+
+
+def test_failed_send_is_redelivered_from_the_checkpoint(transfers):
+    sink = RecordingSink(fail_on={2})
+    dispatcher = _dispatcher(transfers, sink, batch_size=6)
+
+    assert dispatcher.dispatch_once() == 6
+    with pytest.raises(ConnectionError):
+        dispatcher.dispatch_once()
+    assert _checkpoint(transfers).last_event_id == sink.batches[0][-1]
+
+    assert dispatcher.drain() == 3 * TRANSFERS - 6
+    delivered = [event_id for batch in sink.batches for event_id in batch]
+    assert len(delivered) == len(set(delivered)) == 3 * TRANSFERS
+
+
+def test_checkpoint_never_moves_backwards(transfers):
+    dispatcher = _dispatcher(transfers, RecordingSink(), batch_size=9)
+    dispatcher.dispatch_once()
+    last = _checkpoint(transfers).last_event_id
+
+    # As a second dispatcher for the same consumer would, finishing an older batch
+    with Session(transfers) as db:
+        dispatcher._advance_checkpoint(db, last - 5)
+        db.commit()
+    assert _checkpoint(transfers).last_event_id == last
+
+
+def test_file_sink_appends_json_lines(transfers, tmp_path):
+    path = tmp_path / "events" / "outbox.jsonl"
+    dispatcher = _dispatcher(transfers, create_sink(f"file:{path}"), batch_size=4)
+    dispatcher.drain()
+    dispatcher.stop()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["id"] for line in lines] == list(range(1, 3 * TRANSFERS + 1))
+    assert isinstance(dispatcher.sink, FileSink)
+
+
+def test_queue_sink_checkpoints_only_acknowledged_batches(transfers):
+    sink = create_sink("queue", ack_timeout=5.0)
+    dispatcher = _dispatcher(transfers, sink, batch_size=6)
+    sending = threading.Thread(target=dispatcher.dispatch_once)
+    sending.start()
+
+    batch = sink.get(timeout=5.0)
+    assert [event["id"] for event in batch.events] == list(range(1, 7))
+    # Taken from the queue but not yet acknowledged: nothing is checkpointed
+    sending.join(0.2)
+    assert sending.is_alive() and _checkpoint(transfers) is None
+
+    batch.ack()
+    sending.join(5.0)
+    assert _checkpoint(transfers).last_event_id == 6
+
+
+def test_queue_sink_redelivers_nacked_and_unacknowledged_batches(transfers):
+    sink = create_sink("queue", ack_timeout=0.2)
+    dispatcher = _dispatcher(transfers, sink, batch_size=6)
+
+    with pytest.raises(TimeoutError):
+        dispatcher.dispatch_once()
+    assert _checkpoint(transfers) is None
+
+    handled, attempts, stop = [], [], threading.Event()
+
+    def handler(events):
+        attempts.append(events[0]["id"])
+        if len(attempts) == 3:
+            raise ConnectionError("downstream unavailable")
+        handled.extend(event["id"] for event in events)
+
+    sink.ack_timeout = 5.0
+    consumer = threading.Thread(target=sink.consume, args=(handler, stop, 0.05))
+    consumer.start()
+    try:
+        # The batch that timed out is still queued; the consumer handles it late
+        assert dispatcher.dispatch_once() == 6
+        with pytest.raises(ConnectionError):
+            dispatcher.dispatch_once()
+        assert _checkpoint(transfers).last_event_id == 6
+        assert dispatcher.drain() == 3 * TRANSFERS - 6
+    finally:
+        stop.set()
+        consumer.join(5.0)
+
+    assert attempts[:4] == [1, 1, 7, 7] and set(handled) == set(range(1, 3 * TRANSFERS + 1))
+    assert _checkpoint(transfers).last_event_id == 3 * TRANSFERS
+
+
+def test_purge_keeps_events_some_consumer_still_needs(transfers):
+    with Session(transfers) as db:
+        service = OutboxService(db)
+        assert service.purge_delivered() == 0
+
+        db.add_all([OutboxCheckpoint(consumer="default", last_event_id=10),
+                    OutboxCheckpoint(consumer="audit", last_event_id=4)])
+        db.commit()
+        assert service.purge_delivered(["default", "search"]) == 0
+        assert service.purge_delivered(["default"]) == 3
+        assert [event.id for event in db.query(OutboxEvent).order_by(OutboxEvent.id)][:2] == [4, 5]
+
+        # Purged down to the checkpoint, new events still get higher ids
+        db.query(OutboxCheckpoint).update({OutboxCheckpoint.last_event_id: 3 * TRANSFERS})
+        db.commit()
+        assert service.purge_delivered() == 3 * TRANSFERS - 4
+        service.record(TRANSFER_COMPLETED, "transfer", 99, {})
+        db.commit()
+        assert [event.id for event in db.query(OutboxEvent).order_by(OutboxEvent.id)] == [
+            3 * TRANSFERS, 3 * TRANSFERS + 1
+        ]
+
+
+def test_sink_specs_and_jobs(settings_env):
+    with pytest.raises(TypeError):
+        OutboxSink()
+    assert isinstance(create_sink("queue"), QueueSink)
+    for spec in ("kafka:events", "queue:events", "file:"):
+        with pytest.raises(ValueError, match="Unknown outbox sink"):
+            create_sink(spec)
+
+    assert {job.name for job in default_jobs(settings_env())}.isdisjoint({"dispatch_outbox", "purge_outbox"})
+    assert {"dispatch_outbox", "purge_outbox"} <= {job.name for job in default_jobs(settings_env(OUTBOX_SINK="queue"))}
+    assert "dispatch_outbox" not in {job.name for job in default_jobs(settings_env(OUTBOX_SINK="kafka:events"))}
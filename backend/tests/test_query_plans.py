@@ -0,0 +1,132 @@
+"""
+Query plan regression tests
+Runs the hot service queries, captures the SQL they emit and asserts via
+EXPLAIN QUERY PLAN that none falls back to a full table scan or a temp B-tree sort
+"""
+
+import importlib
+import re
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import Session
+
+from src.database.connection import Base
+from src.models import database_models  # noqa: F401 - register tables
+from src.models import transfer, virtual_bank  # noqa: F401 - register tables
+from src.models.database_models import Account, Transaction
+from src.services.transaction_service import AccountService, TransactionService
+from src.services.transfer_service import TransferService
+
+ACCOUNT_ID = 1
+HOT_TABLES = ("transactions", "transfers", "accounts")
+
+# A bare "SCAN <table>" reads every row; index scans ("SCAN t USING INDEX ...")
+# read in index order and stop at LIMIT, so they are allowed
+FULL_SCAN = re.compile(rf"^SCAN ({'|'.join(HOT_TABLES)})$")
+TEMP_BTREE = "USE TEMP B-TREE"
+
+# name -> callable(db) exercising one hot query path
+HOT_QUERIES = {
+    "transactions_list": lambda db: TransactionService(db).get_transactions(account_id=ACCOUNT_ID),
+    "transactions_list_asc": lambda db: TransactionService(db).get_transactions(
+        account_id=ACCOUNT_ID, sort_order="asc"
+    ),
+    "transactions_filter_type": lambda db: TransactionService(db).get_transactions(
+        account_id=ACCOUNT_ID, transaction_type="withdrawal"
+    ),
+    "transactions_filter_type_date_range": lambda db: TransactionService(db).get_transactions(
+        account_id=ACCOUNT_ID, transaction_type="deposit",
+        from_date=date.today() - timedelta(days=30), to_date=date.today()
+    ),
+    "transactions_filter_date_range": lambda db: TransactionService(db).get_transactions(
+        account_id=ACCOUNT_ID, from_date=date.today() - timedelta(days=30), to_date=date.today()
+    ),
+    "transactions_search": lambda db: TransactionService(db).search_transactions(
+        "마트", account_id=ACCOUNT_ID
+    ),
+    "account_summary": lambda db: TransactionService(db).get_account_summary(ACCOUNT_ID),
+    "transaction_statistics": lambda db: TransactionService(db).get_transaction_statistics(ACCOUNT_ID),
+    "accounts_list": lambda db: AccountService(db).get_accounts(),
+    "transfers_by_account": lambda db: TransferService(db).get_transfers_by_account(ACCOUNT_ID),
+    "transfers_by_account_status": lambda db: TransferService(db).get_transfers_by_account(
+        ACCOUNT_ID, status="COMPLETED"
+    ),
+}
+
+
+@pytest.fixture()
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(Account(id=ACCOUNT_ID, account_number="1001-2345-6789",
+                       account_name="테스트 계좌", account_type="checking", balance=1000000.0))
+        now = datetime.now()
+        db.add_all([
+            Transaction(account_id=ACCOUNT_ID, transaction_type=("deposit", "withdrawal")[i % 2],
+                        amount=1000.0, description="마트 결제", balance_after=1000000.0,
+                        transaction_date=now - timedelta(days=i), reference_number=f"QP{i:04d}")
+            for i in range(50)
+        ])
+        db.commit()
+    yield engine
+    engine.dispose()
+
+
+def _capture_selects(engine, run):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as db:
+            run(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return statements
+
+
+def _plan_problems(engine, statement, parameters):
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    details = [row[-1] for row in plan]
+    return [d for d in details if FULL_SCAN.match(d) or TEMP_BTREE in d], details
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(engine, name):
+    statements = _capture_selects(engine, HOT_QUERIES[name])
+    assert statements, f"{name} issued no SELECT statements"
+
+    for statement, parameters in statements:
+        problems, details = _plan_problems(engine, statement, parameters)
+        assert not problems, f"{name}: {problems}\nplan: {details}\nsql: {statement}"
+
+
+def test_migration_creates_composite_indexes(engine):
+    migration = importlib.import_module("src.database.migrations.005_add_composite_indexes")
+
+    with engine.connect() as conn:
+        for index_name, _ in migration.COMPOSITE_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+        for _, create_sql in migration.REDUNDANT_INDEXES:
+            conn.exec_driver_sql(create_sql)
+        conn.commit()
+
+    migration.upgrade(engine)
+
+    inspector = inspect(engine)
+    index_names = {
+        index["name"]
+        for table in HOT_TABLES
+        for index in inspector.get_indexes(table)
+    }
+    for index_name, _ in migration.COMPOSITE_INDEXES:
+        assert index_name in index_names
+    for index_name, _ in migration.REDUNDANT_INDEXES:
+        assert index_name not in index_names
@@ -0,0 +1,178 @@
+"""
+Reconciliation tests
+Chain breaks are found where the ledger goes wrong and nowhere else, and a
+database run reports the same mismatches with one worker or several
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models.database_models import Account, Transaction
+from src.services.reconciliation import reconcile, reconcile_account
+
+AMOUNTS = (10000.0, -2500.0, -1200.0, 700.0, -300.0, 4000.0)
+OPENING = 50000.0
+
+
+def _ledger(amounts=AMOUNTS, opening=OPENING):
+    balances, balance = [], opening
+    for amount in amounts:
+        balance += amount
+        balances.append(balance)
+    return list(range(101, 101 + len(amounts))), list(amounts), balances
+
+
+def test_consistent_ledger_reconciles():
+    ids, amounts, balances = _ledger()
+    assert reconcile_account(1, ids, amounts, balances, balances[-1]) is None
+    # Differences within the tolerance are equal
+    assert reconcile_account(1, ids, amounts, [b + 0.004 for b in balances], balances[-1]) is None
+
+
+@pytest.mark.parametrize("index", [1, 3, len(AMOUNTS) - 1])
+def test_wrong_amount_is_one_break(index):
+    ids, amounts, balances = _ledger()
+    amounts[index] += 100.0
+
+    mismatch = reconcile_account(1, ids, amounts, balances, balances[-1])
+
+    assert mismatch["chain_breaks"] == 1
+    assert mismatch["first_break"] == {
+        "transaction_id": ids[index],
+        "expected_balance_after": balances[index - 1] + amounts[index],
+        "balance_after": balances[index],
+    }
+    assert mismatch["computed_balance"] == balances[-1] + 100.0
+    assert mismatch["balance_difference"] == 0.0
+
+
+@pytest.mark.parametrize("index, breaks", [(2, 2), (len(AMOUNTS) - 1, 1)])
+def test_wrong_balance_after_breaks_into_and_out_of_the_row(index, breaks):
+    ids, amounts, balances = _ledger()
+    account_balance = balances[-1]
+    balances[index] -= 50.0
+
+    mismatch = reconcile_account(1, ids, amounts, balances, account_balance)
+
+    assert mismatch["chain_breaks"] == breaks
+    assert mismatch["first_break"]["transaction_id"] == ids[index]
+    assert mismatch["first_break"]["balance_after"] == balances[index]
+
+
+def test_first_row_only_sets_the_opening_balance():
+    ids, amounts, balances = _ledger()
+    amounts[0] += 100.0
+
+    mismatch = reconcile_account(1, ids, amounts, balances, balances[-1])
+
+    # The opening balance is implied by the first row, so its amount cannot break the chain
+    assert mismatch is None
+    assert reconcile_account(1, ids[:1], amounts[:1], balances[:1], balances[0]) is None
+
+
+def test_account_balance_mismatch_without_breaks():
+    ids, amounts, balances = _ledger()
+
+    mismatch = reconcile_account(1, ids, amounts, balances, balances[-1] + 20.0)
+    assert (mismatch["chain_breaks"], mismatch["first_break"]) == (0, None)
+    assert mismatch["balance_difference"] == 20.0
+    assert not mismatch["missing_account"]
+
+    missing = reconcile_account(1, ids, amounts, balances, None)
+    assert missing["missing_account"] and missing["balance_difference"] is None
+
+
+def test_account_without_history_must_be_empty():
+    assert reconcile_account(1, (), (), (), 0.0) is None
+
+    mismatch = reconcile_account(1, (), (), (), 500.0)
+    assert mismatch["missing_history"] and not mismatch["missing_account"]
+    assert (mismatch["transactions"], mismatch["ledger_balance"], mismatch["balance_difference"]) == (0, 0.0, 500.0)
+
+
+def _expected_mismatches(ledgers, account_balances):
+    """Brute force: walk each chain row by row"""
+    expected = {}
+    for account_id, rows in ledgers.items():
+        breaks = [
+            row[0] for previous, row in zip(rows, rows[1:])
+            if abs(previous[2] + row[1] - row[2]) > 0.01
+        ]
+        balance = account_balances.get(account_id)
+        if breaks or balance is None or abs(balance - rows[-1][2]) > 0.01:
+            expected[account_id] = (len(breaks), breaks[0] if breaks else None, balance is None)
+    for account_id, balance in account_balances.items():
+        if account_id not in ledgers and abs(balance) > 0.01:
+            expected[account_id] = (0, None, False)
+    return expected
+
+
+@pytest.fixture()
+def damaged(engine):
+    """Accounts with clean and damaged ledgers, accounts without history, and transactions of a deleted account"""
+    ledgers, account_balances = {}, {}
+    started = datetime(2024, 3, 1, 9, 0)
+    with Session(engine) as db:
+        for account_id in range(1, 25):
+            ids, amounts, balances = _ledger(
+                [(account_id * 37 + i * 13) % 5000 - 2000.0 for i in range(12)],
+                opening=100000.0 + account_id
+            )
+            if account_id % 5 == 0:
+                amounts[4 + account_id % 7] += 10.0
+            if account_id % 7 == 0:
+                balances[account_id % 11] -= 5.0
+            rows = []
+            for index, (amount, balance) in enumerate(zip(amounts, balances)):
+                transaction = Transaction(
+                    account_id=account_id, transaction_type="deposit" if amount >= 0 else "withdrawal",
+                    amount=abs(amount), balance_after=balance, status="completed",
+                    # Ledger order is by date then id; some rows share a timestamp
+                    transaction_date=started + timedelta(hours=index // 2),
+                    reference_number=f"R{account_id:03d}-{index:02d}"
+                )
+                db.add(transaction)
+                rows.append(transaction)
+            # Pending rows are not part of the ledger
+            db.add(Transaction(account_id=account_id, transaction_type="withdrawal", amount=999.0,
+                               balance_after=0.0, status="pending", transaction_date=started,
+                               reference_number=f"P{account_id:03d}"))
+            db.flush()
+            ledgers[account_id] = [
+                (row.id, row.amount if row.transaction_type == "deposit" else -row.amount, row.balance_after)
+                for row in rows
+            ]
+            if account_id != 24:
+                account_balances[account_id] = balances[-1] + (3.0 if account_id % 9 == 0 else 0.0)
+                db.add(Account(id=account_id, account_number=f"2002-0000-{account_id:04d}",
+                               account_name=f"계좌 {account_id}", account_type="checking",
+                               balance=account_balances[account_id]))
+        # New and emptied accounts have no rows; only a non-zero balance is a mismatch
+        for account_id, balance in ((25, 0.0), (26, 500.0), (40, 0.0)):
+            account_balances[account_id] = balance
+            db.add(Account(id=account_id, account_number=f"2002-0000-{account_id:04d}",
+                           account_name=f"계좌 {account_id}", account_type="checking", balance=balance))
+        db.commit()
+    return _expected_mismatches(ledgers, account_balances)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_database_run_reports_every_damaged_account(damaged, db_path, workers):
+    report = reconcile(str(db_path), workers=workers, fetch_size=7)
+
+    assert report["accounts_checked"] == 27
+    assert report["transactions_checked"] == 24 * 12
+    found = {
+        mismatch["account_id"]: (
+            mismatch["chain_breaks"],
+            mismatch["first_break"]["transaction_id"] if mismatch["first_break"] else None,
+            mismatch["missing_account"],
+        )
+        for mismatch in report["mismatches"]
+    }
+    assert found == damaged
+    assert report["mismatch_count"] == len(damaged)
+    assert damaged[24][2] and 26 in damaged and 25 not in damaged
+    assert [mismatch["account_id"] for mismatch in report["mismatches"]] == sorted(damaged)
@@ -0,0 +1,113 @@
+"""
+Job scheduler tests
+One worker at a time runs an exclusive job, the lease holds until the
+interval has passed, an expired lease is taken over, and run statistics
+reach the lease row
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.models.job_lease import JobLease
+from src.services.scheduler import JobScheduler, ScheduledJob
+
+WORKERS = 8
+
+
+def _schedulers(engine, job_factory, count=WORKERS):
+    schedulers = []
+    for index in range(count):
+        scheduler = JobScheduler(session_factory=sessionmaker(bind=engine), owner=f"worker-{index}")
+        scheduler.add_job(job_factory())
+        schedulers.append(scheduler)
+    return schedulers
+
+
+def _lease(engine, name):
+    with Session(engine) as db:
+        return db.get(JobLease, name)
+
+
+def test_exclusive_job_runs_in_one_worker(engine):
+    runs = []
+    schedulers = _schedulers(engine, lambda: ScheduledJob("nightly", 3600, lambda: runs.append(1)))
+    start = threading.Barrier(WORKERS)
+
+    def tick(scheduler):
+        start.wait(5)
+        return scheduler.run_pending()
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        ran = list(pool.map(tick, schedulers))
+
+    assert len(runs) == 1
+    assert sorted(ran) == [[]] * (WORKERS - 1) + [["nightly"]]
+    winner = next(scheduler for scheduler, names in zip(schedulers, ran) if names)
+    lease = _lease(engine, "nightly")
+    assert lease.owner == winner.owner
+    assert (lease.run_count, lease.failure_count, lease.last_status) == (1, 0, "succeeded")
+    # The finished run holds the lease until the next interval
+    assert lease.lease_expires_at == winner.jobs["nightly"].last_started_at + timedelta(hours=1)
+    # Losers back off instead of re-reading the lease every call
+    assert all(scheduler.run_pending() == [] for scheduler in schedulers)
+    assert len(runs) == 1
+
+
+def test_lease_blocks_other_workers_until_it_expires(engine):
+    runs = []
+    first, second = _schedulers(engine, lambda: ScheduledJob("hourly", 3600, lambda: runs.append(1)), count=2)
+
+    assert first.run_pending() == ["hourly"]
+    second.jobs["hourly"].next_check_at = None
+    assert second.run_pending() == []
+    assert len(runs) == 1
+
+    # A worker that died mid-run leaves an expired lease: another worker takes over
+    with Session(engine) as db:
+        db.query(JobLease).update({
+            JobLease.lease_expires_at: datetime.now() - timedelta(seconds=1),
+            JobLease.last_status: "running",
+        })
+        db.commit()
+    second.jobs["hourly"].next_check_at = None
+    assert second.run_pending() == ["hourly"]
+
+    lease = _lease(engine, "hourly")
+    assert (lease.owner, lease.run_count, len(runs)) == (second.owner, 2, 2)
+
+    # The previous owner cannot record a run over the new lease
+    first._finish(first.jobs["hourly"], datetime.now(), 1.0, "stale")
+    assert _lease(engine, "hourly").run_count == 2
+
+
+def test_non_exclusive_jobs_run_in_every_worker(engine):
+    runs = []
+    schedulers = _schedulers(engine, lambda: ScheduledJob("warm", 60, lambda: runs.append(1), exclusive=False),
+                             count=3)
+
+    assert [scheduler.run_pending() for scheduler in schedulers] == [["warm"]] * 3
+    assert len(runs) == 3
+    assert _lease(engine, "warm") is None
+
+
+def test_failures_are_recorded_on_the_lease(engine):
+    def fail():
+        raise RuntimeError("disk full")
+
+    scheduler, observer = _schedulers(engine, lambda: ScheduledJob("flaky", 60, fail), count=2)
+    assert scheduler.run_pending() == ["flaky"]
+
+    lease = _lease(engine, "flaky")
+    assert (lease.run_count, lease.failure_count) == (1, 1)
+    assert (lease.last_status, lease.last_error) == ("failed", "RuntimeError: disk full")
+
+    # Any worker reports the cluster-wide run, even one that never ran the job
+    with Session(engine) as db:
+        status = observer.status(db)
+    (job,) = status["jobs"]
+    assert job["worker"]["runs"] == 0
+    assert job["cluster"]["owner"] == scheduler.owner
+    assert job["cluster"]["failure_count"] == 1
@@ -0,0 +1,203 @@
+"""
+Single-flight tests
+Concurrent identical calls share one computation, its plain-data result and its errors
+"""
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.database.deadline import deadline_exceeded, install_progress_handler, request_deadline
+from src.models.database_models import Account, Transaction
+from src.services.single_flight import SingleFlight
+from src.services.transaction_service import TransactionService
+
+CALLERS = 8
+FIELDS = ["id", "amount", "transaction_date"]
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _run_coalesced(flight, call, release):
+    """Run ``call`` from CALLERS threads, then ``release`` the first one once all wait for it"""
+    coalesced = flight.stats()["coalesced"]
+    with ThreadPoolExecutor(CALLERS) as pool:
+        futures = [pool.submit(call)]
+        _wait_for(lambda: flight.stats()["in_flight"] == 1)
+        futures += [pool.submit(call) for _ in range(CALLERS - 1)]
+        _wait_for(lambda: flight.stats()["coalesced"] - coalesced == CALLERS - 1)
+        release.set()
+    return futures
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return {"rows": (1, 2, 3)}
+
+    futures = _run_coalesced(flight, lambda: flight.do("key", compute), release)
+    results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {
+        "executions": 1, "coalesced": CALLERS - 1, "coalesce_rate": round((CALLERS - 1) / CALLERS, 4),
+        "max_waiters": CALLERS - 1, "in_flight": 0,
+    }
+
+    # Nothing is cached: the next call runs again
+    assert flight.do("key", compute) == {"rows": (1, 2, 3)}
+    assert len(calls) == 2
+
+
+def test_followers_get_the_leaders_exception():
+    flight = SingleFlight("test")
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError("boom")
+
+    futures = _run_coalesced(flight, lambda: flight.do("key", fail), release)
+    for future in futures:
+        with pytest.raises(ValueError, match="boom"):
+            future.result()
+    assert flight.stats()["executions"] == 1
+
+
+# About half a second of SQLite work, checked against the deadline as it runs
+SLOW_COUNT = "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 1000000) SELECT count(*) FROM n"
+
+
+def _with_deadline(seconds, call):
+    with request_deadline(time.monotonic() + seconds if seconds is not None else None):
+        return call()
+
+
+def test_flight_runs_until_the_latest_callers_deadline():
+    flight = SingleFlight("test")
+    started = threading.Event()
+
+    def count():
+        connection = sqlite3.connect(":memory:")
+        install_progress_handler(connection, None)
+        try:
+            started.set()
+            return connection.execute(SLOW_COUNT).fetchone()[0]
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(_with_deadline, 0.2, lambda: flight.do("key", count))
+        started.wait(5)
+        follower = pool.submit(_with_deadline, 60, lambda: flight.do("key", count))
+        # The follower's deadline keeps the shared statement running past the leader's
+        assert follower.result() == leader.result() == 1000000
+    assert flight.stats()["executions"] == 1
+
+    # Alone, the short deadline interrupts the statement
+    with pytest.raises(sqlite3.OperationalError, match="interrupted"):
+        _with_deadline(0.2, lambda: flight.do("key", count))
+
+
+def test_follower_with_time_left_reruns_a_flight_that_ran_out():
+    flight = SingleFlight("test")
+    lapsed, joined = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        if len(calls) == 1:
+            # The leader's deadline passes before the follower joins
+            while not deadline_exceeded():
+                time.sleep(0.005)
+            lapsed.set()
+            joined.wait(5)
+            raise sqlite3.OperationalError("interrupted")
+        return "rows"
+
+    with ThreadPoolExecutor(3) as pool:
+        leader = pool.submit(_with_deadline, 0.05, lambda: flight.do("key", compute))
+        lapsed.wait(5)
+        follower = pool.submit(_with_deadline, 60, lambda: flight.do("key", compute))
+        expired = pool.submit(_with_deadline, 0, lambda: flight.do("key", compute))
+        _wait_for(lambda: flight.stats()["coalesced"] == 2)
+        joined.set()
+
+        with pytest.raises(sqlite3.OperationalError):
+            leader.result()
+        # A follower whose deadline has passed too gets the error (a 504 upstream)
+        with pytest.raises(sqlite3.OperationalError):
+            expired.result()
+        assert follower.result() == "rows"
+    assert len(calls) == 2
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight("test")
+    assert [flight.do(key, lambda key=key: key * 2) for key in (1, 2, 1)] == [2, 4, 2]
+    assert flight.stats()["executions"] == 3
+    assert flight.stats()["coalesced"] == 0
+
+
+@pytest.fixture()
+def transactions(engine):
+    with Session(engine) as db:
+        db.add(Account(id=1, account_number="1001-0000-0001", account_name="계좌",
+                       account_type="checking", balance=10000.0))
+        now = datetime.now()
+        db.add_all([
+            Transaction(account_id=1, transaction_type="deposit", amount=100.0 + i, balance_after=10000.0,
+                        transaction_date=now - timedelta(hours=i), reference_number=f"SF{i:03d}")
+            for i in range(30)
+        ])
+        db.commit()
+    return engine
+
+
+def test_transaction_page_coalesces_on_plain_data(transactions, monkeypatch):
+    flight = TransactionService.get_transaction_page.flight
+    before = flight.stats()
+    release = threading.Event()
+    get_transactions = TransactionService.get_transactions
+
+    def slow_get_transactions(self, **kwargs):
+        release.wait(5)
+        return get_transactions(self, **kwargs)
+
+    monkeypatch.setattr(TransactionService, "get_transactions", slow_get_transactions)
+
+    def call():
+        # Each caller has its own session, as each request does
+        with Session(transactions) as db:
+            return TransactionService(db).get_transaction_page(FIELDS, account_id=1, limit=10)
+
+    futures = _run_coalesced(flight, call, release)
+    results = [future.result() for future in futures]
+
+    after = flight.stats()
+    assert after["executions"] - before["executions"] == 1
+    assert after["coalesced"] - before["coalesced"] == CALLERS - 1
+    assert after["max_waiters"] >= CALLERS - 1
+
+    rows, total = results[0]
+    assert total == 30
+    assert all(result is results[0] for result in results)
+    assert [type(row) for row in rows] == [dict] * 10
+    assert [set(row) for row in rows] == [set(FIELDS)] * 10
+    assert [row["id"] for row in rows] == list(range(1, 11))
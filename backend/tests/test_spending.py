@@ -0,0 +1,142 @@
+"""
+Spending aggregate tests
+Rows added by ``record`` on the write path match what ``rebuild`` recomputes
+from the ledger, and the report reads the aggregate
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.models.database_models import Account, Transaction, TransactionCategory
+from src.models.spending import MonthlyCategorySpend
+from src.services.categorization import reset_categorizer
+from src.services.spending_service import UNCATEGORIZED, SpendingService, shift_month
+from src.services.transfer_service import TransferService
+
+CATEGORIES = {1: "식비", 2: "교통비", 3: "이체"}
+
+
+@pytest.fixture()
+def accounts(engine):
+    reset_categorizer()
+    with Session(engine) as db:
+        db.add_all([TransactionCategory(id=category_id, name=name) for category_id, name in CATEGORIES.items()])
+        db.add_all([
+            Account(id=account_id, account_number=f"1001-0000-000{account_id}", account_name=f"계좌 {account_id}",
+                    account_type="checking", balance=1000000.0)
+            for account_id in (1, 2, 3)
+        ])
+        db.commit()
+    yield engine
+    reset_categorizer()
+
+
+def _aggregate(db):
+    return sorted(
+        (account_id, month, category_id, round(total, 2), count)
+        for account_id, month, category_id, total, count in db.execute(select(
+            MonthlyCategorySpend.account_id, MonthlyCategorySpend.month, MonthlyCategorySpend.category_id,
+            MonthlyCategorySpend.total_amount, MonthlyCategorySpend.transaction_count
+        ))
+    )
+
+
+def test_transfers_record_what_rebuild_computes(accounts):
+    with Session(accounts) as db:
+        service = TransferService(db)
+        for index, (source, destination, description) in enumerate([
+            (1, 2, "점심 식사"), (1, 3, "택시비"), (1, 2, None), (2, 1, "마트 장보기"),
+            (2, 3, "지하철"), (1, 2, "점심 식사"), (3, 1, "회비"),
+        ]):
+            service.create_internal_transfer(source, f"1001-0000-000{destination}", 1000.0 + index * 10,
+                                             description)
+        with pytest.raises(ValueError):
+            service.create_internal_transfer(1, "9999-9999-9999", 5000.0, "점심")
+
+        recorded = _aggregate(db)
+        SpendingService(db).rebuild()
+        rebuilt = _aggregate(db)
+
+    assert recorded == rebuilt
+    month = datetime.now(timezone.utc).strftime("%Y-%m")
+    # Only the sender's side is a debit; transfers without a keyword fall back to 이체
+    assert {(account_id, category_id) for account_id, _, category_id, _, _ in recorded} == {
+        (1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (3, 3)
+    }
+    assert (1, month, 1, 2050.0, 2) in recorded
+
+
+def test_record_matches_rebuild_across_months(accounts):
+    rows = [
+        Transaction(account_id=account_id, transaction_type=kind, amount=amount, category_id=category_id,
+                    transaction_date=transaction_date, balance_after=0.0, status="completed",
+                    reference_number=f"M{index:03d}")
+        for index, (account_id, kind, amount, category_id, transaction_date) in enumerate([
+            (1, "withdrawal", 12000.0, 1, datetime(2024, 1, 31, 23, 59)),
+            (1, "withdrawal", 3000.0, 1, datetime(2024, 2, 1, 0, 0)),
+            (1, "transfer", 50000.0, 3, datetime(2024, 2, 14, 12, 0)),
+            (1, "deposit", 90000.0, None, datetime(2024, 2, 15, 9, 0)),
+            (1, "withdrawal", 700.0, None, datetime(2024, 2, 20, 18, 0)),
+            (2, "withdrawal", 4500.0, 2, datetime(2024, 2, 3, 8, 0)),
+            (2, "withdrawal", 4500.0, 2, datetime(2024, 3, 3, 8, 0)),
+        ])
+    ]
+    with Session(accounts) as db:
+        db.add_all(rows)
+        db.flush()
+        SpendingService(db).record(rows)
+        db.commit()
+
+        recorded = _aggregate(db)
+        assert SpendingService(db).rebuild() == len(recorded)
+        assert _aggregate(db) == recorded
+
+    assert recorded == [
+        (1, "2024-01", 1, 12000.0, 1),
+        (1, "2024-02", UNCATEGORIZED, 700.0, 1),
+        (1, "2024-02", 1, 3000.0, 1),
+        (1, "2024-02", 3, 50000.0, 1),
+        (2, "2024-02", 2, 4500.0, 1),
+        (2, "2024-03", 2, 4500.0, 1),
+    ]
+
+
+def test_partial_rebuild_keeps_earlier_months(accounts):
+    with Session(accounts) as db:
+        db.add_all([
+            Transaction(account_id=1, transaction_type="withdrawal", amount=1000.0 * month, category_id=1,
+                        transaction_date=datetime(2024, month, 10), balance_after=0.0, status="completed",
+                        reference_number=f"P{month:02d}")
+            for month in range(1, 5)
+        ])
+        db.commit()
+        SpendingService(db).rebuild()
+        # Re-categorize March onwards in bulk, then fold it in
+        db.query(Transaction).filter(Transaction.transaction_date >= datetime(2024, 3, 1)).update(
+            {Transaction.category_id: 2}, synchronize_session=False
+        )
+        db.commit()
+        assert SpendingService(db).rebuild("2024-03") == 2
+
+        assert _aggregate(db) == [
+            (1, "2024-01", 1, 1000.0, 1),
+            (1, "2024-02", 1, 2000.0, 1),
+            (1, "2024-03", 2, 3000.0, 1),
+            (1, "2024-04", 2, 4000.0, 1),
+        ]
+        report = SpendingService(db).get_spending(1, "2024-02", "2024-04")
+
+    assert report["total"] == 9000.0
+    assert [entry["amount"] for entry in report["monthly_totals"]] == [2000.0, 3000.0, 4000.0]
+    # February's change is against January, read from outside the report range
+    assert report["monthly_totals"][0]["change_percent"] == 100.0
+    assert [(entry["name"], entry["total"]) for entry in report["categories"]] == [("교통비", 7000.0), ("식비", 2000.0)]
+
+
+def test_shift_month_crosses_years():
+    assert shift_month("2024-01", -1) == "2023-12"
+    assert shift_month("2024-12", 1) == "2025-01"
+    assert shift_month("2024-05", -17) == "2022-12"
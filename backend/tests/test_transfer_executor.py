@@ -0,0 +1,119 @@
+"""
+Group-commit transfer executor tests
+Per-transfer savepoints, batch commit failures and draining on shutdown
+"""
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.models.database_models import Account
+from src.models.transfer import Transfer
+from src.services import transfer_executor
+from src.services.transfer_executor import GroupCommitTransferExecutor, get_transfer_executor
+
+SOURCE_ID = 1
+DESTINATIONS = {2: "1001-0000-0002", 3: "1001-0000-0003"}
+OPENING_BALANCE = 500000.0
+
+
+@pytest.fixture()
+def accounts(engine):
+    with Session(engine) as db:
+        db.add(Account(id=SOURCE_ID, account_number="1001-0000-0001", account_name="보내는 계좌",
+                       account_type="checking", balance=OPENING_BALANCE))
+        for account_id, account_number in DESTINATIONS.items():
+            db.add(Account(id=account_id, account_number=account_number, account_name=f"받는 계좌 {account_id}",
+                           account_type="checking", balance=0.0))
+        db.commit()
+    return engine
+
+
+class FailingCommitSession(Session):
+    def commit(self):
+        raise RuntimeError("disk I/O error")
+
+
+def _balances(engine):
+    with Session(engine) as db:
+        return {account.id: account.balance for account in db.query(Account)}
+
+
+def _transfer_count(engine):
+    with Session(engine) as db:
+        return db.query(Transfer).count()
+
+
+def _executor(engine, **kwargs):
+    kwargs.setdefault("max_batch_size", 16)
+    # Long enough that every test submission lands in one batch
+    kwargs.setdefault("max_latency_ms", 300)
+    return GroupCommitTransferExecutor(session_factory=sessionmaker(bind=engine), **kwargs)
+
+
+def test_failing_transfer_leaves_the_rest_of_its_batch_committed(accounts):
+    executor = _executor(accounts)
+    ok_first = executor.submit(SOURCE_ID, DESTINATIONS[2], 1000.0, "첫 번째")
+    unknown = executor.submit(SOURCE_ID, "9999-9999-9999", 2000.0)
+    too_large = executor.submit(SOURCE_ID, DESTINATIONS[3], 5000000.0)
+    ok_last = executor.submit(SOURCE_ID, DESTINATIONS[3], 3000.0, "마지막")
+    executor.shutdown()
+
+    assert ok_first.result().status == "COMPLETED"
+    assert ok_last.result().status == "COMPLETED"
+    with pytest.raises(ValueError, match="Destination account not found"):
+        unknown.result()
+    with pytest.raises(ValueError, match="exceeds maximum limit"):
+        too_large.result()
+
+    assert executor.batches == 1
+    assert executor.transfers == 2
+    assert _transfer_count(accounts) == 2
+    assert _balances(accounts) == {SOURCE_ID: OPENING_BALANCE - 4000.0, 2: 1000.0, 3: 3000.0}
+
+
+def test_failed_batch_commit_fails_every_future(accounts):
+    executor = GroupCommitTransferExecutor(
+        max_batch_size=16, max_latency_ms=300,
+        session_factory=sessionmaker(bind=accounts, class_=FailingCommitSession)
+    )
+    futures = [executor.submit(SOURCE_ID, DESTINATIONS[2], 1000.0) for _ in range(3)]
+    futures.append(executor.submit(SOURCE_ID, "9999-9999-9999", 1000.0))
+    executor.shutdown()
+
+    for future in futures[:3]:
+        with pytest.raises(RuntimeError, match="Transfer batch commit failed"):
+            future.result()
+    # Its own error was already set before the commit failed
+    with pytest.raises(ValueError, match="Destination account not found"):
+        futures[3].result()
+
+    assert executor.batches == 0
+    assert _transfer_count(accounts) == 0
+    assert _balances(accounts) == {SOURCE_ID: OPENING_BALANCE, 2: 0.0, 3: 0.0}
+
+
+def test_shutdown_drains_queued_transfers(accounts):
+    executor = _executor(accounts, max_batch_size=3, max_latency_ms=50)
+    futures = [executor.submit(SOURCE_ID, DESTINATIONS[2], 100.0) for _ in range(10)]
+
+    executor.shutdown(wait=True)
+
+    assert all(future.done() for future in futures)
+    assert [future.result().status for future in futures] == ["COMPLETED"] * 10
+    assert executor.batches >= 4
+    assert _balances(accounts)[2] == 1000.0
+    with pytest.raises(RuntimeError, match="shut down"):
+        executor.submit(SOURCE_ID, DESTINATIONS[2], 100.0)
+
+
+def test_group_commit_is_opt_in(settings_env, monkeypatch):
+    monkeypatch.setattr(transfer_executor, "_executor", None)
+    settings_env()
+    assert get_transfer_executor() is None
+
+    settings_env(TRANSFER_GROUP_COMMIT="true", TRANSFER_BATCH_SIZE="8")
+    executor = get_transfer_executor()
+    try:
+        assert executor is not None and executor.max_batch_size == 8
+    finally:
+        transfer_executor.shutdown_transfer_executor()
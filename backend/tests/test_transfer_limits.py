@@ -0,0 +1,102 @@
+"""
+Daily transfer limit tests
+Concurrent transfers cannot overshoot the daily limit, and failed transfers
+release their reservation
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models.database_models import Account, Transaction
+from src.models.transfer import Transfer
+from src.models.transfer_limit import DailyTransferTotal
+from src.services.transfer_limit_service import TransferLimitService
+from src.services.transfer_service import TransferService
+
+AMOUNT = 900000.0
+ATTEMPTS = 16
+# 11 transfers of 900,000 fit a 10,000,000 daily limit
+FITTING = int(TransferLimitService.DAILY_LIMIT // AMOUNT)
+
+
+@pytest.fixture()
+def accounts(engine):
+    with Session(engine) as db:
+        db.add_all([
+            Account(id=1, account_number="1001-0000-0001", account_name="보내는 계좌",
+                    account_type="checking", balance=50000000.0),
+            Account(id=2, account_number="1001-0000-0002", account_name="받는 계좌",
+                    account_type="checking", balance=0.0),
+        ])
+        db.commit()
+    return engine
+
+
+def _transfer(engine, amount, start=None):
+    if start is not None:
+        start.wait(5)
+    with Session(engine) as db:
+        try:
+            TransferService(db).create_internal_transfer(1, "1001-0000-0002", amount)
+            return True
+        except ValueError as e:
+            assert "한도" in str(e)
+            return False
+
+
+def test_concurrent_transfers_never_exceed_the_daily_limit(accounts):
+    start = threading.Event()
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(_transfer, accounts, AMOUNT, start) for _ in range(ATTEMPTS)]
+        start.set()
+        outcomes = [future.result() for future in futures]
+
+    assert outcomes.count(True) == FITTING
+    with Session(accounts) as db:
+        total = db.get(DailyTransferTotal, (1, date.today()))
+        assert (total.total_amount, total.transfer_count) == (FITTING * AMOUNT, FITTING)
+        assert db.query(Transfer).count() == FITTING
+        # Balance updates from concurrent transfers are not lost either
+        assert db.get(Account, 2).balance == FITTING * AMOUNT
+        assert db.get(Account, 1).balance == 50000000.0 - FITTING * AMOUNT
+        credited = sorted(row.balance_after for row in db.query(Transaction).filter_by(account_id=2))
+        assert credited == [AMOUNT * n for n in range(1, FITTING + 1)]
+
+        limits = TransferLimitService(db).get_limits(1)
+    assert limits["daily_used"] == FITTING * AMOUNT
+    assert limits["daily_remaining"] == TransferLimitService.DAILY_LIMIT - FITTING * AMOUNT
+    assert limits["transfer_count"] == FITTING
+
+
+def test_failed_transfer_releases_its_reservation(accounts):
+    with Session(accounts) as db:
+        service = TransferService(db)
+        service.create_internal_transfer(1, "1001-0000-0002", 500000.0)
+        with pytest.raises(ValueError, match="Destination account not found"):
+            service.create_internal_transfer(1, "9999-9999-9999", 700000.0)
+        assert TransferLimitService(db).get_daily_used(1) == 500000.0
+
+        # A rejected amount leaves the running total untouched
+        db.query(DailyTransferTotal).update({"total_amount": TransferLimitService.DAILY_LIMIT - 100.0})
+        db.commit()
+        with pytest.raises(ValueError, match="한도"):
+            TransferLimitService(db).reserve(1, 200.0)
+        assert TransferLimitService(db).reserve(1, 100.0) == TransferLimitService.DAILY_LIMIT
+
+
+def test_daily_totals_are_per_day_and_purgeable(accounts):
+    with Session(accounts) as db:
+        limits = TransferLimitService(db)
+        yesterday = date.today() - timedelta(days=1)
+        limits.reserve(1, TransferLimitService.DAILY_LIMIT, transfer_date=yesterday)
+        assert limits.reserve(1, 1000.0) == 1000.0
+        db.commit()
+
+        assert limits.purge_before(date.today()) == 1
+        assert limits.get_daily_used(1, yesterday) == 0.0
+        assert limits.get_daily_used(1) == 1000.0
+        assert limits.get_limits(999) is None
@@ -0,0 +1,81 @@
+"""
+Transfer rule engine tests
+Batch validation carries daily usage from request to request, and otherwise
+gives the same answer as validating each request on its own
+"""
+
+import pytest
+
+from src.utils.validators import TransferRuleEngine, TransferValidator, validate_complete_transfer_request
+
+DAILY_LIMIT = float(TransferValidator.MAX_DAILY_TRANSFER)
+INTERNAL = "1001-2345-6789"
+
+
+def _request(from_account_id, amount, **fields):
+    return {"from_account_id": from_account_id, "to_account_number": INTERNAL, "amount": amount, **fields}
+
+
+def test_daily_usage_accumulates_within_a_batch():
+    engine = TransferRuleEngine()
+    results = engine.validate_many([
+        _request(1, 6000000.0),
+        _request(1, 5000000.0),   # 11,000,000 with the first: over the limit
+        _request(2, 5000000.0),   # Another account has its own limit
+        _request(1, 4000000.0),   # Fits exactly: the rejected one used nothing
+        _request(1, 1000.0),
+    ])
+
+    assert [valid for valid, _ in results] == [True, False, True, True, False]
+    assert "일일 이체 한도" in results[1][1] and "4,000,000" in results[1][1]
+    assert "남은 한도: 0" in results[4][1]
+
+
+def test_usage_before_the_batch_counts():
+    engine = TransferRuleEngine()
+    results = engine.validate_many(
+        [_request(1, 2000000.0), _request(1, 2000000.0), _request(2, 2000000.0)],
+        daily_used={1: DAILY_LIMIT - 3000000.0},
+    )
+    assert [valid for valid, _ in results] == [True, False, True]
+
+
+def test_invalid_requests_use_no_allowance():
+    engine = TransferRuleEngine()
+    results = engine.validate_many([
+        _request(1, 6000000.0, description="<script>"),
+        _request(1, 6000000.0, bank_code="XX", to_account_number="12345678901234"),
+        _request(1, 6000000.0),
+    ])
+    assert [valid for valid, _ in results] == [False, False, True]
+
+
+REQUESTS = [
+    _request(1, 50000.0, description="월세"),
+    _request(1, 500.0),
+    _request(0, 50000.0),
+    _request(2, 60000000.0),
+    _request(3, 150000.0, to_account_number="12345678901234", bank_code="KB"),
+    _request(3, 150000.0, to_account_number="12345678901234", bank_code="ZZ"),
+    _request(4, 10000.0, to_account_number="123"),
+    _request(5, 300000.0, account_limit=200000.0),
+    _request(5, 100000.0, account_limit=200000.0, description="<img src=x>"),
+    _request(6, None),
+]
+
+
+@pytest.mark.parametrize("active_banks", [None, ["kb", " nh "]])
+def test_results_match_single_validation(active_banks):
+    engine = TransferRuleEngine(active_banks)
+    used, expected = {}, []
+    for request in REQUESTS:
+        result = validate_complete_transfer_request(
+            **request, daily_used=used.get(request["from_account_id"], 0.0), active_banks=active_banks
+        )
+        if result[0]:
+            used[request["from_account_id"]] = used.get(request["from_account_id"], 0.0) + request["amount"]
+        expected.append(result)
+
+    assert engine.validate_many(REQUESTS) == expected
+    assert [engine.validate(**request) for request in REQUESTS] == expected
+    assert [valid for valid, _ in expected].count(True) == 3